@@ -15,25 +15,28 @@ def main(argv):
     """
     Main
     """
-    helptext = sys.argv[0] + " -i input.yaml -t type"
+    helptext = sys.argv[0] + " -i input.yaml -t type [-r checkpoint.npz]"
     types = ['pd', 'dic' , 'energy']
 
-    if len(sys.argv) != 5:
+    if len(sys.argv) != 5 and len(sys.argv) != 7:
         print (helptext)
         sys.exit(1)
 
     try:
         opts, args = getopt.getopt(
-            argv, "hi:o:t:", ["ifile=","type="])
+            argv, "hi:o:t:r:", ["ifile=","type=","restart="])
     except getopt.GetoptError:
         print( helptext)
         sys.exit(0)
 
+    restartFile = None
     for opt, arg in opts:
         if opt in ("-i", "--ifile"):
             inputFile = arg
         elif opt in ("-t", "--type"):
             typeIn = arg
+        elif opt in ("-r", "--restart"):
+            restartFile = arg
     if typeIn not in types:
         print("Error: Only pd or dic types are supported")
         sys.exit(1)
@@ -41,9 +44,9 @@ def main(argv):
     if typeIn == types[0]:
         deck = IO.deck.PD_deck(inputFile)
         if deck.material_type == "Elastic":
-            simulation(deck)
+            simulation(deck, restartFile)
         elif deck.material_type == "Viscoelastic":
-            simulation(deck)
+            simulation(deck, restartFile)
         else:
             print ("Error in pd_dict.py: Material type unknown, please use Elastic or Viscoelastic")
 
@@ -66,12 +69,21 @@ def dic(deck):
     if deck.vtk_writer.vtk_enabled == True:
         deck.vtk_writer.write_data(deck,dic_solver_class,None)
 
-def simulation(deck):
+def simulation(deck, restartFile=None):
     t0 = time.time()
-    y_0 = deck.geometry.nodes.copy()
-    pb_solver_class = problem.pd.PD_problem(deck)
-    pb_solver_class.quasi_static_solver(deck, y_0)
-    ccm_class = IO.ccm.CCM_calcul(deck, pb_solver_class)
+    checkpoint = None
+    if restartFile is not None:
+        checkpoint = util.checkpoint.read_checkpoint(restartFile)
+    pb_solver_class = problem.pd.PD_problem(deck, checkpoint)
+    # A restarted simulation continues from the nodes' positions of the checkpoint
+    y_0 = pb_solver_class.y[:,:,pb_solver_class.restart_step].copy()
+    if deck.solver_type == "Velocity_Verlet":
+        pb_solver_class.dynamic_solver(deck, y_0)
+    else:
+        pb_solver_class.quasi_static_solver(deck, y_0)
+    pb_solver_class.close()
+    ccm_class = IO.ccm.CCM_calcul(deck, pb_solver_class, getStressSteps(deck))
+    deck.results_store.close()
 
     writeCSV(deck,pb_solver_class)
     if deck.vtk_writer.vtk_enabled == True:
@@ -94,10 +106,25 @@ def simulation(deck):
         print ("stress_tensor")
         print (stress_tensor)
         print ("strain_energy")
-        print (pb_solver_class.strain_energy) 
+        if deck.history_type == "Full":
+            print (pb_solver_class.strain_energy)
+        else:
+            print (pb_solver_class.strain_energy[:,deck.time_steps-1])
 
     print ("Duration:", (time.time() - t0)/60. , "minutes")
 
+def getStressSteps(deck):
+    # All time steps are needed by the results store and the streamed history
+    if deck.results_store.store_enabled == True and "Stress" in deck.results_store.types:
+        return None
+    if deck.history_type == "Streaming" and "Stress" in deck.history_fields:
+        return None
+    # Otherwise only the last time step printed and the time steps written to VTK are needed
+    steps = [deck.time_steps-1]
+    if deck.vtk_writer.vtk_enabled == True and "Stress" in deck.vtk_writer.types:
+        steps += list(range(0, deck.time_steps, deck.vtk_writer.slice_length))
+    return steps
+
 def writeCSV(deck,problem):
     for out in deck.outputs:
         if out.outType == "CSV":
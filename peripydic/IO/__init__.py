@@ -7,6 +7,8 @@
 from .deck import *
 from .dic import *
 from .geometry import *
+from .loader import *
 from .output import *
+from .store import *
 from .vis import *
 from .ccm import *
@@ -4,9 +4,7 @@
 #@author: patrickdiehl@lsu.edu
 import sys
 import numpy as np
-from scipy import linalg
 np.set_printoptions(precision=8, threshold=sys.maxsize)
-from ..util import functions
 
 ## Class to compute the well-known strain and stress tensors defined in the classical continuum mechanics
 class CCM_calcul():
@@ -14,7 +12,8 @@ class CCM_calcul():
     ## Constructor
     # @param deck The input deck
     # @param data_solver Data from the peridynamic problem/solving class
-    def __init__(self, deck, data_solver):
+    # @param stress_steps Ids of the time steps whose stress tensors are computed, None for all time steps
+    def __init__(self, deck, data_solver, stress_steps=None):
 
         ## Nodes' initial position
         self.x = deck.geometry.nodes
@@ -87,6 +86,9 @@ class CCM_calcul():
                         ## Plane strain
                         self.factor2d = 1
 
+        ## Compute the shape tensor of each node and its inverse, which depend only on the reference configuration
+        self.compute_shape_tensors(deck, data_solver)
+
         ## Compute the global strain tensor storing the strain tensor for each node at each time step
         self.compute_global_strain_tensor(deck,data_solver)
 
@@ -95,28 +97,54 @@ class CCM_calcul():
 
         ## Compute the global stress tensor storing the strain tensor for each node at each time step
         if self.material_type == "Elastic":
-            self.compute_global_stress_tensor(deck,data_solver)
+            self.compute_global_stress_tensor(deck,data_solver,stress_steps)
+
+        # The selected time steps of the streamed tensors are written to disk
+        if hasattr(data_solver, "flush_history"):
+            data_solver.flush_history()
 
-    ## Provide the image of (xi - xp) under the reference position vector state X
+    ## Provide the storage of the tensors for each node at each time step
+    # @param deck Input deck
     # @param data_solver Data from the peridynamic problem/solving class
-    # @param i Id of Node "i"
-    # @param p Id of Node "p" with Node "i" family
-    # @return Image of (xi - xp) under the deformation vector state X
-    def X_vector_state(self, data_solver, i, p):
-        X = self.x[p,:] - self.x[i,:]
-        X = np.reshape(X,(self.dim,1))
-        return X
+    # @param name Name of the tensor in the Fields of the History tag
+    # @return Storage with an axis for the time steps, which is streamed as the history of the problem
+    def create_tensor_history(self, deck, data_solver, name):
+        if hasattr(data_solver, "create_history"):
+            return data_solver.create_history(deck, name, (self.num_nodes*self.dim, self.dim))
+        return np.zeros((self.num_nodes*self.dim, self.dim, self.time_steps),dtype=np.float64)
+
+    ## Provide the time steps whose nodes' positions are available
+    # @param deck Input deck
+    # @param data_solver Data from the peridynamic problem/solving class
+    # @return Ids of the time steps except the initial one
+    def get_time_steps(self, deck, data_solver):
+        if hasattr(data_solver, "get_time_steps"):
+            return [t_n for t_n in data_solver.get_time_steps(deck) if t_n >= 1]
+        return list(range(1, self.time_steps))
+
+    ## Compute the shape tensor K of each node and its inverse
+    # K = sum_p w * c_p * X_p X_p^T is summed over the flat bond arrays for each component
+    # @param deck Input deck
+    # @param data_solver Data from the peridynamic problem/solving class
+    def compute_shape_tensors(self, deck, data_solver):
+        ## Shape tensor K of each node
+        self.shape_tensors = self.sum_bond_tensors(deck, data_solver, data_solver.neighbors.get_bonds(deck).X)
+        ## Inverse of the shape tensor K of each node
+        self.shape_tensors_inv = np.linalg.inv(self.shape_tensors)
 
-    ## Provide the image of (xi - xp) under the deformation vector state Y
+    ## Sum the tensor products of a vector state with the reference position vector state X over the family of each node
+    # @param deck Input deck
     # @param data_solver Data from the peridynamic problem/solving class
-    # @param i Id of Node "i"
-    # @param p Id of Node "p" with Node "i" family
-    # @param t_n Id of the time step
-    # @return Image of (xi - xp) under the deformation vector state Y
-    def Y_vector_state(self, data_solver, i, p, t_n):
-        Y = self.y[p,:,t_n] - self.y[i,:,t_n]
-        Y = np.reshape(Y,(self.dim,1))
-        return Y
+    # @param V Image of each bond under the vector state
+    # @return Tensor sum_p w * c_p * V_p X_p^T of each node
+    def sum_bond_tensors(self, deck, data_solver, V):
+        bonds = data_solver.neighbors.get_bonds(deck)
+        weights = bonds.w * bonds.c_p
+        result = np.empty((self.num_nodes, self.dim, self.dim), dtype=np.float64)
+        for r in range(0, self.dim):
+            for s in range(0, self.dim):
+                result[:, r, s] = np.bincount(bonds.i, weights=weights * V[:, r] * bonds.X[:, s], minlength=self.num_nodes)
+        return result
 
     ## Provide the shape tensor K related to Node "i"
     # @param data_solver Data from the peridynamic problem/solving class
@@ -124,14 +152,27 @@ class CCM_calcul():
     # @param i Id of Node "i"
     # @return Shape tensor K
     def K_shape_tensor(self, deck, data_solver, i):
-        K = np.zeros((self.dim, self.dim),dtype=np.float64)
-        index_x_family = data_solver.neighbors.get_index_x_family(i)
-        n = 0
-        for p in index_x_family:
-            X = self.X_vector_state(data_solver, i, p)
-            K += functions.w(data_solver, X, deck.influence_function) * np.dot(X,X.T) * self.Volume_Correction[i,n] * self.node_volumes[p]
-            n += 1
-        return K
+        return self.shape_tensors[i]
+
+    ## Provide the deformation gradient tensor of all nodes
+    # @param deck Input deck
+    # @param data_solver Data from the peridynamic problem/solving class
+    # @param t_n Id of the time step
+    # @return Deformation gradient tensor of each node
+    def deformation_gradients(self, deck, data_solver, t_n):
+        bonds = data_solver.neighbors.get_bonds(deck)
+        y = self.y[:,:,t_n]
+        Y = y[bonds.p, :] - y[bonds.i, :]
+        return np.einsum('nij,njk->nik', self.sum_bond_tensors(deck, data_solver, Y), self.shape_tensors_inv)
+
+    ## Provide the strain tensor of all nodes
+    # @param deck Input deck
+    # @param data_solver Data from the peridynamic problem/solving class
+    # @param t_n Id of the time step
+    # @return Strain tensor of each node
+    def strain_tensors(self, deck, data_solver, t_n):
+        F = self.deformation_gradients(deck, data_solver, t_n)
+        return (F + np.transpose(F, (0, 2, 1)))/2 - np.identity(self.dim, dtype=np.float64)
 
     ## Provide the deformation gradient tensor related to Node "i"
     # @param deck Input deck
@@ -140,15 +181,11 @@ class CCM_calcul():
     # @param t_n Id of the time step
     # @return Deformation gradient tensor related to Node "i"
     def deformation_gradient(self, deck, data_solver, i, t_n):
-        tmp = np.zeros((self.dim, self.dim),dtype=np.float64)
-        index_x_family = data_solver.neighbors.get_index_x_family(i)
-        n = 0
-        for p in index_x_family:
-            Y = self.Y_vector_state(data_solver, i, p, t_n)
-            X = self.X_vector_state(data_solver, i, p)
-            tmp += functions.w(data_solver, X, deck.influence_function) * np.dot(Y,X.T) * self.Volume_Correction[i,n] * self.node_volumes[p]
-            n += 1
-        deformation = np.dot(tmp, linalg.inv(self.K_shape_tensor(deck,data_solver, i)))
+        bonds = data_solver.neighbors.get_bonds(deck)
+        b = slice(bonds.offsets[i], bonds.offsets[i+1])
+        Y = self.y[bonds.p[b],:,t_n] - self.y[i,:,t_n]
+        tmp = np.dot(((bonds.w[b] * bonds.c_p[b])[:, None] * Y).T, bonds.X[b])
+        deformation = np.dot(tmp, self.shape_tensors_inv[i])
         return deformation
 
     ## Provide the strain tensor related to Node "i"
@@ -162,63 +199,54 @@ class CCM_calcul():
         return strain
 
     ## Compute the global strain tensor storing the strain tensor for each node at each time step
+    # The strain tensors of all nodes are computed at once for each time step
     # @param data_solver Data from the peridynamic problem/solving class
     def compute_global_strain_tensor(self, deck, data_solver):
         ## Golbal strain tensor storing the strain tensor for each node at each time step
-        self.global_strain = np.zeros((self.num_nodes*self.dim, self.dim, self.time_steps),dtype=np.float64)
-        for t_n in range(1, self.time_steps):
-            for i in range(0, self.num_nodes):
-                tmp = self.strain_tensor(deck,data_solver, i, t_n)
-                for j in range(0, self.dim):
-                    for r in range(0, self.dim):
-                        self.global_strain[i*self.dim+r,j,t_n] = tmp[r,j]
-
-    ## Provide the image of x under the Dirac Delta Function
-    # @param x Vector x
-    # @return 1 if x is a null-vector, otherwise 0
-    def DiracDelta(self, x, i, q, m):
-        if linalg.norm(x) == 0.:
-            delta = 1. / (self.node_volumes[q] * self.Volume_Correction[i,m])
-        else:
-            delta = 0.
-        return delta
-
-    ## Provide the modulus state K related to Node "i"
+        self.global_strain = self.create_tensor_history(deck, data_solver, "Strain")
+        for t_n in self.get_time_steps(deck, data_solver):
+            self.global_strain[:,:,t_n] = np.reshape(self.strain_tensors(deck, data_solver, t_n), (self.num_nodes*self.dim, self.dim))
+            if hasattr(deck, "results_store"):
+                deck.results_store.write_tensor(deck, "Strain", self.global_strain[:,:,t_n], t_n)
+
+    ## Provide the coefficients of the closed-form stress tensor of the linear elastic material
+    # With the modulus state K(p,q) = A * w_p * w_q * X_p X_q^T + alpha_d * w_p * M_p M_p^T * delta(X_q - X_p), the double sum over the family
+    # sum_p sum_q K(p,q) (strain X_q) X_p^T c_q c_p reduces to A * (strain : K) * K + alpha_d * sum_p w_p c_p (X_p^T strain X_p) / |X_p|^2 X_p X_p^T
+    # with the shape tensor K, so the stress tensor is computed with a single sum over the family
+    # @return Coefficients A and alpha_d of each node
+    def modulus_coefficients(self):
+        m = self.Weighted_Volume
+        if self.dim == 1:
+            # PD material parameter
+            return np.zeros(self.num_nodes), self.Young_Modulus / m
+        if self.dim == 2:
+            # PD material parameter
+            # Plane stress
+            alpha_s = (9. / m) * (self.K + ((self.Nu + 1.)/(2. * self.Nu - 1.))**2 * self.Mu / 9.)
+            # Plane strain
+            #alpha_s = (9. / m) * (self.K + self.Mu / 9.)
+            alpha_d = (8. / m) * self.Mu
+            alpha_sb = (2. * self.factor2d * alpha_s - (3. - 2. * self.factor2d) * alpha_d) /3.
+            return (alpha_sb - alpha_d) / m, alpha_d
+        # PD material parameter
+        alpha_s = (9. / m) * self.K
+        alpha_d = (15. / m) * self.Mu
+        return (alpha_s - alpha_d) / m, alpha_d
+
+    ## Provide the stress tensor of all nodes
+    # @param deck Input deck
     # @param data_solver Data from the peridynamic problem/solving class
-    # @param i Id of Node "i"
-    # @param p Id of Node "p" with Node "i" family
-    # @param q Id of Node "q" with Node "i" family
     # @param t_n Id of the time step
-    # @return Shape tensor K
-    def K_modulus_tensor(self, deck, data_solver, i , p, q, m):
-        Xp = self.X_vector_state(data_solver, i, p)
-        M = Xp / linalg.norm(Xp)
-        Xq = self.X_vector_state(data_solver, i, q)
-        xp = deck.geometry.nodes[p,:] - deck.geometry.nodes[i,:]
-        xq = deck.geometry.nodes[q,:] - deck.geometry.nodes[i,:]
-        if self.material_type == "Elastic":
-            if self.dim == 1:
-                # PD material parameter
-                alpha = self.Young_Modulus / self.Weighted_Volume[i]
-                K = alpha * functions.w(data_solver, xp, deck.influence_function) * np.dot(M,M.T) * self.DiracDelta(Xq - Xp, i, q, m)
-
-            if self.dim == 2:
-                # PD material parameter
-                # Plane stress
-                alpha_s = (9. / self.Weighted_Volume[i]) * (self.K + ((self.Nu + 1.)/(2. * self.Nu - 1.))**2 * self.Mu / 9.)
-                # Plane strain
-                #alpha_s = (9. / self.Weighted_Volume[i]) * (self.K + self.Mu / 9.)
-                alpha_d = (8. / self.Weighted_Volume[i]) * self.Mu
-                alpha_sb = (2. * self.factor2d * alpha_s - (3. - 2. * self.factor2d) * alpha_d) /3.
-                K = ((alpha_sb - alpha_d) / self.Weighted_Volume[i]) * functions.w(data_solver, xp, deck.influence_function) * functions.w(data_solver, xq, deck.influence_function) * np.dot(Xp,Xq.T) + alpha_d * functions.w(data_solver, xp, deck.influence_function) * np.dot(M,M.T) * self.DiracDelta(Xq - Xp, i, q, m)
-
-            if self.dim == 3:
-                # PD material parameter
-                alpha_s = (9. / self.Weighted_Volume[i]) * self.K
-                alpha_d = (15. / self.Weighted_Volume[i]) * self.Mu
-                K = ((alpha_s - alpha_d) / self.Weighted_Volume[i]) * functions.w(data_solver, xp, deck.influence_function) * functions.w(data_solver, xq, deck.influence_function) * np.dot(Xp,Xq.T) + alpha_d * functions.w(data_solver, xp, deck.influence_function) * np.dot(M,M.T) * self.DiracDelta(Xq - Xp, i, q, m)
-
-        return K
+    # @return Stress tensor of each node
+    def stress_tensors(self, deck, data_solver, t_n):
+        bonds = data_solver.neighbors.get_bonds(deck)
+        strain = self.strain_tensors(deck, data_solver, t_n)
+        A, alpha_d = self.modulus_coefficients()
+        # Image X_p^T strain X_p of each bond
+        extension = np.einsum('bj,bjk,bk->b', bonds.X, strain[bonds.i], bonds.X)
+        stress = alpha_d[:, None, None] * self.sum_bond_tensors(deck, data_solver, (extension / bonds.norm_X**2)[:, None] * bonds.X)
+        stress += (A * np.einsum('njk,njk->n', strain, self.shape_tensors))[:, None, None] * self.shape_tensors
+        return stress
 
     ## Provide the stress tensor related to Node "i"
     # @param data_solver Data from the peridynamic problem/solving class
@@ -226,31 +254,29 @@ class CCM_calcul():
     # @param t_n Id of the time step
     # @return stress tensor related do Node "i"
     def stress_tensor(self, deck, data_solver, i, t_n):
-        #force = np.zeros((self.dim, 1),dtype=np.float64)
-        stress = np.zeros((self.dim, self.dim),dtype=np.float64)
-        index_x_family = data_solver.neighbors.get_index_x_family(i)
-        n = 0
-        for p in index_x_family:
-            Xp = self.X_vector_state(data_solver, i, p)
-            m = 0
-            for q in index_x_family:
-                Xq = self.X_vector_state(data_solver, i, q)
-                stress += np.dot(np.dot(self.K_modulus_tensor(deck,data_solver, i , p, q, m), np.dot(self.strain_tensor(deck,data_solver, i, t_n), Xq)), Xp.T) * self.Volume_Correction[i,m] * self.node_volumes[q] * self.Volume_Correction[i,n] * self.node_volumes[p]
-                m += 1
-            n += 1
+        bonds = data_solver.neighbors.get_bonds(deck)
+        b = slice(bonds.offsets[i], bonds.offsets[i+1])
+        strain = self.strain_tensor(deck,data_solver, i, t_n)
+        A, alpha_d = self.modulus_coefficients()
+        X = bonds.X[b]
+        extension = np.einsum('bj,jk,bk->b', X, strain, X)
+        stress = alpha_d[i] * np.dot(((bonds.w[b] * bonds.c_p[b] * extension / bonds.norm_X[b]**2)[:, None] * X).T, X)
+        stress += A[i] * np.sum(strain * self.shape_tensors[i]) * self.shape_tensors[i]
         return stress
 
     ## Compute the global stress tensor storing the strain tensor for each node at each time step
+    # The stress tensors of all nodes are computed at once for each time step
     # @param data_solver Data from the peridynamic problem/solving class
-    def compute_global_stress_tensor(self, deck, data_solver):
+    # @param time_steps Ids of the time steps evaluated, None for all time steps
+    def compute_global_stress_tensor(self, deck, data_solver, time_steps=None):
         ## Golbal strain tensor storing the strain tensor for each node at each time step
-        self.global_stress = np.zeros((self.num_nodes*self.dim, self.dim, self.time_steps),dtype=np.float64)
-        for t_n in range(1, self.time_steps):
-            for i in range(0, self.num_nodes):
-                tmp = self.stress_tensor(deck,data_solver, i, t_n)
-                for j in range(0, self.dim):
-                    for r in range(0, self.dim):
-                        self.global_stress[i*self.dim+r,j,t_n] = tmp[r,j]
+        self.global_stress = self.create_tensor_history(deck, data_solver, "Stress")
+        for t_n in self.get_time_steps(deck, data_solver):
+            if time_steps is not None and t_n not in time_steps:
+                continue
+            self.global_stress[:,:,t_n] = np.reshape(self.stress_tensors(deck, data_solver, t_n), (self.num_nodes*self.dim, self.dim))
+            if hasattr(deck, "results_store"):
+                deck.results_store.write_tensor(deck, "Stress", self.global_stress[:,:,t_n], t_n)
 
     ## Compute the displacement for each node at each time step
     def compute_u_displacement(self):
@@ -10,6 +10,8 @@ from . import output
 from ..util import condition
 from . import vis
 from . import dic
+from . import store
+from ..materials import kernels
 import numpy as np
 
 ## Class handeling the input of the yaml file and storing the values
@@ -30,6 +32,22 @@ class PD_deck():
                     self.safety_factor = 1.001
                     ## Number of threads
                     self.num_threads = 1
+                    ## Backend of the material kernels, Python or Numba
+                    self.backend = "Python"
+                    ## Storage of the time history, Full or Streaming
+                    self.history_type = "Full"
+                    ## Fields of the time history written to disk in the Streaming storage
+                    self.history_fields = []
+                    ## Directory of the time history written to disk
+                    self.history_path = "./"
+                    ## Every n-th time step of the time history is written to disk
+                    self.history_interval = 1
+                    ## File of the checkpoint, None if no checkpoint is written
+                    self.checkpoint_file = None
+                    ## Every n-th time step a checkpoint is written
+                    self.checkpoint_interval = 1
+                    ## Adaptive time stepping, i.e. each time step is solved with load increments adapted to the convergence of the solver
+                    self.solver_adaptive = False
 
                     if not "Discretization" in self.doc:
                         print ("Error: Specific a Discretization tag in your yaml")
@@ -81,7 +99,11 @@ class PD_deck():
                             sys.exit(1)
                         ## Object for handling the discrete nodes
                         self.geometry = geometry.Geometry()
-                        self.geometry.readNodes(self.dim,self.doc["Discretization"]["File"]["Name"])
+                        ## Directory of the binary caches of the CSV files, None to read them without a cache
+                        self.cache_path = None
+                        if "Cache" in self.doc["Discretization"]["File"]:
+                            self.cache_path = self.doc["Discretization"]["File"]["Cache"]
+                        self.geometry.readNodes(self.dim,self.doc["Discretization"]["File"]["Name"],self.cache_path)
                         ## The minimal nodal spacing
                         self.delta_X = self.geometry.getMinDist()
                         ## Amount of nodes
@@ -94,7 +116,7 @@ class PD_deck():
                                 ## List of all conditions specified in the configuration file
                                 self.conditions = []
                                 for i in range(0,len(self.doc["Boundary"]["Condition"]["Value"])):
-                                    self.conditions.append(condition.ConditionFromFile(self.doc["Boundary"]["Condition"]["Type"][i],self.doc["Boundary"]["Condition"]["File"][i],self.doc["Boundary"]["Condition"]["Value"][i],self.geometry.volumes,self.doc["Boundary"]["Condition"]["Direction"][i],self.doc["Boundary"]["Condition"]["Shape"][i]))
+                                    self.conditions.append(condition.ConditionFromFile(self.doc["Boundary"]["Condition"]["Type"][i],self.doc["Boundary"]["Condition"]["File"][i],self.doc["Boundary"]["Condition"]["Value"][i],self.geometry.volumes,self.doc["Boundary"]["Condition"]["Direction"][i],self.doc["Boundary"]["Condition"]["Shape"][i],self.cache_path))
                             if not "Shape" in self.doc["Boundary"]:
                                 print ("Error: No Shape tag found")
                                 sys.exit(1)
@@ -165,9 +187,54 @@ class PD_deck():
                             else:
                                 print ("Error in deck.py: Material type unknown, please use Elastic or Viscoelastic")
                                 sys.exit(1)
+                            ## Mass density of the material, which is needed by the explicit dynamic solver
+                            self.density = None
+                            if "Density" in self.doc["Material"]:
+                                self.density = float(self.doc["Material"]["Density"])
+                                if self.density <= 0.:
+                                    print ("Error: Density needs to be positive")
+                                    sys.exit(1)
+                            ## Critical stretch of the bonds of the damage model, None if the bonds never break
+                            self.critical_stretch = None
+                            if "Critical_Stretch" in self.doc["Material"]:
+                                if self.material_type != "Elastic":
+                                    print ("Error: The Critical_Stretch is only supported by the Elastic material")
+                                    sys.exit(1)
+                                self.critical_stretch = float(self.doc["Material"]["Critical_Stretch"])
+                                if self.critical_stretch <= 0.:
+                                    print ("Error: Critical_Stretch needs to be positive")
+                                    sys.exit(1)
                         ## List of all outputs specified in the configuration file
                         self.outputs = []
+                        ## Results store writing the fields of all time steps to a HDF5 file
+                        self.results_store = store.ResultsStore()
                         if "Output" in self.doc:
+                            if "Store" in self.doc["Output"]:
+                                if not "File" in self.doc["Output"]["Store"]:
+                                    print ("Error: No File tag found in Store")
+                                    sys.exit(1)
+                                types = store.store_fields
+                                if "Type" in self.doc["Output"]["Store"]:
+                                    types = self.doc["Output"]["Store"]["Type"]
+                                for field in types:
+                                    if field not in store.store_fields:
+                                        print ("Error: Store Type " + str(field) + " unknown, please use Position, Force, External_Force, Extension, Viscoelastic_Extension, Strain_Energy, Damage, Strain or Stress")
+                                        sys.exit(1)
+                                compression = "gzip"
+                                if "Compression" in self.doc["Output"]["Store"]:
+                                    compression = self.doc["Output"]["Store"]["Compression"]
+                                if compression not in ["gzip", "lzf", None]:
+                                    print ("Error: Store Compression unknown, please use gzip, lzf or null")
+                                    sys.exit(1)
+                                level = 4
+                                if "Level" in self.doc["Output"]["Store"]:
+                                    level = int(self.doc["Output"]["Store"]["Level"])
+                                chunk = 4096
+                                if "Chunk" in self.doc["Output"]["Store"]:
+                                    chunk = int(self.doc["Output"]["Store"]["Chunk"])
+                                self.results_store = store.ResultsStore(self.doc["Output"]["Store"]["File"], types, compression, level, chunk)
+                                if self.results_store.store_enabled == False:
+                                    print ("Warning: Store found, but no h5py is found, so there will be no results store written.")
                             if  "CSV" in self.doc["Output"]:
                                 if not "Type" in self.doc["Output"]["CSV"]:
                                     print ("Error: No Type tag found")
@@ -214,16 +281,155 @@ class PD_deck():
                             else:
                                 ## Absolute tolerance of the solver
                                 self.solver_tolerance = float(self.doc["Solver"]["Tolerance"])
-                            if not "Jacobian_Perturbation" in self.doc["Solver"]:
-                                print ("Error: No Jacobian_Perturbation tag in Solver found")
+                            ## Type of the solver, e.g. Newton, Modified_Newton, Broyden, Newton_Krylov, Velocity_Verlet or Dynamic_Relaxation
+                            self.solver_type = "Newton"
+                            if "Type" in self.doc["Solver"]:
+                                self.solver_type = self.doc["Solver"]["Type"]
+                            if self.solver_type not in ["Newton", "Modified_Newton", "Broyden", "Newton_Krylov", "Velocity_Verlet", "Dynamic_Relaxation"]:
+                                print ("Error: Solver Type unknown, please use Newton, Modified_Newton, Broyden, Newton_Krylov, Velocity_Verlet or Dynamic_Relaxation")
                                 sys.exit(1)
+                            ## True for the explicit solvers, which need neither the Jacobian matrix nor linear solves
+                            self.solver_explicit = self.solver_type in ["Velocity_Verlet", "Dynamic_Relaxation"]
+                            if not "Jacobian_Perturbation" in self.doc["Solver"]:
+                                if not self.solver_explicit:
+                                    print ("Error: No Jacobian_Perturbation tag in Solver found")
+                                    sys.exit(1)
+                                self.solver_perturbation = 0.
                             else:
                                 ## Perturbation factor for the Jacobian matrix
                                 self.solver_perturbation = float(self.doc["Solver"]["Jacobian_Perturbation"])
+                            ## Assembly of the Jacobian matrix, e.g. Analytic, Local_Finite_Difference or Finite_Difference
+                            self.solver_jacobian = "Local_Finite_Difference"
+                            if self.material_type == "Elastic":
+                                self.solver_jacobian = "Analytic"
+                            if "Jacobian_Type" in self.doc["Solver"]:
+                                self.solver_jacobian = self.doc["Solver"]["Jacobian_Type"]
+                            if self.solver_jacobian not in ["Analytic", "Local_Finite_Difference", "Finite_Difference"]:
+                                print ("Error: Jacobian_Type unknown, please use Analytic, Local_Finite_Difference or Finite_Difference")
+                                sys.exit(1)
+                            if self.solver_jacobian == "Analytic" and self.material_type != "Elastic":
+                                print ("Error: The Analytic Jacobian_Type is only available for Elastic materials")
+                                sys.exit(1)
+                            if self.solver_type == "Velocity_Verlet" and self.density is None:
+                                print ("Error: The Velocity_Verlet solver needs the Density of the Material")
+                                sys.exit(1)
+                            ## Safety factor of the stable time step of the explicit solvers
+                            self.solver_safety_factor = 0.9
+                            if "Safety_Factor" in self.doc["Solver"]:
+                                self.solver_safety_factor = float(self.doc["Solver"]["Safety_Factor"])
+                            if self.solver_safety_factor <= 0. or self.solver_safety_factor > 1.:
+                                print ("Error: Safety_Factor needs to be between 0 and 1")
+                                sys.exit(1)
+                            ## Krylov method of the matrix-free Newton-Krylov solver, e.g. GMRES or CG
+                            self.solver_krylov_method = "GMRES"
+                            if "Krylov_Method" in self.doc["Solver"]:
+                                self.solver_krylov_method = self.doc["Solver"]["Krylov_Method"]
+                            if self.solver_krylov_method not in ["GMRES", "CG"]:
+                                print ("Error: Krylov_Method unknown, please use GMRES or CG")
+                                sys.exit(1)
+                            ## Relative tolerance of the Krylov method
+                            self.solver_krylov_tolerance = 1.0e-6
+                            if "Krylov_Tolerance" in self.doc["Solver"]:
+                                self.solver_krylov_tolerance = float(self.doc["Solver"]["Krylov_Tolerance"])
+                            ## Maximal amount of iterations of the Krylov method
+                            self.solver_krylov_max_it = 1000
+                            if "Krylov_Max_Iteration" in self.doc["Solver"]:
+                                self.solver_krylov_max_it = int(self.doc["Solver"]["Krylov_Max_Iteration"])
+                            ## Amount of iterations of GMRES between two restarts
+                            self.solver_krylov_restart = 50
+                            if "Krylov_Restart" in self.doc["Solver"]:
+                                self.solver_krylov_restart = int(self.doc["Solver"]["Krylov_Restart"])
+                            ## Maximal amount of iterations using the same factorization of the Jacobian matrix
+                            self.solver_refactorization_interval = 10
+                            if "Refactorization_Interval" in self.doc["Solver"]:
+                                self.solver_refactorization_interval = int(self.doc["Solver"]["Refactorization_Interval"])
+                            ## Ratio of two consecutive residual norms above which the Jacobian matrix is factorized again
+                            self.solver_stagnation_ratio = 0.5
+                            if "Stagnation_Ratio" in self.doc["Solver"]:
+                                self.solver_stagnation_ratio = float(self.doc["Solver"]["Stagnation_Ratio"])
+                            if "Adaptive" in self.doc["Solver"]:
+                                if self.solver_explicit:
+                                    print ("Error: Adaptive is only available for the implicit solvers")
+                                    sys.exit(1)
+                                self.solver_adaptive = True
+                                adaptive = self.doc["Solver"]["Adaptive"]
+                                if adaptive is None:
+                                    adaptive = {}
+                                ## Initial load increment as a fraction of the time step
+                                self.adaptive_initial = 1.
+                                if "Initial_Increment" in adaptive:
+                                    self.adaptive_initial = float(adaptive["Initial_Increment"])
+                                ## Minimal load increment as a fraction of the time step
+                                self.adaptive_min = 1.0e-3
+                                if "Min_Increment" in adaptive:
+                                    self.adaptive_min = float(adaptive["Min_Increment"])
+                                if self.adaptive_min <= 0. or self.adaptive_min > self.adaptive_initial or self.adaptive_initial > 1.:
+                                    print ("Error: The increments of Adaptive need 0 < Min_Increment <= Initial_Increment <= 1")
+                                    sys.exit(1)
+                                ## Amount of iterations of a load increment above which the next load increment is reduced
+                                self.adaptive_target = 4
+                                if "Target_Iterations" in adaptive:
+                                    self.adaptive_target = int(adaptive["Target_Iterations"])
+                                if self.adaptive_target < 1:
+                                    print ("Error: Target_Iterations of Adaptive needs to be at least 1")
+                                    sys.exit(1)
+                                ## Factor of the load increment after a fast convergence
+                                self.adaptive_growth = 2.
+                                if "Growth_Factor" in adaptive:
+                                    self.adaptive_growth = float(adaptive["Growth_Factor"])
+                                if self.adaptive_growth < 1.:
+                                    print ("Error: Growth_Factor of Adaptive needs to be at least 1")
+                                    sys.exit(1)
+                                ## Factor of the load increment after a slow convergence or a failure of the solver
+                                self.adaptive_cut = 0.5
+                                if "Cut_Factor" in adaptive:
+                                    self.adaptive_cut = float(adaptive["Cut_Factor"])
+                                if self.adaptive_cut <= 0. or self.adaptive_cut >= 1.:
+                                    print ("Error: Cut_Factor of Adaptive needs to be between 0 and 1")
+                                    sys.exit(1)
 
                         if "Parallel" in self.doc:
                             if "Threads" in self.doc["Parallel"]:
                                 self.num_threads = int(self.doc["Parallel"]["Threads"])
+                            if "Backend" in self.doc["Parallel"]:
+                                self.backend = self.doc["Parallel"]["Backend"]
+                                if self.backend != "Python" and self.backend != "Numba":
+                                    print ("Error: Backend not known, please use Python or Numba")
+                                    sys.exit(1)
+                                if self.backend == "Numba":
+                                    if kernels.found_numba == False:
+                                        print ("Warning: Numba not found, so the Python backend is used.")
+                                        self.backend = "Python"
+                                    else:
+                                        kernels.set_threads(self.num_threads)
+
+                        if "History" in self.doc:
+                            if "Type" in self.doc["History"]:
+                                self.history_type = self.doc["History"]["Type"]
+                            if self.history_type not in ["Full", "Streaming"]:
+                                print ("Error: History Type unknown, please use Full or Streaming")
+                                sys.exit(1)
+                            if "Path" in self.doc["History"]:
+                                self.history_path = self.doc["History"]["Path"]
+                            if "Interval" in self.doc["History"]:
+                                self.history_interval = int(self.doc["History"]["Interval"])
+                            if "Fields" in self.doc["History"]:
+                                self.history_fields = self.doc["History"]["Fields"]
+                            for field in self.history_fields:
+                                if field not in ["Position", "Force", "External_Force", "Extension", "Viscoelastic_Extension", "Strain_Energy", "Damage", "Strain", "Stress"]:
+                                    print ("Error: History Field " + str(field) + " unknown, please use Position, Force, External_Force, Extension, Viscoelastic_Extension, Strain_Energy, Damage, Strain or Stress")
+                                    sys.exit(1)
+
+                        if "Checkpoint" in self.doc:
+                            if not "File" in self.doc["Checkpoint"]:
+                                print ("Error: No File tag found in Checkpoint")
+                                sys.exit(1)
+                            self.checkpoint_file = self.doc["Checkpoint"]["File"]
+                            if "Interval" in self.doc["Checkpoint"]:
+                                self.checkpoint_interval = int(self.doc["Checkpoint"]["Interval"])
+                            if self.checkpoint_interval < 1:
+                                print ("Error: Checkpoint Interval has to be at least 1")
+                                sys.exit(1)
 
 class DIC_deck():
 
@@ -368,6 +574,8 @@ class DIC_deck():
                         self.time_steps = 2
                         ## Number of threads
                         self.num_threads = 1
+                        ## Backend of the material kernels, Python or Numba
+                        self.backend = "Python"
                         if "Output" in self.doc:
                             if "VTK" in self.doc["Output"]:
                                 if not "Path" in self.doc["Output"]["VTK"]:
@@ -384,6 +592,17 @@ class DIC_deck():
                         if "Parallel" in self.doc:
                             if "Threads" in self.doc["Parallel"]:
                                 self.num_threads = int(self.doc["Parallel"]["Threads"])
+                            if "Backend" in self.doc["Parallel"]:
+                                self.backend = self.doc["Parallel"]["Backend"]
+                                if self.backend != "Python" and self.backend != "Numba":
+                                    print ("Error: Backend not known, please use Python or Numba")
+                                    sys.exit(1)
+                                if self.backend == "Numba":
+                                    if kernels.found_numba == False:
+                                        print ("Warning: Numba not found, so the Python backend is used.")
+                                        self.backend = "Python"
+                                    else:
+                                        kernels.set_threads(self.num_threads)
                                 
                         if "Energy" in self.doc:
                             if not "Measured Energy" in self.doc["Energy"]:
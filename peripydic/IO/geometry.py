@@ -4,84 +4,78 @@
 #@author: patrickdiehl@lsu.edu
 import numpy as np
 from numpy import linalg
-import csv
+import scipy.spatial
 import os
 import sys
+from . import loader
 
 ## Class handeling the discrete nodes
 class Geometry():
 
     ## Read the positions, volume, and density of the nodes from the inFile.
+    # The inFile is a CSV file with spaces as delimiter and the columns id, positions and volume, a NPY file with the same columns,
+    # or a NPZ or HDF5 file with the arrays "nodes" and "volumes"
     # @param dim Dimension of the nodes
-    # @param inFile CSV file with the geometry
-    def readNodes(self,dim,inFile):
+    # @param inFile File with the geometry
+    # @param cache_path Directory of the binary cache of a CSV file, None to read it without a cache
+    def readNodes(self,dim,inFile,cache_path=None):
 
         if not os.path.exists(inFile):
                 print ("Error: Could not find " + inFile)
                 sys.exit(1)
         ##Dimension of the problem
         self.dim = dim
-        with open(inFile, 'r') as csvfile:
-            spamreader = csv.reader(csvfile, delimiter=' ')
-            #Skip the first line, because is the header
-            next(spamreader)
-            length = len(list(spamreader))
-            csvfile.seek(0)
-            next(spamreader)
 
-            ## Amount of nodes
-            self.amount = length
-            ## Volume related to each node
-            self.volumes = np.empty(length,dtype=np.float64)
+        extension = os.path.splitext(inFile)[1].lower()
+        if extension in [".npz", ".h5", ".hdf5"]:
+            nodes, volumes = loader.read_binary(inFile, ["nodes", "volumes"])
+            nodes = np.asarray(nodes).reshape(len(volumes), -1)[:, 0:dim]
+        else:
+            # The columns are the id, the positions and the volume
+            if extension == ".npy":
+                data = loader.read_binary(inFile, ["nodes"])[0][:, 1:dim+2]
+            else:
+                data = loader.read_csv(inFile, range(1, dim + 2), cache_path)
+            nodes = data[:, 0:dim]
+            volumes = data[:, dim]
 
-            if dim >= 1:
-                pos_x = np.empty(length,dtype=np.float64)
-            if dim >= 2:
-                pos_y = np.empty(length,dtype=np.float64)
-            if dim >= 3:
-                pos_z = np.empty(length,dtype=np.float64)
+        ## Amount of nodes
+        self.amount = len(volumes)
+        ## Volume related to each node
+        self.volumes = np.ascontiguousarray(volumes, dtype=np.float64)
+        ## Nodes of the discretization
+        self.nodes = np.ascontiguousarray(nodes, dtype=np.float64)
+        ## KD-tree of the nodes, which is built once for the nodal spacing and the neighbor search
+        self.tree = scipy.spatial.cKDTree(self.nodes)
+        ## Distances of each node to its nearest nodes
+        self.distances = None
 
-            i = 0
+    ## Provide the KD-tree of the nodes read by readNodes, which is shared with the neighbor search
+    # @return KD-tree of the nodes
+    def getTree(self):
+        return self.tree
 
-            for row in spamreader:
-                if dim >= 1:
-                    pos_x[i] = np.array(np.array(row[1]),dtype=np.float64)
-                if dim >= 2:
-                    pos_y[i] = np.array(np.array(row[2]),dtype=np.float64)
-                if dim >= 3:
-                    pos_z[i] = np.array(np.array(row[3]),dtype=np.float64)
+    ## Provide the distances of each node to its k nearest nodes
+    # @param k Amount of nearest nodes
+    # @return Distances of each node to its k nearest nodes in ascending order, inf if there are less than k other nodes
+    def getNearestDistances(self, k=1):
+        tree = self.getTree()
+        if self.distances is None or self.distances.shape[1] < k:
+            d, ids = tree.query(self.nodes, k=k+1, p=2, eps=0.0)
+            # The nearest node of each node is itself
+            self.distances = d[:, 1:]
+        return self.distances[:, 0:k]
 
-                self.volumes[i] = np.array(np.array(row[dim + 1]),dtype=np.float64)
-                i +=1
-
-            ## Nodes of the discretization
-            self.nodes = np.empty((len(pos_x),dim),dtype=np.float64)
-            if dim == 1:
-                self.nodes[:,0] = pos_x
-                del pos_x
-            if dim == 2:
-                self.nodes[:,0] = pos_x
-                self.nodes[:,1] = pos_y
-                del pos_x
-                del pos_y
-            if dim >= 3:
-                self.nodes[:,0] = pos_x
-                self.nodes[:,1] = pos_y
-                self.nodes[:,2] = pos_z
-                del pos_x
-                del pos_y
-                del pos_z
+    ## Provide the spacing statistics of each node
+    # @param k Amount of nearest nodes
+    # @return Distance to the nearest node, mean and maximal distance to the k nearest nodes of each node
+    def getSpacing(self, k=1):
+        d = self.getNearestDistances(k)
+        return d[:, 0], np.mean(d, axis=1), d[:, k-1]
 
     ## Computes the minimal distance between all nodes
     # @return Minimal distance
     def getMinDist(self):
-        tmp = float('inf')
-        for i in range(0,self.amount):
-            for j in range(0,self.amount):
-                if i != j:
-                    #if dim == 1:
-                    val = np.linalg.norm(self.nodes[i,:]-self.nodes[j,:])
-                    if val < tmp:
-
-                        tmp = val
-        return tmp
+        if self.amount < 2:
+            return float('inf')
+        return float(np.min(self.getNearestDistances(1)))
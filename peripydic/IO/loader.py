@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+#@author: ilyass.tabiai@polymtl.ca
+#@author: rolland.delorme@polymtl.ca
+#@author: patrickdiehl@lsu.edu
+import numpy as np
+import hashlib
+import os
+import sys
+
+import pkgutil
+h5py_loader = pkgutil.find_loader('h5py')
+found_h5py = h5py_loader is not None
+if found_h5py == True:
+    import h5py
+
+## Extensions of the binary files
+binary_extensions = [".npy", ".npz", ".h5", ".hdf5"]
+
+## Check if a file is a binary file (NPY, NPZ or HDF5)
+# @param inFile Path to the file
+# @return True if the file is a binary file
+def is_binary(inFile):
+    return os.path.splitext(inFile)[1].lower() in binary_extensions
+
+## Provide the path of the binary cache of a CSV file in the cache directory
+# The name of the cache contains the hash of the absolute path of the CSV file, so CSV files of the same name do not share a cache
+# @param inFile Path to the CSV file
+# @param cache_path Directory of the binary caches
+# @return Path to the binary cache
+def get_cache_path(inFile, cache_path):
+    key = hashlib.sha1(os.path.abspath(inFile).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(os.path.expanduser(cache_path), os.path.basename(inFile) + "." + key + ".npz")
+
+## Compute the hash of a file
+# @param inFile Path to the file
+# @return SHA-1 hash of the content of the file
+def get_file_hash(inFile):
+    sha = hashlib.sha1()
+    with open(inFile, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+## Read columns of a CSV file with spaces as delimiter and a header line
+# With a cache directory, the columns are cached in a binary file, which is used as long as the modification time and the size, or else the hash,
+# of the CSV file match
+# @param inFile Path to the CSV file
+# @param columns Ids of the read columns
+# @param cache_path Directory of the binary caches, None to read the CSV file without a cache
+# @return Array with a row for each line and the read columns
+def read_csv(inFile, columns, cache_path=None):
+    columns = np.asarray(columns, dtype=int)
+    if cache_path is None:
+        return np.loadtxt(inFile, dtype=np.float64, comments=None, skiprows=1, usecols=columns, ndmin=2)
+    stat = os.stat(inFile)
+    cache = get_cache_path(inFile, cache_path)
+    file_hash = None
+
+    if os.path.exists(cache):
+        try:
+            with np.load(cache) as data:
+                if np.array_equal(data["columns"], columns):
+                    if data["mtime"] == stat.st_mtime_ns and data["size"] == stat.st_size:
+                        return np.array(data["values"])
+                    # The file was touched, its content is compared
+                    file_hash = get_file_hash(inFile)
+                    if str(data["hash"]) == file_hash:
+                        values = np.array(data["values"])
+                        write_cache(cache, columns, stat, file_hash, values)
+                        return values
+        except (OSError, KeyError, ValueError):
+            pass
+
+    values = np.loadtxt(inFile, dtype=np.float64, comments=None, skiprows=1, usecols=columns, ndmin=2)
+    if file_hash is None:
+        file_hash = get_file_hash(inFile)
+    write_cache(cache, columns, stat, file_hash, values)
+    return values
+
+## Write the binary cache of a CSV file, a cache which can not be written, e.g. in a read-only directory, is skipped
+# @param cache Path to the binary cache
+# @param columns Ids of the read columns
+# @param stat Status of the CSV file
+# @param file_hash Hash of the CSV file
+# @param values Read columns
+def write_cache(cache, columns, stat, file_hash, values):
+    # The cache is written to a temporary file first, so a cache is never read partially written
+    tmp = cache + ".tmp.npz"
+    try:
+        directory = os.path.dirname(cache)
+        if directory != "" and not os.path.exists(directory):
+            os.makedirs(directory)
+        np.savez(tmp, columns=columns, mtime=stat.st_mtime_ns, size=stat.st_size, hash=file_hash, values=values)
+        os.replace(tmp, cache)
+    except OSError:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+## Read arrays from a binary file
+# A NPY file stores a single array, which is provided for each name, and NPZ and HDF5 files store an array for each name
+# @param inFile Path to the binary file
+# @param names Names of the read arrays
+# @return List of the read arrays
+def read_binary(inFile, names):
+    extension = os.path.splitext(inFile)[1].lower()
+    if extension == ".npy":
+        data = np.load(inFile)
+        return [data for name in names]
+
+    if extension == ".npz":
+        with np.load(inFile) as data:
+            for name in names:
+                if not name in data:
+                    print ("Error: No array " + name + " found in " + inFile)
+                    sys.exit(1)
+            return [np.array(data[name]) for name in names]
+
+    if found_h5py == False:
+        print ("Error: h5py is needed to read " + inFile)
+        sys.exit(1)
+    with h5py.File(inFile, 'r') as data:
+        for name in names:
+            if not name in data:
+                print ("Error: No dataset " + name + " found in " + inFile)
+                sys.exit(1)
+        return [np.array(data[name]) for name in names]
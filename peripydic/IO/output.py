@@ -32,16 +32,21 @@ class OutputCSV():
                 for i in range(0, deck.dim):
                     header.append(pos[i])
                 spamwriter.writerow(header)
-                for t in range(0, deck.time_steps):
+                steps = range(0, deck.time_steps)
+                # Only the time steps available in a streamed history are written
+                if hasattr(problem, "get_time_steps"):
+                    steps = problem.get_time_steps(deck)
+                for t in steps:
                     s = [t]
+                    y = problem.y[:,:,t]
                     for i in range(0,deck.num_nodes):
                         s.append(i)
                         if deck.dim >= 1:
-                            s.append(problem.y[i][0][t])
+                            s.append(y[i][0])
                         if deck.dim >= 2:
-                            s.append(problem.y[i][1][t])
+                            s.append(y[i][1])
                         if deck.dim >= 3:
-                            s.append(problem.y[i][2][t])
+                            s.append(y[i][2])
                         spamwriter.writerow(s)
                         s = [t]
 
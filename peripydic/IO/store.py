@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+#@author: ilyass.tabiai@polymtl.ca
+#@author: rolland.delorme@polymtl.ca
+#@author: patrickdiehl@lsu.edu
+import numpy as np
+import yaml
+import sys
+import os
+
+import pkgutil
+h5py_loader = pkgutil.find_loader('h5py')
+found_h5py = h5py_loader is not None
+if found_h5py == True:
+    import h5py
+
+## Fields of the results store
+store_fields = ["Position", "Force", "External_Force", "Extension", "Viscoelastic_Extension", "Strain_Energy", "Damage", "Strain", "Stress"]
+
+## Fields of the results store with a value for each bond instead of each node
+bond_fields = ["Extension", "Viscoelastic_Extension"]
+
+## Class handles the output of the simulation results to a single chunked and compressed HDF5 file
+# Each field is a dataset whose first axis is the time step and second axis the node, or the bond for the extension states,
+# and which is chunked by time step and node range, so a time step or a node range is read without reading the whole simulation.
+# The time steps are appended during the simulation and the dataset "Time_Steps" marks the time steps written.
+class ResultsStore():
+
+    ## Constructor
+    # @param inFile The HDF5 file where the results are written
+    # @param types The fields written to the file
+    # @param compression Compression filter of the datasets, gzip, lzf or None
+    # @param level Level of the gzip compression
+    # @param chunk Amount of nodes of a chunk
+    def __init__(self, inFile="", types=store_fields, compression="gzip", level=4, chunk=4096):
+        ## Is the results store enabled
+        self.store_enabled = inFile != "" and found_h5py == True
+        ## Filename for the HDF5 file
+        self.inFile = inFile
+        ## Fields written to the file
+        self.types = list(types)
+        ## Compression filter of the datasets
+        self.compression = compression
+        ## Options of the compression filter
+        self.level = None
+        if compression == "gzip":
+            self.level = int(level)
+        ## Amount of nodes of a chunk
+        self.chunk = max(1, int(chunk))
+        ## Opened HDF5 file
+        self.data = None
+
+    ## Create the HDF5 file with the metadata of the simulation and the datasets of the fields
+    # A problem restarted from a checkpoint appends to the HDF5 file written before the checkpoint
+    # @param deck The deck with the input from the yaml file
+    # @param problem The problem contains the simulation results
+    # @param t_n Id of the time step of the checkpoint, 0 if the problem is not restarted
+    def create(self, deck, problem, t_n=0):
+        if self.store_enabled == False:
+            return
+        self.close()
+        if t_n > 0:
+            if os.path.exists(self.inFile):
+                self.data = h5py.File(self.inFile, 'r+')
+                if self.data.attrs["Num_Nodes"] == deck.num_nodes and self.data.attrs["Time_Steps"] == deck.time_steps:
+                    self.data["Time_Steps"][t_n+1:] = False
+                    self.append(deck, problem, t_n)
+                    return
+                self.close()
+            print ("Warning: No results store " + self.inFile + " matching the checkpoint is found, so the time steps before the checkpoint are not written.")
+        self.data = h5py.File(self.inFile, 'w')
+
+        # Metadata of the simulation
+        self.data.attrs["Deck"] = yaml.dump(deck.doc)
+        self.data.attrs["Dimension"] = deck.dim
+        self.data.attrs["Num_Nodes"] = deck.num_nodes
+        self.data.attrs["Time_Steps"] = deck.time_steps
+        self.data.attrs["Delta_t"] = deck.delta_t
+        self.data.attrs["Material"] = deck.material_type
+        self.data.attrs["Horizon"] = problem.neighbors.horizon
+        bonds = problem.neighbors.get_bonds(deck)
+        self.data.create_dataset("Nodes", data=deck.geometry.nodes)
+        self.data.create_dataset("Volumes", data=deck.geometry.volumes)
+        # The families locate the bonds of a node range in the datasets of the extension states
+        self.data.create_dataset("Offsets", data=bonds.offsets)
+        self.data.create_dataset("Families", data=bonds.p)
+        self.data.create_dataset("Time_Steps", data=np.zeros(deck.time_steps, dtype=bool))
+
+        shapes = {
+            "Position": (deck.num_nodes, deck.dim),
+            "Force": (deck.num_nodes, deck.dim),
+            "External_Force": (deck.num_nodes, deck.dim),
+            "Extension": (bonds.num_bonds,),
+            "Strain_Energy": (deck.num_nodes,),
+            "Strain": (deck.num_nodes, deck.dim, deck.dim),
+            "Stress": (deck.num_nodes, deck.dim, deck.dim)
+        }
+        if deck.material_type == "Viscoelastic":
+            shapes["Viscoelastic_Extension"] = (bonds.num_bonds, len(deck.relax_time))
+        if deck.critical_stretch is not None:
+            shapes["Damage"] = (deck.num_nodes,)
+        # The bonds of a chunk are the bonds of about the amount of nodes of a chunk
+        bonds_per_node = int(np.ceil(bonds.num_bonds / float(max(1, deck.num_nodes))))
+        for name in self.types:
+            if not name in shapes:
+                continue
+            shape = shapes[name]
+            rows = self.chunk
+            if name in bond_fields:
+                rows = self.chunk * max(1, bonds_per_node)
+            chunks = (1, max(1, min(shape[0], rows))) + shape[1:]
+            self.data.create_dataset(name, shape=(deck.time_steps,) + shape, dtype=np.float64, chunks=chunks, compression=self.compression, compression_opts=self.level, shuffle=self.compression is not None)
+        self.append(deck, problem, t_n)
+
+    ## Append a time step of the fields of the problem to the HDF5 file
+    # @param deck The deck with the input from the yaml file
+    # @param problem The problem contains the simulation results
+    # @param t_n Id of the time step
+    def append(self, deck, problem, t_n):
+        if self.data is None:
+            return
+        fields = {
+            "Position": problem.y,
+            "Force": problem.force_int,
+            "External_Force": problem.b,
+            "Extension": problem.ext,
+            "Strain_Energy": problem.strain_energy
+        }
+        if deck.material_type == "Viscoelastic":
+            fields["Viscoelastic_Extension"] = problem.ext_visco
+        if deck.critical_stretch is not None:
+            fields["Damage"] = problem.damage
+        for name in fields:
+            if name in self.data:
+                history = fields[name]
+                self.data[name][t_n] = history[(slice(None),) * (len(self.data[name].shape) - 1) + (t_n,)]
+        self.data["Time_Steps"][t_n] = True
+        self.data.flush()
+
+    ## Write a time step of a tensor computed by the CCM to the HDF5 file
+    # @param deck The deck with the input from the yaml file
+    # @param name Name of the tensor, Strain or Stress
+    # @param tensor Tensor of each node stored in a (num_nodes * dim, dim) array
+    # @param t_n Id of the time step
+    def write_tensor(self, deck, name, tensor, t_n):
+        if self.data is None or not name in self.data:
+            return
+        self.data[name][t_n] = np.reshape(tensor, (deck.num_nodes, deck.dim, deck.dim))
+
+    ## Close the HDF5 file
+    def close(self):
+        if self.data is not None:
+            self.data.close()
+            self.data = None
+
+## Read a field from a results store
+# @param inFile The HDF5 file of the results store
+# @param name Name of the field
+# @param time_steps Id or slice of the read time steps
+# @param nodes Id or slice of the read nodes, the bonds of these nodes for the extension states
+# @return Array whose first axis is the time step, if a slice of time steps is read, and second axis the node or the bond
+def read_results(inFile, name, time_steps=slice(None), nodes=slice(None)):
+    if found_h5py == False:
+        print ("Error: h5py is needed to read " + inFile)
+        sys.exit(1)
+    with h5py.File(inFile, 'r') as data:
+        if not name in data:
+            print ("Error: No field " + name + " found in " + inFile)
+            sys.exit(1)
+        if name in bond_fields:
+            offsets = np.array(data["Offsets"])
+            if isinstance(nodes, slice):
+                start, stop, step = nodes.indices(len(offsets) - 1)
+                if step != 1:
+                    print ("Error: The bonds of a node range with a step are not read")
+                    sys.exit(1)
+                stop = max(start, stop)
+            else:
+                start, stop = int(nodes), int(nodes) + 1
+            nodes = slice(offsets[start], offsets[stop])
+        return np.array(data[name][time_steps, nodes])
@@ -35,21 +35,25 @@ class vtk_writer():
         # @param ccm_class The results from the computation from ccm
         def write_data(self,deck,problem,ccm_class):
             num_nodes = deck.num_nodes
-            for t in range(0,deck.time_steps,self.slice_length):
+            steps = range(0,deck.time_steps,self.slice_length)
+            # Only the time steps available in a streamed history are written
+            if hasattr(problem, "get_time_steps"):
+                steps = [t for t in steps if t in problem.get_time_steps(deck)]
+            for t in steps:
                 writer = vtk.vtkXMLUnstructuredGridWriter()
                 writer.SetFileName(self.path+"output_"+str(t)+".vtu")
                 grid = vtk.vtkUnstructuredGrid()
                 points = vtk.vtkPoints()
                 points.SetNumberOfPoints(num_nodes)
                 points.SetDataTypeToDouble()
+                act = problem.y[:,:,t]
                 for i in range(0,num_nodes):
-                    act = problem.y
                     if deck.dim == 1:
-                        points.InsertPoint(i,act[i][0][t],0.,0.)
+                        points.InsertPoint(i,act[i][0],0.,0.)
                     if deck.dim == 2:
-                        points.InsertPoint(i,act[i][0][t],act[i][1][t],0.)
+                        points.InsertPoint(i,act[i][0],act[i][1],0.)
                     if deck.dim == 3:
-                        points.InsertPoint(i,act[i][0][t],act[i][1][t],act[i][2][t])
+                        points.InsertPoint(i,act[i][0],act[i][1],act[i][2])
                     grid.SetPoints(points)
 
                 dataOut = grid.GetPointData()
@@ -62,13 +66,13 @@ class vtk_writer():
                         array.SetNumberOfComponents(deck.dim)
                         array.SetNumberOfTuples(num_nodes)
 
-                        act = problem.y
+                        act = problem.y[:,:,t]
 
                         for i in range(num_nodes):
                             if deck.dim == 1:
-                                array.SetTuple1(i,act[i][0][t] - deck.geometry.nodes[i][0])
+                                array.SetTuple1(i,act[i][0] - deck.geometry.nodes[i][0])
                             if deck.dim == 2:
-                                array.SetTuple2(i,act[i][0][t] - deck.geometry.nodes[i][0],act[i][1][t] - deck.geometry.nodes[i][1])
+                                array.SetTuple2(i,act[i][0] - deck.geometry.nodes[i][0],act[i][1] - deck.geometry.nodes[i][1])
                                 array.SetComponentName(0,"d_x")
                                 array.SetComponentName(1,"d_y")
                             dataOut.AddArray(array)
@@ -89,13 +93,13 @@ class vtk_writer():
                         array.SetNumberOfComponents(deck.dim)
                         array.SetNumberOfTuples(num_nodes)
 
-                        force = problem.force_int
+                        force = problem.force_int[:,:,t]
                         #print force
                         for i in range(num_nodes):
                             if deck.dim == 1:
-                                array.SetTuple1(i,force[i][0][t])
+                                array.SetTuple1(i,force[i][0])
                             if deck.dim == 2:
-                                array.SetTuple2(i,force[i][0][t], force[i][1][t])
+                                array.SetTuple2(i,force[i][0], force[i][1])
                                 array.SetComponentName(0,"f_x")
                                 array.SetComponentName(1,"f_y")
                             dataOut.AddArray(array)
@@ -117,7 +121,7 @@ class vtk_writer():
 
                     if out_type == "Volume_Force":
 
-                        force = problem.force_int
+                        force = problem.force_int[:,:,t]
                         for con in deck.conditions:
                             if con.type == "Force":
                                 result_x = 0.
@@ -127,13 +131,13 @@ class vtk_writer():
                                     index = int(i)
 
                                     if deck.dim >=1:
-                                        result_x += force[index][0][t] * deck.geometry.volumes[index]
+                                        result_x += force[index][0] * deck.geometry.volumes[index]
                                     if deck.dim >= 2:
-                                        result_y += force[index][1][t] * deck.geometry.volumes[index]
+                                        result_y += force[index][1] * deck.geometry.volumes[index]
                                         array.SetComponentName(0,"f_x")
                                         array.SetComponentName(1,"f_y")
                                     if deck.dim >= 3:
-                                        result_z += force[index][2][t] * deck.geometry.volumes[index]
+                                        result_z += force[index][2] * deck.geometry.volumes[index]
                                         array.SetComponentName(2,"f_z")
 
                                 array = vtk.vtkDoubleArray()
@@ -170,7 +174,7 @@ class vtk_writer():
                             array.SetNumberOfComponents(6)
                         array.SetNumberOfTuples(num_nodes)
 
-                        strain = ccm_class.global_strain[:,:,1]
+                        strain = ccm_class.global_strain[:,:,t]
 
                         for i in range(num_nodes):
                             if deck.dim ==1:
@@ -211,7 +215,7 @@ class vtk_writer():
                             array.SetNumberOfComponents(6)
                         array.SetNumberOfTuples(num_nodes)
 
-                        stress = ccm_class.global_stress[:,:,1]
+                        stress = ccm_class.global_stress[:,:,t]
 
                         for i in range(num_nodes):
                             if deck.dim ==1:
@@ -263,7 +267,7 @@ class vtk_writer():
                         array.SetNumberOfComponents(3)
                         array.SetNumberOfTuples(num_nodes)
 
-                        strain = ccm_class.global_strain[:,:,1]
+                        strain = ccm_class.global_strain[:,:,t]
 
                         for i in range(num_nodes):
                             xx = abs(deck.geometry.strain[i][0] - strain[i*deck.dim,0])
@@ -281,13 +285,26 @@ class vtk_writer():
                         array.SetNumberOfComponents(1)
                         array.SetNumberOfTuples(num_nodes)
                         
-                        strain_energy = problem.strain_energy
+                        strain_energy = problem.strain_energy[:,t]
                         
                         for i in range(num_nodes):
                             array.SetTuple1(i,strain_energy[i])
                         
                         dataOut.AddArray(array)   
 
+                    if out_type == "Damage" and deck.critical_stretch is not None:
+                        array = vtk.vtkDoubleArray()
+                        array.SetName("Damage")
+                        array.SetNumberOfComponents(1)
+                        array.SetNumberOfTuples(num_nodes)
+
+                        damage = problem.damage[:,t]
+
+                        for i in range(num_nodes):
+                            array.SetTuple1(i,damage[i])
+
+                        dataOut.AddArray(array)
+
                     if out_type == "Volume":
                         array = vtk.vtkDoubleArray()
                         array.SetName("Volume")
@@ -4,10 +4,8 @@
 #@author: patrickdiehl@lsu.edu
 import numpy as np
 from scipy import linalg
-from multiprocessing import Process, Lock
-import sharedmem
-from ..util import linalgebra
-from ..util import functions
+from ..util import workers
+from . import kernels
 
 
 ## Class to compute the global internal volumic force at each node of an elastic material using its material properties
@@ -17,8 +15,34 @@ class Elastic_material():
     # @param deck The input deck
     # @param data_solver Data from the peridynamic problem/solving class
     # @param y Actual nodes' position
-    def __init__(self, deck, data_solver, y):
+    # @param ids Ids of the nodes whose family is evaluated, all nodes if None
+    # @param forces_only True if the strain energy density is not computed, e.g. for trial states of the solver
+    # @param buffers Work buffers reused for the arrays of the material, None to allocate them
+    def __init__(self, deck, data_solver, y, ids=None, forces_only=False, buffers=None):
 
+        if ids is None:
+            ids = np.arange(deck.num_nodes)
+        ## Ids of the nodes whose family is evaluated
+        self.ids = np.asarray(ids, dtype=int)
+        ## Work buffers reused for the arrays of the material
+        self.work_buffers = buffers
+
+        self.set_parameters(deck, data_solver)
+
+        ## Compute the dilatation for each node
+        self.compute_dilatation(deck, data_solver, y)
+
+        ## Compute the global internal force density at each node
+        self.compute_f_int(deck, data_solver, y)
+
+        if not forces_only:
+            ## Compute the strain energy density at each node
+            self.compute_strain_energy(deck, data_solver)
+
+    ## Set the parameters of the material, which are the only data needed by the kernels evaluated by a worker pool
+    # @param deck The input deck
+    # @param data_solver Data from the peridynamic problem/solving class
+    def set_parameters(self, deck, data_solver):
         ## Weighted volume
         self.Weighted_Volume = data_solver.weighted_volume
 
@@ -45,214 +69,343 @@ class Elastic_material():
                     ## Plane strain
                     self.factor2d = 1
 
-        ## Compute the dilatation for each node
-        self.compute_dilatation(deck, data_solver, y)
-
-        ## Compute the global internal force density at each node
-        self.compute_f_int(deck, data_solver, y)
-
-        ## Compute the strain energy density at each node
-        self.compute_strain_energy(deck, data_solver)
+    ## Provide the influence function of some bonds, which is zero for the bonds broken by the damage model of the problem
+    # @param deck The input deck
+    # @param data_solver Data from the peridynamic problem/solving class
+    # @param b Positions of the bonds in the flat bond arrays
+    # @return Influence function of the bonds
+    def get_influence(self, deck, data_solver, b):
+        influence = getattr(data_solver, "bond_influence", None)
+        if influence is None:
+            return data_solver.neighbors.get_bonds(deck).w[b]
+        return influence[b]
 
     ## Compute the dilatation for each node
     # @param deck The input deck
     # @param data_solver Data from the peridynamic problem/solving class
     # @param y The actual nodes' position
-    # @param start Starting Id of the loop
-    # @param end Ending Id of the loop
+    # @param start Starting position of the loop in the evaluated ids
+    # @param end Ending position of the loop in the evaluated ids
     def compute_dilatation_slice(self, deck, data_solver, y, start, end):
-        for i in range(start, end):
-            index_x_family = data_solver.neighbors.get_index_x_family(i)
-            n = 0
-            for p in index_x_family:
-                Y = (y[p,:]) - y[i,:]
-                X = deck.geometry.nodes[p,:] - deck.geometry.nodes[i,:]
-                self.e[i,n] = linalgebra.norm(Y) - linalgebra.norm(X)
-
-                if deck.dim == 1:
-                    self.dilatation[i] += (1. / self.Weighted_Volume[i]) * functions.w(data_solver, X, deck.influence_function) * linalgebra.norm(X) * self.e[i,n] * self.Volume_Correction[i,n] * deck.geometry.volumes[p]
+        bonds = data_solver.neighbors.get_bonds(deck)
+        ids = self.ids[start:end]
+        b = bonds.get_bonds(ids)
+        i = bonds.i[b]
+        Y, norm_Y = bonds.get_actual_bonds(y, b)
+        e = norm_Y - bonds.norm_X[b]
+        self.e[b] = e
 
-                if deck.dim == 2:
-                    self.dilatation[i] += (2. / self.Weighted_Volume[i]) * self.factor2d * functions.w(data_solver, X, deck.influence_function) * linalgebra.norm(X) * self.e[i,n] * self.Volume_Correction[i,n] * deck.geometry.volumes[p]
+        self.dilatation[ids] = np.bincount(bonds.get_bond_owners(ids), weights=self.get_dilatation_factor(deck, i) * self.get_influence(deck, data_solver, b) * bonds.norm_X[b] * e * bonds.c_p[b], minlength=len(ids))
 
-                if deck.dim == 3:
-                    self.dilatation[i] += (3. / self.Weighted_Volume[i]) * functions.w(data_solver, X, deck.influence_function) * linalgebra.norm(X) * self.e[i,n] * self.Volume_Correction[i,n] * deck.geometry.volumes[p]
-                n += 1
+    ## Provide the factor of the dilatation of some nodes
+    # @param deck The input deck
+    # @param i Ids of the nodes
+    # @return Factor of the weighted sum of the extensions
+    def get_dilatation_factor(self, deck, i):
+        if deck.dim == 1:
+            return 1. / self.Weighted_Volume[i]
+        if deck.dim == 2:
+            return (2. / self.Weighted_Volume[i]) * self.factor2d
+        if deck.dim == 3:
+            return 3. / self.Weighted_Volume[i]
 
     ## Compute the dilatation and and also the scalar extension state for each node
     # @param deck The input deck
     # @param data_solver Data from the peridynamic problem/solving class
     # @param y The actual nodes' position
     def compute_dilatation(self, deck, data_solver, y):
-        ## Dilatation at each node
-        self.dilatation = sharedmem.empty((deck.num_nodes),dtype=np.float64)
-        ## Extension between Node "i" and Node "p" within its family
-        self.e = sharedmem.empty((deck.num_nodes, data_solver.neighbors.max_neighbors),dtype=np.float64)
-
-        threads = deck.num_threads
-        part = int(deck.num_nodes/threads)
-
-        processes = []
+        if deck.backend == "Numba":
+            bonds = data_solver.neighbors.get_bonds(deck)
+            ## Dilatation at each node
+            self.dilatation = workers.get_buffer(self, "dilatation", (deck.num_nodes))
+            ## Extension of each bond between Node "i" and Node "p" within its family
+            self.e = workers.get_buffer(self, "e", (bonds.num_bonds))
+            factor = self.get_dilatation_factor(deck, np.arange(deck.num_nodes))
+            kernels.compute_dilatation(self.ids, bonds.offsets, bonds.p, bonds.norm_X, self.get_influence(deck, data_solver, slice(None)), bonds.c_p, np.ascontiguousarray(y, dtype=np.float64), factor, self.e, self.dilatation)
+        else:
+            # The dilatation at each node and the extension of each bond between Node "i" and Node "p" within its family are stored in dilatation and e
+            workers.run_kernel(deck, data_solver, self, "compute_dilatation_slice", y, results={"dilatation": (deck.num_nodes), "e": (data_solver.neighbors.get_bonds(deck).num_bonds)})
+
+    ## Provide the PD material parameters of some nodes
+    # @param deck The input deck
+    # @param i Ids of the nodes
+    # @return The parameter alpha in 1D, the parameters alpha_s and alpha_d otherwise
+    def get_material_parameters(self, deck, i):
+        if deck.dim == 1:
+            return self.Young_Modulus / self.Weighted_Volume[i], None
 
-        for i in range(0,threads):
-            start = i * part
-            if i < threads - 1:
-                end = (i+1) * part
-            else:
-                end = deck.num_nodes
-            processes.append(Process(target=self.compute_dilatation_slice, args=(deck, data_solver, y, start, end)))
-            processes[i].start()
+        if deck.dim == 2:
+            if deck.type2d == "Plane_Stress":
+                alpha_s = (9. / self.Weighted_Volume[i]) * (self.K + ((self.Nu + 1.)/(2. * self.Nu - 1.))**2 * self.Mu / 9.)
+            if deck.type2d == "Plane_Strain":
+                alpha_s = (9. / self.Weighted_Volume[i]) * (self.K + self.Mu / 9.)
+            alpha_d = (8. / self.Weighted_Volume[i]) * self.Mu
+            return alpha_s, alpha_d
 
-        for p in processes:
-            p.join()
+        if deck.dim == 3:
+            alpha_s = (9. / self.Weighted_Volume[i]) * self.K
+            alpha_d = (15. / self.Weighted_Volume[i]) * self.Mu
+            return alpha_s, alpha_d
 
     ## Compute the global internal force density at each node
     # @param deck The input deck
     # @param data_solver Data from the peridynamic problem/solving class
     # @param y The actual nodes' position
-    # @param start Starting Id of the loop
-    # @param end Ending Id of the loop
-    def compute_f_int_slice(self, deck, data_solver, y, start, end, data):
-        for i in range(start, end):
-            index_x_family = data_solver.neighbors.get_index_x_family(i)
-            n = 0
-            for p in index_x_family:
-                Y = y[p,:] - y[i,:]
-                X = deck.geometry.nodes[p,:] - deck.geometry.nodes[i,:]
-
-                # Compute the direction vector between Node_p and Node_i
-                M = Y / linalgebra.norm(Y)
-
-                if deck.dim == 1:
-                    # PD material parameter
-                    alpha = self.Young_Modulus / self.Weighted_Volume[i]
-                    ## Scalar force state
-                    self.t = alpha * functions.w(data_solver, X, deck.influence_function) * self.e[i,n]
-
-                if deck.dim == 2:
-                    # PD material parameter
-                    if deck.type2d == "Plane_Stress":
-                        alpha_s = (9. / self.Weighted_Volume[i]) * (self.K + ((self.Nu + 1.)/(2. * self.Nu - 1.))**2 * self.Mu / 9.)
-                    if deck.type2d == "Plane_Strain":
-                        alpha_s = (9. / self.Weighted_Volume[i]) * (self.K + self.Mu / 9.)
-
-                    alpha_d = (8. / self.Weighted_Volume[i]) * self.Mu
-                    # Scalar extension states
-                    e_s = self.dilatation[i] * linalgebra.norm(X) / 3.
-                    e_d = self.e[i,n] - e_s
-                    # Scalar force states
-                    t_s = (2. * self.factor2d * alpha_s - (3. - 2. * self.factor2d) * alpha_d) * functions.w(data_solver, X, deck.influence_function) * e_s / 3.
-                    t_d = alpha_d * functions.w(data_solver, X, deck.influence_function) * e_d
-                    self.t = t_s + t_d
-
-                if deck.dim == 3:
-                    # PD material parameter
-                    alpha_s = (9. / self.Weighted_Volume[i]) * self.K
-                    alpha_d = (15. / self.Weighted_Volume[i]) * self.Mu
-                    # Scalar extension states
-                    e_s = self.dilatation[i] * linalgebra.norm(X) / 3.
-                    e_d = self.e[i,n] - e_s
-                    # Scalar force states
-                    t_s = alpha_s * functions.w(data_solver, X, deck.influence_function) * e_s
-                    t_d = alpha_d * functions.w(data_solver, X, deck.influence_function) * e_d
-                    self.t = t_s + t_d
-
-                #lock.acquire()
-                data[i,:] += self.t * M * self.Volume_Correction[i,n] * deck.geometry.volumes[p]
-                data[p,:] += -self.t * M * self.Volume_Correction[i,n] * deck.geometry.volumes[i]
-                #lock.release()
-                n += 1
+    # @param start Starting position of the loop in the evaluated ids
+    # @param end Ending position of the loop in the evaluated ids
+    # @return Ids of the nodes and internal force density of the contributions of the bonds, which have to be summed for each node
+    def compute_f_int_slice(self, deck, data_solver, y, start, end):
+        bonds = data_solver.neighbors.get_bonds(deck)
+        ids = self.ids[start:end]
+        b = bonds.get_bonds(ids)
+        i = bonds.i[b]
+        p = bonds.p[b]
+        Y, norm_Y = bonds.get_actual_bonds(y, b)
+        # Compute the direction vector between Node_p and Node_i
+        M = bonds.get_directions(Y, norm_Y)
+        w = self.get_influence(deck, data_solver, b)
+        e = self.e[b]
+
+        if deck.dim == 1:
+            # PD material parameter
+            alpha, _ = self.get_material_parameters(deck, i)
+            # Scalar force state
+            t = alpha * w * e
+
+        if deck.dim == 2:
+            # PD material parameter
+            alpha_s, alpha_d = self.get_material_parameters(deck, i)
+            # Scalar extension states
+            e_s = self.dilatation[i] * bonds.norm_X[b] / 3.
+            e_d = e - e_s
+            # Scalar force states
+            t_s = (2. * self.factor2d * alpha_s - (3. - 2. * self.factor2d) * alpha_d) * w * e_s / 3.
+            t_d = alpha_d * w * e_d
+            t = t_s + t_d
+
+        if deck.dim == 3:
+            # PD material parameter
+            alpha_s, alpha_d = self.get_material_parameters(deck, i)
+            # Scalar extension states
+            e_s = self.dilatation[i] * bonds.norm_X[b] / 3.
+            e_d = e - e_s
+            # Scalar force states
+            t_s = alpha_s * w * e_s
+            t_d = alpha_d * w * e_d
+            t = t_s + t_d
+
+        f_i = t[:, None] * M * bonds.c_p[b][:, None]
+        f_p = -t[:, None] * M * bonds.c_i[b][:, None]
+        # The contributions to Node "i" and Node "p" are interleaved to sum them in the order of the bonds
+        return np.stack((i, p), axis=1).ravel(), np.stack((f_i, f_p), axis=1).reshape(-1, deck.dim)
 
     ## Compute the global internal force density at each node
     # @param deck The input deck
     # @param data_solver Data from the peridynamic problem/solving class
     # @param y The actual nodes' position
     def compute_f_int(self, deck, data_solver, y):
-        ## Internal force density at each node
-        self.f_int = sharedmem.empty((deck.num_nodes, deck.dim),dtype=np.float64)
-        #self.f_int.fill(0.0)
-        #lock = Lock()
-        threads = deck.num_threads
-        part = int(deck.num_nodes/threads)
-
-        processes = []
-        data = []
-        for i in range(0,threads):
-            start = i * part
-            if i < threads - 1:
-                end = (i+1) * part
-            else:
-                end = deck.num_nodes
-            data.append(sharedmem.empty((deck.num_nodes, deck.dim),dtype=np.float64))
-            #data[i].fill(0)
-            processes.append(Process(target=self.compute_f_int_slice, args=(deck, data_solver, y, start, end, data[i])))
-            processes[i].start()
-
-        for p in processes:
-            p.join()
-
-        for i in range(0,threads):
-            self.f_int += data[i]
+        if deck.backend == "Numba":
+            bonds = data_solver.neighbors.get_bonds(deck)
+            ## Internal force density at each node
+            self.f_int = workers.get_buffer(self, "f_int", (deck.num_nodes, deck.dim))
+            ids = np.arange(deck.num_nodes)
+            if deck.dim == 1:
+                # The scalar force state does not depend on the dilatation
+                alpha, _ = self.get_material_parameters(deck, ids)
+                s, d, dilatation = alpha, alpha, np.zeros((deck.num_nodes), dtype=np.float64)
+            if deck.dim == 2:
+                alpha_s, alpha_d = self.get_material_parameters(deck, ids)
+                s, d, dilatation = (2. * self.factor2d * alpha_s - (3. - 2. * self.factor2d) * alpha_d) / 3., alpha_d, self.dilatation
+            if deck.dim == 3:
+                alpha_s, alpha_d = self.get_material_parameters(deck, ids)
+                s, d, dilatation = alpha_s, alpha_d, self.dilatation
+            kernels.compute_f_int(workers.get_evaluated_mask(self, deck.num_nodes), bonds.offsets, bonds.p, bonds.reverse, bonds.norm_X, self.get_influence(deck, data_solver, slice(None)), bonds.c_p, bonds.c_i, np.ascontiguousarray(y, dtype=np.float64), self.e, dilatation,
+                np.zeros((1, 1), dtype=np.float64), np.zeros((1, 1), dtype=np.float64), s[:, None], d[:, None], self.f_int)
+        else:
+            ## Internal force density at each node
+            self.f_int = workers.run_kernel(deck, data_solver, self, "compute_f_int_slice", y, output="f_int")
 
     ## Computes the strain energy density for each PD node
     # @param deck The input deck
     # @param data_solver Data from the peridynamic problem/solving class
-    # @param start Starting Id of the loop
-    # @param end Ending Id of the loop
+    # @param start Starting position of the loop in the evaluated ids
+    # @param end Ending position of the loop in the evaluated ids
     def compute_strain_energy_slice(self, deck, data_solver, start, end):
-        for i in range(start, end):
-            index_x_family = data_solver.neighbors.get_index_x_family(i)
-            n = 0
-            for p in index_x_family:
-                X = deck.geometry.nodes[p,:] - deck.geometry.nodes[i,:]
-                if deck.dim == 1:
-                    # PD material parameter
-                    alpha = self.Young_Modulus / self.Weighted_Volume[i]
-                    # Strain energy density
-                    self.strain_energy[i] += 0.5 * alpha * functions.w(data_solver, X, deck.influence_function) * self.e[i,n]**2 * self.Volume_Correction[i,n] * deck.geometry.volumes[p]
-
-                if deck.dim >= 2:
-                    X = deck.geometry.nodes[p,:] - deck.geometry.nodes[i,:]
-                    if deck.dim == 2:
-                        # PD material parameter
-                        if deck.type2d == "Plane_Stress":
-                            alpha_s = (9. / self.Weighted_Volume[i]) * (self.K + ((self.Nu + 1.)/(2. * self.Nu - 1.))**2 * self.Mu / 9.)
-                        if deck.type2d == "Plane_Strain":
-                            alpha_s = (9. / self.Weighted_Volume[i]) * (self.K + self.Mu / 9.)
-                        alpha_d = (8. / self.Weighted_Volume[i]) * self.Mu
-
-                    if deck.dim == 3:
-                        # PD material parameter
-                        alpha_s = (9. / self.Weighted_Volume[i]) * self.K
-                        alpha_d = (15. / self.Weighted_Volume[i]) * self.Mu
-
-                    # Scalar extension states
-                    e_s = self.dilatation[i] * linalgebra.norm(X) / 3.
-                    e_d = self.e[i,n] - e_s
-                    # Strain energy density
-                    self.strain_energy[i] += 0.5 * functions.w(data_solver, X, deck.influence_function) * (alpha_s * e_s**2 + alpha_d * e_d**2) * self.Volume_Correction[i,n] * deck.geometry.volumes[p]
-                n += 1
+        bonds = data_solver.neighbors.get_bonds(deck)
+        ids = self.ids[start:end]
+        b = bonds.get_bonds(ids)
+        i = bonds.i[b]
+        w = self.get_influence(deck, data_solver, b)
+        e = self.e[b]
+
+        if deck.dim == 1:
+            # PD material parameter
+            alpha, _ = self.get_material_parameters(deck, i)
+            # Strain energy density
+            energy = 0.5 * alpha * w * e**2 * bonds.c_p[b]
+
+        if deck.dim >= 2:
+            # PD material parameter
+            alpha_s, alpha_d = self.get_material_parameters(deck, i)
+            # Scalar extension states
+            e_s = self.dilatation[i] * bonds.norm_X[b] / 3.
+            e_d = e - e_s
+            # Strain energy density
+            energy = 0.5 * w * (alpha_s * e_s**2 + alpha_d * e_d**2) * bonds.c_p[b]
+
+        self.strain_energy[ids] = np.bincount(bonds.get_bond_owners(ids), weights=energy, minlength=len(ids))
 
     ## Compute the strain energy density at each node
     # @param deck The input deck
     # @param data_solver Data from the peridynamic problem/solving class
     def compute_strain_energy(self, deck, data_solver):
-        ## Strain energy density at each node
-        self.strain_energy = sharedmem.empty((deck.num_nodes),dtype=np.float64)
+        if deck.backend == "Numba":
+            bonds = data_solver.neighbors.get_bonds(deck)
+            ## Strain energy density at each node
+            self.strain_energy = workers.get_buffer(self, "strain_energy", (deck.num_nodes))
+            ids = np.arange(deck.num_nodes)
+            if deck.dim == 1:
+                # The strain energy density does not depend on the dilatation
+                alpha, _ = self.get_material_parameters(deck, ids)
+                s, d, dilatation = alpha, alpha, np.zeros((deck.num_nodes), dtype=np.float64)
+            if deck.dim >= 2:
+                alpha_s, alpha_d = self.get_material_parameters(deck, ids)
+                s, d, dilatation = alpha_s, alpha_d, self.dilatation
+            kernels.compute_strain_energy(self.ids, bonds.offsets, bonds.norm_X, self.get_influence(deck, data_solver, slice(None)), bonds.c_p, self.e, dilatation, s, d, self.strain_energy)
+        else:
+            # The strain energy density at each node is stored in strain_energy
+            workers.run_kernel(deck, data_solver, self, "compute_strain_energy_slice", None, results={"strain_energy": (deck.num_nodes)})
+
+    ## Provide the PD material parameters of the linearized scalar force state
+    # t = a * w * e + g * w * |X| * dilatation, where dilatation = (c / m) * sum(w * |X| * e * V)
+    # @param deck The input deck
+    # @param i Id of Node "i"
+    # @return The parameters a, g and c of Node "i"
+    def get_force_state_parameters(self, deck, i):
+        alpha_s, alpha_d = self.get_material_parameters(deck, i)
+        if deck.dim == 1:
+            return alpha_s, 0., 1.
 
-        threads = deck.num_threads
-        part = int(deck.num_nodes/threads)
+        if deck.dim == 2:
+            alpha_sb = (2. * self.factor2d * alpha_s - (3. - 2. * self.factor2d) * alpha_d) / 3.
+            return alpha_d, (alpha_sb - alpha_d) / 3., 2. * self.factor2d
 
-        processes = []
+        if deck.dim == 3:
+            return alpha_d, (alpha_s - alpha_d) / 3., 3.
 
-        for i in range(0,threads):
-            start = i * part
-            if i < threads - 1:
-                end = (i+1) * part
-            else:
-                end = deck.num_nodes
-            processes.append(Process(target=self.compute_strain_energy_slice, args=(deck, data_solver, start, end)))
-            processes[i].start()
+    ## Provide a bound of the stiffness of each node, i.e. of the eigenvalues of the tangent stiffness matrix at the reference configuration
+    # @param deck The input deck
+    # @param data_solver Data from the peridynamic problem/solving class
+    # @return Stiffness bound of each node
+    def compute_stiffness_bound(self, deck, data_solver):
+        ids = np.arange(deck.num_nodes)
+        a, g, c = self.get_force_state_parameters(deck, ids)
+        return data_solver.neighbors.get_bonds(deck).get_stiffness_bound(np.abs(a) * np.ones(deck.num_nodes), np.abs(g) * c / self.Weighted_Volume)
 
-        for p in processes:
-            p.join()
+    ## Provide the linearization data of all bonds
+    # @param deck The input deck
+    # @param data_solver Data from the peridynamic problem/solving class
+    # @param y The actual nodes' position
+    # @return Bonds, direction vectors and scalar force state divided by the actual length of each bond, the coefficients a * w, g * w * |X|
+    # and (c / m) * w * |X| * c_p of each bond and whether the dilatation contributes to the tangent
+    def get_tangent_data(self, deck, data_solver, y):
+        bonds = data_solver.neighbors.get_bonds(deck)
+        Y, norm_Y = bonds.get_actual_bonds(y, slice(None))
+        # Direction vectors between Node_p and Node_i
+        M = bonds.get_directions(Y, norm_Y)
+        w = self.get_influence(deck, data_solver, slice(None))
+
+        a, g, c = self.get_force_state_parameters(deck, np.arange(deck.num_nodes))
+        aw = a[bonds.i] * w
+        # Derivative of the force state and of the dilatation of Node "i" with respect to the dilatation and to the extensions
+        beta = g * np.ones(deck.num_nodes)
+        beta = beta[bonds.i] * w * bonds.norm_X
+        kappa = (c / self.Weighted_Volume[bonds.i]) * w * bonds.norm_X * bonds.c_p
+        # Scalar force state
+        t = aw * self.e + beta * self.dilatation[bonds.i]
+        # Derivative of the direction vectors, a bond of zero length has no direction
+        t_Y = np.zeros(bonds.num_bonds, dtype=np.float64)
+        np.divide(t, norm_Y, out=t_Y, where=norm_Y > 0.)
+        return bonds, M, t_Y, aw, beta, kappa, bool(np.any(beta != 0.))
+
+    ## Compute the tangent stiffness matrix, i.e. the analytic derivative of the internal force density with respect to the actual nodes' position
+    # @param deck The input deck
+    # @param data_solver Data from the peridynamic problem/solving class
+    # @param y The actual nodes' position
+    # @return Rows, columns and values of the tangent stiffness matrix in the COO format, duplicated entries have to be summed
+    def compute_tangent_stiffness(self, deck, data_solver, y):
+        dim = deck.dim
+        rows = []
+        cols = []
+        values = []
+
+        # Append the (dim x dim) blocks "blocks" coupling the nodes "left" to the nodes "right"
+        def add_blocks(left, right, blocks):
+            r = np.arange(dim)
+            rows.append((left[:, None, None] * dim + r[None, :, None]).repeat(dim, axis=2).ravel())
+            cols.append((right[:, None, None] * dim + r[None, None, :]).repeat(dim, axis=1).ravel())
+            values.append(blocks.ravel())
+
+        bonds, M, t_Y, aw, beta, kappa, dilatation = self.get_tangent_data(deck, data_solver, y)
+
+        # Bond part: derivative of the extension and of the direction vector
+        MM = M[:, :, None] * M[:, None, :]
+        K_b = aw[:, None, None] * MM + t_Y[:, None, None] * (np.identity(dim, dtype=np.float64)[None, :, :] - MM)
+        add_blocks(bonds.i, bonds.p, bonds.c_p[:, None, None] * K_b)
+        add_blocks(bonds.i, bonds.i, -bonds.c_p[:, None, None] * K_b)
+        add_blocks(bonds.p, bonds.p, -bonds.c_i[:, None, None] * K_b)
+        add_blocks(bonds.p, bonds.i, bonds.c_i[:, None, None] * K_b)
+
+        # Dilatation part: derivative of the dilatation of Node "i" couples all nodes of its family
+        if dilatation:
+            ids = np.arange(deck.num_nodes)
+            v = kappa[:, None] * M
+            s = beta[:, None] * M
+            v_sum = workers.accumulate(bonds.i, v, deck.num_nodes)
+            u = workers.accumulate(bonds.i, bonds.c_p[:, None] * s, deck.num_nodes)
+            s = bonds.c_i[:, None] * s
+            add_blocks(bonds.i, bonds.p, u[bonds.i, :, None] * v[:, None, :])
+            add_blocks(ids, ids, -u[:, :, None] * v_sum[:, None, :])
+            first, second = bonds.get_bond_pairs()
+            add_blocks(bonds.p[first], bonds.p[second], -s[first, :, None] * v[second, None, :])
+            add_blocks(bonds.p, bonds.i, s[:, :, None] * v_sum[bonds.i, None, :])
+
+        return np.concatenate(rows), np.concatenate(cols), np.concatenate(values)
+
+    ## Compute the product of the tangent stiffness matrix with a vector without assembling the matrix
+    # @param deck The input deck
+    # @param tangent_data Linearization data of all bonds provided by get_tangent_data, which does not depend on the vector
+    # @param v Vector with a value for each node and direction
+    # @return Product of the tangent stiffness matrix with the vector for each node
+    def compute_tangent_product(self, deck, tangent_data, v):
+        bonds, M, t_Y, aw, beta, kappa, dilatation = tangent_data
+        # Directional derivatives of the bond vectors and of the extensions
+        dY = v[bonds.p, :] - v[bonds.i, :]
+        de = np.sum(M * dY, axis=1)
+        dt = aw * de
+        if dilatation:
+            dtheta = np.bincount(bonds.i, weights=kappa * de, minlength=deck.num_nodes)
+            dt = dt + beta * dtheta[bonds.i]
+        dF = dt[:, None] * M + t_Y[:, None] * (dY - de[:, None] * M)
+        return workers.accumulate(bonds.i, bonds.c_p[:, None] * dF, deck.num_nodes) - workers.accumulate(bonds.p, bonds.c_i[:, None] * dF, deck.num_nodes)
+
+    ## Compute the diagonal (dim x dim) blocks of the tangent stiffness matrix, i.e. the derivative of the internal force density of each node with respect to its own position
+    # @param deck The input deck
+    # @param tangent_data Linearization data of all bonds provided by get_tangent_data
+    # @return Diagonal block of each node
+    def compute_tangent_diagonal(self, deck, tangent_data):
+        dim = deck.dim
+        bonds, M, t_Y, aw, beta, kappa, dilatation = tangent_data
+
+        MM = M[:, :, None] * M[:, None, :]
+        K_b = (aw[:, None, None] * MM + t_Y[:, None, None] * (np.identity(dim, dtype=np.float64)[None, :, :] - MM)).reshape(-1, dim * dim)
+        result = -workers.accumulate(bonds.i, bonds.c_p[:, None] * K_b, deck.num_nodes) - workers.accumulate(bonds.p, bonds.c_i[:, None] * K_b, deck.num_nodes)
+
+        if dilatation:
+            v = kappa[:, None] * M
+            s = beta[:, None] * M
+            v_sum = workers.accumulate(bonds.i, v, deck.num_nodes)
+            u = workers.accumulate(bonds.i, bonds.c_p[:, None] * s, deck.num_nodes)
+            result -= (u[:, :, None] * v_sum[:, None, :]).reshape(-1, dim * dim)
+            result -= workers.accumulate(bonds.p, ((bonds.c_i[:, None] * s)[:, :, None] * v[:, None, :]).reshape(-1, dim * dim), deck.num_nodes)
+        return result.reshape(deck.num_nodes, dim, dim)
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+#@author: ilyass.tabiai@polymtl.ca
+#@author: rolland.delorme@polymtl.ca
+#@author: patrickdiehl@lsu.edu
+import numpy as np
+
+import pkgutil
+numba_loader = pkgutil.find_loader('numba')
+found_numba = numba_loader is not None
+if found_numba == True:
+    import numba
+    prange = numba.prange
+else:
+    prange = range
+
+## Compile a kernel to a multi-threaded function if Numba is found, the compiled code is cached on disk
+# @param function The kernel
+# @return The compiled kernel or the kernel itself if Numba is not found
+def jit(function):
+    if found_numba == True:
+        return numba.njit(parallel=True, cache=True)(function)
+    return function
+
+## Compile a function called by the kernels if Numba is found, the compiled code is cached on disk
+# @param function The function
+# @return The compiled function or the function itself if Numba is not found
+def jit_function(function):
+    if found_numba == True:
+        return numba.njit(cache=True)(function)
+    return function
+
+## Set the amount of threads of the compiled kernels
+# @param threads Amount of threads
+def set_threads(threads):
+    if found_numba == True:
+        numba.set_num_threads(max(1, min(threads, numba.config.NUMBA_NUM_THREADS)))
+
+## Compute the extension of the bonds and the dilatation of the evaluated nodes
+# The bonds of Node "i" are offsets[i]:offsets[i+1] in the flat bond arrays
+# @param ids Ids of the evaluated nodes
+# @param offsets Position of the first bond of each node
+# @param p Id of Node "p" of each bond
+# @param norm_X Length of each bond in the reference configuration
+# @param w Influence function of each bond
+# @param c_p Corrected volume of Node "p" of each bond
+# @param y The actual nodes' position
+# @param factor Factor of the dilatation of each node
+# @param e Extension of each bond (output)
+# @param dilatation Dilatation of each node (output)
+@jit
+def compute_dilatation(ids, offsets, p, norm_X, w, c_p, y, factor, e, dilatation):
+    dim = y.shape[1]
+    for m in prange(len(ids)):
+        i = ids[m]
+        total = 0.
+        for b in range(offsets[i], offsets[i+1]):
+            norm_Y = 0.
+            for d in range(dim):
+                Y = y[p[b], d] - y[i, d]
+                norm_Y += Y * Y
+            e_b = np.sqrt(norm_Y) - norm_X[b]
+            e[b] = e_b
+            total += factor[i] * w[b] * norm_X[b] * e_b * c_p[b]
+        dilatation[i] = total
+
+## Compute the viscoelastic part of the extension of the bonds and of the dilatation of the evaluated nodes for each relaxation time
+# @param ids Ids of the evaluated nodes
+# @param offsets Position of the first bond of each node
+# @param norm_X Length of each bond in the reference configuration
+# @param w Influence function of each bond
+# @param c_p Corrected volume of Node "p" of each bond
+# @param e Extension of each bond
+# @param ext Extension of each bond at the beginning of the load increment
+# @param ext_visco Viscoelastic part of the extension of each bond for each relaxation time at the beginning of the load increment
+# @param decay Decay exp(-delta_t / tau) of each relaxation time
+# @param beta Factor of the extension increment of each relaxation time
+# @param factor Factor of the dilatation of each node for each relaxation time
+# @param e_visco Viscoelastic part of the extension of each bond for each relaxation time (output)
+# @param dilatation_visco Viscoelastic part of the dilatation of each node for each relaxation time (output)
+@jit
+def compute_dilatation_visco(ids, offsets, norm_X, w, c_p, e, ext, ext_visco, decay, beta, factor, e_visco, dilatation_visco):
+    for m in prange(len(ids)):
+        i = ids[m]
+        for k in range(1, len(decay)):
+            total = 0.
+            for b in range(offsets[i], offsets[i+1]):
+                e_v = ext[b] * (1.0 - decay[k]) + ext_visco[b, k] * decay[k] + beta[k] * (e[b] - ext[b])
+                e_visco[b, k] = e_v
+                total += factor[i, k] * w[b] * norm_X[b] * (e[b] - e_v) * c_p[b]
+            dilatation_visco[i, k] = total
+
+## Provide the scalar force state of a bond
+# The scalar force state of a bond is t = sum_k s_k * w * (e_s - e_s_k) + d_k * w * (e_d - e_d_k), where e_s = dilatation * |X| / 3 and e_d = e - e_s
+# are the spherical and the deviatoric extension and e_s_k and e_d_k are their viscoelastic parts, which are zero for k = 0.
+# @param i Id of Node "i" of the bond
+# @param b Position of the bond
+# @return Scalar force state of the bond
+@jit_function
+def scalar_force_state(i, b, norm_X, w, e, dilatation, e_visco, dilatation_visco, s, d):
+    e_s = dilatation[i] * norm_X[b] / 3.
+    e_d = e[b] - e_s
+    t = d[i, 0] * w[b] * e_d + s[i, 0] * w[b] * e_s
+    for k in range(1, s.shape[1]):
+        e_s_k = dilatation_visco[i, k] * norm_X[b] / 3.
+        e_d_k = e_visco[b, k] - e_s_k
+        t += s[i, k] * w[b] * (e_s - e_s_k) + d[i, k] * w[b] * (e_d - e_d_k)
+    return t
+
+## Compute the internal force density of the bonds of the evaluated nodes
+# Each node sums in parallel the forces of its bonds (i, p), if Node "i" is evaluated, and of their reverse bonds (p, i), if Node "p" is evaluated,
+# so the forces are gathered by the receiving node without a serial scatter and without temporary arrays.
+# The families are symmetric, so the bonds of a node and their reverse bonds are all the bonds acting on the node.
+# @param evaluated Mask of the evaluated nodes
+# @param offsets Position of the first bond of each node
+# @param p Id of Node "p" of each bond
+# @param reverse Position of the reverse bond (p, i) of each bond (i, p)
+# @param norm_X Length of each bond in the reference configuration
+# @param w Influence function of each bond
+# @param c_p Corrected volume of Node "p" of each bond
+# @param c_i Corrected volume of Node "i" of each bond
+# @param y The actual nodes' position
+# @param e Extension of each bond
+# @param dilatation Dilatation of each node, zero if the force state does not depend on it
+# @param e_visco Viscoelastic part of the extension of each bond for each relaxation time
+# @param dilatation_visco Viscoelastic part of the dilatation of each node for each relaxation time
+# @param s Spherical coefficient of each node for each relaxation time
+# @param d Deviatoric coefficient of each node for each relaxation time
+# @param f Internal force density of each node (output)
+@jit
+def compute_f_int(evaluated, offsets, p, reverse, norm_X, w, c_p, c_i, y, e, dilatation, e_visco, dilatation_visco, s, d, f):
+    dim = y.shape[1]
+    for i in prange(len(offsets) - 1):
+        for r in range(dim):
+            f[i, r] = 0.
+        for b in range(offsets[i], offsets[i+1]):
+            q = p[b]
+            if not evaluated[i] and not evaluated[q]:
+                continue
+            norm_Y = 0.
+            for r in range(dim):
+                Y = y[q, r] - y[i, r]
+                norm_Y += Y * Y
+            norm_Y = np.sqrt(norm_Y)
+            # A bond of zero length has no direction and transmits no force
+            if norm_Y == 0.:
+                continue
+            # The force of the bond (i, p) and the force of the reverse bond (p, i) on Node "i" are along M = (y_p - y_i) / |y_p - y_i|
+            value = 0.
+            if evaluated[i]:
+                value += scalar_force_state(i, b, norm_X, w, e, dilatation, e_visco, dilatation_visco, s, d) * c_p[b]
+            if evaluated[q]:
+                value += scalar_force_state(q, reverse[b], norm_X, w, e, dilatation, e_visco, dilatation_visco, s, d) * c_i[reverse[b]]
+            for r in range(dim):
+                f[i, r] += value * (y[q, r] - y[i, r]) / norm_Y
+
+## Compute the strain energy density of the evaluated nodes
+# The strain energy density of a bond is 0.5 * w * (s * e_s^2 + d * e_d^2) * c_p with the spherical and the deviatoric extension e_s and e_d
+# @param ids Ids of the evaluated nodes
+# @param offsets Position of the first bond of each node
+# @param norm_X Length of each bond in the reference configuration
+# @param w Influence function of each bond
+# @param c_p Corrected volume of Node "p" of each bond
+# @param e Extension of each bond
+# @param dilatation Dilatation of each node, zero if the strain energy does not depend on it
+# @param s Spherical coefficient of each node
+# @param d Deviatoric coefficient of each node
+# @param energy Strain energy density of each node (output)
+@jit
+def compute_strain_energy(ids, offsets, norm_X, w, c_p, e, dilatation, s, d, energy):
+    for m in prange(len(ids)):
+        i = ids[m]
+        total = 0.
+        for b in range(offsets[i], offsets[i+1]):
+            e_s = dilatation[i] * norm_X[b] / 3.
+            e_d = e[b] - e_s
+            total += 0.5 * w[b] * (s[i] * e_s * e_s + d[i] * e_d * e_d) * c_p[b]
+        energy[i] = total
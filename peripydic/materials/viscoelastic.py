@@ -4,10 +4,8 @@
 #@author: patrickdiehl@lsu.edu
 import numpy as np
 from scipy import linalg
-from multiprocessing import Process, Lock
-import sharedmem
-from ..util import linalgebra
-from ..util import functions
+from ..util import workers
+from . import kernels
 #import warnings
 #warnings.filterwarnings("error")
 
@@ -18,9 +16,33 @@ class Viscoelastic_material():
     # @param deck The input deck
     # @param data_solver Data from the peridynamic problem/solving class
     # @param y Actual nodes' position
-    # @param t_n Id of the time step
-    def __init__(self, deck, data_solver, y, t_n):
+    # @param delta_t Time increment of the load increment, the extension states at its beginning are the states ext_previous and ext_visco_previous of data_solver
+    # @param ids Ids of the nodes whose family is evaluated, all nodes if None
+    # @param buffers Work buffers reused for the arrays of the material, None to allocate them
+    def __init__(self, deck, data_solver, y, delta_t, ids=None, buffers=None):
 
+        if ids is None:
+            ids = np.arange(deck.num_nodes)
+        ## Ids of the nodes whose family is evaluated
+        self.ids = np.asarray(ids, dtype=int)
+        ## Work buffers reused for the arrays of the material
+        self.work_buffers = buffers
+
+        self.set_parameters(deck, data_solver)
+
+        ## Compute the dilatation for each node
+        self.compute_dilatation(deck, data_solver, y)
+
+        ## Compute the viscoelastic part of the dilatation for each node
+        self.compute_dilatation_visco(deck, data_solver, y, delta_t)
+
+        ## Compute the global internal force density at each node
+        self.compute_f_int(deck, data_solver, y)
+
+    ## Set the parameters of the material, which are the only data needed by the kernels evaluated by a worker pool
+    # @param deck The input deck
+    # @param data_solver Data from the peridynamic problem/solving class
+    def set_parameters(self, deck, data_solver):
         ## Weighted volume
         self.Weighted_Volume = data_solver.weighted_volume
 
@@ -45,255 +67,245 @@ class Viscoelastic_material():
                     self.factor2d = (2. * self.Nu - 1.) / (self.Nu - 1.)
                 if deck.type2d == "Plane_Strain":
                     ## Plane strain
-                    self.factor2d = 1
+                    self.factor2d = np.ones(len(self.K))
 
         ## Relaxation time of the material
         self.Relax_Time = deck.relax_time
 
-        ## Compute the dilatation for each node
-        self.compute_dilatation(deck, data_solver, y)
-
-        ## Compute the viscoelastic part of the dilatation for each node
-        self.compute_dilatation_visco(deck, data_solver, y, t_n)
-
-        ## Compute the global internal force density at each node
-        self.compute_f_int(deck, data_solver, y)
-
     ## Compute the dilatation for each node
     # @param deck The input deck
     # @param data_solver Data from the peridynamic problem/solving class
     # @param y The actual nodes' position
-    # @param start Starting Id of the loop
-    # @param end Ending Id of the loop
+    # @param start Starting position of the loop in the evaluated ids
+    # @param end Ending position of the loop in the evaluated ids
     def compute_dilatation_slice(self, deck, data_solver, y, start, end):
-        for i in range(start, end):
-            index_x_family = data_solver.neighbors.get_index_x_family(i)
-            n = 0
-            for p in index_x_family:
-                    Y = (y[p,:]) - y[i,:]
-                    X = deck.geometry.nodes[p,:] - deck.geometry.nodes[i,:]
-                    self.e[i,n] = linalgebra.norm(Y) - linalgebra.norm(X)
-
-                    if deck.dim == 1:
-                        self.dilatation[i] += (1. / self.Weighted_Volume[i]) * functions.w( data_solver, X, deck.influence_function) * linalgebra.norm(X) * self.e[i,n] * self.Volume_Correction[i,n] * deck.geometry.volumes[p]
+        bonds = data_solver.neighbors.get_bonds(deck)
+        ids = self.ids[start:end]
+        b = bonds.get_bonds(ids)
+        i = bonds.i[b]
+        Y, norm_Y = bonds.get_actual_bonds(y, b)
+        e = norm_Y - bonds.norm_X[b]
+        self.e[b] = e
 
-                    if deck.dim == 2:
-                        self.dilatation[i] += (2. / self.Weighted_Volume[i]) * self.factor2d[0] * functions.w( data_solver, X, deck.influence_function) * linalgebra.norm(X) * self.e[i,n] * self.Volume_Correction[i,n] * deck.geometry.volumes[p]
+        self.dilatation[ids] = np.bincount(bonds.get_bond_owners(ids), weights=self.get_dilatation_factor(deck, i, 0) * bonds.w[b] * bonds.norm_X[b] * e * bonds.c_p[b], minlength=len(ids))
 
-                    if deck.dim == 3:
-                        self.dilatation[i] += (3. / self.Weighted_Volume[i]) * functions.w( data_solver, X, deck.influence_function) * linalgebra.norm(X) * self.e[i,n] * self.Volume_Correction[i,n] * deck.geometry.volumes[p]
-                    n += 1
+    ## Provide the factor of the dilatation of some nodes
+    # @param deck The input deck
+    # @param i Ids of the nodes
+    # @param k Id of the relaxation time
+    # @return Factor of the weighted sum of the extensions
+    def get_dilatation_factor(self, deck, i, k):
+        if deck.dim == 1:
+            return 1. / self.Weighted_Volume[i]
+        if deck.dim == 2:
+            return (2. / self.Weighted_Volume[i]) * self.factor2d[k]
+        if deck.dim == 3:
+            return 3. / self.Weighted_Volume[i]
 
     ## Compute the dilatation and also the scalar extension state for each node
     # @param deck The input deck
     # @param data_solver Data from the peridynamic problem/solving class
     # @param y The actual nodes' position
     def compute_dilatation(self, deck, data_solver, y):
-        ## Dilatation at each node
-        self.dilatation = sharedmem.empty((deck.num_nodes),dtype=np.float64)
-        ## Extension between Node "i" and Node "p" within its family
-        self.e = sharedmem.empty((deck.num_nodes, data_solver.neighbors.max_neighbors),dtype=np.float64)
-
-        threads = deck.num_threads
-        part = int(deck.num_nodes/threads)
-
-        processes = []
-
-        for i in range(0,threads):
-            start = i * part
-            if i < threads - 1:
-                end = (i+1) * part
-            else:
-                end = deck.num_nodes
-
-            processes.append(Process(target=self.compute_dilatation_slice, args=(deck, data_solver, y, start, end)))
-            processes[i].start()
-
-        for p in processes:
-            p.join()
+        if deck.backend == "Numba":
+            bonds = data_solver.neighbors.get_bonds(deck)
+            ## Dilatation at each node
+            self.dilatation = workers.get_buffer(self, "dilatation", (deck.num_nodes))
+            ## Extension of each bond between Node "i" and Node "p" within its family
+            self.e = workers.get_buffer(self, "e", (bonds.num_bonds))
+            factor = self.get_dilatation_factor(deck, np.arange(deck.num_nodes), 0)
+            kernels.compute_dilatation(self.ids, bonds.offsets, bonds.p, bonds.norm_X, bonds.w, bonds.c_p, np.ascontiguousarray(y, dtype=np.float64), factor, self.e, self.dilatation)
+        else:
+            # The dilatation at each node and the extension of each bond between Node "i" and Node "p" within its family are stored in dilatation and e
+            workers.run_kernel(deck, data_solver, self, "compute_dilatation_slice", y, results={"dilatation": (deck.num_nodes), "e": (data_solver.neighbors.get_bonds(deck).num_bonds)})
 
     ## Compute the viscoelastic part of the scalar extension state
     # @param deck The input deck
     # @param data_solver Data from the peridynamic problem/solving class
     # @param y The actual nodes' position
-    # @param t_n Id of the time step
-    # @param start Starting Id of the loop
-    # @param end Ending Id of the loop
-    def compute_dilatation_visco_slice(self, deck, data_solver, y, t_n, start, end):
-        for i in range(start, end):
-            index_x_family = data_solver.neighbors.get_index_x_family(i)
-            n = 0
-            for p in index_x_family:
-                X = deck.geometry.nodes[p,:] - deck.geometry.nodes[i,:]
-                for k in range(1, len(self.Relax_Time)):
-                    tmp_exp = np.exp((- deck.delta_t) / (self.Relax_Time[k]))
-                    #print i, n, p
-                    delta_e = self.e[i, n] - data_solver.ext[i, n, t_n-1]
-                    beta = 1.0 - (self.Relax_Time[k] * (1.0 - tmp_exp)) / deck.delta_t
-                    self.e_visco[i,n,k] = data_solver.ext[i, n, t_n-1] * (1.0 - tmp_exp) + data_solver.ext_visco[i, n, k, t_n-1] * tmp_exp + beta * delta_e
-
-                    if deck.dim == 1:
-                        self.dilatation_visco[i,k] += (1. / self.Weighted_Volume[i]) * functions.w( data_solver, X, deck.influence_function) * linalgebra.norm(X) * (self.e[i,n] - self.e_visco[i, n, k]) * self.Volume_Correction[i,n] * deck.geometry.volumes[p]
-
-                    if deck.dim == 2:
-                        self.dilatation_visco[i,k] += (2. / self.Weighted_Volume[i]) * self.factor2d[k] * functions.w( data_solver, X, deck.influence_function) * linalgebra.norm(X) * (self.e[i,n] - self.e_visco[i, n, k]) * self.Volume_Correction[i,n] * deck.geometry.volumes[p]
-
-                    if deck.dim == 3:
-                        self.dilatation_visco[i,k] += (3. / self.Weighted_Volume[i]) * functions.w( data_solver, X, deck.influence_function) * linalgebra.norm(X) * (self.e[i,n] - self.e_visco[i, n, k]) * self.Volume_Correction[i,n] * deck.geometry.volumes[p]
-                n +=1
+    # @param delta_t Time increment of the load increment, which is an argument since the worker processes do not share the problem
+    # @param start Starting position of the loop in the evaluated ids
+    # @param end Ending position of the loop in the evaluated ids
+    def compute_dilatation_visco_slice(self, deck, data_solver, y, delta_t, start, end):
+        bonds = data_solver.neighbors.get_bonds(deck)
+        ids = self.ids[start:end]
+        b = bonds.get_bonds(ids)
+        i = bonds.i[b]
+        e = self.e[b]
+        ext = data_solver.ext_previous[b]
+        delta_e = e - ext
+        owners = bonds.get_bond_owners(ids)
+        for k in range(1, len(self.Relax_Time)):
+            tmp_exp = np.exp((- delta_t) / (self.Relax_Time[k]))
+            beta = 1.0 - (self.Relax_Time[k] * (1.0 - tmp_exp)) / delta_t
+            e_visco = ext * (1.0 - tmp_exp) + data_solver.ext_visco_previous[b, k] * tmp_exp + beta * delta_e
+            self.e_visco[b, k] = e_visco
+
+            self.dilatation_visco[ids, k] = np.bincount(owners, weights=self.get_dilatation_factor(deck, i, k) * bonds.w[b] * bonds.norm_X[b] * (e - e_visco) * bonds.c_p[b], minlength=len(ids))
 
     ## Compute the viscoelastic part of the scalar extension state
     # @param deck The input deck
     # @param data_solver Data from the peridynamic problem/solving class
     # @param y The actual nodes' position
-    # @param t_n Id of the time step
-    def compute_dilatation_visco(self, deck, data_solver, y, t_n):
-        ## Dilatation at each node
-        self.dilatation_visco = sharedmem.empty((deck.num_nodes, len(self.Relax_Time)),dtype=np.float64)
-        ## Extension between Node "i" and Node "p" within its family
-        self.e_visco = sharedmem.empty((deck.num_nodes, data_solver.neighbors.max_neighbors, len(self.Relax_Time)),dtype=np.float64)
-
-        threads = deck.num_threads
-        part = int(deck.num_nodes/threads)
-
-        processes = []
-
-        for i in range(0,threads):
-            start = i * part
-            if i < threads - 1:
-                end = (i+1) * part
+    # @param delta_t Time increment of the load increment
+    def compute_dilatation_visco(self, deck, data_solver, y, delta_t):
+        if deck.backend == "Numba":
+            bonds = data_solver.neighbors.get_bonds(deck)
+            ## Viscoelastic part of the dilatation at each node
+            self.dilatation_visco = workers.get_buffer(self, "dilatation_visco", (deck.num_nodes, len(self.Relax_Time)))
+            ## Viscoelastic part of the extension of each bond between Node "i" and Node "p" within its family
+            self.e_visco = workers.get_buffer(self, "e_visco", (bonds.num_bonds, len(self.Relax_Time)))
+            ids = np.arange(deck.num_nodes)
+            decay = np.zeros(len(self.Relax_Time), dtype=np.float64)
+            beta = np.zeros(len(self.Relax_Time), dtype=np.float64)
+            factor = np.zeros((deck.num_nodes, len(self.Relax_Time)), dtype=np.float64)
+            for k in range(1, len(self.Relax_Time)):
+                decay[k] = np.exp((- delta_t) / (self.Relax_Time[k]))
+                beta[k] = 1.0 - (self.Relax_Time[k] * (1.0 - decay[k])) / delta_t
+                factor[:, k] = self.get_dilatation_factor(deck, ids, k)
+            kernels.compute_dilatation_visco(self.ids, bonds.offsets, bonds.norm_X, bonds.w, bonds.c_p, self.e, data_solver.ext_previous,
+                data_solver.ext_visco_previous, decay, beta, factor, self.e_visco, self.dilatation_visco)
+        else:
+            # The viscoelastic parts of the dilatation at each node and of the extension of each bond between Node "i" and Node "p" within its family are stored in dilatation_visco and e_visco
+            workers.run_kernel(deck, data_solver, self, "compute_dilatation_visco_slice", y, args=(delta_t,), results={"dilatation_visco": (deck.num_nodes, len(self.Relax_Time)), "e_visco": (data_solver.neighbors.get_bonds(deck).num_bonds, len(self.Relax_Time))})
+
+    ## Provide the PD material parameters of some nodes for a relaxation time
+    # @param deck The input deck
+    # @param i Ids of the nodes
+    # @param k Id of the relaxation time
+    # @return The parameter alpha in 1D, the parameters alpha_s and alpha_d otherwise
+    def get_material_parameters(self, deck, i, k):
+        if deck.dim == 1:
+            return self.Relax_Modulus[k] / self.Weighted_Volume[i], None
+
+        if deck.dim == 2:
+            if deck.type2d == "Plane_Stress":
+                alpha_s = (9. / self.Weighted_Volume[i]) * (self.K[k] + ((self.Nu[k] + 1.)/(2. * self.Nu[k] - 1.))**2 * self.Mu[k] / 9.)
+            if deck.type2d == "Plane_Strain":
+                alpha_s = (9. / self.Weighted_Volume[i]) * (self.K[k] + self.Mu[k] / 9.)
+            alpha_d = (8. / self.Weighted_Volume[i]) * self.Mu[k]
+            return alpha_s, alpha_d
+
+        if deck.dim == 3:
+            alpha_s = (9. / self.Weighted_Volume[i]) * self.K[k]
+            alpha_d = (15. / self.Weighted_Volume[i]) * self.Mu[k]
+            return alpha_s, alpha_d
+
+    ## Provide a bound of the stiffness of each node, i.e. of the eigenvalues of the tangent stiffness matrix at the reference configuration
+    # The instantaneous response sums the elastic and the viscoelastic parts of the force state, whose viscoelastic extensions only reduce the stiffness
+    # @param deck The input deck
+    # @param data_solver Data from the peridynamic problem/solving class
+    # @return Stiffness bound of each node
+    def compute_stiffness_bound(self, deck, data_solver):
+        ids = np.arange(deck.num_nodes)
+        a = np.zeros(deck.num_nodes, dtype=np.float64)
+        g = np.zeros(deck.num_nodes, dtype=np.float64)
+        for k in range(0, len(self.Relax_Time)):
+            alpha_s, alpha_d = self.get_material_parameters(deck, ids, k)
+            if deck.dim == 1:
+                a += np.abs(alpha_s)
             else:
-                end = deck.num_nodes
-
-            processes.append(Process(target=self.compute_dilatation_visco_slice, args=(deck, data_solver, y, t_n, start, end)))
-            processes[i].start()
-
-        for p in processes:
-            p.join()
+                if deck.dim == 2:
+                    alpha_s = (2. * self.factor2d[k] * alpha_s - (3. - 2. * self.factor2d[k]) * alpha_d) / 3.
+                a += np.abs(alpha_d)
+                g += np.abs(alpha_s - alpha_d) / 3. * self.get_dilatation_factor(deck, ids, k)
+        return data_solver.neighbors.get_bonds(deck).get_stiffness_bound(a, g)
 
     ## Compute the global internal force density at each node
     # @param deck The input deck
     # @param data_solver Data from the peridynamic problem/solving class
     # @param y The actual nodes' position
-    # @param start Starting Id of the loop
-    # @param end Ending Id of the loop
-    def compute_f_int_slice(self, deck, data_solver, y, start, end, data):
-        #print start , end
-        for i in range(start, end):
-            index_x_family = data_solver.neighbors.get_index_x_family(i)
-            n = 0
-            for p in index_x_family:
-                Y = y[p,:] - y[i,:]
-                X = deck.geometry.nodes[p,:] - deck.geometry.nodes[i,:]
-
-                # Compute the direction vector between Node_p and Node_i
-                M = Y / linalgebra.norm(Y)
+    # @param start Starting position of the loop in the evaluated ids
+    # @param end Ending position of the loop in the evaluated ids
+    # @return Ids of the nodes and internal force density of the contributions of the bonds, which have to be summed for each node
+    def compute_f_int_slice(self, deck, data_solver, y, start, end):
+        bonds = data_solver.neighbors.get_bonds(deck)
+        ids = self.ids[start:end]
+        b = bonds.get_bonds(ids)
+        i = bonds.i[b]
+        p = bonds.p[b]
+        Y, norm_Y = bonds.get_actual_bonds(y, b)
+        # Compute the direction vector between Node_p and Node_i
+        M = bonds.get_directions(Y, norm_Y)
+        w = bonds.w[b]
+        e = self.e[b]
 
-                if deck.dim == 1:
-                    t_visco = 0.0
-                    for k in range(1, len(self.Relax_Time)):
-                        # PD viscoelastic material parameter
-                        alpha_k = self.Relax_Modulus[k] / self.Weighted_Volume[i]
-                        # Viscoelastic part of the scalar force state
-                        t_visco += alpha_k * functions.w( data_solver, X, deck.influence_function) * (self.e[i,n] - self.e_visco[i,n,k])
-
-                    # PD elastic material parameter
-                    alpha_0 = self.Relax_Modulus[0] / self.Weighted_Volume[i]
-                    ## Scalar force state
-                    self.t = alpha_0 * functions.w( data_solver, X, deck.influence_function) * self.e[i,n] + t_visco
+        if deck.dim == 1:
+            t_visco = 0.0
+            for k in range(1, len(self.Relax_Time)):
+                # PD viscoelastic material parameter
+                alpha_k, _ = self.get_material_parameters(deck, i, k)
+                # Viscoelastic part of the scalar force state
+                t_visco += alpha_k * w * (e - self.e_visco[b, k])
+
+            # PD elastic material parameter
+            alpha_0, _ = self.get_material_parameters(deck, i, 0)
+            # Scalar force state
+            t = alpha_0 * w * e + t_visco
 
+        if deck.dim >= 2:
+            # Scalar extension states
+            e_s = self.dilatation[i] * bonds.norm_X[b] / 3.
+            e_d = e - e_s
+
+            t_s_visco = 0.0
+            t_d_visco = 0.0
+            for k in range(1, len(self.Relax_Time)):
+                # Scalar visco extension states
+                e_s_visco = self.dilatation_visco[i, k] * bonds.norm_X[b] / 3.
+                e_d_visco = self.e_visco[b, k] - e_s_visco
+                # PD viscoelastic material parameter
+                alpha_s_k, alpha_d_k = self.get_material_parameters(deck, i, k)
+                # Viscoelastic parts of the scalar force state
                 if deck.dim == 2:
-                    # Scalar extension states
-                    e_s = self.dilatation[i] * linalgebra.norm(X) / 3.
-                    e_d = self.e[i,n] - e_s
-
-                    t_s_visco = 0.0
-                    t_d_visco = 0.0
-                    for k in range(1, len(self.Relax_Time)):
-                        # Scalar visco extension states
-                        e_s_visco = self.dilatation_visco[i,k] * linalgebra.norm(X) / 3.
-                        e_d_visco = self.e_visco[i,n,k] - e_s_visco
-                        # PD viscoelastic material parameter
-                        if deck.type2d == "Plane_Stress":
-                            alpha_s_k = (9. / self.Weighted_Volume[i]) * (self.K[k] + ((self.Nu[k] + 1.)/(2. * self.Nu[k] - 1.))**2 * self.Mu[k] / 9.)
-                        if deck.type2d == "Plane_Strain":
-                            alpha_s_k = (9. / self.Weighted_Volume[i]) * (self.K[k] + self.Mu[k] / 9.)
-                        alpha_d_k = (8. / self.Weighted_Volume[i]) * self.Mu[k]
-                        # Viscoelastic parts of the scalar force state
-                        t_s_visco += (2. * self.factor2d[k] * alpha_s_k - (3. - 2. * self.factor2d[k]) * alpha_d_k) * functions.w( data_solver, X, deck.influence_function) * (e_s - e_s_visco) / 3.
-                        t_d_visco += alpha_d_k * functions.w( data_solver, X, deck.influence_function) * (e_d - e_d_visco)
-
-                    # PD elastic material parameter
-                    if deck.type2d == "Plane_Stress":
-                        alpha_s_0 = (9. / self.Weighted_Volume[i]) * (self.K[0] + ((self.Nu[0] + 1.)/(2. * self.Nu[0] - 1.))**2 * self.Mu[0] / 9.)
-                    if deck.type2d == "Plane_Strain":
-                        alpha_s_0 = (9. / self.Weighted_Volume[i]) * (self.K[0] + self.Mu[0] / 9.)
-                    alpha_d_0 = (8. / self.Weighted_Volume[i]) * self.Mu[0]
-                    # Scalar force states
-                    t_s = (2. * self.factor2d[0] * alpha_s_0 - (3. - 2. * self.factor2d[0]) * alpha_d_0) * functions.w( data_solver, X, deck.influence_function) * e_s / 3. + t_s_visco
-                    t_d = alpha_d_0 * functions.w( data_solver, X, deck.influence_function) * e_d + t_d_visco
-                    self.t = t_s + t_d
-
+                    t_s_visco += (2. * self.factor2d[k] * alpha_s_k - (3. - 2. * self.factor2d[k]) * alpha_d_k) * w * (e_s - e_s_visco) / 3.
                 if deck.dim == 3:
-                    # Scalar extension states
-                    e_s = self.dilatation[i] * linalgebra.norm(X) / 3.
-                    e_d = self.e[i,n] - e_s
-
-                    t_s_visco = 0.0
-                    t_d_visco = 0.0
-                    for k in range(1, len(self.Relax_Time)):
-                        # Scalar visco extension states
-                        e_s_visco = self.dilatation_visco[i,k] * linalgebra.norm(X) / 3.
-                        e_d_visco = self.e_visco[i,n,k] - e_s_visco
-                        # PD viscoelastic material parameter
-                        alpha_s_k = (9. / self.Weighted_Volume[i]) * self.K[k]
-                        alpha_d_k = (15. / self.Weighted_Volume[i]) * self.Mu[k]
-                        # Viscoelastic parts of the scalar force state
-                        t_s_visco += alpha_s_k * functions.w( data_solver, X, deck.influence_function) * (e_s - e_s_visco)
-                        t_d_visco += alpha_d_k * functions.w( data_solver, X, deck.influence_function) * (e_d - e_d_visco)
-
-                    # PD elastic material parameter
-                    alpha_s_0 = (9. / self.Weighted_Volume[i]) * self.K[0]
-                    alpha_d_0 = (15. / self.Weighted_Volume[i]) * self.Mu[0]
-                    # Scalar force states
-                    t_s = alpha_s_0 * functions.w( data_solver, X, deck.influence_function) * e_s + t_s_visco
-                    t_d = alpha_d_0 * functions.w( data_solver, X, deck.influence_function) * e_d + t_d_visco
-                    self.t = t_s + t_d
-
-                #lock.acquire()
-                data[i,:] += self.t * M * self.Volume_Correction[i,n] * deck.geometry.volumes[p]
-                data[p,:] += -self.t * M * self.Volume_Correction[i,n] * deck.geometry.volumes[i]
-                #lock.release()
-                n += 1
+                    t_s_visco += alpha_s_k * w * (e_s - e_s_visco)
+                t_d_visco += alpha_d_k * w * (e_d - e_d_visco)
+
+            # PD elastic material parameter
+            alpha_s_0, alpha_d_0 = self.get_material_parameters(deck, i, 0)
+            # Scalar force states
+            if deck.dim == 2:
+                t_s = (2. * self.factor2d[0] * alpha_s_0 - (3. - 2. * self.factor2d[0]) * alpha_d_0) * w * e_s / 3. + t_s_visco
+            if deck.dim == 3:
+                t_s = alpha_s_0 * w * e_s + t_s_visco
+            t_d = alpha_d_0 * w * e_d + t_d_visco
+            t = t_s + t_d
+
+        f_i = t[:, None] * M * bonds.c_p[b][:, None]
+        f_p = -t[:, None] * M * bonds.c_i[b][:, None]
+        # The contributions to Node "i" and Node "p" are interleaved to sum them in the order of the bonds
+        return np.stack((i, p), axis=1).ravel(), np.stack((f_i, f_p), axis=1).reshape(-1, deck.dim)
 
     ## Compute the global internal force density at each node
     # @param deck The input deck
     # @param data_solver Data from the peridynamic problem/solving class
     # @param y The actual nodes' position
     def compute_f_int(self, deck, data_solver, y):
-        ## Internal force density at each node
-        self.f_int = sharedmem.empty((deck.num_nodes, deck.dim),dtype=np.float64)
-        #self.f_int.fill(0.0)
-        #lock = Lock()
-        threads = deck.num_threads
-        part = int(deck.num_nodes/threads)
-
-        processes = []
-        data = []
-        for i in range(0,threads):
-            start = i * part
-            if i < threads - 1:
-                end = (i+1) * part
+        if deck.backend == "Numba":
+            bonds = data_solver.neighbors.get_bonds(deck)
+            ## Internal force density at each node
+            self.f_int = workers.get_buffer(self, "f_int", (deck.num_nodes, deck.dim))
+            ids = np.arange(deck.num_nodes)
+            s = np.zeros((deck.num_nodes, len(self.Relax_Time)), dtype=np.float64)
+            d = np.zeros((deck.num_nodes, len(self.Relax_Time)), dtype=np.float64)
+            for k in range(0, len(self.Relax_Time)):
+                if deck.dim == 1:
+                    alpha_k, _ = self.get_material_parameters(deck, ids, k)
+                    s[:, k], d[:, k] = alpha_k, alpha_k
+                if deck.dim == 2:
+                    alpha_s_k, alpha_d_k = self.get_material_parameters(deck, ids, k)
+                    s[:, k], d[:, k] = (2. * self.factor2d[k] * alpha_s_k - (3. - 2. * self.factor2d[k]) * alpha_d_k) / 3., alpha_d_k
+                if deck.dim == 3:
+                    s[:, k], d[:, k] = self.get_material_parameters(deck, ids, k)
+            if deck.dim == 1:
+                # The scalar force state does not depend on the dilatation
+                dilatation, dilatation_visco = np.zeros((deck.num_nodes), dtype=np.float64), np.zeros((deck.num_nodes, len(self.Relax_Time)), dtype=np.float64)
             else:
-                end = deck.num_nodes
-            #print start , end , deck.num_nodes
-            data.append(sharedmem.empty((deck.num_nodes, deck.dim),dtype=np.float64))
-            #data[i].fill(0)
-            processes.append(Process(target=self.compute_f_int_slice, args=(deck, data_solver, y, start, end, data[i])))
-            processes[i].start()
-
-        for p in processes:
-            p.join()
-
-        for i in range(0,threads):
-            self.f_int += data[i]
+                dilatation, dilatation_visco = self.dilatation, self.dilatation_visco
+            kernels.compute_f_int(workers.get_evaluated_mask(self, deck.num_nodes), bonds.offsets, bonds.p, bonds.reverse, bonds.norm_X, bonds.w, bonds.c_p, bonds.c_i, np.ascontiguousarray(y, dtype=np.float64), self.e, dilatation,
+                self.e_visco, dilatation_visco, s, d, self.f_int)
+        else:
+            ## Internal force density at each node
+            self.f_int = workers.run_kernel(deck, data_solver, self, "compute_f_int_slice", y, output="f_int")
@@ -32,8 +32,8 @@ class DIC_problem(abstractions.Problem):
         ## Internal forces
         self.force_int = np.zeros((deck.num_nodes, deck.dim,2),dtype=np.float32)
 
-        ## Extension state
-        self.ext = np.zeros( ( deck.num_nodes, self.neighbors.max_neighbors,2),dtype=np.float32 )
+        ## Extension state of each bond
+        self.ext = np.zeros( ( self.neighbors.get_bonds(deck).num_bonds,2),dtype=np.float32 )
 
 
         if deck.material_type == "Elastic":
@@ -57,7 +57,7 @@ class DIC_problem(abstractions.Problem):
     # @param mat_class Material class object for the elastic/viscoelastic material models
     def update_ext_state_data(self, mat_class):
         ## Extension state
-        self.ext[:, :, 1] = mat_class.e
+        self.ext[:, 1] = mat_class.e
 
     ## Records the actual position vector at each time step
     # @param act Actual position obtained from DIC data
@@ -5,10 +5,16 @@
 
 import numpy as np
 from ..util import neighbor
-from scipy.sparse import linalg
+from ..util import condition
 from scipy import sparse
 from ..util import linalgebra
 from ..util import abstractions
+from ..util import assembly
+from ..util import workers
+from ..util import history
+from ..util import checkpoint as util_checkpoint
+import sharedmem
+import sys
 
 
 ## Class to define the peridynamic problem, i.e. applying boundaries conditions to the geometry and solve the problem
@@ -16,27 +22,66 @@ class PD_problem(abstractions.Problem):
 
     ## Constructor
     # @param deck The input deck
-    def __init__(self, deck):
+    # @param checkpoint Checkpoint to restart from, or None to start at the initial time step
+    def __init__(self, deck, checkpoint=None):
 
-        ## Family of each node
-        self.neighbors = neighbor.NeighborSearch(deck)
+        ## Family of each node, the families stored in the checkpoint are reused
+        if checkpoint is not None:
+            self.neighbors = neighbor.NeighborSearch(deck, (checkpoint["Offsets"], checkpoint["Families"]))
+        else:
+            self.neighbors = neighbor.NeighborSearch(deck)
+
+        ## Time histories keeping only the current and the previous time step in memory
+        self.histories = []
+
+        ## Work buffers of the arrays of the material reused by each evaluation of the internal force density of the solver
+        self.work_buffers = {}
 
         ## Nodes' positions stored for each time step
-        self.y = np.zeros((deck.num_nodes, deck.dim, deck.time_steps), dtype=np.float64)
+        self.y = self.create_history(deck, "Position", (deck.num_nodes, deck.dim))
         self.y[:,:,0] = deck.geometry.nodes[:,:]
 
         ## Global internal force density array storing the force density attached to each node
-        self.force_int = np.zeros((deck.num_nodes, deck.dim, deck.time_steps), dtype=np.float64)
+        self.force_int = self.create_history(deck, "Force", (deck.num_nodes, deck.dim))
 
-        ## Extension state at each node between the node and its family
-        self.ext = np.zeros( ( deck.num_nodes, self.neighbors.max_neighbors, deck.time_steps ), dtype=np.float64 )
+        ## Extension state of each bond between a node and its family, which is shared with the worker pool
+        self.ext = self.create_history(deck, "Extension", (self.neighbors.get_bonds(deck).num_bonds,), True)
 
         ## Strain energy at each node between the node and its family
-        self.strain_energy = np.zeros( ( deck.num_nodes, deck.time_steps ), dtype=np.float64 )
+        self.strain_energy = self.create_history(deck, "Strain_Energy", (deck.num_nodes,))
+
+        if deck.critical_stretch is not None:
+            bonds = self.neighbors.get_bonds(deck)
+            ## Mask of the intact bonds of the damage model, which is shared with the worker pool
+            self.bond_intact = sharedmem.full((bonds.num_bonds), True, dtype=bool)
+            ## Influence function of each bond, which is zero for the broken bonds, which is shared with the worker pool
+            self.bond_influence = sharedmem.full((bonds.num_bonds), 0., dtype=np.float64)
+            self.bond_influence[:] = bonds.w
+            ## Amount of intact bonds of each node
+            self.intact_bonds = np.diff(bonds.offsets)
+            ## Nodes without any intact bond left by the damage model
+            self.detached_nodes = np.zeros(deck.num_nodes, dtype=bool)
+            ## Damage at each node, i.e. the fraction of the volume of its family whose bonds are broken
+            self.damage = self.create_history(deck, "Damage", (deck.num_nodes,))
 
         if deck.material_type == "Viscoelastic":
-            ## Viscoelastic part of the extension state at each node between the node and its family
-            self.ext_visco = np.zeros( ( deck.num_nodes, self.neighbors.max_neighbors, len(deck.relax_time), deck.time_steps ), dtype=np.float64 )
+            ## Viscoelastic part of the extension state of each bond between a node and its family, which is shared with the worker pool
+            self.ext_visco = self.create_history(deck, "Viscoelastic_Extension", (self.neighbors.get_bonds(deck).num_bonds, len(deck.relax_time)), True)
+            ## Extension state of each bond at the beginning of the current load increment, which is shared with the worker pool
+            self.ext_previous = sharedmem.full((self.neighbors.get_bonds(deck).num_bonds), 0., dtype=np.float64)
+            ## Viscoelastic part of the extension state of each bond at the beginning of the current load increment, which is shared with the worker pool
+            self.ext_visco_previous = sharedmem.full((self.neighbors.get_bonds(deck).num_bonds, len(deck.relax_time)), 0., dtype=np.float64)
+
+        ## Time increment of the current load increment, which is the time step size unless the time stepping is adaptive
+        self.delta_t = deck.delta_t
+        if deck.solver_adaptive:
+            ## Load increment of the adaptive time stepping as a fraction of the time step
+            self.load_increment = deck.adaptive_initial
+            ## Rate of the nodes' positions per time step of the last converged load increment, which predicts the initial guess of the next one
+            self.predictor = None
+
+        ## Boundary conditions of all nodes
+        self.boundary = condition.BoundaryConditions(deck)
 
         ## Compute the external force density "b" applied on each node
         self.compute_b(deck)
@@ -47,57 +92,103 @@ class PD_problem(abstractions.Problem):
         # Compute the weighted volume for each node
         self.compute_weighted_volume(deck)
 
+        if deck.solver_explicit:
+            # The explicit solvers only evaluate the internal force density
+            self.linear_solver = None
+        elif deck.solver_type == "Newton_Krylov":
+            ## Solver of the reduced Jacobian system, i.e. a matrix-free Krylov solver or a sparse direct solver caching the sparsity pattern of the Jacobian matrix and the constrained degrees of freedom
+            self.linear_solver = assembly.KrylovSolver(deck)
+            if deck.solver_jacobian != "Analytic":
+                # Compute the coloring of the nodes for the finite difference diagonal blocks of the Jacobian matrix
+                self.compute_diagonal_coloring(deck)
+        else:
+            if deck.solver_jacobian == "Finite_Difference":
+                self.linear_solver = assembly.SparseSolver(deck, self.neighbors, 1)
+            else:
+                self.linear_solver = assembly.SparseSolver(deck, self.neighbors, 2)
+
+            if deck.solver_jacobian == "Local_Finite_Difference":
+                # Compute the coloring of the nodes for the localized finite difference Jacobian matrix
+                self.compute_jacobian_coloring(deck)
+
+        ## Amount of solver iterations using the current factorization of the Jacobian matrix
+        self.factorization_uses = 0
+        ## Broyden updates (a, s) of the inverse Jacobian matrix, H = (I + a s^T) H_previous
+        self.broyden_updates = []
+        ## Residual of the last Broyden iteration
+        self.broyden_residual = None
+        ## Displacement increment of the last Broyden iteration
+        self.broyden_increment = None
+
+        ## Velocity of each node of the explicit dynamic solver
+        self.velocity = None
+        ## Acceleration of each node of the explicit dynamic solver
+        self.acceleration = None
+        ## Fictitious density of each node of the dynamic relaxation
+        self.relaxation_density = None
+
+        ## Last time step solved, which is the time step of the checkpoint for a restart
+        self.restart_step = 0
+        if checkpoint is not None:
+            self.restore_checkpoint(deck, checkpoint)
+
+        ## Pool of worker processes evaluating the material kernels, which is started last to inherit the data of the problem
+        # The compiled kernels of the Numba backend use threads instead
+        self.worker_pool = None
+        if deck.num_threads > 1 and deck.backend == "Python":
+            self.worker_pool = workers.WorkerPool(deck, self)
+
+
+    ## Provide the storage of the time history of a field
+    # @param deck The input deck
+    # @param name Name of the field in the Fields of the History tag
+    # @param shape Shape of the field at a time step
+    # @param shared True if the storage is shared with the worker pool
+    # @return Array whose last axis is the time step for the Full history, otherwise a History keeping only the current and the previous time step in memory
+    def create_history(self, deck, name, shape, shared=False):
+        if deck.history_type == "Full":
+            if shared:
+                return sharedmem.full(tuple(shape) + (deck.time_steps,), 0., dtype=np.float64)
+            return np.zeros(tuple(shape) + (deck.time_steps,), dtype=np.float64)
+        path = None
+        if name in deck.history_fields:
+            path = deck.history_path
+        result = history.History(name, shape, deck.time_steps, path, deck.history_interval, shared)
+        self.histories.append(result)
+        return result
+
+    ## Write the selected time steps of the histories in memory to disk
+    def flush_history(self):
+        for h in self.histories:
+            h.flush()
+
+    ## Provide the time steps whose nodes' positions are available
+    # @param deck The input deck
+    # @return Ids of the time steps
+    def get_time_steps(self, deck):
+        if deck.history_type == "Full":
+            return list(range(0, deck.time_steps))
+        return self.y.get_time_steps()
 
     ## Compute the external force density "b" applied on each node
+    # The Streaming history computes it at the beginning of each time step
     # @param deck The input deck
     def compute_b(self, deck):
         ## External force density "b" applied on each node
-        self.b = np.zeros((deck.num_nodes, deck.dim, deck.time_steps),dtype=np.float64)
-        for t_n in range(1, deck.time_steps):
-            for con in deck.conditions:
-                if con.type == "Force":
-                    if con.shape == "Ramp":
-                        #Madenci approach
-                        for i in con.id:
-                            # x direction
-                            if con.direction == 1:
-                                self.b[int(i), 0, t_n] = self.shape_loading( deck, t_n , con , i )
-                            # y direction
-                            if con.direction == 2:
-                                self.b[int(i),  1 , t_n] = self.shape_loading( deck, t_n , con , i )
-                            # z direction
-                            if con.direction == 3:
-                                self.b[int(i), 2, t_n] = self.shape_loading( deck, t_n , con , i )
-        #print self.b
-
-    ## Provide the loading shape
+        self.b = self.create_history(deck, "External_Force", (deck.num_nodes, deck.dim))
+        if deck.history_type == "Full":
+            for t_n in range(1, deck.time_steps):
+                self.compute_b_step(deck, t_n)
+
+    ## Compute the external force density "b" applied on each node for a given time step t_n
     # @param deck The input deck
     # @param t_n Id of the time step
-    # @param con Type of loading, "Force" or "Displacement"
-    # @param i Id of Node "i"
-    def shape_loading(self, deck, t_n, con, i):
-        Time_t = deck.delta_t*(t_n)
-        if deck.shape_type == "Ramp":
-
-            if con.type == "Force":
-                value = con.value / deck.geometry.volumes[int(i)]
-            if con.type == "Displacement":
-                value = con.value
-
-            if Time_t <= deck.shape_values[0]:
-                result = (value*Time_t)/deck.shape_values[0]
-                return result
-            elif Time_t > deck.shape_values[0] and Time_t <= deck.shape_values[1]:
-                result = value
-                return result
-            elif Time_t > deck.shape_values[1] and Time_t <= deck.shape_values[2]:
-                result = value - value*(Time_t - deck.shape_values[1])/(deck.shape_values[2] - deck.shape_values[1])
-                return result
-            else:
-                result = 0
-                return result
+    def compute_b_step(self, deck, t_n):
+        self.b[:, :, t_n] = self.boundary.get_force(t_n)
 
     ## Provide the internal force density for each node for a given time step t_n
+    # The nodes' position is a trial state of the solver, so only the internal force density is computed, the arrays of the material
+    # are the work buffers of the problem, which are overwritten by the next evaluation, and the history is not updated, see update_history()
     # @param deck The input deck
     # @param ysolver Initial guess for Actual nodes' position
     # @param t_n Id of the time step
@@ -106,66 +197,111 @@ class PD_problem(abstractions.Problem):
         # Choice of the material class
         if deck.material_type == "Elastic":
             from ..materials.elastic import Elastic_material
-            ## Data from the material class
-            self.mat_class = Elastic_material( deck, self, ysolver )
-            self.update_force_data(self.mat_class, t_n)
-            self.update_ext_state_data(self.mat_class, t_n)
-            self.update_strain_energy_data(self.mat_class, t_n)
+            ## Data from the material class of the last evaluation
+            self.mat_class = Elastic_material( deck, self, ysolver, forces_only=True, buffers=self.work_buffers )
 
         elif deck.material_type == "Viscoelastic":
             from ..materials.viscoelastic import Viscoelastic_material
-            self.mat_class = Viscoelastic_material( deck, self, ysolver, t_n)
-            self.update_force_data(self.mat_class, t_n)
-            self.update_ext_state_data(self.mat_class, t_n)
+            self.mat_class = Viscoelastic_material( deck, self, ysolver, self.delta_t, buffers=self.work_buffers )
+
+        return self.mat_class.f_int
+
+    ## Store the last evaluation of the internal force density as the converged state of a given time step t_n
+    # @param deck The input deck
+    # @param t_n Id of the time step
+    def update_history(self, deck, t_n):
+        self.update_force_data(self.mat_class, t_n)
+        self.update_ext_state_data(self.mat_class, t_n)
+        if deck.material_type == "Elastic":
+            self.mat_class.compute_strain_energy(deck, self)
+            self.update_strain_energy_data(self.mat_class, t_n)
+        elif deck.material_type == "Viscoelastic":
             self.update_ext_state_visco_data(self.mat_class, t_n)
-       
-        force = self.mat_class.f_int
-        #internal_force = np.reshape(internal_force, (deck.num_nodes * deck.dim,-1) )
-        return force
+        if deck.critical_stretch is not None:
+            self.damage[:, t_n] = self.compute_damage(deck)
+
+    ## Set the extension states at the beginning of the load increment to the converged extension states of a given time step t_n
+    # @param deck The input deck
+    # @param t_n Id of the time step
+    def set_previous_state(self, deck, t_n):
+        if deck.material_type == "Viscoelastic":
+            self.ext_previous[:] = self.ext[:, t_n]
+            self.ext_visco_previous[:, :] = self.ext_visco[:, :, t_n]
+
+    ## Set the extension states at the beginning of the next load increment to the last evaluation of the internal force density, i.e. the converged load increment
+    # @param deck The input deck
+    def update_previous_state(self, deck):
+        if deck.material_type == "Viscoelastic":
+            self.ext_previous[:] = self.mat_class.e
+            self.ext_visco_previous[:, :] = self.mat_class.e_visco
+
+    ## Provide the external force density for each node for a given time step t_n
+    # @param t_n Id of the time step, which is fractional for a load increment within a time step
+    # @return External force density for each node
+    def external_force(self, t_n):
+        if t_n == int(t_n):
+            return self.b[:, :, int(t_n)]
+        return self.boundary.get_force(t_n)
 
     ## Provide the residual for each node after a solving step for a given time step t_n
     # @param deck The input deck
     # @param ysolver Initial guess for Actual nodes' position
-    # @param t_n Id of the time step
+    # @param t_n Id of the time step, which is fractional for a load increment within a time step
     # @return Residual for each node
     def residual_vector(self, deck, ysolver, t_n):
-        residual = np.zeros((deck.num_nodes, deck.dim),dtype=np.float64)
+        # The internal force density is evaluated with the displacement conditions of the time step
+        self.boundary.apply_displacement(ysolver, t_n)
         internal_force = self.internal_force(deck, ysolver, t_n)
-        for con in deck.conditions:
-            if con.type == "Displacement" and con.shape == "Fixed":
-                for id_node in con.id:
-                    # x direction
-                    if con.direction == 1:
-                        ysolver[int(id_node),0] = deck.geometry.nodes[int(id_node),0] + con.value
-                    # y direction
-                    if con.direction == 2:
-                        ysolver[int(id_node),1] = deck.geometry.nodes[int(id_node),1] + con.value
-                    # z direction
-                    if con.direction == 3:
-                        ysolver[int(id_node),2] = deck.geometry.nodes[int(id_node),2] + con.value
-
-            if con.type == "Displacement" and con.shape == "Ramp":
-                for i in con.id:
-                    # x direction
-                    if con.direction == 1:
-                        ysolver[int(id_node),0] = self.shape_loading( deck, t_n , con , i )
-                    # y direction
-                    if con.direction == 2:
-                        ysolver[int(id_node),1] = self.shape_loading( deck, t_n , con , i )
-                    # z direction
-                    if con.direction == 3:
-                        ysolver[int(id_node),2] = self.shape_loading( deck, t_n , con , i )
-
-        for i in range(0,deck.num_nodes):
-            found = False
-            for con in deck.conditions:
-                if con.type == "Displacement":
-                    if i in con.id:
-                        found = True
-            if found == False:
-                residual[i,:] = internal_force[i,:] + self.b[i,:, t_n]
+        residual = internal_force + self.external_force(t_n)
+        residual[self.boundary.constrained_nodes, :] = 0.
+        if deck.critical_stretch is not None:
+            # The nodes without any intact bond are not in equilibrium with the external force density, so they keep their position
+            residual[self.detached_nodes, :] = 0.
         return residual
 
+    ## Break the intact bonds whose stretch exceeds the critical stretch of the damage model, a broken bond is never restored
+    # The bond between Node "i" and Node "p" and the bond between Node "p" and Node "i" have the same stretch, so they break together
+    # @param deck The input deck
+    # @param ysolver Actual nodes' position
+    # @return Amount of bonds broken
+    def update_damage(self, deck, ysolver):
+        bonds = self.neighbors.get_bonds(deck)
+        _, norm_Y = bonds.get_actual_bonds(ysolver, slice(None))
+        broken = np.flatnonzero(self.bond_intact & (norm_Y - bonds.norm_X > deck.critical_stretch * bonds.norm_X))
+        if len(broken) > 0:
+            self.break_bonds(deck, broken)
+        return len(broken)
+
+    ## Break some intact bonds, the kernels skip them with their zero influence function
+    # The nodes left without any intact bond are released from the Jacobian system, whose sparsity pattern is not computed again
+    # @param deck The input deck
+    # @param broken Positions of the broken bonds in the flat bond arrays
+    def break_bonds(self, deck, broken):
+        bonds = self.neighbors.get_bonds(deck)
+        self.bond_intact[broken] = False
+        self.bond_influence[broken] = 0.
+        owners = bonds.i[broken]
+        np.subtract.at(self.intact_bonds, owners, 1)
+        owners = np.unique(owners)
+        detached = owners[(self.intact_bonds[owners] == 0) & ~self.detached_nodes[owners]]
+        if len(detached) > 0:
+            self.detached_nodes[detached] = True
+            if hasattr(self.linear_solver, "release_nodes"):
+                self.linear_solver.release_nodes(detached)
+        # The factorization of the Jacobian matrix with the broken bonds is not reused
+        self.factorization_uses = deck.solver_refactorization_interval
+
+    ## Provide the damage of each node, i.e. the fraction of the volume of its family whose bonds are broken
+    # @param deck The input deck
+    # @return Damage of each node, zero for an empty family
+    def compute_damage(self, deck):
+        bonds = self.neighbors.get_bonds(deck)
+        volume = np.bincount(bonds.i, weights=bonds.c_p, minlength=deck.num_nodes)
+        intact = np.bincount(bonds.i, weights=bonds.c_p * self.bond_intact, minlength=deck.num_nodes)
+        result = np.zeros(deck.num_nodes, dtype=np.float64)
+        np.divide(volume - intact, volume, out=result, where=volume > 0.)
+        return result
+
     ## Provide the Jacobian (stiffness) matrix for a given time step t_n for the Newton's method
     # @param deck The input deck
     # @param ysolver Initial guess for Actual nodes' position
@@ -173,31 +309,169 @@ class PD_problem(abstractions.Problem):
     # @param perturbation_factor Magnitude of the perturbation factor
     # @return Jacobian matrix
     def jacobian_matrix(self, deck, ysolver, t_n, perturbation_factor):
+        if deck.solver_jacobian == "Analytic":
+            return self.jacobian_matrix_analytic(deck, ysolver, t_n)
+        if deck.solver_jacobian == "Local_Finite_Difference":
+            return self.jacobian_matrix_local_finite_difference(deck, ysolver, t_n, perturbation_factor)
+        return self.jacobian_matrix_finite_difference(deck, ysolver, t_n, perturbation_factor)
+
+    ## Provide the Jacobian (stiffness) matrix for a given time step t_n using the analytic tangent stiffness of the material
+    # @param deck The input deck
+    # @param ysolver Initial guess for Actual nodes' position
+    # @param t_n Id of the time step
+    # @return Sparse Jacobian matrix
+    def jacobian_matrix_analytic(self, deck, ysolver, t_n):
+        from ..materials.elastic import Elastic_material
+        # The Jacobian matrix is evaluated at the position of the last residual, so the work buffers of the internal force density are reused
+        mat_class = Elastic_material( deck, self, ysolver, forces_only=True, buffers=self.work_buffers )
+        rows, cols, values = mat_class.compute_tangent_stiffness(deck, self, ysolver)
+        return self.linear_solver.assemble(rows, cols, values, deck.solver_jacobian)
+
+    ## Provide a greedy coloring of the nodes
+    # @param deck The input deck
+    # @param conflicts Adjacency matrix of the nodes which can not share a color
+    # @return Color of each node
+    def compute_coloring(self, deck, conflicts):
+        colors = np.full(deck.num_nodes, -1, dtype=int)
+        for j in range(0, deck.num_nodes):
+            used = colors[conflicts.indices[conflicts.indptr[j]:conflicts.indptr[j+1]]]
+            free = np.ones(len(used) + 1, dtype=bool)
+            free[used[(used >= 0) & (used <= len(used))]] = False
+            colors[j] = np.argmax(free)
+        return colors
+
+    ## Compute the coloring of the nodes for the localized finite difference Jacobian matrix
+    # Nodes sharing the same color do not influence the internal force density of a common node, so they are perturbed together
+    # @param deck The input deck
+    def compute_jacobian_coloring(self, deck):
+        ## Nodes influencing the internal force density of each node, i.e. nodes within two horizons
+        self.jacobian_pattern = self.linear_solver.node_pattern
+        # Nodes whose perturbations influence a common node
+        conflicts = self.jacobian_pattern.dot(self.jacobian_pattern).tocsr()
+        ## Color of each node
+        self.jacobian_colors = self.compute_coloring(deck, conflicts)
+        del conflicts
+
+        # Nodes whose family has to be evaluated to obtain the internal force density of the nodes within two horizons
+        evaluated = self.neighbors.get_adjacency_matrix(3)
+        ## Nodes perturbed together for each color
+        self.jacobian_groups = []
+        ## Nodes whose family is evaluated for each color
+        self.jacobian_evaluated_ids = []
+        for color in range(0, np.max(self.jacobian_colors) + 1):
+            group = np.flatnonzero(self.jacobian_colors == color)
+            self.jacobian_groups.append(group)
+            self.jacobian_evaluated_ids.append(np.unique(evaluated[group].indices))
+
+    ## Compute the coloring of the nodes for the finite difference diagonal blocks of the Jacobian matrix
+    # Nodes sharing the same color do not influence the internal force density of each other, so they are perturbed together
+    # @param deck The input deck
+    def compute_diagonal_coloring(self, deck):
+        ## Color of each node
+        self.diagonal_colors = self.compute_coloring(deck, self.neighbors.get_adjacency_matrix(2))
+        # Nodes whose family has to be evaluated to obtain the internal force density of the perturbed nodes
+        evaluated = self.neighbors.get_adjacency_matrix(1)
+        ## Nodes perturbed together for each color
+        self.diagonal_groups = []
+        ## Nodes whose family is evaluated for each color
+        self.diagonal_evaluated_ids = []
+        for color in range(0, np.max(self.diagonal_colors) + 1):
+            group = np.flatnonzero(self.diagonal_colors == color)
+            self.diagonal_groups.append(group)
+            self.diagonal_evaluated_ids.append(np.unique(evaluated[group].indices))
+
+    ## Provide the diagonal (dim x dim) blocks of the Jacobian matrix for a given time step t_n using localized central finite differences
+    # @param deck The input deck
+    # @param ysolver Initial guess for Actual nodes' position
+    # @param t_n Id of the time step
+    # @param perturbation_factor Magnitude of the perturbation factor
+    # @return Diagonal block of each node
+    def jacobian_diagonal_finite_difference(self, deck, ysolver, t_n, perturbation_factor):
+        eps = perturbation_factor * deck.delta_X
+        blocks = np.zeros((deck.num_nodes, deck.dim, deck.dim), dtype=np.float64)
+        for group, ids in zip(self.diagonal_groups, self.diagonal_evaluated_ids):
+            for r in range(0, deck.dim):
+                eps_vector = np.zeros((deck.num_nodes , deck.dim),dtype=np.float64)
+                eps_vector[group,r] = eps
+                force_int_p = self.local_internal_force(deck, ysolver + eps_vector, t_n, ids)
+                force_int_m = self.local_internal_force(deck, ysolver - eps_vector, t_n, ids)
+                blocks[group,:,r] = (force_int_p[group,:] - force_int_m[group,:]) / (2.*eps)
+        return blocks
+
+    ## Provide the Jacobian (stiffness) matrix for a given time step t_n using localized central finite differences
+    # Only the nodes within three horizons of the perturbed nodes are evaluated and all nodes of one color are perturbed at once
+    # @param deck The input deck
+    # @param ysolver Initial guess for Actual nodes' position
+    # @param t_n Id of the time step
+    # @param perturbation_factor Magnitude of the perturbation factor
+    # @return Sparse Jacobian matrix
+    def jacobian_matrix_local_finite_difference(self, deck, ysolver, t_n, perturbation_factor):
         eps = perturbation_factor * deck.delta_X
-        jacobian = np.zeros((deck.num_nodes * deck.dim , deck.num_nodes * deck.dim),dtype=np.float64)
+        rows = []
+        cols = []
+        values = []
+        for group, ids in zip(self.jacobian_groups, self.jacobian_evaluated_ids):
+            # Nodes within two horizons of each perturbed node
+            pattern = self.jacobian_pattern[group]
+            lengths = np.diff(pattern.indptr)
+            nodes_j = np.repeat(group, lengths)
+            nodes_i = pattern.indices
+            for r in range(0, deck.dim):
+                eps_vector = np.zeros((deck.num_nodes , deck.dim),dtype=np.float64)
+                eps_vector[group,r] = eps
+                force_int_p = self.local_internal_force(deck, ysolver + eps_vector, t_n, ids)
+                force_int_m = self.local_internal_force(deck, ysolver - eps_vector, t_n, ids)
+                force_int_diff = (force_int_p[nodes_i,:] - force_int_m[nodes_i,:]) / (2.*eps)
+                for s in range(0, deck.dim):
+                    rows.append(nodes_i * deck.dim + s)
+                    cols.append(nodes_j * deck.dim + r)
+                    values.append(force_int_diff[:,s])
+        return self.linear_solver.assemble(np.concatenate(rows), np.concatenate(cols), np.concatenate(values), deck.solver_jacobian)
+
+    ## Provide the internal force density for a given time step t_n evaluating only the family of some nodes
+    # The history of the problem is not updated
+    # @param deck The input deck
+    # @param ysolver Actual nodes' position
+    # @param t_n Id of the time step
+    # @param ids Ids of the nodes whose family is evaluated
+    # @return Internal force density, which is exact for the nodes whose complete family is among ids
+    def local_internal_force(self, deck, ysolver, t_n, ids):
+        # The callers keep the returned internal force density between two evaluations, so the work buffers are not reused
+        if deck.material_type == "Elastic":
+            from ..materials.elastic import Elastic_material
+            mat_class = Elastic_material( deck, self, ysolver, ids, forces_only=True )
+        elif deck.material_type == "Viscoelastic":
+            from ..materials.viscoelastic import Viscoelastic_material
+            mat_class = Viscoelastic_material( deck, self, ysolver, self.delta_t, ids )
+        return mat_class.f_int
 
-        #ids = []
-        #for con in deck.conditions:
-        #    if con.type == "Displacement":
-        #        for i in con.id:
-        #            ids.append(i)
+    ## Provide the Jacobian (stiffness) matrix for a given time step t_n using central finite differences
+    # @param deck The input deck
+    # @param ysolver Initial guess for Actual nodes' position
+    # @param t_n Id of the time step
+    # @param perturbation_factor Magnitude of the perturbation factor
+    # @return Jacobian matrix
+    def jacobian_matrix_finite_difference(self, deck, ysolver, t_n, perturbation_factor):
+        eps = perturbation_factor * deck.delta_X
+        rows = []
+        cols = []
+        values = []
 
         for i in range(0, deck.num_nodes):
             traversal_list = np.append([i],self.neighbors.get_index_x_family(i))
             for j in traversal_list :
                 for r in range(0, deck.dim):
                     eps_vector = np.zeros((deck.num_nodes , deck.dim),dtype=np.float64)
-                    eps_vector[j,r] = eps
-                    force_int_p = self.internal_force(deck, ysolver + eps_vector, t_n)[i,:]
-                    force_int_m = self.internal_force(deck, ysolver - eps_vector, t_n)[i,:]
+                    eps_vector[int(j),r] = eps
+                    force_int_p = self.local_internal_force(deck, ysolver + eps_vector, t_n, None)[i,:]
+                    force_int_m = self.local_internal_force(deck, ysolver - eps_vector, t_n, None)[i,:]
                     force_int_diff = (force_int_p - force_int_m)
                     del force_int_p;
                     del force_int_m;
-                    for s in range(0, deck.dim):
-                        if r==s:
-                            jacobian[i*deck.dim+r,j*deck.dim+s] = force_int_diff[r] / (2.*eps)
-        #print "Jacobian Matrix Density =", np.count_nonzero(jacobian) / (float(deck.num_nodes) * float(deck.dim))**2 * 100., "%"
-        return jacobian
+                    rows.append(i*deck.dim+r)
+                    cols.append(int(j)*deck.dim+r)
+                    values.append(force_int_diff[r] / (2.*eps))
+        return self.linear_solver.assemble(np.asarray(rows, dtype=int), np.asarray(cols, dtype=int), np.asarray(values, dtype=np.float64), deck.solver_jacobian)
 
     ## Provide the displacement increment resulting for the Newton's method, for each node for a given time step t_n
     # @param deck The input deck
@@ -208,62 +482,440 @@ class PD_problem(abstractions.Problem):
     # @return Displacement increment for each node
     def newton_step(self, deck, ysolver, t_n, perturbation_factor, residual):
         jacobian = self.jacobian_matrix(deck, ysolver, t_n, perturbation_factor)
-        residual = np.reshape(residual,(deck.dim*deck.num_nodes,1))
-
-        removeId = []
-        for con in deck.conditions:
-            if con.type == "Displacement":
-                for i in con.id:
-                    removeId.append(int((i*deck.dim) + con.direction-1))
-        removeId.sort()
-
-        jacobian = np.delete(jacobian,removeId,0)
-        jacobian = np.delete(jacobian,removeId,1)
-        residual = np.delete(residual,removeId,0)
-
-        #delta_y = linalg.solve(jacobian, -residual, check_finite = "False", assume_a = "sym" )
-        #delta_y = linalg.solve(jacobian, -residual, check_finite = "False")
-
-        s = sparse.csr_matrix(jacobian)
-        delta_y = linalg.spsolve(s, -residual)
-
-        mask = np.ones((deck.num_nodes * deck.dim), dtype=bool)
-        mask[removeId] = False
-
-        result = np.zeros((deck.num_nodes * deck.dim),dtype=np.float64)
-        i = 0
-        j = 0
-        for m in mask:
-            if m == True:
-                result[int(i)] = delta_y[int(j)]
-                j+= 1
-            i += 1
+        self.linear_solver.factorize(jacobian)
+        result = self.linear_solver.solve(-residual)
         return np.reshape(result, (deck.num_nodes,deck.dim))
 
-    ## Solve the peridynamic problem at each time step using the Newton's method to obtain the actual nodes' position
+    ## Provide the displacement increment resulting for the matrix-free Newton-Krylov method, for each node for a given time step t_n
+    # The products of the Jacobian matrix with vectors are provided by the analytic linearization of the material or by directional
+    # finite differences of the internal force density, and the Krylov method is preconditioned with the diagonal blocks of the Jacobian matrix
     # @param deck The input deck
     # @param ysolver Initial guess for Actual nodes' position
-    def quasi_static_solver(self, deck, ysolver):
-        for t_n in range(1, deck.time_steps):
-            res = float('inf')
-            iteration = 1
+    # @param t_n Id of the time step
+    # @param perturbation_factor Magnitude of the perturbation factor
+    # @param residual Residual for each node resulting from a solving step
+    # @return Displacement increment for each node
+    def newton_krylov_step(self, deck, ysolver, t_n, perturbation_factor, residual):
+        shape = (deck.num_nodes, deck.dim)
+        if deck.solver_jacobian == "Analytic":
+            from ..materials.elastic import Elastic_material
+            mat_class = Elastic_material( deck, self, ysolver, forces_only=True, buffers=self.work_buffers )
+            # The linearization data of the bonds does not depend on the vector, so it is computed once for all products
+            tangent_data = mat_class.get_tangent_data(deck, self, ysolver)
+            self.linear_solver.set_preconditioner(mat_class.compute_tangent_diagonal(deck, tangent_data))
+
+            def product(v):
+                return np.reshape(mat_class.compute_tangent_product(deck, tangent_data, np.reshape(v, shape)), -1)
+        else:
+            self.linear_solver.set_preconditioner(self.jacobian_diagonal_finite_difference(deck, ysolver, t_n, perturbation_factor))
+            force_int = self.local_internal_force(deck, ysolver, t_n, None)
+            eps = perturbation_factor * deck.delta_X
+
+            def product(v):
+                # The largest perturbation of a node is eps
+                norm_v = np.max(np.abs(v))
+                if norm_v == 0.:
+                    return np.zeros_like(v)
+                h = eps / norm_v
+                force_int_p = self.local_internal_force(deck, ysolver + h * np.reshape(v, shape), t_n, None)
+                return np.reshape(force_int_p - force_int, -1) / h
+
+        result = self.linear_solver.solve(product, -residual)
+        return np.reshape(result, shape)
+
+    ## Provide the displacement increment of the solver type selected in the deck, for each node for a given time step t_n
+    # The modified Newton's method and Broyden's method reuse the factorization of the Jacobian matrix until the
+    # refactorization interval is reached or the residual norm does not decrease by the stagnation ratio anymore
+    # @param deck The input deck
+    # @param ysolver Initial guess for Actual nodes' position
+    # @param t_n Id of the time step
+    # @param residual Residual for each node resulting from a solving step
+    # @param res Norm of the residual
+    # @param res_previous Norm of the residual at the previous iteration
+    # @return Displacement increment for each node
+    def solver_step(self, deck, ysolver, t_n, residual, res, res_previous):
+        if deck.solver_type == "Newton":
+            return self.newton_step(deck, ysolver, t_n, deck.solver_perturbation, residual)
+        if deck.solver_type == "Newton_Krylov":
+            return self.newton_krylov_step(deck, ysolver, t_n, deck.solver_perturbation, residual)
+
+        if self.linear_solver.factor is None or self.factorization_uses >= deck.solver_refactorization_interval or res > deck.solver_stagnation_ratio * res_previous:
+            jacobian = self.jacobian_matrix(deck, ysolver, t_n, deck.solver_perturbation)
+            self.linear_solver.factorize(jacobian)
+            self.factorization_uses = 0
+            self.broyden_updates = []
+            self.broyden_residual = None
+        self.factorization_uses += 1
+
+        if deck.solver_type == "Broyden":
+            return self.broyden_step(deck, residual)
+        result = self.linear_solver.solve(-residual)
+        return np.reshape(result, (deck.num_nodes,deck.dim))
+
+    ## Provide the displacement increment resulting from Broyden's method, using the factorized Jacobian matrix as initial inverse Jacobian matrix
+    # @param deck The input deck
+    # @param residual Residual for each node resulting from a solving step
+    # @return Displacement increment for each node
+    def broyden_step(self, deck, residual):
+        residual = np.reshape(residual, (deck.num_nodes * deck.dim))
+        if self.broyden_residual is not None:
+            # Good Broyden update of the inverse Jacobian matrix
+            tmp = self.apply_inverse_jacobian(residual - self.broyden_residual)
+            denominator = np.dot(self.broyden_increment, tmp)
+            if denominator != 0.:
+                self.broyden_updates.append(((self.broyden_increment - tmp) / denominator, self.broyden_increment))
+        result = -self.apply_inverse_jacobian(residual)
+        self.broyden_residual = residual.copy()
+        self.broyden_increment = result
+        return np.reshape(result, (deck.num_nodes,deck.dim))
+
+    ## Apply the inverse Jacobian matrix of Broyden's method to a vector
+    # @param vector Vector with a value for each degree of freedom
+    # @return Image of the vector
+    def apply_inverse_jacobian(self, vector):
+        result = self.linear_solver.solve(vector)
+        for a, s in self.broyden_updates:
+            result += a * np.dot(s, result)
+        return result
+
+    ## Provide the fields of the problem stored in a checkpoint
+    # @param deck The input deck
+    # @return Dictionary of the histories of the fields
+    def get_checkpoint_fields(self, deck):
+        fields = {"Position": self.y, "Force": self.force_int, "External_Force": self.b, "Extension": self.ext, "Strain_Energy": self.strain_energy}
+        if deck.material_type == "Viscoelastic":
+            fields["Viscoelastic_Extension"] = self.ext_visco
+        if deck.critical_stretch is not None:
+            fields["Damage"] = self.damage
+        return fields
+
+    ## Write a checkpoint of the problem solved until a given time step t_n
+    # The checkpoint stores the time steps of the Full history until t_n, or the state of the Streaming history, the families of the nodes and the state of the solver
+    # @param deck The input deck
+    # @param t_n Id of the time step
+    def write_checkpoint(self, deck, t_n):
+        data = {"Time_Step": t_n, "Num_Nodes": deck.num_nodes, "Dim": deck.dim, "Time_Steps": deck.time_steps, "History_Type": deck.history_type,
+            "Offsets": self.neighbors.offsets, "Families": self.neighbors.indices, "Factorization_Uses": self.factorization_uses}
+        if deck.history_type == "Streaming":
+            # The selected time steps in memory are written to disk, so the checkpoint only stores the time steps in memory
+            self.flush_history()
+        for name, field in self.get_checkpoint_fields(deck).items():
+            if deck.history_type == "Full":
+                data[name] = field[..., :t_n+1]
+            else:
+                for key, value in field.get_state().items():
+                    data[name + "_" + key] = value
+        if deck.critical_stretch is not None:
+            # The mask of the intact bonds is stored as bits
+            data["Bond_Intact"] = np.packbits(self.bond_intact)
+        if self.velocity is not None:
+            data["Velocity"] = self.velocity
+            data["Acceleration"] = self.acceleration
+        if deck.solver_adaptive:
+            data["Load_Increment"] = self.load_increment
+            if self.predictor is not None:
+                data["Predictor"] = self.predictor
+        # The factorized Jacobian matrix and the Broyden updates are reused by the modified Newton's method and Broyden's method
+        if hasattr(self.linear_solver, "jacobian_data") and self.linear_solver.jacobian_data is not None:
+            data["Jacobian"] = self.linear_solver.jacobian_data
+            if len(self.broyden_updates) > 0:
+                data["Broyden_A"] = np.array([a for a, s in self.broyden_updates])
+                data["Broyden_S"] = np.array([s for a, s in self.broyden_updates])
+        util_checkpoint.write_checkpoint(deck.checkpoint_file, data)
+
+    ## Restore the problem solved until the time step of a checkpoint
+    # @param deck The input deck
+    # @param checkpoint Checkpoint written by write_checkpoint
+    def restore_checkpoint(self, deck, checkpoint):
+        if int(checkpoint["Num_Nodes"]) != deck.num_nodes or int(checkpoint["Dim"]) != deck.dim or int(checkpoint["Time_Steps"]) != deck.time_steps:
+            print ("Error: The checkpoint does not match the discretization of the deck")
+            sys.exit(1)
+        if str(checkpoint["History_Type"]) != deck.history_type:
+            print ("Error: The checkpoint was written with the " + str(checkpoint["History_Type"]) + " history")
+            sys.exit(1)
+        t_n = int(checkpoint["Time_Step"])
+        for name, field in self.get_checkpoint_fields(deck).items():
+            if deck.history_type == "Full":
+                if not name in checkpoint:
+                    print ("Error: No field " + name + " found in the checkpoint")
+                    sys.exit(1)
+                field[..., :t_n+1] = checkpoint[name]
+            else:
+                field.set_state({key: checkpoint[name + "_" + key] for key in ["memory", "slots", "assigned", "written"]})
+        if deck.critical_stretch is not None:
+            if not "Bond_Intact" in checkpoint:
+                print ("Error: No field Bond_Intact found in the checkpoint")
+                sys.exit(1)
+            intact = np.unpackbits(checkpoint["Bond_Intact"], count=len(self.bond_intact)).astype(bool)
+            self.break_bonds(deck, np.flatnonzero(~intact))
+        if "Jacobian" in checkpoint and hasattr(self.linear_solver, "jacobian_data"):
+            self.linear_solver.factorize(sparse.csr_matrix((checkpoint["Jacobian"], self.linear_solver.indices, self.linear_solver.indptr), shape=(self.linear_solver.size, self.linear_solver.size)))
+            self.factorization_uses = int(checkpoint["Factorization_Uses"])
+            if "Broyden_A" in checkpoint:
+                self.broyden_updates = list(zip(checkpoint["Broyden_A"], checkpoint["Broyden_S"]))
+        if "Velocity" in checkpoint:
+            self.velocity = checkpoint["Velocity"]
+            self.acceleration = checkpoint["Acceleration"]
+        if deck.solver_adaptive and "Load_Increment" in checkpoint:
+            self.load_increment = float(checkpoint["Load_Increment"])
+            if "Predictor" in checkpoint:
+                self.predictor = checkpoint["Predictor"]
+        self.restart_step = t_n
+
+    ## Solve the load increment ending at a given time step t_n using the solver type selected in the deck
+    # @param deck The input deck
+    # @param ysolver Initial guess for Actual nodes' position, which is updated to the solution
+    # @param t_n Id of the time step, which is fractional for a load increment within a time step
+    # @return Residual norm, amount of iterations and True if the solver converged
+    def newton_solve(self, deck, ysolver, t_n):
+        res = float('inf')
+        iteration = 1
+        residual = self.residual_vector(deck, ysolver, t_n)
+
+        res = linalgebra.norm(residual)
+        res_previous = float('inf')
+        # The load changed, so the residuals of the previous load increment are not used for Broyden's update
+        self.broyden_residual = None
+
+        while res >= deck.solver_tolerance and iteration <= deck.solver_max_it :
+            print ("iteration", iteration , res)
+            # The adaptive time stepping reduces the load increment instead
+            if iteration == deck.solver_max_it and not deck.solver_adaptive:
+                print ("Warning: Solver reached limit of " + str(deck.solver_max_it) + " iterations")
+            delta_y = self.solver_step(deck, ysolver, t_n, residual, res, res_previous)
+            ysolver += delta_y
             residual = self.residual_vector(deck, ysolver, t_n)
 
+            res_previous = res
             res = linalgebra.norm(residual)
-           
-            while res >= deck.solver_tolerance and iteration <= deck.solver_max_it :
-                print ("iteration", iteration , res)
-                if iteration == deck.solver_max_it:
-                    print ("Warning: Solver reached limit of " + str(deck.solver_max_it) + " iterations")
-                delta_y = self.newton_step(deck, ysolver, t_n, deck.solver_perturbation, residual)
-                ysolver += delta_y
-                residual = self.residual_vector(deck, ysolver, t_n)
-
-                res = linalgebra.norm(residual)
-
-                iteration += 1
+
+            iteration += 1
+        return res, iteration - 1, res < deck.solver_tolerance
+
+    ## Solve a given time step t_n with load increments adapted to the convergence of the solver
+    # A load increment converging within half of Target_Iterations increases the next load increment by Growth_Factor and a load increment
+    # converging within more than Target_Iterations decreases it by Cut_Factor. A load increment not converging within Max_Iteration is solved
+    # again from the last converged state with the load increment decreased by Cut_Factor. The last load increment ends at the time step,
+    # so the results are stored at the time steps of the deck.
+    # @param deck The input deck
+    # @param ysolver Actual nodes' position at the previous time step, which is updated to the solution
+    # @param t_n Id of the time step
+    # @return Residual norm of the last load increment, amount of iterations and amount of converged load increments of the time step
+    def adaptive_time_step(self, deck, ysolver, t_n):
+        start = float(t_n - 1)
+        iterations = 0
+        increments = 0
+        while start < t_n:
+            end = min(start + self.load_increment, t_n)
+            # A load increment below Min_Increment is not left before the time step
+            if t_n - end < deck.adaptive_min:
+                end = t_n
+            increment = end - start
+            self.delta_t = increment * deck.delta_t
+            ytrial = ysolver.copy()
+            if self.predictor is not None:
+                ytrial += self.predictor * increment
+            res, iteration, converged = self.newton_solve(deck, ytrial, end)
+            iterations += iteration
+            if converged:
+                self.predictor = (ytrial - ysolver) / increment
+                ysolver[:, :] = ytrial
+                start = end
+                increments += 1
+                if start < t_n:
+                    self.update_previous_state(deck)
+                if iteration <= deck.adaptive_target / 2:
+                    self.load_increment = min(1., self.load_increment * deck.adaptive_growth)
+                elif iteration > deck.adaptive_target:
+                    self.load_increment = max(deck.adaptive_min, increment * deck.adaptive_cut)
+            else:
+                self.load_increment = increment * deck.adaptive_cut
+                print ("Warning: Solver did not converge, the load increment is reduced to " + str(self.load_increment) + " time steps")
+                if self.load_increment < deck.adaptive_min:
+                    print ("Error: The load increment of the time step " + str(t_n) + " is below Min_Increment")
+                    sys.exit(1)
+                # The predictor and the Jacobian matrix of the failed load increment are not reused
+                self.predictor = None
+                self.factorization_uses = deck.solver_refactorization_interval
+        return res, iterations, increments
+
+    ## Solve the peridynamic problem at each time step using the Newton's method to obtain the actual nodes' position
+    # A restarted problem continues after the time step of the checkpoint. With the damage model, a time step is solved again until no bond breaks
+    # and the simulation stops if the solver does not converge after breaking bonds, with the adaptive time stepping the load increment is reduced instead.
+    # @param deck The input deck
+    # @param ysolver Initial guess for Actual nodes' position
+    def quasi_static_solver(self, deck, ysolver):
+        deck.results_store.create(deck, self, self.restart_step)
+        for t_n in range(self.restart_step + 1, deck.time_steps):
+            if deck.history_type == "Streaming":
+                self.compute_b_step(deck, t_n)
+            self.set_previous_state(deck, t_n - 1)
+            if deck.solver_adaptive:
+                yprevious = ysolver.copy()
+                res, iteration, increments = self.adaptive_time_step(deck, ysolver, t_n)
+            elif deck.solver_type == "Dynamic_Relaxation":
+                res, iteration, converged = self.relaxation_solve(deck, ysolver, t_n)
+            else:
+                res, iteration, converged = self.newton_solve(deck, ysolver, t_n)
+            if not np.isfinite(res):
+                print ("Error: The residual of the time step " + str(t_n) + " is not finite")
+                sys.exit(1)
+            if deck.critical_stretch is not None:
+                # The bonds are only broken at an equilibrium, the adaptive time stepping only returns converged load increments
+                if not deck.solver_adaptive and not converged:
+                    print ("Error: Solver did not converge at the time step " + str(t_n) + " before breaking bonds, res: " + str(res))
+                    sys.exit(1)
+                broken = self.update_damage(deck, ysolver)
+                # The broken bonds change the equilibrium, so the time step is solved again until no bond breaks
+                while broken > 0:
+                    print ("t_n:" , t_n , "Broken bonds #", broken)
+                    if deck.solver_adaptive:
+                        # The time step is solved again from the previous time step, so the load increment is reduced if the solver does not converge
+                        ysolver[:, :] = yprevious
+                        self.set_previous_state(deck, t_n - 1)
+                        res, resolve_iterations, resolve_increments = self.adaptive_time_step(deck, ysolver, t_n)
+                        increments += resolve_increments
+                    else:
+                        if deck.solver_type == "Dynamic_Relaxation":
+                            res, resolve_iterations, converged = self.relaxation_solve(deck, ysolver, t_n)
+                        else:
+                            res, resolve_iterations, converged = self.newton_solve(deck, ysolver, t_n)
+                        # The bonds are only broken at an equilibrium
+                        if not converged or not np.isfinite(res):
+                            print ("Error: Solver did not converge at the time step " + str(t_n) + " after breaking bonds, res: " + str(res))
+                            sys.exit(1)
+                    iteration += resolve_iterations
+                    broken = self.update_damage(deck, ysolver)
+            # Only the converged state is stored in the history
+            self.update_history(deck, t_n)
+            self.y[:,:,t_n] = ysolver
+            deck.results_store.append(deck, self, t_n)
+            if deck.solver_adaptive:
+                print ("t_n:" , t_n , "res:" , res , "Iteration #",iteration, "Increments #", increments)
+            else:
+                print ("t_n:" , t_n , "res:" , res , "Iteration #",iteration)
+            if deck.checkpoint_file is not None and t_n % deck.checkpoint_interval == 0 and t_n < deck.time_steps - 1:
+                self.write_checkpoint(deck, t_n)
+        self.flush_history()
+
+    ## Provide a bound of the stiffness of each node for the material of the deck, i.e. of the eigenvalues of the tangent stiffness matrix
+    # @param deck The input deck
+    # @return Stiffness bound of each node
+    def compute_stiffness_bound(self, deck):
+        if deck.material_type == "Elastic":
+            from ..materials.elastic import Elastic_material
+            material_class = Elastic_material
+        elif deck.material_type == "Viscoelastic":
+            from ..materials.viscoelastic import Viscoelastic_material
+            material_class = Viscoelastic_material
+        # The bound only depends on the parameters of the material
+        material = material_class.__new__(material_class)
+        material.set_parameters(deck, self)
+        return material.compute_stiffness_bound(deck, self)
+
+    ## Provide the stable time step of the explicit dynamic solver
+    # The central difference scheme is stable for delta_t <= 2 / omega_max and the eigenfrequencies satisfy omega^2 <= max(stiffness bound) / density
+    # @param deck The input deck
+    # @return Stable time step scaled by the Safety_Factor
+    def stable_time_step(self, deck):
+        return deck.solver_safety_factor * 2. * np.sqrt(deck.density / np.max(self.compute_stiffness_bound(deck)))
+
+    ## Provide the acceleration of each node for a given time step t_n, the degrees of freedom with a displacement condition are not accelerated
+    # @param deck The input deck
+    # @param ysolver Actual nodes' position
+    # @param t_n Id of the time step, which is fractional for a substep within a time step
+    # @return Acceleration of each node
+    def dynamic_acceleration(self, deck, ysolver, t_n):
+        acceleration = (self.internal_force(deck, ysolver, t_n) + self.external_force(t_n)) / deck.density
+        acceleration[self.boundary.displacement_nodes, self.boundary.displacement_directions] = 0.
+        return acceleration
+
+    ## Solve the peridynamic problem at each time step with the explicit velocity-Verlet (central difference) scheme
+    # Each time step of the deck is integrated with the amount of equal substeps needed by the stable time step, so the results are stored at the time steps of the deck.
+    # A substep evaluates the internal force density once and solves no linear system. The degrees of freedom with a displacement condition follow it.
+    # A restarted problem continues after the time step of the checkpoint with the velocities and the accelerations of the checkpoint
+    # @param deck The input deck
+    # @param ysolver Actual nodes' position at the initial time step
+    def dynamic_solver(self, deck, ysolver):
+        deck.results_store.create(deck, self, self.restart_step)
+        stable = self.stable_time_step(deck)
+        substeps = int(np.ceil(deck.delta_t / stable))
+        self.delta_t = deck.delta_t / substeps
+        print ("Stable time step:", stable, "Substeps per time step:", substeps)
+        dofs = (self.boundary.displacement_nodes, self.boundary.displacement_directions)
+        if self.velocity is None:
+            self.velocity = np.zeros((deck.num_nodes, deck.dim), dtype=np.float64)
+            self.set_previous_state(deck, self.restart_step)
+            self.acceleration = self.dynamic_acceleration(deck, ysolver, self.restart_step)
+        for t_n in range(self.restart_step + 1, deck.time_steps):
+            if deck.history_type == "Streaming":
+                self.compute_b_step(deck, t_n)
+            self.set_previous_state(deck, t_n - 1)
+            for s in range(1, substeps + 1):
+                time = t_n - 1 + s / float(substeps)
+                self.velocity += 0.5 * self.delta_t * self.acceleration
+                y_previous = ysolver[dofs]
+                ysolver += self.delta_t * self.velocity
+                self.boundary.apply_displacement(ysolver, time)
+                self.velocity[dofs] = (ysolver[dofs] - y_previous) / self.delta_t
+                if deck.critical_stretch is not None:
+                    self.update_damage(deck, ysolver)
+                self.acceleration = self.dynamic_acceleration(deck, ysolver, time)
+                self.velocity += 0.5 * self.delta_t * self.acceleration
+                if s < substeps:
+                    self.update_previous_state(deck)
+            self.update_history(deck, t_n)
             self.y[:,:,t_n] = ysolver
-            print ("t_n:" , t_n , "res:" , res , "Iteration #",iteration-1)
+            deck.results_store.append(deck, self, t_n)
+            print ("t_n:" , t_n , "Substeps #", substeps)
+            if deck.checkpoint_file is not None and t_n % deck.checkpoint_interval == 0 and t_n < deck.time_steps - 1:
+                self.write_checkpoint(deck, t_n)
+        self.flush_history()
+
+    ## Solve a given time step t_n with the adaptive dynamic relaxation
+    # The residual drives a fictitious dynamics with a unit time step, a fictitious density of each node bounding its stiffness and the damping
+    # c = 2 * sqrt(u^T K u / u^T u) of the lowest mode estimated with the diagonal local stiffness K of the last iteration, which converges to the
+    # static equilibrium. An iteration only evaluates the internal force density, so it needs no Jacobian matrix and no linear solve.
+    # @param deck The input deck
+    # @param ysolver Initial guess for Actual nodes' position, which is updated to the solution
+    # @param t_n Id of the time step
+    # @return Residual norm, amount of iterations and True if the solver converged
+    def relaxation_solve(self, deck, ysolver, t_n):
+        if self.relaxation_density is None:
+            self.relaxation_density = np.repeat((self.compute_stiffness_bound(deck) / (4. * deck.solver_safety_factor**2))[:, None], deck.dim, axis=1)
+        density = self.relaxation_density
+        residual = self.residual_vector(deck, ysolver, t_n)
+        res = linalgebra.norm(residual)
+        iteration = 0
+        while res >= deck.solver_tolerance and iteration < deck.solver_max_it:
+            if iteration == 0:
+                velocity = 0.5 * residual / density
+            else:
+                # Diagonal local stiffness of the last iteration
+                stiffness = np.zeros((deck.num_nodes, deck.dim), dtype=np.float64)
+                moving = velocity != 0.
+                stiffness[moving] = -(residual[moving] - residual_previous[moving]) / (density[moving] * velocity[moving])
+                displacement = ysolver - deck.geometry.nodes
+                numerator = np.sum(displacement * stiffness * displacement)
+                denominator = np.sum(displacement * displacement)
+                damping = 0.
+                if numerator > 0. and denominator > 0.:
+                    damping = min(2. * np.sqrt(numerator / denominator), 2.)
+                velocity = ((2. - damping) * velocity + 2. * residual / density) / (2. + damping)
+            ysolver += velocity
+            residual_previous = residual
+            residual = self.residual_vector(deck, ysolver, t_n)
+            res = linalgebra.norm(residual)
+            iteration += 1
+        if res >= deck.solver_tolerance:
+            print ("Warning: Solver reached limit of " + str(deck.solver_max_it) + " iterations")
+        return res, iteration, res < deck.solver_tolerance
+
+    ## Stop the worker processes of the problem
+    def close(self):
+        if self.worker_pool is not None:
+            self.worker_pool.close()
+            self.worker_pool = None
 
     ## Store the internal force density for each node at each time step
     # @param mat_class Data from the material class
@@ -276,21 +928,21 @@ class PD_problem(abstractions.Problem):
     # @param mat_class Data from the material class
     # @param t_n Id of the time step
     def update_ext_state_data(self, mat_class, t_n):
-        # Extension state at each node between the node and its family
-        self.ext[:, :, t_n] = mat_class.e
+        # Extension state of each bond between a node and its family
+        self.ext[:, t_n] = mat_class.e
 
     ## Store the viscoelastic part of the extension state for each node between itself and its family
     # @param mat_class Data from the material class
     # @param t_n Id of the time step
     def update_ext_state_visco_data(self, mat_class, t_n):
         # Viscoelastic part of the extension state at each node between the node and its family
-        self.ext_visco[:, :, :, t_n] = mat_class.e_visco
+        self.ext_visco[:, :, t_n] = mat_class.e_visco
 
     ## Store the strain energy for each node between itself and its family
     # @param mat_class Data from the material class
     # @param t_n Id of the time step
     def update_strain_energy_data(self, mat_class, t_n):
-        # Viscoelastic part of the extension state at each node between the node and its family
+        # Strain energy density at each node between the node and its family
         self.strain_energy[:, t_n] = mat_class.strain_energy
 
     ## Provide the strain between 2 nodes
@@ -299,7 +951,7 @@ class PD_problem(abstractions.Problem):
     # @param id_Node_2 Id of the 2nd node
     def strain_calculation(self, deck, id_Node_1, id_Node_2):
         strain = np.zeros( ( deck.time_steps ),dtype=np.float64 )
-        for t_n in range(1, deck.time_steps):
+        for t_n in [t for t in self.get_time_steps(deck) if t >= 1]:
             actual = linalgebra.norm(self.y[id_Node_2,:,t_n] - self.y[id_Node_1,:,t_n])
             initial = linalgebra.norm(deck.geometry.nodes[id_Node_2,:] - deck.geometry.nodes[id_Node_1,:])
             strain[t_n] = (actual - initial) / initial
@@ -7,3 +7,8 @@
 from .condition import *
 from .linalgebra import *
 from .neighbor import *
+from .assembly import *
+from .bonds import *
+from .workers import *
+from .history import *
+from .checkpoint import *
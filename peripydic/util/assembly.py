@@ -0,0 +1,260 @@
+#-*- coding: utf-8 -*-
+#@author: ilyass.tabiai@polymtl.ca
+#@author: rolland.delorme@polymtl.ca
+#@author: patrickdiehl@lsu.edu
+import inspect
+import sys
+import numpy as np
+from scipy import sparse
+from scipy.sparse import linalg
+
+## Class handling the elimination of the constrained degrees of freedom
+class DofMap():
+
+    ## Constructor
+    # @param deck The input deck
+    def __init__(self, deck):
+        ## Dimension of the problem
+        self.dim = deck.dim
+        ## Amount of degrees of freedom
+        self.size = deck.num_nodes * deck.dim
+
+        removeId = [np.asarray(con.id, dtype=int) * deck.dim + int(con.direction) - 1 for con in deck.conditions if con.type == "Displacement"]
+        ## Constrained degrees of freedom
+        self.constrained_dofs = np.unique(np.concatenate(removeId)) if len(removeId) > 0 else np.zeros(0, dtype=int)
+        ## Mask of the free degrees of freedom
+        self.free_mask = np.ones(self.size, dtype=bool)
+        self.free_mask[self.constrained_dofs] = False
+        ## Free degrees of freedom
+        self.free_dofs = np.flatnonzero(self.free_mask)
+
+    ## Provide the values of a vector at the free degrees of freedom
+    # @param vector Vector with a value for each degree of freedom
+    # @return Values at the free degrees of freedom
+    def reduce_vector(self, vector):
+        return np.reshape(vector, self.size)[self.free_dofs]
+
+    ## Provide the vector for all degrees of freedom with zeros at the constrained degrees of freedom
+    # @param vector Values at the free degrees of freedom
+    # @return Vector with a value for each degree of freedom
+    def expand_vector(self, vector):
+        result = np.zeros(self.size, dtype=np.float64)
+        result[self.free_dofs] = vector
+        return result
+
+
+## Class handling the sparsity pattern of the Jacobian matrix and the elimination of the constrained degrees of freedom
+class SparseAssembly(DofMap):
+
+    ## Constructor
+    # The sparsity pattern is computed once from the families of the nodes
+    # @param deck The input deck
+    # @param neighbors The neighborhood of the nodes
+    # @param hops Amount of bonds between two nodes coupled in the Jacobian matrix
+    def __init__(self, deck, neighbors, hops=2):
+        DofMap.__init__(self, deck)
+
+        ## Nodes coupled in the Jacobian matrix
+        self.node_pattern = neighbors.get_adjacency_matrix(hops)
+        pattern = sparse.kron(self.node_pattern, np.ones((self.dim, self.dim)), format="csr")
+        pattern.sort_indices()
+        ## Row pointers of the Jacobian matrix in the CSR format
+        self.indptr = pattern.indptr
+        ## Column indices of the Jacobian matrix in the CSR format
+        self.indices = pattern.indices
+        ## Amount of non-zero entries of the Jacobian matrix
+        self.nnz = len(self.indices)
+        ## Sorted keys (row * size + column) of the non-zero entries
+        self.keys = np.repeat(np.arange(self.size, dtype=np.int64), np.diff(self.indptr)) * self.size + self.indices
+        del pattern
+
+        ## Positions of the entries in the sparsity pattern for each kind of assembly
+        self.positions = {}
+
+        self.compute_reduced_pattern()
+
+    ## Compute the index map of the entries of the Jacobian matrix kept in the reduced matrix
+    def compute_reduced_pattern(self):
+        # Position of each non-zero entry of the Jacobian matrix in the reduced matrix
+        positions = sparse.csr_matrix((np.arange(1, self.nnz + 1, dtype=np.float64), self.indices, self.indptr), shape=(self.size, self.size))
+        reduced = positions[self.free_dofs, :][:, self.free_dofs].tocsr()
+        reduced.sort_indices()
+        ## Entries of the Jacobian matrix kept in the reduced matrix
+        self.reduced_map = reduced.data.astype(np.int64) - 1
+        ## Row pointers of the reduced matrix in the CSR format
+        self.reduced_indptr = reduced.indptr
+        ## Column indices of the reduced matrix in the CSR format
+        self.reduced_indices = reduced.indices
+        del positions, reduced
+
+    ## Provide the position of entries in the sparsity pattern
+    # @param rows Row ids of the entries
+    # @param cols Column ids of the entries
+    # @return Position of each entry in the values of the Jacobian matrix
+    def get_positions(self, rows, cols):
+        return np.searchsorted(self.keys, np.asarray(rows, dtype=np.int64) * self.size + cols)
+
+    ## Assemble the Jacobian matrix from entries in the COO format, duplicated entries are summed
+    # @param rows Row ids of the entries
+    # @param cols Column ids of the entries
+    # @param values Values of the entries
+    # @param key Name of the assembly, the positions of the entries are computed once for each key
+    # @return Jacobian matrix in the CSR format
+    def assemble(self, rows, cols, values, key=None):
+        if key in self.positions and len(self.positions[key]) == len(values):
+            positions = self.positions[key]
+        else:
+            positions = self.get_positions(rows, cols)
+            if key is not None:
+                self.positions[key] = positions
+        data = np.bincount(positions, weights=values, minlength=self.nnz)
+        return sparse.csr_matrix((data, self.indices, self.indptr), shape=(self.size, self.size))
+
+    ## Provide the Jacobian matrix without the rows and columns of the constrained degrees of freedom
+    # @param jacobian Jacobian matrix assembled on the sparsity pattern
+    # @return Reduced Jacobian matrix in the CSR format
+    def reduce_matrix(self, jacobian):
+        size = len(self.free_dofs)
+        return sparse.csr_matrix((jacobian.data[self.reduced_map], self.reduced_indices, self.reduced_indptr), shape=(size, size))
+
+
+## Class handling the solution of the reduced Jacobian system with a sparse direct solver
+# The pattern of the reduced matrix in the CSC format is computed once, so each factorization only refills the values
+class SparseSolver(SparseAssembly):
+
+    ## Constructor
+    # @param deck The input deck
+    # @param neighbors The neighborhood of the nodes
+    # @param hops Amount of bonds between two nodes coupled in the Jacobian matrix
+    def __init__(self, deck, neighbors, hops=2):
+        SparseAssembly.__init__(self, deck, neighbors, hops)
+        ## Factorization of the last reduced Jacobian matrix
+        self.factor = None
+        ## Values of the last factorized Jacobian matrix on the sparsity pattern, e.g. to store them in a checkpoint
+        self.jacobian_data = None
+        ## Positions of the diagonal entries of the released degrees of freedom in the values of the Jacobian matrix
+        self.released_positions = np.zeros(0, dtype=np.int64)
+        self.compute_csc_pattern()
+
+    ## Compute the pattern of the reduced Jacobian matrix in the CSC format, which is the input format of the sparse LU factorization
+    def compute_csc_pattern(self):
+        size = len(self.free_dofs)
+        nnz = len(self.reduced_indices)
+        positions = sparse.csr_matrix((np.arange(1, nnz + 1, dtype=np.float64), self.reduced_indices, self.reduced_indptr), shape=(size, size)).tocsc()
+        positions.sort_indices()
+        ## Entries of the Jacobian matrix kept in the reduced matrix in the CSC format
+        self.csc_map = self.reduced_map[positions.data.astype(np.int64) - 1]
+        ## Column pointers of the reduced matrix in the CSC format
+        self.csc_indptr = positions.indptr
+        ## Row indices of the reduced matrix in the CSC format
+        self.csc_indices = positions.indices
+        del positions
+
+    ## Release the degrees of freedom of nodes without any intact bond, e.g. detached by the damage model
+    # The sparsity pattern is kept as a superset of the couplings of the intact bonds, the entries of the broken bonds
+    # are assembled as zeros at their positions, so only the diagonal entries of the released degrees of freedom are set to one by each factorization
+    # @param nodes Ids of the released nodes
+    def release_nodes(self, nodes):
+        dofs = (np.asarray(nodes, dtype=int)[:, None] * self.dim + np.arange(self.dim)[None, :]).ravel()
+        dofs = dofs[self.free_mask[dofs]]
+        self.released_positions = np.union1d(self.released_positions, self.get_positions(dofs, dofs))
+
+    ## Factorize the reduced Jacobian matrix
+    # The pattern of the Jacobian matrix is structurally symmetric, so the minimum degree ordering of A^T + A is used as fill-reducing ordering,
+    # a bandwidth-reducing ordering like reverse Cuthill-McKee leads to a larger fill-in of the factors
+    # @param jacobian Jacobian matrix assembled on the sparsity pattern
+    def factorize(self, jacobian):
+        size = len(self.free_dofs)
+        data = jacobian.data
+        if len(self.released_positions) > 0:
+            data = data.copy()
+            data[self.released_positions] = 1.
+        matrix = sparse.csc_matrix((data[self.csc_map], self.csc_indices, self.csc_indptr), shape=(size, size))
+        try:
+            self.factor = linalg.splu(matrix, permc_spec="MMD_AT_PLUS_A")
+        except RuntimeError:
+            # E.g. the broken bonds leave a part of the body free to move as a rigid body
+            print ("Error: The Jacobian matrix is singular")
+            sys.exit(1)
+        self.jacobian_data = data
+
+    ## Solve the system with the last factorized Jacobian matrix
+    # @param rhs Right hand side with a value for each degree of freedom
+    # @return Solution with a value for each degree of freedom and zeros at the constrained degrees of freedom
+    def solve(self, rhs):
+        return self.expand_vector(self.factor.solve(self.reduce_vector(rhs)))
+
+
+## Class handling the matrix-free solution of the reduced Jacobian system with a Krylov method
+# Only products of the Jacobian matrix with vectors are needed, so the memory scales with the amount of nodes
+class KrylovSolver(DofMap):
+
+    ## Constructor
+    # @param deck The input deck
+    def __init__(self, deck):
+        DofMap.__init__(self, deck)
+        ## Krylov method, e.g. GMRES or CG
+        self.method = deck.solver_krylov_method
+        ## Relative tolerance of the Krylov method
+        self.tolerance = deck.solver_krylov_tolerance
+        ## Maximal amount of iterations of the Krylov method
+        self.max_it = deck.solver_krylov_max_it
+        ## Amount of iterations of GMRES between two restarts
+        self.restart = deck.solver_krylov_restart
+        # The tangent stiffness matrix of the internal force density is the Hessian of the strain energy divided by the volume of each node,
+        # so it is only symmetric for equal volumes of the nodes
+        volumes = deck.geometry.volumes
+        if self.method == "CG" and len(volumes) > 0 and not np.allclose(volumes, volumes[0], rtol=1e-12, atol=0.):
+            print ("Error: CG needs a symmetric Jacobian matrix, i.e. equal volumes of the nodes, please use GMRES")
+            sys.exit(1)
+        ## Inverse of the diagonal (dim x dim) block of each node used as block-Jacobi preconditioner
+        self.inverse_blocks = None
+
+    ## Compute the block-Jacobi preconditioner
+    # The rows and columns of the constrained degrees of freedom are replaced by the identity before the inversion
+    # @param blocks Diagonal (dim x dim) block of the Jacobian matrix for each node
+    def set_preconditioner(self, blocks):
+        blocks = np.array(blocks, dtype=np.float64)
+        mask = np.reshape(self.free_mask, (-1, self.dim))
+        blocks *= mask[:, :, None] * mask[:, None, :]
+        blocks[:, np.arange(self.dim), np.arange(self.dim)] += ~mask
+        # Nodes without stiffness are not preconditioned
+        singular = np.abs(np.linalg.det(blocks)) <= np.finfo(np.float64).tiny
+        blocks[singular] = np.identity(self.dim)
+        self.inverse_blocks = np.linalg.inv(blocks)
+
+    ## Apply the block-Jacobi preconditioner to a vector of the free degrees of freedom
+    # @param vector Values at the free degrees of freedom
+    # @return Preconditioned values at the free degrees of freedom
+    def apply_preconditioner(self, vector):
+        vector = np.reshape(self.expand_vector(vector), (-1, self.dim))
+        return self.reduce_vector(np.einsum('nij,nj->ni', self.inverse_blocks, vector))
+
+    ## Solve the reduced Jacobian system
+    # @param product Function providing the product of the Jacobian matrix with a vector with a value for each degree of freedom
+    # @param rhs Right hand side with a value for each degree of freedom
+    # @return Solution with a value for each degree of freedom and zeros at the constrained degrees of freedom
+    def solve(self, product, rhs):
+        size = len(self.free_dofs)
+        operator = linalg.LinearOperator((size, size), matvec=lambda v: self.reduce_vector(product(self.expand_vector(v))), dtype=np.float64)
+        preconditioner = None
+        if self.inverse_blocks is not None:
+            preconditioner = linalg.LinearOperator((size, size), matvec=self.apply_preconditioner, dtype=np.float64)
+        options = {}
+        if self.method == "CG":
+            method = linalg.cg
+        else:
+            method = linalg.gmres
+            options["restart"] = self.restart
+        # Older versions of scipy name the relative tolerance tol
+        if "rtol" in inspect.signature(method).parameters:
+            options["rtol"] = self.tolerance
+        else:
+            options["tol"] = self.tolerance
+        result, info = method(operator, self.reduce_vector(rhs), M=preconditioner, atol=0., maxiter=self.max_it, **options)
+        if info > 0:
+            print ("Warning: " + self.method + " reached limit of " + str(self.max_it) + " iterations")
+        elif info < 0:
+            print ("Error: " + self.method + " broke down")
+            sys.exit(1)
+        return self.expand_vector(result)
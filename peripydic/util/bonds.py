@@ -0,0 +1,111 @@
+#-*- coding: utf-8 -*-
+#@author: ilyass.tabiai@polymtl.ca
+#@author: rolland.delorme@polymtl.ca
+#@author: patrickdiehl@lsu.edu
+import numpy as np
+from ..util import functions
+
+## Class storing the bonds of all families as flat arrays, the bonds of Node "i" are stored contiguously in the order of its family
+# Only quantities of the reference configuration are stored, so the bonds are computed once for a geometry and a horizon
+class BondList():
+
+    ## Constructor
+    # @param deck The input deck
+    # @param neighbors The neighborhood of the nodes
+    def __init__(self, deck, neighbors):
+        num_nodes = len(neighbors.offsets) - 1
+        lengths = np.diff(neighbors.offsets)
+
+        ## Position of the first bond of each node, the bonds of Node "i" are offsets[i]:offsets[i+1]
+        self.offsets = np.array(neighbors.offsets, dtype=int)
+        ## Amount of bonds
+        self.num_bonds = self.offsets[-1]
+        ## Id of Node "i" of each bond
+        self.i = np.repeat(np.arange(num_nodes), lengths)
+        ## Id of Node "p" of each bond
+        self.p = np.array(neighbors.indices, dtype=int)
+        ## Position of the reverse bond (p, i) of each bond (i, p), the families are symmetric and sorted in ascending order
+        self.reverse = np.searchsorted(self.i.astype(np.int64) * num_nodes + self.p, self.p.astype(np.int64) * num_nodes + self.i)
+
+        ## Bond vector between Node "p" and Node "i" in the reference configuration
+        self.X = deck.geometry.nodes[self.p, :] - deck.geometry.nodes[self.i, :]
+        ## Length of the bonds in the reference configuration
+        self.norm_X = np.sqrt(np.sum(self.X * self.X, axis=1))
+        ## Influence function of each bond
+        self.w = functions.w_bonds(neighbors.horizon, self.norm_X, deck.influence_function)
+
+        ## Volume correction factor of each bond
+        self.volume_correction = np.ones(self.num_bonds, dtype=np.float64)
+        r = deck.delta_X / 2.0
+        partial = self.norm_X > neighbors.horizon - r
+        self.volume_correction[partial] = (neighbors.horizon + r - self.norm_X[partial]) / (deck.delta_X)
+        ## Volume of Node "i" of each bond
+        self.volume_i = deck.geometry.volumes[self.i]
+        ## Volume of Node "p" of each bond
+        self.volume_p = deck.geometry.volumes[self.p]
+        ## Corrected volume of Node "p" of each bond, i.e. the volume correction factor times the volume of Node "p"
+        self.c_p = self.volume_correction * self.volume_p
+        ## Corrected volume of Node "i" of each bond, i.e. the volume correction factor times the volume of Node "i"
+        self.c_i = self.volume_correction * self.volume_i
+
+        ## Weighted volume of each node
+        self.weighted_volume = np.bincount(self.i, weights=self.w * self.norm_X**2 * self.volume_correction * self.volume_p, minlength=num_nodes)
+
+    ## Provide the bonds of some nodes
+    # @param ids Ids of the nodes
+    # @return Positions of the bonds of the nodes in the flat arrays
+    def get_bonds(self, ids):
+        ids = np.asarray(ids, dtype=int)
+        lengths = self.offsets[ids + 1] - self.offsets[ids]
+        starts = self.offsets[ids] - np.cumsum(lengths) + lengths
+        return np.repeat(starts, lengths) + np.arange(np.sum(lengths))
+
+    ## Provide the position of Node "i" in the ids of the nodes for the bonds of some nodes
+    # @param ids Ids of the nodes
+    # @return Position of Node "i" in ids for each bond provided by get_bonds
+    def get_bond_owners(self, ids):
+        ids = np.asarray(ids, dtype=int)
+        lengths = self.offsets[ids + 1] - self.offsets[ids]
+        return np.repeat(np.arange(len(ids)), lengths)
+
+    ## Provide all pairs of bonds of the same node, e.g. for the coupling of the family of Node "i" by its dilatation
+    # @return Positions of the first and of the second bond of each pair in the flat arrays
+    def get_bond_pairs(self):
+        lengths = np.diff(self.offsets)[self.i]
+        first = np.repeat(np.arange(self.num_bonds), lengths)
+        second = self.offsets[self.i[first]] + np.arange(len(first)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return first, second
+
+    ## Provide the actual bond vectors and their lengths
+    # @param y The actual nodes' position
+    # @param bonds Positions of the bonds in the flat arrays
+    # @return Bond vectors between Node "p" and Node "i" and their lengths in the actual configuration
+    def get_actual_bonds(self, y, bonds):
+        Y = y[self.p[bonds], :] - y[self.i[bonds], :]
+        return Y, np.sqrt(np.sum(Y * Y, axis=1))
+
+    ## Provide the direction vectors of the actual bonds
+    # A bond of zero length, whose nodes coincide, has no direction, so its direction vector is zero and it transmits no force
+    # @param Y Bond vectors between Node "p" and Node "i" in the actual configuration
+    # @param norm_Y Lengths of the bonds in the actual configuration
+    # @return Direction vectors between Node "p" and Node "i"
+    def get_directions(self, Y, norm_Y):
+        M = np.zeros_like(Y)
+        np.divide(Y, norm_Y[:, None], out=M, where=norm_Y[:, None] > 0.)
+        return M
+
+    ## Provide a bound of the stiffness of each node for the linearized scalar force state t = a * w * e + g * w * |X| * sum(w * |X| * e * c_p)
+    # The bound is the sum of the absolute values of the row of the node in the tangent stiffness matrix at the reference configuration,
+    # which bounds the eigenvalues of the tangent stiffness matrix (Gershgorin), e.g. to compute a stable time step
+    # @param a Absolute value of the parameter a of each node
+    # @param g Absolute value of the parameter g of each node
+    # @return Stiffness bound of each node
+    def get_stiffness_bound(self, a, g):
+        num_nodes = len(self.offsets) - 1
+        # Bond part: the bonds of Node "i" and the bonds of its family ending at Node "i"
+        aw = a[self.i] * self.w
+        bound = 2. * np.bincount(self.i, weights=aw * self.c_p, minlength=num_nodes) + 2. * np.bincount(self.p, weights=aw * self.c_i, minlength=num_nodes)
+        # Dilatation part: the dilatation of a node couples all nodes of its family
+        moment = np.bincount(self.i, weights=self.w * self.norm_X * self.c_p, minlength=num_nodes)
+        bound += 2. * g * moment**2 + 2. * np.bincount(self.p, weights=g[self.i] * self.w * self.norm_X * self.c_i * moment[self.i], minlength=num_nodes)
+        return bound
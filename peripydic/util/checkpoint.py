@@ -0,0 +1,32 @@
+#-*- coding: utf-8 -*-
+#@author: ilyass.tabiai@polymtl.ca
+#@author: rolland.delorme@polymtl.ca
+#@author: patrickdiehl@lsu.edu
+import os
+import sys
+import numpy as np
+
+## Write a checkpoint to a compressed NPZ file
+# The checkpoint is written to a temporary file, which is synchronized to disk and then renamed, so a checkpoint is never read partially written
+# @param inFile Path to the checkpoint
+# @param data Dictionary of the arrays of the checkpoint
+def write_checkpoint(inFile, data):
+    directory = os.path.dirname(inFile)
+    if directory != "" and not os.path.exists(directory):
+        os.makedirs(directory)
+    tmp = inFile + ".tmp"
+    with open(tmp, 'wb') as f:
+        np.savez_compressed(f, **data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, inFile)
+
+## Read a checkpoint from a NPZ file
+# @param inFile Path to the checkpoint
+# @return Dictionary of the arrays of the checkpoint
+def read_checkpoint(inFile):
+    if not os.path.exists(inFile):
+        print ("Error: Could not find the checkpoint " + inFile)
+        sys.exit(1)
+    with np.load(inFile) as data:
+        return {name: np.array(data[name]) for name in data.files}
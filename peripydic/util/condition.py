@@ -4,8 +4,8 @@
 #@author: patrickdiehl@lsu.edu
 import os
 import sys
-import csv
 import numpy as np
+from ..IO import loader
 
 ## Class for storing the conditions from the yaml file
 class ConditionFromFile():
@@ -20,9 +20,10 @@ class ConditionFromFile():
     # @param volume The volume of the nodes
     # @param direction The direction where the conditions is applied
     # @param shape The shape of the condition
-    def __init__(self,cType,inFile,value,volume,direction,shape):
+    # @param cache_path Directory of the binary cache of a CSV file, None to read it without a cache
+    def __init__(self,cType,inFile,value,volume,direction,shape,cache_path=None):
         ## Ids of the node where this condition is applied
-        self.id = self.readCondition(inFile,volume)
+        self.id = self.readCondition(inFile,volume,cache_path)
         ## Type of the condition (Force or Displacement)
         self.type = cType
         ## Value in Newton or Millimeter
@@ -33,25 +34,103 @@ class ConditionFromFile():
         self.shape = shape
 
     ##Reads the ids from the inFile where this condition should be applied.
-    # @param inFile File name of the CSV file with the ids of the nodes
+    # The inFile is a CSV file with spaces as delimiter and the ids in the first column, a NPY file with the ids or a NPZ or HDF5 file with the array "ids"
+    # @param inFile File name of the file with the ids of the nodes
     # @param volume The volume of the nodes
+    # @param cache_path Directory of the binary cache of a CSV file, None to read it without a cache
     # @return The ids read from the inFile
-    def readCondition(self, inFile,volume):
+    def readCondition(self, inFile,volume,cache_path=None):
         if not os.path.exists(inFile):
             print ("Error: Could not find " + str(inFile))
             sys.exit(1)
 
-        with open(inFile, 'r') as csvfile:
-            spamreader = csv.reader(csvfile, delimiter=' ')
-            # Skip the first line, because is the header
-            next(spamreader)
-            length = len(list(spamreader))
-            ids = np.empty(length)
-            csvfile.seek(0)
-            next(spamreader)
-            i = 0
-            for row in spamreader:
-                ids[i] = int(row[0])
-                i += 1
+        if loader.is_binary(inFile):
+            ids = np.asarray(loader.read_binary(inFile, ["ids"])[0], dtype=np.float64)
+            if ids.ndim > 1:
+                ids = ids[:, 0]
             return ids
+        return loader.read_csv(inFile, [0], cache_path)[:, 0]
 
+## Class storing the boundary conditions of all nodes as index arrays, which are computed once and applied with array operations
+class BoundaryConditions():
+
+    ## Constructor
+    # @param deck The input deck
+    def __init__(self, deck):
+        ## Dimension of the problem
+        self.dim = deck.dim
+        ## Time step size
+        self.delta_t = deck.delta_t
+        ## Type of the shape, e.g. Ramp
+        self.shape_type = deck.shape_type
+        ## List of the values for specifying the shape
+        self.shape_values = deck.shape_values
+
+        ## Force density of the Ramp force conditions at the plateau of the shape
+        self.force = np.zeros((deck.num_nodes, deck.dim), dtype=np.float64)
+        dofs = []
+        values = []
+        ramped = []
+        for con in deck.conditions:
+            ids = np.asarray(con.id, dtype=int)
+            direction = int(con.direction) - 1
+            if con.shape == "Ramp" and self.shape_type != "Ramp":
+                print ("Error: Shape type unknown, please use Ramp")
+                sys.exit(1)
+            if con.type == "Force" and con.shape == "Ramp":
+                self.force[ids, direction] = con.value / deck.geometry.volumes[ids]
+            if con.type == "Displacement":
+                dofs.append(ids * deck.dim + direction)
+                values.append(np.full(len(ids), con.value, dtype=np.float64))
+                ramped.append(np.full(len(ids), con.shape == "Ramp", dtype=bool))
+        dofs = np.concatenate(dofs) if len(dofs) > 0 else np.zeros(0, dtype=int)
+        values = np.concatenate(values) if len(values) > 0 else np.zeros(0, dtype=np.float64)
+        ramped = np.concatenate(ramped) if len(ramped) > 0 else np.zeros(0, dtype=bool)
+        # A degree of freedom with several conditions takes the value of the last condition
+        dofs, last = np.unique(dofs[::-1], return_index=True)
+        last = len(values) - 1 - last
+        ## Nodes of the displacement conditions
+        self.displacement_nodes = dofs // deck.dim
+        ## Directions of the displacement conditions
+        self.displacement_directions = dofs % deck.dim
+        ## Prescribed displacement of each degree of freedom, at the plateau of the shape for the Ramp conditions
+        self.displacement_values = values[last]
+        ## Displacement conditions following the shape
+        self.displacement_ramped = ramped[last]
+        ## Reference position of each degree of freedom of the displacement conditions
+        self.displacement_reference = deck.geometry.nodes[self.displacement_nodes, self.displacement_directions]
+        ## Nodes with a displacement condition, whose residual is zero
+        self.constrained_nodes = np.zeros(deck.num_nodes, dtype=bool)
+        self.constrained_nodes[self.displacement_nodes] = True
+
+    ## Provide the loading shape of a value at a given time step t_n
+    # @param value Value at the plateau of the shape, a scalar or an array
+    # @param t_n Id of the time step, which is fractional for a load increment within a time step
+    # @return Value at the time step
+    def shape_loading(self, value, t_n):
+        Time_t = self.delta_t*(t_n)
+        if Time_t <= self.shape_values[0]:
+            return (value*Time_t)/self.shape_values[0]
+        elif Time_t > self.shape_values[0] and Time_t <= self.shape_values[1]:
+            return value * 1.
+        elif Time_t > self.shape_values[1] and Time_t <= self.shape_values[2]:
+            return value - value*(Time_t - self.shape_values[1])/(self.shape_values[2] - self.shape_values[1])
+        return value * 0.
+
+    ## Provide the external force density of each node at a given time step t_n
+    # @param t_n Id of the time step, which is fractional for a load increment within a time step
+    # @return External force density of each node
+    def get_force(self, t_n):
+        return self.shape_loading(self.force, t_n)
+
+    ## Provide the prescribed displacements at a given time step t_n
+    # @param t_n Id of the time step, which is fractional for a load increment within a time step
+    # @return Displacement of each degree of freedom of the displacement conditions
+    def get_displacement(self, t_n):
+        return np.where(self.displacement_ramped, self.shape_loading(self.displacement_values, t_n), self.displacement_values)
+
+    ## Apply the displacement conditions to the nodes' positions at a given time step t_n
+    # @param y The actual nodes' position, which is modified
+    # @param t_n Id of the time step, which is fractional for a load increment within a time step
+    def apply_displacement(self, y, t_n):
+        y[self.displacement_nodes, self.displacement_directions] = self.displacement_reference + self.get_displacement(t_n)
@@ -11,4 +11,13 @@ def w(problem,X,type):
     if type == "NORM":
         return 1. / linalgebra.norm(X) 
     
-    return 1.
\ No newline at end of file
+    return 1.
+
+def w_bonds(horizon,norm_X,type):
+
+    if type == "EXP":
+        return np.exp(- (norm_X*norm_X) / horizon / horizon)
+    if type == "NORM":
+        return 1. / norm_X
+
+    return np.ones(len(norm_X), dtype=np.float64)
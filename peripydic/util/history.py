@@ -0,0 +1,170 @@
+#-*- coding: utf-8 -*-
+#@author: ilyass.tabiai@polymtl.ca
+#@author: rolland.delorme@polymtl.ca
+#@author: patrickdiehl@lsu.edu
+import os
+import sys
+import numpy as np
+import sharedmem
+
+## Class storing the time history of a field with a fixed amount of memory
+# Only the two latest time steps, i.e. the current and the previous one needed by the solver, are kept in memory.
+# A time step leaving the memory is written to disk if it is selected, i.e. every interval-th time step and the last one.
+# The history is indexed as an array whose last axis is the time step, e.g. history[:, :, t_n], and a single time step is indexed at once.
+class History():
+
+    ## Constructor
+    # @param name Name of the field, which is the name of the file on disk
+    # @param shape Shape of the field at a time step
+    # @param time_steps Amount of time steps
+    # @param path Directory of the files on disk, or None to keep only the time steps in memory
+    # @param interval Every interval-th time step is written to disk
+    # @param shared True if the time steps in memory are shared with the worker processes
+    def __init__(self, name, shape, time_steps, path=None, interval=1, shared=False):
+        ## Name of the field
+        self.name = name
+        ## Shape of the history, the last axis is the time step
+        self.shape = tuple(shape) + (time_steps,)
+        ## Amount of time steps
+        self.time_steps = time_steps
+        ## Every interval-th time step is written to disk
+        self.interval = max(1, int(interval))
+        ## File storing the selected time steps on disk
+        self.filename = None
+        if path is not None:
+            self.filename = os.path.join(path, name + ".npy")
+
+        ## Time steps stored in memory, the time step t_n is stored in the slot t_n % 2
+        if shared:
+            self.memory = sharedmem.full((2,) + tuple(shape), 0., dtype=np.float64)
+            ## Time step held by each slot, which is shared with the worker processes as well
+            self.slots = sharedmem.full(2, -1, dtype=int)
+        else:
+            self.memory = np.zeros((2,) + tuple(shape), dtype=np.float64)
+            self.slots = np.full(2, -1, dtype=int)
+        # The initial time step is zero as a new array
+        self.slots[0] = 0
+
+        ## Position of each selected time step in the file on disk, -1 for the time steps not written to disk
+        self.positions = np.full(time_steps, -1, dtype=int)
+        if self.filename is not None:
+            selected = np.arange(0, time_steps, self.interval)
+            if selected[-1] != time_steps - 1:
+                selected = np.append(selected, time_steps - 1)
+            self.positions[selected] = np.arange(len(selected))
+        ## Time steps already written to disk
+        self.written = np.zeros(time_steps, dtype=bool)
+        ## Time steps set at least once, the other time steps are zero as in a new array
+        self.assigned = np.zeros(time_steps, dtype=bool)
+        self.assigned[0] = True
+        ## Memory map of the file on disk, which is opened when the first time step is written
+        self.disk = None
+
+    ## Split the index of the history into the index of a time step and the time step
+    # @param key Index of the history
+    # @return Index of the field and time step
+    def split_key(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) != len(self.shape) or not isinstance(key[-1], (int, np.integer)):
+            print ("Error: The history " + self.name + " is indexed by a single time step on its last axis")
+            sys.exit(1)
+        t_n = int(key[-1])
+        if t_n < 0:
+            t_n += self.time_steps
+        return key[:-1], t_n
+
+    ## Check if a time step is available, i.e. stored in memory, written to disk or never set
+    # @param t_n Id of the time step
+    # @return True if the time step is available
+    def is_available(self, t_n):
+        return self.slots[t_n % 2] == t_n or self.written[t_n] or not self.assigned[t_n]
+
+    ## Provide the available time steps
+    # @return Ids of the time steps stored in memory or written to disk in ascending order
+    def get_time_steps(self):
+        return [t_n for t_n in range(0, self.time_steps) if self.is_available(t_n)]
+
+    ## Provide a time step of the field
+    # @param key Index of the history
+    # @return Values of the field
+    def __getitem__(self, key):
+        index, t_n = self.split_key(key)
+        if self.slots[t_n % 2] == t_n:
+            return self.memory[(t_n % 2,) + index]
+        if self.written[t_n]:
+            return np.array(self.disk[(self.positions[t_n],) + index])
+        if not self.assigned[t_n]:
+            return np.zeros(self.shape[:-1], dtype=np.float64)[index]
+        print ("Error: The time step " + str(t_n) + " of " + self.name + " is neither in memory nor written to disk")
+        sys.exit(1)
+
+    ## Set a time step of the field, a new time step replaces the time step before the previous one in memory
+    # @param key Index of the history
+    # @param value Values of the field
+    def __setitem__(self, key, value):
+        index, t_n = self.split_key(key)
+        slot = t_n % 2
+        if self.slots[slot] != t_n:
+            if self.slots[slot] >= 0:
+                self.write(self.slots[slot])
+            # A new time step is zero as in a new array
+            self.memory[slot].fill(0.)
+            self.slots[slot] = t_n
+            self.assigned[t_n] = True
+        self.memory[(slot,) + index] = value
+
+    ## Write a time step in memory to disk if it is selected
+    # @param t_n Id of the time step
+    def write(self, t_n):
+        if self.positions[t_n] < 0 or self.slots[t_n % 2] != t_n:
+            return
+        if self.disk is None:
+            directory = os.path.dirname(self.filename)
+            if directory != "" and not os.path.exists(directory):
+                os.makedirs(directory)
+            self.disk = np.lib.format.open_memmap(self.filename, mode="w+", dtype=np.float64, shape=(np.max(self.positions) + 1,) + self.shape[:-1])
+        self.disk[self.positions[t_n]] = self.memory[t_n % 2]
+        self.written[t_n] = True
+
+    ## Write the selected time steps in memory to disk, e.g. at the end of the simulation
+    def flush(self):
+        for t_n in self.slots:
+            if t_n >= 0:
+                self.write(t_n)
+        if self.disk is not None:
+            self.disk.flush()
+
+    ## Provide the state of the history, e.g. to store it in a checkpoint
+    # The selected time steps in memory have to be written to disk before, see flush()
+    # @return Dictionary of the time steps in memory and of the time steps set and written to disk
+    def get_state(self):
+        return {"memory": np.array(self.memory), "slots": np.array(self.slots), "assigned": self.assigned.copy(), "written": self.written.copy()}
+
+    ## Set the state of the history, e.g. provided by a checkpoint
+    # The file on disk is opened again to keep the time steps written before the checkpoint
+    # @param state Dictionary of the time steps in memory and of the time steps set and written to disk
+    def set_state(self, state):
+        self.memory[...] = state["memory"]
+        self.slots[:] = state["slots"]
+        self.assigned[:] = state["assigned"]
+        self.written[:] = False
+        if self.filename is not None and np.any(state["written"]):
+            if not os.path.exists(self.filename):
+                print ("Error: The history " + self.filename + " of the checkpoint is not found")
+                sys.exit(1)
+            self.disk = np.lib.format.open_memmap(self.filename, mode="r+")
+            if self.disk.shape != (np.max(self.positions) + 1,) + self.shape[:-1]:
+                print ("Error: The history " + self.filename + " does not match the checkpoint")
+                sys.exit(1)
+            self.written[:] = state["written"]
+
+    ## Provide all time steps of the field, which have to be available
+    # @return Array whose last axis is the time step
+    def __array__(self, dtype=None):
+        result = np.zeros(self.shape, dtype=np.float64)
+        for t_n in range(0, self.time_steps):
+            result[..., t_n] = self[(slice(None),) * (len(self.shape) - 1) + (t_n,)]
+        if dtype is not None:
+            return result.astype(dtype)
+        return result
@@ -1,4 +1,5 @@
 from math import sqrt
+import numpy as np
 
 def norm(a):
 
@@ -10,7 +11,7 @@ def norm(a):
             return sqrt(a[0]*a[0]+a[1]*a[1])
         
         if a.shape[0] == 3:
-            return sqrt(a[0]*a[0]+a[1]*a[1]*a[2]*a[2])
+            return sqrt(a[0]*a[0]+a[1]*a[1]+a[2]*a[2])
         
         else:
             tmp = 0.
@@ -19,10 +20,6 @@ def norm(a):
             return sqrt(tmp)
 
     if len(a.shape) == 2:
-        if a.shape[1] ==  2:
-            tmp = 0.
-            for i in range(0,a.shape[0]):
-                tmp += a[i][0]*a[i][0]+a[i][1]*a[i][1]
-            return sqrt(tmp)
         if a.shape[1] == 1:
             return sum(abs(a))
+        return sqrt(np.sum(a*a))
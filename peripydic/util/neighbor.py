@@ -2,42 +2,105 @@
 #@author: ilyass.tabiai@polymtl.ca
 #@author: rolland.delorme@polymtl.ca
 #@author: patrickdiehl@lsu.edu
+import sys
 import numpy as np
 import scipy.spatial
-import sys 
-
-sys.setrecursionlimit(100000)
+from scipy import sparse
+from ..util import bonds
 
 ## Class for handling the neighborhood
 class NeighborSearch():
 
     ## Constructor
     # @param deck The input deck
-    def __init__(self,deck):
+    # @param families Families (offsets, indices) computed before, e.g. stored in a checkpoint, or None to search the neighbors
+    def __init__(self,deck,families=None):
         ## Safety factor for the search of the neighborhood
         self.safety_factor = deck.safety_factor
         ## Maximal amount of neighbors
         self.max_neighbors = 0
         ## Horizon of the neighborhood
         self.horizon = deck.horizon_factor_m_value * deck.delta_X * self.safety_factor
-        self.findNeighbors(deck)
+        if families is not None and len(families[0]) == deck.num_nodes + 1:
+            self.setNeighbors(families[0], families[1])
+        else:
+            self.findNeighbors(deck)
+        ## Nodes of the geometry the families and the bonds are built from
+        self.nodes = deck.geometry.nodes
+        ## Bonds of all families in the reference configuration, which are computed once with the families
+        self.bonds = bonds.BondList(deck, self)
+
+    ## Provide the bonds of all families in the reference configuration
+    # The bonds, the histories and the sparsity pattern of the Jacobian matrix rely on the families, so another geometry than the one
+    # the families are built from is an error. The nodes are only compared if the geometry of the deck holds another array than this one,
+    # so changes of the nodes in place are not detected
+    # @param deck The input deck
+    # @return Bonds of all families stored as flat arrays
+    def get_bonds(self, deck):
+        nodes = deck.geometry.nodes
+        if nodes is not self.nodes:
+            if nodes.shape != self.nodes.shape or not np.array_equal(nodes, self.nodes):
+                print ("Error: The geometry of the deck does not match the families of the neighborhood")
+                sys.exit(1)
+            # The same nodes are stored in another array, e.g. a geometry read again, so they are only compared once
+            self.nodes = nodes
+        return self.bonds
 
     ## Returns the family of node "i"
     # @param i Id of the node
     # @return The ids of the neighbors of node "i"
     def get_index_x_family(self, i):
-        return self.family[i]
+        return self.indices[self.offsets[i]:self.offsets[i+1]]
+
+    ## Provide the adjacency matrix of the nodes connected by at most "hops" bonds
+    # @param hops Amount of bonds between two connected nodes
+    # @return Sparse adjacency matrix, including the diagonal, in the CSR format
+    def get_adjacency_matrix(self, hops=1):
+        num_nodes = len(self.offsets) - 1
+        adjacency = sparse.csr_matrix((np.ones(len(self.indices), dtype=np.float64), self.indices, self.offsets), shape=(num_nodes, num_nodes))
+        adjacency = (adjacency + sparse.identity(num_nodes, format="csr")).tocsr()
+        adjacency.data[:] = 1.
+        result = adjacency
+        for k in range(1, hops):
+            result = result.dot(adjacency)
+            result.data[:] = 1.
+        result.sort_indices()
+        return result
+
+    ## Set the families computed before
+    # @param offsets Position of the first neighbor of each node in indices
+    # @param indices Ids of the neighbors of all nodes
+    def setNeighbors(self, offsets, indices):
+        ## Position of the first neighbor of each node in indices
+        self.offsets = np.array(offsets, dtype=int)
+        ## Ids of the neighbors of all nodes
+        self.indices = np.array(indices, dtype=int)
+        self.max_neighbors = int(np.max(np.diff(self.offsets))) if len(self.offsets) > 1 else 0
 
     ## Generates adjacency lists
+    # The families are stored in the CSR format, the family of Node "i" is indices[offsets[i]:offsets[i+1]] in ascending order
     # @param deck The input deck
     def findNeighbors(self,deck):
-        tree = scipy.spatial.KDTree(deck.geometry.nodes)
-        d , ids =  tree.query(deck.geometry.nodes, k=150, eps=0.0, p=2, distance_upper_bound=self.horizon)
-        ## Adjaceny list
-        self.family = []
-        for i in range(0,len(ids)):
-            self.family.append(np.array(list(filter(lambda x: x != i, np.array(list(filter(lambda x: x < deck.num_nodes, ids[i])))))))
-            tmp = len(self.family[i])
-            if tmp > self.max_neighbors:
-                self.max_neighbors = tmp
-        del d , ids
+        nodes = deck.geometry.nodes
+        # The KD-tree built by the geometry to compute the nodal spacing is reused
+        if hasattr(deck.geometry, "getTree"):
+            tree = deck.geometry.getTree()
+        else:
+            tree = scipy.spatial.cKDTree(nodes)
+        num_nodes = len(nodes)
+        # The nodes are queried in parallel with one worker per thread and the neighbors of each node are sorted by id
+        candidates = tree.query_ball_point(nodes, self.horizon, p=2., eps=0.0, workers=deck.num_threads, return_sorted=True)
+        lengths = np.fromiter(map(len, candidates), dtype=int, count=num_nodes)
+        ids = np.concatenate(candidates).astype(int) if num_nodes > 0 else np.zeros(0, dtype=int)
+        rows = np.repeat(np.arange(num_nodes), lengths)
+        del candidates
+        # Node "i" is not in its own family and the nodes at a distance equal to the horizon are excluded
+        X = nodes[ids, :] - nodes[rows, :]
+        keep = np.logical_and(ids != rows, np.sqrt(np.sum(X * X, axis=1)) < self.horizon)
+        ## Position of the first neighbor of each node in indices
+        self.offsets = np.zeros(num_nodes + 1, dtype=int)
+        np.cumsum(np.bincount(rows[keep], minlength=num_nodes), out=self.offsets[1:])
+        ## Ids of the neighbors of all nodes
+        self.indices = ids[keep]
+        self.max_neighbors = int(np.max(np.diff(self.offsets))) if num_nodes > 0 else 0
+        del X, ids, rows, keep
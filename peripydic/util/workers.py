@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+#@author: ilyass.tabiai@polymtl.ca
+#@author: rolland.delorme@polymtl.ca
+#@author: patrickdiehl@lsu.edu
+import sys
+import traceback
+import numpy as np
+from multiprocessing import Process, Pipe
+import sharedmem
+
+## Provide the slice of the evaluated ids handled by a thread
+# @param count Amount of evaluated ids
+# @param threads Amount of threads
+# @param k Id of the thread
+# @return Starting and ending position of the slice in the evaluated ids
+def get_slice(count, threads, k):
+    part = int(count / threads)
+    start = k * part
+    if k < threads - 1:
+        end = (k + 1) * part
+    else:
+        end = count
+    return start, end
+
+## Provide the arguments of a kernel of a material
+# @param deck The input deck
+# @param data_solver Data from the peridynamic problem/solving class
+# @param y The actual nodes' position or None if the kernel does not depend on it
+# @param args Further arguments of the kernel
+# @param start Starting position of the slice in the evaluated ids
+# @param end Ending position of the slice in the evaluated ids
+# @return Arguments (deck, data_solver, [y,] *args, start, end) of the kernel
+def get_kernel_arguments(deck, data_solver, y, args, start, end):
+    arguments = [deck, data_solver]
+    if y is not None:
+        arguments.append(y)
+    arguments.extend(args)
+    arguments.extend([start, end])
+    return arguments
+
+## Provide a zeroed array for an attribute of a material
+# The work buffer of the same name of the material is reused if the material has work buffers, so repeated evaluations do not allocate
+# @param material The material, whose attribute work_buffers stores its work buffers or is None
+# @param name Name of the attribute
+# @param shape Shape of the array
+# @param dtype Type of the values of the array
+# @return Zeroed array
+def get_buffer(material, name, shape, dtype=np.float64):
+    buffers = getattr(material, "work_buffers", None)
+    if buffers is None:
+        return np.zeros(shape, dtype=dtype)
+    if not name in buffers or buffers[name].shape != tuple(np.atleast_1d(shape)) or buffers[name].dtype != dtype:
+        buffers[name] = np.zeros(shape, dtype=dtype)
+    else:
+        buffers[name].fill(0)
+    return buffers[name]
+
+## Provide the mask of the nodes evaluated by a material, e.g. for the compiled kernels
+# @param material The material, whose attribute ids stores the evaluated nodes
+# @param size Amount of nodes
+# @return Mask of the evaluated nodes, which is a work buffer of the material
+def get_evaluated_mask(material, size):
+    mask = get_buffer(material, "evaluated", (size), dtype=bool)
+    mask[material.ids] = True
+    return mask
+
+## Sum the contributions to the nodes
+# @param nodes Id of the node of each contribution
+# @param values Value of each contribution
+# @param size Amount of nodes
+# @param out Array storing the result, None to allocate it
+# @return Sum of the contributions to each node
+def accumulate(nodes, values, size, out=None):
+    result = out
+    if result is None:
+        result = np.empty((size, values.shape[1]), dtype=np.float64)
+    for d in range(0, values.shape[1]):
+        result[:, d] = np.bincount(nodes, weights=values[:, d], minlength=size)
+    return result
+
+## Evaluate a kernel of a material on a slice of the evaluated ids in a new process and sum the contributions to the nodes
+# @param material The material
+# @param method Name of the kernel
+# @param arguments Arguments of the kernel
+# @param data Shared buffer storing the sum of the contributions to each node
+def run_slice(material, method, arguments, data):
+    nodes, values = getattr(material, method)(*arguments)
+    data[:, :] = accumulate(nodes, values, len(data))
+
+## Evaluate a kernel of a material on slices of the evaluated ids of the material
+# The kernel is evaluated by the worker pool of the problem if there is one, directly for a single thread and otherwise by a new process for each slice
+# @param deck The input deck
+# @param data_solver Data from the peridynamic problem/solving class
+# @param material The material, whose attribute ids stores the evaluated ids
+# @param method Name of the kernel
+# @param y The actual nodes' position or None if the kernel does not depend on it
+# @param args Further arguments of the kernel
+# @param results Shape of the attributes of the material written by the kernel
+# @param output Name of the attribute of the material storing the sum of the contributions to each node if the kernel provides contributions
+# (ids of the nodes, values), False otherwise
+# @return Sum of the contributions to each node if output is set
+def run_kernel(deck, data_solver, material, method, y, args=(), results={}, output=False):
+    worker_pool = getattr(data_solver, "worker_pool", None)
+    if worker_pool is not None:
+        return worker_pool.map(material, method, y, args, results, output)
+
+    threads = deck.num_threads
+    if threads == 1:
+        for name in results:
+            setattr(material, name, get_buffer(material, name, results[name]))
+        contributions = getattr(material, method)(*get_kernel_arguments(deck, data_solver, y, args, 0, len(material.ids)))
+        if output:
+            return accumulate(contributions[0], contributions[1], deck.num_nodes, get_buffer(material, output, (deck.num_nodes, contributions[1].shape[1])))
+        return None
+
+    for name in results:
+        setattr(material, name, sharedmem.empty(results[name], dtype=np.float64))
+    processes = []
+    data = []
+    for k in range(0, threads):
+        start, end = get_slice(len(material.ids), threads, k)
+        arguments = get_kernel_arguments(deck, data_solver, y, args, start, end)
+        if output:
+            data.append(sharedmem.empty((deck.num_nodes, deck.dim), dtype=np.float64))
+            processes.append(Process(target=run_slice, args=(material, method, arguments, data[k])))
+        else:
+            processes.append(Process(target=getattr(material, method), args=arguments))
+        processes[k].start()
+
+    for p in processes:
+        p.join()
+    if output:
+        return np.sum(data, axis=0)
+    return None
+
+## Class handling a pool of worker processes evaluating the kernels of the materials
+# The workers are started once and inherit the geometry, the neighborhood and the bonds, so each evaluation only copies the actual nodes' position
+# and the evaluated ids to shared memory, and the kernels write to shared buffers allocated once.
+# The nodes are partitioned into contiguous spatial blocks and each worker evaluates the families of the nodes of its block (owner computes).
+# A worker writes the sums of the contributions to the nodes of its block directly and the contributions to the nodes of its halo,
+# i.e. the nodes outside the block bonded to a node of the block, to its own halo buffer, which is added by the main process.
+class WorkerPool():
+
+    ## Constructor
+    # @param deck The input deck
+    # @param data_solver Data from the peridynamic problem/solving class
+    def __init__(self, deck, data_solver):
+        ## Amount of worker processes
+        self.threads = deck.num_threads
+        # The bonds are computed before the workers are started to be inherited by them
+        bonds = data_solver.neighbors.get_bonds(deck)
+
+        # The blocks are slabs along the largest extent of the geometry, which keeps the halos small
+        axis = np.argmax(np.ptp(deck.geometry.nodes, axis=0))
+        order = np.argsort(deck.geometry.nodes[:, axis], kind="stable")
+        ## Nodes of the block of each worker
+        self.blocks = np.array_split(order, self.threads)
+        ## Id of the block of each node
+        self.block_of = np.empty(deck.num_nodes, dtype=int)
+        ## Nodes of the block and of the halo of each worker in ascending order
+        self.local_nodes = []
+        ## Mask of the nodes of the block among the local nodes of each worker
+        self.owned = []
+        ## Nodes of the halo of each worker
+        self.halo_nodes = []
+        ## Shared buffer storing the sum of the contributions to the nodes of the halo of each worker
+        self.halos = []
+        for k in range(0, self.threads):
+            self.block_of[self.blocks[k]] = k
+        for k in range(0, self.threads):
+            local_nodes = np.union1d(self.blocks[k], bonds.p[bonds.get_bonds(self.blocks[k])]).astype(int)
+            owned = self.block_of[local_nodes] == k
+            self.local_nodes.append(local_nodes)
+            self.owned.append(owned)
+            self.halo_nodes.append(local_nodes[~owned])
+            self.halos.append(sharedmem.empty((len(self.halo_nodes[k]), deck.dim), dtype=np.float64))
+
+        ## Actual nodes' position of the current evaluation
+        self.y = sharedmem.empty((deck.num_nodes, deck.dim), dtype=np.float64)
+        ## Evaluated ids of the current evaluation sorted by block
+        self.ids = sharedmem.empty((deck.num_nodes), dtype=int)
+        ## Shared buffers bound to the attributes of the same name of the materials in the workers
+        self.buffers = {}
+        self.buffers["e"] = sharedmem.empty((bonds.num_bonds), dtype=np.float64)
+        self.buffers["dilatation"] = sharedmem.empty((deck.num_nodes), dtype=np.float64)
+        self.buffers["strain_energy"] = sharedmem.empty((deck.num_nodes), dtype=np.float64)
+        if deck.material_type == "Viscoelastic":
+            self.buffers["e_visco"] = sharedmem.empty((bonds.num_bonds, len(deck.relax_time)), dtype=np.float64)
+            self.buffers["dilatation_visco"] = sharedmem.empty((deck.num_nodes, len(deck.relax_time)), dtype=np.float64)
+        ## Sum of the contributions to each node written by the owner of the node, e.g. the internal force density
+        self.output = sharedmem.empty((deck.num_nodes, deck.dim), dtype=np.float64)
+
+        ## Connection to each worker
+        self.connections = []
+        ## Worker processes
+        self.processes = []
+        for k in range(0, self.threads):
+            connection, worker_connection = Pipe()
+            process = Process(target=self.work, args=(deck, data_solver, k, worker_connection))
+            process.daemon = True
+            process.start()
+            worker_connection.close()
+            self.connections.append(connection)
+            self.processes.append(process)
+
+    ## Evaluate the kernels sent by the main process until the pool is closed
+    # Each worker keeps one instance of each material class storing only its parameters
+    # @param deck The input deck
+    # @param data_solver Data from the peridynamic problem/solving class
+    # @param k Id of the worker
+    # @param connection Connection to the main process
+    def work(self, deck, data_solver, k, connection):
+        kernels = {}
+        while True:
+            task = connection.recv()
+            if task is None:
+                break
+            material_class, method, count, start, end, use_y, args, output = task
+            try:
+                if material_class not in kernels:
+                    kernel = material_class.__new__(material_class)
+                    kernel.set_parameters(deck, data_solver)
+                    kernels[material_class] = kernel
+                kernel = kernels[material_class]
+                for name in self.buffers:
+                    setattr(kernel, name, self.buffers[name])
+                kernel.ids = self.ids[0:count]
+                y = None
+                if use_y:
+                    y = self.y
+                contributions = getattr(kernel, method)(*get_kernel_arguments(deck, data_solver, y, args, start, end))
+                if output:
+                    nodes, values = contributions
+                    local = accumulate(np.searchsorted(self.local_nodes[k], nodes), values, len(self.local_nodes[k]))
+                    self.output[self.local_nodes[k][self.owned[k]]] = local[self.owned[k]]
+                    self.halos[k][:, :] = local[~self.owned[k]]
+                connection.send(None)
+            except Exception:
+                connection.send(traceback.format_exc())
+        connection.close()
+
+    ## Evaluate a kernel of a material on the evaluated ids of the material, each worker evaluates the ids of its block
+    # @param material The material, whose attribute ids stores the evaluated ids
+    # @param method Name of the kernel
+    # @param y The actual nodes' position or None if the kernel does not depend on it
+    # @param args Further arguments of the kernel
+    # @param results Shape of the attributes of the material written by the kernel, which are copied from the shared buffers
+    # @param output Name of the attribute of the material storing the sum of the contributions to each node if the kernel provides contributions
+    # (ids of the nodes, values), False otherwise
+    # @return Sum of the contributions to each node if output is set
+    def map(self, material, method, y, args=(), results={}, output=False):
+        count = len(material.ids)
+        blocks = self.block_of[material.ids]
+        order = np.argsort(blocks, kind="stable")
+        self.ids[0:count] = material.ids[order]
+        bounds = np.searchsorted(blocks[order], np.arange(self.threads + 1))
+        if y is not None:
+            self.y[:, :] = y
+        # The entries not written by the kernel are zero as in a new buffer
+        for name in results:
+            self.buffers[name].fill(0.)
+        for k in range(0, self.threads):
+            self.connections[k].send((type(material), method, count, bounds[k], bounds[k+1], y is not None, args, bool(output)))
+        errors = [connection.recv() for connection in self.connections]
+        for error in errors:
+            if error is not None:
+                print ("Error in a worker process:\n" + error)
+                sys.exit(1)
+        # The shared buffers are copied to the work buffers of the material, which are reused by the next evaluation
+        for name in results:
+            setattr(material, name, get_buffer(material, name, self.buffers[name].shape))
+            getattr(material, name)[...] = self.buffers[name]
+        if output:
+            result = get_buffer(material, output, self.output.shape)
+            result[...] = self.output
+            # The reduction only runs over the halo nodes
+            for k in range(0, self.threads):
+                result[self.halo_nodes[k]] += self.halos[k]
+            return result
+        return None
+
+    ## Stop the worker processes
+    def close(self):
+        for connection in self.connections:
+            connection.send(None)
+            connection.close()
+        for process in self.processes:
+            process.join()
+        self.connections = []
+        self.processes = []
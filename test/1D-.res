@@ -1,6 +1,5 @@
 iteration 1 [80.]
-iteration 2 [0.0000089]
-t_n: 1 res: [0.] Iteration # 2
+t_n: 1 res: [0.] Iteration # 1
 delta_x = 0.5
 Horizon = 0.5005
 epsilon_tensor
@@ -0,0 +1 @@
+True True True True
@@ -0,0 +1,423 @@
+iteration 1 160.0
+iteration 2 0.6512155047143778
+iteration 3 0.0045567668747945045
+t_n: 1 res: 2.1191863145802185e-05 Iteration # 3
+iteration 1 159.99999106802613
+iteration 2 0.9145687396484266
+iteration 3 0.017681051718920655
+t_n: 2 res: 0.00014280436111044679 Iteration # 3
+iteration 1 159.99993783998616
+iteration 2 3.4450530812087985
+iteration 3 0.04085537336772667
+t_n: 3 res: 0.0009444918262098209 Iteration # 3
+delta_x = 0.5
+Horizon = 1.5014999999999998
+epsilon_tensor
+[[ 0.01003764  0.00160773]
+ [ 0.00160773 -0.00146895]
+ [ 0.00895114  0.00110709]
+ [ 0.00110709 -0.00115588]
+ [ 0.00827904  0.0008978 ]
+ [ 0.0008978  -0.00079774]
+ [ 0.00798176  0.00040913]
+ [ 0.00040913 -0.00042029]
+ [ 0.00791137  0.        ]
+ [ 0.         -0.0003668 ]
+ [ 0.00798176 -0.00040913]
+ [-0.00040913 -0.00042029]
+ [ 0.00827904 -0.0008978 ]
+ [-0.0008978  -0.00079774]
+ [ 0.00895114 -0.00110709]
+ [-0.00110709 -0.00115588]
+ [ 0.01003764 -0.00160773]
+ [-0.00160773 -0.00146895]
+ [ 0.01469399  0.00446766]
+ [ 0.00446766  0.00022581]
+ [ 0.01481659  0.00300498]
+ [ 0.00300498 -0.00108781]
+ [ 0.01457015  0.00153209]
+ [ 0.00153209 -0.00167606]
+ [ 0.01418112  0.0007265 ]
+ [ 0.0007265  -0.00102519]
+ [ 0.01406354  0.        ]
+ [ 0.         -0.00093577]
+ [ 0.01418112 -0.0007265 ]
+ [-0.0007265  -0.00102519]
+ [ 0.01457015 -0.00153209]
+ [-0.00153209 -0.00167606]
+ [ 0.01481659 -0.00300498]
+ [-0.00300498 -0.00108781]
+ [ 0.01469399 -0.00446766]
+ [-0.00446766  0.00022581]
+ [ 0.01401315  0.00083021]
+ [ 0.00083021 -0.00608402]
+ [ 0.01401622  0.00153824]
+ [ 0.00153824 -0.00282523]
+ [ 0.01400286  0.0011821 ]
+ [ 0.0011821  -0.00267237]
+ [ 0.01385113  0.00051992]
+ [ 0.00051992 -0.0022437 ]
+ [ 0.01379775  0.        ]
+ [ 0.         -0.00201726]
+ [ 0.01385113 -0.00051992]
+ [-0.00051992 -0.0022437 ]
+ [ 0.01400286 -0.0011821 ]
+ [-0.0011821  -0.00267237]
+ [ 0.01401622 -0.00153824]
+ [-0.00153824 -0.00282523]
+ [ 0.01401315 -0.00083021]
+ [-0.00083021 -0.00608402]
+ [ 0.01613065  0.00145961]
+ [ 0.00145961 -0.00741699]
+ [ 0.01639611  0.00154121]
+ [ 0.00154121 -0.00428136]
+ [ 0.01651997  0.00099026]
+ [ 0.00099026 -0.00395829]
+ [ 0.01662821  0.0005181 ]
+ [ 0.0005181  -0.0034169 ]
+ [ 0.0166709   0.        ]
+ [ 0.         -0.00322758]
+ [ 0.01662821 -0.0005181 ]
+ [-0.0005181  -0.0034169 ]
+ [ 0.01651997 -0.00099026]
+ [-0.00099026 -0.00395829]
+ [ 0.01639611 -0.00154121]
+ [-0.00154121 -0.00428136]
+ [ 0.01613065 -0.00145961]
+ [-0.00145961 -0.00741699]
+ [ 0.01612157  0.00080716]
+ [ 0.00080716 -0.0075767 ]
+ [ 0.01653035  0.0007459 ]
+ [ 0.0007459  -0.00535757]
+ [ 0.01691584  0.00060944]
+ [ 0.00060944 -0.00503058]
+ [ 0.01735793  0.00039991]
+ [ 0.00039991 -0.00443574]
+ [ 0.01750383  0.        ]
+ [ 0.         -0.00432451]
+ [ 0.01735793 -0.00039991]
+ [-0.00039991 -0.00443574]
+ [ 0.01691584 -0.00060944]
+ [-0.00060944 -0.00503058]
+ [ 0.01653035 -0.0007459 ]
+ [-0.0007459  -0.00535757]
+ [ 0.01612157 -0.00080716]
+ [-0.00080716 -0.0075767 ]
+ [ 0.01546421 -0.00025008]
+ [-0.00025008 -0.00719635]
+ [ 0.01579478  0.00021968]
+ [ 0.00021968 -0.00537607]
+ [ 0.0163454   0.00037629]
+ [ 0.00037629 -0.00530082]
+ [ 0.01689491  0.00025359]
+ [ 0.00025359 -0.00491958]
+ [ 0.01708043  0.        ]
+ [ 0.         -0.00491546]
+ [ 0.01689491 -0.00025359]
+ [-0.00025359 -0.00491958]
+ [ 0.0163454  -0.00037629]
+ [-0.00037629 -0.00530082]
+ [ 0.01579478 -0.00021968]
+ [-0.00021968 -0.00537607]
+ [ 0.01546421  0.00025008]
+ [ 0.00025008 -0.00719635]
+ [ 0.01660619  0.00021041]
+ [ 0.00021041 -0.00734048]
+ [ 0.01734997  0.00016326]
+ [ 0.00016326 -0.00535817]
+ [ 0.01785779  0.00041576]
+ [ 0.00041576 -0.00526681]
+ [ 0.01850847  0.00033675]
+ [ 0.00033675 -0.00496027]
+ [ 0.01884639  0.        ]
+ [ 0.         -0.00497383]
+ [ 0.01850847 -0.00033675]
+ [-0.00033675 -0.00496027]
+ [ 0.01785779 -0.00041576]
+ [-0.00041576 -0.00526681]
+ [ 0.01734997 -0.00016326]
+ [-0.00016326 -0.00535817]
+ [ 0.01660619 -0.00021041]
+ [-0.00021041 -0.00734048]
+ [ 0.01492186  0.00232317]
+ [ 0.00232317 -0.00523822]
+ [ 0.01486589  0.00145525]
+ [ 0.00145525 -0.00481153]
+ [ 0.01549842  0.00051903]
+ [ 0.00051903 -0.00514484]
+ [ 0.01612509  0.00048735]
+ [ 0.00048735 -0.00475356]
+ [ 0.01649522  0.        ]
+ [ 0.         -0.00477911]
+ [ 0.01612509 -0.00048735]
+ [-0.00048735 -0.00475356]
+ [ 0.01549842 -0.00051903]
+ [-0.00051903 -0.00514484]
+ [ 0.01486589 -0.00145525]
+ [-0.00145525 -0.00481153]
+ [ 0.01492186 -0.00232317]
+ [-0.00232317 -0.00523822]
+ [ 0.0209218  -0.00012634]
+ [-0.00012634 -0.0061474 ]
+ [ 0.02001113  0.00021125]
+ [ 0.00021125 -0.00462237]
+ [ 0.02345407  0.00017733]
+ [ 0.00017733 -0.00480098]
+ [ 0.02533851  0.00045345]
+ [ 0.00045345 -0.00455934]
+ [ 0.02576868 -0.        ]
+ [-0.         -0.00448052]
+ [ 0.02533851 -0.00045345]
+ [-0.00045345 -0.00455934]
+ [ 0.02345407 -0.00017733]
+ [-0.00017733 -0.00480098]
+ [ 0.02001113 -0.00021125]
+ [-0.00021125 -0.00462237]
+ [ 0.0209218   0.00012634]
+ [ 0.00012634 -0.0061474 ]]
+strain_longi [0. 0. 0. 0.]
+stress_tensor
+[[ 46.82133819  12.4622615 ]
+ [ 12.4622615    2.81311013]
+ [ 40.08836125   5.23962107]
+ [  5.23962107   3.50202823]
+ [ 29.98125085   2.59061844]
+ [  2.59061844   3.56918026]
+ [ 27.39092678   1.09620667]
+ [  1.09620667   4.10101679]
+ [ 27.18799778   0.        ]
+ [  0.           4.31256229]
+ [ 27.39092678  -1.09620667]
+ [ -1.09620667   4.10101679]
+ [ 29.98125085  -2.59061844]
+ [ -2.59061844   3.56918026]
+ [ 40.08836125  -5.23962107]
+ [ -5.23962107   3.50202823]
+ [ 46.82133819 -12.4622615 ]
+ [-12.4622615    2.81311013]
+ [ 65.72484883  21.88717172]
+ [ 21.88717172  15.06359136]
+ [ 61.20392039  12.26430352]
+ [ 12.26430352  10.41821835]
+ [ 46.46842312   4.85068672]
+ [  4.85068672   7.00213065]
+ [ 43.55284417   2.16728343]
+ [  2.16728343   8.13401763]
+ [ 43.26734921   0.        ]
+ [  0.           8.47058414]
+ [ 43.55284417  -2.16728343]
+ [ -2.16728343   8.13401763]
+ [ 46.46842312  -4.85068672]
+ [ -4.85068672   7.00213065]
+ [ 61.20392039 -12.26430352]
+ [-12.26430352  10.41821835]
+ [ 65.72484883 -21.88717172]
+ [-21.88717172  15.06359136]
+ [ 58.53447223   2.395568  ]
+ [  2.395568   -10.35095688]
+ [ 62.44870722   4.8701569 ]
+ [  4.8701569    4.90916513]
+ [ 50.92908975   4.06983237]
+ [  4.06983237   5.72335185]
+ [ 48.99364831   1.71149826]
+ [  1.71149826   5.51226738]
+ [ 49.03790253   0.        ]
+ [  0.           6.39471851]
+ [ 48.99364831  -1.71149826]
+ [ -1.71149826   5.51226738]
+ [ 50.92908975  -4.06983237]
+ [ -4.06983237   5.72335185]
+ [ 62.44870722  -4.8701569 ]
+ [ -4.8701569    4.90916513]
+ [ 58.53447223  -2.395568  ]
+ [ -2.395568   -10.35095688]
+ [ 74.50930462   3.91087064]
+ [  3.91087064 -13.24151243]
+ [ 77.85318327   4.59771317]
+ [  4.59771317   1.88387445]
+ [ 64.31062574   3.25975559]
+ [  3.25975559   2.99073741]
+ [ 63.09994341   1.63381326]
+ [  1.63381326   2.9566001 ]
+ [ 63.4600049    0.        ]
+ [  0.           3.75657645]
+ [ 63.09994341  -1.63381326]
+ [ -1.63381326   2.9566001 ]
+ [ 64.31062574  -3.25975559]
+ [ -3.25975559   2.99073741]
+ [ 77.85318327  -4.59771317]
+ [ -4.59771317   1.88387445]
+ [ 74.50930462  -3.91087064]
+ [ -3.91087064 -13.24151243]
+ [ 74.34020721   2.16270169]
+ [  2.16270169 -13.80315057]
+ [ 77.51764138   2.22514792]
+ [  2.22514792  -1.36863925]
+ [ 64.80573509   2.00615394]
+ [  2.00615394  -0.56437807]
+ [ 65.00033261   1.26109166]
+ [  1.26109166  -0.38938953]
+ [ 65.6951753    0.        ]
+ [  0.           0.20140162]
+ [ 65.00033261  -1.26109166]
+ [ -1.26109166  -0.38938953]
+ [ 64.80573509  -2.00615394]
+ [ -2.00615394  -0.56437807]
+ [ 77.51764138  -2.22514792]
+ [ -2.22514792  -1.36863925]
+ [ 74.34020721  -2.16270169]
+ [ -2.16270169 -13.80315057]
+ [ 71.3643869   -0.6700677 ]
+ [ -0.6700677  -12.99236282]
+ [ 73.82819042   0.65534524]
+ [  0.65534524  -2.11406842]
+ [ 62.1496455    1.23867323]
+ [  1.23867323  -2.17753765]
+ [ 62.66442065   0.79967649]
+ [  0.79967649  -2.78776716]
+ [ 63.41068202   0.        ]
+ [  0.          -2.58581683]
+ [ 62.66442065  -0.79967649]
+ [ -0.79967649  -2.78776716]
+ [ 62.1496455   -1.23867323]
+ [ -1.23867323  -2.17753765]
+ [ 73.82819042  -0.65534524]
+ [ -0.65534524  -2.11406842]
+ [ 71.3643869    0.6700677 ]
+ [  0.6700677  -12.99236282]
+ [ 69.25221353   0.60714655]
+ [  0.60714655 -12.75042123]
+ [ 75.41007473   0.51690443]
+ [  0.51690443  -0.07599029]
+ [ 62.82231078   1.4314286 ]
+ [  1.4314286    0.13261389]
+ [ 63.36774597   1.10852348]
+ [  1.10852348  -0.77580141]
+ [ 64.60707132   0.        ]
+ [  0.          -0.47046489]
+ [ 63.36774597  -1.10852348]
+ [ -1.10852348  -0.77580141]
+ [ 62.82231078  -1.4314286 ]
+ [ -1.4314286    0.13261389]
+ [ 75.41007473  -0.51690443]
+ [ -0.51690443  -0.07599029]
+ [ 69.25221353  -0.60714655]
+ [ -0.60714655 -12.75042123]
+ [ 53.09686628  -2.5875019 ]
+ [ -2.5875019  -14.12511549]
+ [ 55.83157608   1.80079289]
+ [  1.80079289  -7.00208225]
+ [ 46.01088821   1.64328645]
+ [  1.64328645  -8.21996742]
+ [ 46.17032416   1.45384042]
+ [  1.45384042  -8.662454  ]
+ [ 47.30820108   0.        ]
+ [  0.          -8.44410044]
+ [ 46.17032416  -1.45384042]
+ [ -1.45384042  -8.662454  ]
+ [ 46.01088821  -1.64328645]
+ [ -1.64328645  -8.21996742]
+ [ 55.83157608  -1.80079289]
+ [ -1.80079289  -7.00208225]
+ [ 53.09686628   2.5875019 ]
+ [  2.5875019  -14.12511549]
+ [ 88.96736473 -15.86988735]
+ [-15.86988735 -14.56172482]
+ [ 86.19739572  -3.36048624]
+ [ -3.36048624  -4.15837379]
+ [ 82.72457064   0.51169306]
+ [  0.51169306  -1.46267433]
+ [ 84.45187716   1.21497567]
+ [  1.21497567  -3.02866509]
+ [ 86.00681099  -0.        ]
+ [ -0.          -2.30274864]
+ [ 84.45187716  -1.21497567]
+ [ -1.21497567  -3.02866509]
+ [ 82.72457064  -0.51169306]
+ [ -0.51169306  -1.46267433]
+ [ 86.19739572   3.36048624]
+ [  3.36048624  -4.15837379]
+ [ 88.96736473  15.86988735]
+ [ 15.86988735 -14.56172482]]
+strain_energy
+[[0.         0.03440812 0.13705703 0.30710526]
+ [0.         0.02510019 0.1001564  0.22481029]
+ [0.         0.01761235 0.07032522 0.15795659]
+ [0.         0.01639817 0.06548421 0.14709892]
+ [0.         0.01644    0.06565423 0.14748752]
+ [0.         0.01639817 0.06548421 0.14709892]
+ [0.         0.01761235 0.07032522 0.15795659]
+ [0.         0.02510019 0.1001564  0.22481029]
+ [0.         0.03440812 0.13705703 0.30710526]
+ [0.         0.08273767 0.32981632 0.73956946]
+ [0.         0.06370905 0.25435981 0.57125439]
+ [0.         0.04543245 0.18147257 0.40774598]
+ [0.         0.04214733 0.1683994  0.37847999]
+ [0.         0.04196747 0.16768816 0.37689826]
+ [0.         0.04214733 0.1683994  0.37847999]
+ [0.         0.04543245 0.18147257 0.40774598]
+ [0.         0.06370905 0.25435981 0.57125439]
+ [0.         0.08273767 0.32981632 0.73956946]
+ [0.         0.0516631  0.20618754 0.46288984]
+ [0.         0.05562426 0.22192475 0.49806541]
+ [0.         0.0456717  0.18222329 0.40898053]
+ [0.         0.04237702 0.16912535 0.37968997]
+ [0.         0.04151088 0.16568292 0.3719942 ]
+ [0.         0.04237702 0.16912535 0.37968997]
+ [0.         0.0456717  0.18222329 0.40898053]
+ [0.         0.05562426 0.22192475 0.49806541]
+ [0.         0.0516631  0.20618754 0.46288984]
+ [0.         0.07049725 0.28155032 0.63250689]
+ [0.         0.0785696  0.31347834 0.70355623]
+ [0.         0.06788153 0.27071352 0.60731493]
+ [0.         0.06510041 0.25961555 0.58240698]
+ [0.         0.0644202  0.25690746 0.5763438 ]
+ [0.         0.06510041 0.25961555 0.58240698]
+ [0.         0.06788153 0.27071352 0.60731493]
+ [0.         0.0785696  0.31347834 0.70355623]
+ [0.         0.07049725 0.28155032 0.63250689]
+ [0.         0.06775416 0.27071958 0.6084462 ]
+ [0.         0.07395076 0.29519787 0.66285331]
+ [0.         0.06711018 0.26759424 0.60022304]
+ [0.         0.06837681 0.27253837 0.61108245]
+ [0.         0.06859391 0.27338759 0.61295311]
+ [0.         0.06837681 0.27253837 0.61108245]
+ [0.         0.06711018 0.26759424 0.60022304]
+ [0.         0.07395076 0.29519787 0.66285331]
+ [0.         0.06775416 0.27071958 0.6084462 ]
+ [0.         0.06533861 0.26108612 0.58683123]
+ [0.         0.06957744 0.27770587 0.6234994 ]
+ [0.         0.06547343 0.26097603 0.58517645]
+ [0.         0.06790223 0.27050942 0.6062327 ]
+ [0.         0.0686849  0.27357613 0.61299426]
+ [0.         0.06790223 0.27050942 0.6062327 ]
+ [0.         0.06547343 0.26097603 0.58517645]
+ [0.         0.06957744 0.27770587 0.6234994 ]
+ [0.         0.06533861 0.26108612 0.58683123]
+ [0.         0.07188184 0.28707185 0.64488284]
+ [0.         0.08191515 0.32676967 0.73325798]
+ [0.         0.07623697 0.3037372  0.68074447]
+ [0.         0.08110531 0.32287293 0.72306343]
+ [0.         0.08348905 0.33229646 0.74402368]
+ [0.         0.08110531 0.32287293 0.72306343]
+ [0.         0.07623697 0.3037372  0.68074447]
+ [0.         0.08191515 0.32676967 0.73325798]
+ [0.         0.07188184 0.28707185 0.64488284]
+ [0.         0.04989729 0.19934879 0.4479879 ]
+ [0.         0.05155774 0.20596942 0.46284779]
+ [0.         0.04904772 0.19556467 0.43864083]
+ [0.         0.05280648 0.21041435 0.4716462 ]
+ [0.         0.05444989 0.21692701 0.48616674]
+ [0.         0.05280648 0.21041435 0.4716462 ]
+ [0.         0.04904772 0.19556467 0.43864083]
+ [0.         0.05155774 0.20596942 0.46284779]
+ [0.         0.04989729 0.19934879 0.4479879 ]
+ [0.         0.11071786 0.44160335 0.99078487]
+ [0.         0.0957036  0.38135616 0.85482625]
+ [0.         0.10593462 0.42167878 0.94423889]
+ [0.         0.11519731 0.45853945 1.0267663 ]
+ [0.         0.11738177 0.46725816 1.04634406]
+ [0.         0.11519731 0.45853945 1.0267663 ]
+ [0.         0.10593462 0.42167878 0.94423889]
+ [0.         0.0957036  0.38135616 0.85482625]
+ [0.         0.11071786 0.44160335 0.99078487]]
@@ -0,0 +1,836 @@
+iteration 1 480.0
+iteration 2 5.830243992530067
+iteration 3 0.0010385035751154883
+t_n: 1 res: 5.093792428334687e-11 Iteration # 3
+delta_x = 0.5
+Horizon = 1.5014999999999998
+epsilon_tensor
+[[ 0.01003764  0.00160773]
+ [ 0.00160773 -0.00146895]
+ [ 0.00895114  0.00110709]
+ [ 0.00110709 -0.00115588]
+ [ 0.00827904  0.0008978 ]
+ [ 0.0008978  -0.00079774]
+ [ 0.00798176  0.00040912]
+ [ 0.00040912 -0.00042029]
+ [ 0.00791137  0.        ]
+ [ 0.         -0.0003668 ]
+ [ 0.00798176 -0.00040912]
+ [-0.00040912 -0.00042029]
+ [ 0.00827904 -0.0008978 ]
+ [-0.0008978  -0.00079774]
+ [ 0.00895114 -0.00110709]
+ [-0.00110709 -0.00115588]
+ [ 0.01003764 -0.00160773]
+ [-0.00160773 -0.00146895]
+ [ 0.01469399  0.00446766]
+ [ 0.00446766  0.00022581]
+ [ 0.01481659  0.00300498]
+ [ 0.00300498 -0.00108781]
+ [ 0.01457015  0.00153209]
+ [ 0.00153209 -0.00167606]
+ [ 0.01418112  0.0007265 ]
+ [ 0.0007265  -0.00102519]
+ [ 0.01406354 -0.        ]
+ [-0.         -0.00093576]
+ [ 0.01418112 -0.0007265 ]
+ [-0.0007265  -0.00102519]
+ [ 0.01457015 -0.00153209]
+ [-0.00153209 -0.00167606]
+ [ 0.01481659 -0.00300498]
+ [-0.00300498 -0.00108781]
+ [ 0.01469399 -0.00446766]
+ [-0.00446766  0.00022581]
+ [ 0.01401315  0.0008302 ]
+ [ 0.0008302  -0.00608402]
+ [ 0.01401622  0.00153824]
+ [ 0.00153824 -0.00282523]
+ [ 0.01400286  0.00118209]
+ [ 0.00118209 -0.00267237]
+ [ 0.01385112  0.00051992]
+ [ 0.00051992 -0.0022437 ]
+ [ 0.01379774 -0.        ]
+ [-0.         -0.00201726]
+ [ 0.01385112 -0.00051992]
+ [-0.00051992 -0.0022437 ]
+ [ 0.01400286 -0.00118209]
+ [-0.00118209 -0.00267237]
+ [ 0.01401622 -0.00153824]
+ [-0.00153824 -0.00282523]
+ [ 0.01401315 -0.0008302 ]
+ [-0.0008302  -0.00608402]
+ [ 0.01613065  0.00145961]
+ [ 0.00145961 -0.00741699]
+ [ 0.01639611  0.00154121]
+ [ 0.00154121 -0.00428136]
+ [ 0.01651997  0.00099026]
+ [ 0.00099026 -0.00395829]
+ [ 0.0166282   0.0005181 ]
+ [ 0.0005181  -0.00341689]
+ [ 0.0166709   0.        ]
+ [ 0.         -0.00322758]
+ [ 0.0166282  -0.0005181 ]
+ [-0.0005181  -0.00341689]
+ [ 0.01651997 -0.00099026]
+ [-0.00099026 -0.00395829]
+ [ 0.01639611 -0.00154121]
+ [-0.00154121 -0.00428136]
+ [ 0.01613065 -0.00145961]
+ [-0.00145961 -0.00741699]
+ [ 0.01612157  0.00080716]
+ [ 0.00080716 -0.0075767 ]
+ [ 0.01653035  0.00074589]
+ [ 0.00074589 -0.00535757]
+ [ 0.01691584  0.00060943]
+ [ 0.00060943 -0.00503058]
+ [ 0.01735792  0.00039991]
+ [ 0.00039991 -0.00443573]
+ [ 0.01750383  0.        ]
+ [ 0.         -0.00432451]
+ [ 0.01735792 -0.00039991]
+ [-0.00039991 -0.00443573]
+ [ 0.01691584 -0.00060943]
+ [-0.00060943 -0.00503058]
+ [ 0.01653035 -0.00074589]
+ [-0.00074589 -0.00535757]
+ [ 0.01612157 -0.00080716]
+ [-0.00080716 -0.0075767 ]
+ [ 0.01546421 -0.00025009]
+ [-0.00025009 -0.00719634]
+ [ 0.01579478  0.00021968]
+ [ 0.00021968 -0.00537606]
+ [ 0.0163454   0.00037629]
+ [ 0.00037629 -0.00530082]
+ [ 0.0168949   0.00025359]
+ [ 0.00025359 -0.00491957]
+ [ 0.01708043  0.        ]
+ [ 0.         -0.00491546]
+ [ 0.0168949  -0.00025359]
+ [-0.00025359 -0.00491957]
+ [ 0.0163454  -0.00037629]
+ [-0.00037629 -0.00530082]
+ [ 0.01579478 -0.00021968]
+ [-0.00021968 -0.00537606]
+ [ 0.01546421  0.00025009]
+ [ 0.00025009 -0.00719634]
+ [ 0.01660619  0.00021041]
+ [ 0.00021041 -0.00734047]
+ [ 0.01734997  0.00016327]
+ [ 0.00016327 -0.00535817]
+ [ 0.0178578   0.00041576]
+ [ 0.00041576 -0.00526681]
+ [ 0.01850848  0.00033675]
+ [ 0.00033675 -0.00496027]
+ [ 0.01884639  0.        ]
+ [ 0.         -0.00497383]
+ [ 0.01850848 -0.00033675]
+ [-0.00033675 -0.00496027]
+ [ 0.0178578  -0.00041576]
+ [-0.00041576 -0.00526681]
+ [ 0.01734997 -0.00016327]
+ [-0.00016327 -0.00535817]
+ [ 0.01660619 -0.00021041]
+ [-0.00021041 -0.00734047]
+ [ 0.01492187  0.00232317]
+ [ 0.00232317 -0.00523822]
+ [ 0.01486589  0.00145526]
+ [ 0.00145526 -0.00481154]
+ [ 0.01549842  0.00051904]
+ [ 0.00051904 -0.00514484]
+ [ 0.01612509  0.00048735]
+ [ 0.00048735 -0.00475357]
+ [ 0.01649522  0.        ]
+ [ 0.         -0.00477911]
+ [ 0.01612509 -0.00048735]
+ [-0.00048735 -0.00475357]
+ [ 0.01549842 -0.00051904]
+ [-0.00051904 -0.00514484]
+ [ 0.01486589 -0.00145526]
+ [-0.00145526 -0.00481154]
+ [ 0.01492187 -0.00232317]
+ [-0.00232317 -0.00523822]
+ [ 0.02092182 -0.00012634]
+ [-0.00012634 -0.00614742]
+ [ 0.02001114  0.00021126]
+ [ 0.00021126 -0.00462237]
+ [ 0.02345409  0.00017733]
+ [ 0.00017733 -0.00480099]
+ [ 0.02533855  0.00045346]
+ [ 0.00045346 -0.00455935]
+ [ 0.02576872 -0.        ]
+ [-0.         -0.00448053]
+ [ 0.02533855 -0.00045346]
+ [-0.00045346 -0.00455935]
+ [ 0.02345409 -0.00017733]
+ [-0.00017733 -0.00480099]
+ [ 0.02001114 -0.00021126]
+ [-0.00021126 -0.00462237]
+ [ 0.02092182  0.00012634]
+ [ 0.00012634 -0.00614742]]
+strain_longi [0. 0.]
+stress_tensor
+[[ 46.82134028  12.46226017]
+ [ 12.46226017   2.81310913]
+ [ 40.08836153   5.2396182 ]
+ [  5.2396182    3.50202768]
+ [ 29.98124923   2.59061563]
+ [  2.59061563   3.56918092]
+ [ 27.39092317   1.09620523]
+ [  1.09620523   4.10101795]
+ [ 27.18799351   0.        ]
+ [  0.           4.31256343]
+ [ 27.39092317  -1.09620523]
+ [ -1.09620523   4.10101795]
+ [ 29.98124923  -2.59061563]
+ [ -2.59061563   3.56918092]
+ [ 40.08836153  -5.2396182 ]
+ [ -5.2396182    3.50202768]
+ [ 46.82134028 -12.46226017]
+ [-12.46226017   2.81310913]
+ [ 65.72485288  21.88716773]
+ [ 21.88716773  15.06358786]
+ [ 61.20392112  12.26429718]
+ [ 12.26429718  10.41821699]
+ [ 46.46842118   4.85068082]
+ [  4.85068082   7.00213252]
+ [ 43.55283893   2.16728033]
+ [  2.16728033   8.13402091]
+ [ 43.26734274  -0.        ]
+ [ -0.           8.47058757]
+ [ 43.55283893  -2.16728033]
+ [ -2.16728033   8.13402091]
+ [ 46.46842118  -4.85068082]
+ [ -4.85068082   7.00213252]
+ [ 61.20392112 -12.26429718]
+ [-12.26429718  10.41821699]
+ [ 65.72485288 -21.88716773]
+ [-21.88716773  15.06358786]
+ [ 58.53447944   2.395559  ]
+ [  2.395559   -10.35095741]
+ [ 62.44870865   4.87014892]
+ [  4.87014892   4.90916879]
+ [ 50.92908689   4.06982487]
+ [  4.06982487   5.72335547]
+ [ 48.99364151   1.71149429]
+ [  1.71149429   5.51227271]
+ [ 49.03789443  -0.        ]
+ [ -0.           6.39472453]
+ [ 48.99364151  -1.71149429]
+ [ -1.71149429   5.51227271]
+ [ 50.92908689  -4.06982487]
+ [ -4.06982487   5.72335547]
+ [ 62.44870865  -4.87014892]
+ [ -4.87014892   4.90916879]
+ [ 58.53447944  -2.395559  ]
+ [ -2.395559   -10.35095741]
+ [ 74.50931517   3.91085886]
+ [  3.91085886 -13.24151108]
+ [ 77.85318406   4.59770124]
+ [  4.59770124   1.88388245]
+ [ 64.31062132   3.25974584]
+ [  3.25974584   2.99074509]
+ [ 63.09993358   1.63380872]
+ [  1.63380872   2.95660869]
+ [ 63.45999331  -0.        ]
+ [ -0.           3.75658544]
+ [ 63.09993358  -1.63380872]
+ [ -1.63380872   2.95660869]
+ [ 64.31062132  -3.25974584]
+ [ -3.25974584   2.99074509]
+ [ 77.85318406  -4.59770124]
+ [ -4.59770124   1.88388245]
+ [ 74.50931517  -3.91085886]
+ [ -3.91085886 -13.24151108]
+ [ 74.34021972   2.1626887 ]
+ [  2.1626887  -13.80313797]
+ [ 77.51763982   2.22513754]
+ [  2.22513754  -1.36862632]
+ [ 64.80573011   2.00614575]
+ [  2.00614575  -0.56436795]
+ [ 65.0003218    1.2610885 ]
+ [  1.2610885   -0.38938082]
+ [ 65.69516254   0.        ]
+ [  0.           0.20140917]
+ [ 65.0003218   -1.2610885 ]
+ [ -1.2610885   -0.38938082]
+ [ 64.80573011  -2.00614575]
+ [ -2.00614575  -0.56436795]
+ [ 77.51763982  -2.22513754]
+ [ -2.22513754  -1.36862632]
+ [ 74.34021972  -2.1626887 ]
+ [ -2.1626887  -13.80313797]
+ [ 71.36440106  -0.67008137]
+ [ -0.67008137 -12.9923168 ]
+ [ 73.82818191   0.65533783]
+ [  0.65533783  -2.11405079]
+ [ 62.1496339    1.23866732]
+ [  1.23866732  -2.17753141]
+ [ 62.66440487   0.79967617]
+ [  0.79967617  -2.78776436]
+ [ 63.41066563   0.        ]
+ [  0.          -2.58581711]
+ [ 62.66440487  -0.79967617]
+ [ -0.79967617  -2.78776436]
+ [ 62.1496339   -1.23866732]
+ [ -1.23866732  -2.17753141]
+ [ 73.82818191  -0.65533783]
+ [ -0.65533783  -2.11405079]
+ [ 71.36440106   0.67008137]
+ [  0.67008137 -12.9923168 ]
+ [ 69.25224343   0.60713302]
+ [  0.60713302 -12.7503876 ]
+ [ 75.41009871   0.51691021]
+ [  0.51691021  -0.07598059]
+ [ 62.82232971   1.43143219]
+ [  1.43143219   0.13261428]
+ [ 63.36776549   1.10852874]
+ [  1.10852874  -0.7758033 ]
+ [ 64.6070949    0.        ]
+ [  0.          -0.47046851]
+ [ 63.36776549  -1.10852874]
+ [ -1.10852874  -0.7758033 ]
+ [ 62.82232971  -1.43143219]
+ [ -1.43143219   0.13261428]
+ [ 75.41009871  -0.51691021]
+ [ -0.51691021  -0.07598059]
+ [ 69.25224343  -0.60713302]
+ [ -0.60713302 -12.7503876 ]
+ [ 53.09690238  -2.58751584]
+ [ -2.58751584 -14.12508182]
+ [ 55.83154878   1.80081916]
+ [  1.80081916  -7.00210361]
+ [ 46.01087158   1.64329839]
+ [  1.64329839  -8.21999264]
+ [ 46.17031937   1.45384778]
+ [  1.45384778  -8.66247868]
+ [ 47.30819584   0.        ]
+ [  0.          -8.44413108]
+ [ 46.17031937  -1.45384778]
+ [ -1.45384778  -8.66247868]
+ [ 46.01087158  -1.64329839]
+ [ -1.64329839  -8.21999264]
+ [ 55.83154878  -1.80081916]
+ [ -1.80081916  -7.00210361]
+ [ 53.09690238   2.58751584]
+ [  2.58751584 -14.12508182]
+ [ 88.96746195 -15.86988339]
+ [-15.86988339 -14.56181325]
+ [ 86.19741531  -3.36046408]
+ [ -3.36046408  -4.15841044]
+ [ 82.72464225   0.51170056]
+ [  0.51170056  -1.46269269]
+ [ 84.45201364   1.21498548]
+ [  1.21498548  -3.02868523]
+ [ 86.00695296  -0.        ]
+ [ -0.          -2.30276574]
+ [ 84.45201364  -1.21498548]
+ [ -1.21498548  -3.02868523]
+ [ 82.72464225  -0.51170056]
+ [ -0.51170056  -1.46269269]
+ [ 86.19741531   3.36046408]
+ [  3.36046408  -4.15841044]
+ [ 88.96746195  15.86988339]
+ [ 15.86988339 -14.56181325]]
+strain_energy
+[[0.         0.3071053 ]
+ [0.         0.22481029]
+ [0.         0.15795657]
+ [0.         0.14709889]
+ [0.         0.14748747]
+ [0.         0.14709889]
+ [0.         0.15795657]
+ [0.         0.22481029]
+ [0.         0.3071053 ]
+ [0.         0.73956955]
+ [0.         0.57125439]
+ [0.         0.40774592]
+ [0.         0.3784799 ]
+ [0.         0.37689815]
+ [0.         0.3784799 ]
+ [0.         0.40774592]
+ [0.         0.57125439]
+ [0.         0.73956955]
+ [0.         0.46288999]
+ [0.         0.49806541]
+ [0.         0.40898043]
+ [0.         0.37968983]
+ [0.         0.37199403]
+ [0.         0.37968983]
+ [0.         0.40898043]
+ [0.         0.49806541]
+ [0.         0.46288999]
+ [0.         0.63250715]
+ [0.         0.70355623]
+ [0.         0.60731477]
+ [0.         0.58240674]
+ [0.         0.57634353]
+ [0.         0.58240674]
+ [0.         0.60731477]
+ [0.         0.70355623]
+ [0.         0.63250715]
+ [0.         0.60844651]
+ [0.         0.66285324]
+ [0.         0.60022281]
+ [0.         0.61108215]
+ [0.         0.61295278]
+ [0.         0.61108215]
+ [0.         0.60022281]
+ [0.         0.66285324]
+ [0.         0.60844651]
+ [0.         0.5868317 ]
+ [0.         0.6234992 ]
+ [0.         0.58517616]
+ [0.         0.60623248]
+ [0.         0.61299407]
+ [0.         0.60623248]
+ [0.         0.58517616]
+ [0.         0.6234992 ]
+ [0.         0.5868317 ]
+ [0.         0.6448836 ]
+ [0.         0.73325838]
+ [0.         0.6807449 ]
+ [0.         0.72306421]
+ [0.         0.74402462]
+ [0.         0.72306421]
+ [0.         0.6807449 ]
+ [0.         0.73325838]
+ [0.         0.6448836 ]
+ [0.         0.44798851]
+ [0.         0.46284791]
+ [0.         0.43864117]
+ [0.         0.47164686]
+ [0.         0.48616752]
+ [0.         0.47164686]
+ [0.         0.43864117]
+ [0.         0.46284791]
+ [0.         0.44798851]
+ [0.         0.99078761]
+ [0.         0.85482718]
+ [0.         0.94424118]
+ [0.         1.02676994]
+ [0.         1.04634771]
+ [0.         1.02676994]
+ [0.         0.94424118]
+ [0.         0.85482718]
+ [0.         0.99078761]]
+iteration 1 480.0
+iteration 2 5.830243992530067
+iteration 3 0.0010385035751154883
+t_n: 1 res: 5.093792428334687e-11 Iteration # 3
+delta_x = 0.5
+Horizon = 1.5014999999999998
+epsilon_tensor
+[[ 0.01003764  0.00160773]
+ [ 0.00160773 -0.00146895]
+ [ 0.00895114  0.00110709]
+ [ 0.00110709 -0.00115588]
+ [ 0.00827904  0.0008978 ]
+ [ 0.0008978  -0.00079774]
+ [ 0.00798176  0.00040912]
+ [ 0.00040912 -0.00042029]
+ [ 0.00791137  0.        ]
+ [ 0.         -0.0003668 ]
+ [ 0.00798176 -0.00040912]
+ [-0.00040912 -0.00042029]
+ [ 0.00827904 -0.0008978 ]
+ [-0.0008978  -0.00079774]
+ [ 0.00895114 -0.00110709]
+ [-0.00110709 -0.00115588]
+ [ 0.01003764 -0.00160773]
+ [-0.00160773 -0.00146895]
+ [ 0.01469399  0.00446766]
+ [ 0.00446766  0.00022581]
+ [ 0.01481659  0.00300498]
+ [ 0.00300498 -0.00108781]
+ [ 0.01457015  0.00153209]
+ [ 0.00153209 -0.00167606]
+ [ 0.01418112  0.0007265 ]
+ [ 0.0007265  -0.00102519]
+ [ 0.01406354 -0.        ]
+ [-0.         -0.00093576]
+ [ 0.01418112 -0.0007265 ]
+ [-0.0007265  -0.00102519]
+ [ 0.01457015 -0.00153209]
+ [-0.00153209 -0.00167606]
+ [ 0.01481659 -0.00300498]
+ [-0.00300498 -0.00108781]
+ [ 0.01469399 -0.00446766]
+ [-0.00446766  0.00022581]
+ [ 0.01401315  0.0008302 ]
+ [ 0.0008302  -0.00608402]
+ [ 0.01401622  0.00153824]
+ [ 0.00153824 -0.00282523]
+ [ 0.01400286  0.00118209]
+ [ 0.00118209 -0.00267237]
+ [ 0.01385112  0.00051992]
+ [ 0.00051992 -0.0022437 ]
+ [ 0.01379774 -0.        ]
+ [-0.         -0.00201726]
+ [ 0.01385112 -0.00051992]
+ [-0.00051992 -0.0022437 ]
+ [ 0.01400286 -0.00118209]
+ [-0.00118209 -0.00267237]
+ [ 0.01401622 -0.00153824]
+ [-0.00153824 -0.00282523]
+ [ 0.01401315 -0.0008302 ]
+ [-0.0008302  -0.00608402]
+ [ 0.01613065  0.00145961]
+ [ 0.00145961 -0.00741699]
+ [ 0.01639611  0.00154121]
+ [ 0.00154121 -0.00428136]
+ [ 0.01651997  0.00099026]
+ [ 0.00099026 -0.00395829]
+ [ 0.0166282   0.0005181 ]
+ [ 0.0005181  -0.00341689]
+ [ 0.0166709   0.        ]
+ [ 0.         -0.00322758]
+ [ 0.0166282  -0.0005181 ]
+ [-0.0005181  -0.00341689]
+ [ 0.01651997 -0.00099026]
+ [-0.00099026 -0.00395829]
+ [ 0.01639611 -0.00154121]
+ [-0.00154121 -0.00428136]
+ [ 0.01613065 -0.00145961]
+ [-0.00145961 -0.00741699]
+ [ 0.01612157  0.00080716]
+ [ 0.00080716 -0.0075767 ]
+ [ 0.01653035  0.00074589]
+ [ 0.00074589 -0.00535757]
+ [ 0.01691584  0.00060943]
+ [ 0.00060943 -0.00503058]
+ [ 0.01735792  0.00039991]
+ [ 0.00039991 -0.00443573]
+ [ 0.01750383  0.        ]
+ [ 0.         -0.00432451]
+ [ 0.01735792 -0.00039991]
+ [-0.00039991 -0.00443573]
+ [ 0.01691584 -0.00060943]
+ [-0.00060943 -0.00503058]
+ [ 0.01653035 -0.00074589]
+ [-0.00074589 -0.00535757]
+ [ 0.01612157 -0.00080716]
+ [-0.00080716 -0.0075767 ]
+ [ 0.01546421 -0.00025009]
+ [-0.00025009 -0.00719634]
+ [ 0.01579478  0.00021968]
+ [ 0.00021968 -0.00537606]
+ [ 0.0163454   0.00037629]
+ [ 0.00037629 -0.00530082]
+ [ 0.0168949   0.00025359]
+ [ 0.00025359 -0.00491957]
+ [ 0.01708043  0.        ]
+ [ 0.         -0.00491546]
+ [ 0.0168949  -0.00025359]
+ [-0.00025359 -0.00491957]
+ [ 0.0163454  -0.00037629]
+ [-0.00037629 -0.00530082]
+ [ 0.01579478 -0.00021968]
+ [-0.00021968 -0.00537606]
+ [ 0.01546421  0.00025009]
+ [ 0.00025009 -0.00719634]
+ [ 0.01660619  0.00021041]
+ [ 0.00021041 -0.00734047]
+ [ 0.01734997  0.00016327]
+ [ 0.00016327 -0.00535817]
+ [ 0.0178578   0.00041576]
+ [ 0.00041576 -0.00526681]
+ [ 0.01850848  0.00033675]
+ [ 0.00033675 -0.00496027]
+ [ 0.01884639  0.        ]
+ [ 0.         -0.00497383]
+ [ 0.01850848 -0.00033675]
+ [-0.00033675 -0.00496027]
+ [ 0.0178578  -0.00041576]
+ [-0.00041576 -0.00526681]
+ [ 0.01734997 -0.00016327]
+ [-0.00016327 -0.00535817]
+ [ 0.01660619 -0.00021041]
+ [-0.00021041 -0.00734047]
+ [ 0.01492187  0.00232317]
+ [ 0.00232317 -0.00523822]
+ [ 0.01486589  0.00145526]
+ [ 0.00145526 -0.00481154]
+ [ 0.01549842  0.00051904]
+ [ 0.00051904 -0.00514484]
+ [ 0.01612509  0.00048735]
+ [ 0.00048735 -0.00475357]
+ [ 0.01649522  0.        ]
+ [ 0.         -0.00477911]
+ [ 0.01612509 -0.00048735]
+ [-0.00048735 -0.00475357]
+ [ 0.01549842 -0.00051904]
+ [-0.00051904 -0.00514484]
+ [ 0.01486589 -0.00145526]
+ [-0.00145526 -0.00481154]
+ [ 0.01492187 -0.00232317]
+ [-0.00232317 -0.00523822]
+ [ 0.02092182 -0.00012634]
+ [-0.00012634 -0.00614742]
+ [ 0.02001114  0.00021126]
+ [ 0.00021126 -0.00462237]
+ [ 0.02345409  0.00017733]
+ [ 0.00017733 -0.00480099]
+ [ 0.02533855  0.00045346]
+ [ 0.00045346 -0.00455935]
+ [ 0.02576872 -0.        ]
+ [-0.         -0.00448053]
+ [ 0.02533855 -0.00045346]
+ [-0.00045346 -0.00455935]
+ [ 0.02345409 -0.00017733]
+ [-0.00017733 -0.00480099]
+ [ 0.02001114 -0.00021126]
+ [-0.00021126 -0.00462237]
+ [ 0.02092182  0.00012634]
+ [ 0.00012634 -0.00614742]]
+strain_longi [0. 0.]
+stress_tensor
+[[ 46.82134028  12.46226017]
+ [ 12.46226017   2.81310913]
+ [ 40.08836153   5.2396182 ]
+ [  5.2396182    3.50202768]
+ [ 29.98124923   2.59061563]
+ [  2.59061563   3.56918092]
+ [ 27.39092317   1.09620523]
+ [  1.09620523   4.10101795]
+ [ 27.18799351   0.        ]
+ [  0.           4.31256343]
+ [ 27.39092317  -1.09620523]
+ [ -1.09620523   4.10101795]
+ [ 29.98124923  -2.59061563]
+ [ -2.59061563   3.56918092]
+ [ 40.08836153  -5.2396182 ]
+ [ -5.2396182    3.50202768]
+ [ 46.82134028 -12.46226017]
+ [-12.46226017   2.81310913]
+ [ 65.72485288  21.88716773]
+ [ 21.88716773  15.06358786]
+ [ 61.20392112  12.26429718]
+ [ 12.26429718  10.41821699]
+ [ 46.46842118   4.85068082]
+ [  4.85068082   7.00213252]
+ [ 43.55283893   2.16728033]
+ [  2.16728033   8.13402091]
+ [ 43.26734274  -0.        ]
+ [ -0.           8.47058757]
+ [ 43.55283893  -2.16728033]
+ [ -2.16728033   8.13402091]
+ [ 46.46842118  -4.85068082]
+ [ -4.85068082   7.00213252]
+ [ 61.20392112 -12.26429718]
+ [-12.26429718  10.41821699]
+ [ 65.72485288 -21.88716773]
+ [-21.88716773  15.06358786]
+ [ 58.53447944   2.395559  ]
+ [  2.395559   -10.35095741]
+ [ 62.44870865   4.87014892]
+ [  4.87014892   4.90916879]
+ [ 50.92908689   4.06982487]
+ [  4.06982487   5.72335547]
+ [ 48.99364151   1.71149429]
+ [  1.71149429   5.51227271]
+ [ 49.03789443  -0.        ]
+ [ -0.           6.39472453]
+ [ 48.99364151  -1.71149429]
+ [ -1.71149429   5.51227271]
+ [ 50.92908689  -4.06982487]
+ [ -4.06982487   5.72335547]
+ [ 62.44870865  -4.87014892]
+ [ -4.87014892   4.90916879]
+ [ 58.53447944  -2.395559  ]
+ [ -2.395559   -10.35095741]
+ [ 74.50931517   3.91085886]
+ [  3.91085886 -13.24151108]
+ [ 77.85318406   4.59770124]
+ [  4.59770124   1.88388245]
+ [ 64.31062132   3.25974584]
+ [  3.25974584   2.99074509]
+ [ 63.09993358   1.63380872]
+ [  1.63380872   2.95660869]
+ [ 63.45999331  -0.        ]
+ [ -0.           3.75658544]
+ [ 63.09993358  -1.63380872]
+ [ -1.63380872   2.95660869]
+ [ 64.31062132  -3.25974584]
+ [ -3.25974584   2.99074509]
+ [ 77.85318406  -4.59770124]
+ [ -4.59770124   1.88388245]
+ [ 74.50931517  -3.91085886]
+ [ -3.91085886 -13.24151108]
+ [ 74.34021972   2.1626887 ]
+ [  2.1626887  -13.80313797]
+ [ 77.51763982   2.22513754]
+ [  2.22513754  -1.36862632]
+ [ 64.80573011   2.00614575]
+ [  2.00614575  -0.56436795]
+ [ 65.0003218    1.2610885 ]
+ [  1.2610885   -0.38938082]
+ [ 65.69516254   0.        ]
+ [  0.           0.20140917]
+ [ 65.0003218   -1.2610885 ]
+ [ -1.2610885   -0.38938082]
+ [ 64.80573011  -2.00614575]
+ [ -2.00614575  -0.56436795]
+ [ 77.51763982  -2.22513754]
+ [ -2.22513754  -1.36862632]
+ [ 74.34021972  -2.1626887 ]
+ [ -2.1626887  -13.80313797]
+ [ 71.36440106  -0.67008137]
+ [ -0.67008137 -12.9923168 ]
+ [ 73.82818191   0.65533783]
+ [  0.65533783  -2.11405079]
+ [ 62.1496339    1.23866732]
+ [  1.23866732  -2.17753141]
+ [ 62.66440487   0.79967617]
+ [  0.79967617  -2.78776436]
+ [ 63.41066563   0.        ]
+ [  0.          -2.58581711]
+ [ 62.66440487  -0.79967617]
+ [ -0.79967617  -2.78776436]
+ [ 62.1496339   -1.23866732]
+ [ -1.23866732  -2.17753141]
+ [ 73.82818191  -0.65533783]
+ [ -0.65533783  -2.11405079]
+ [ 71.36440106   0.67008137]
+ [  0.67008137 -12.9923168 ]
+ [ 69.25224343   0.60713302]
+ [  0.60713302 -12.7503876 ]
+ [ 75.41009871   0.51691021]
+ [  0.51691021  -0.07598059]
+ [ 62.82232971   1.43143219]
+ [  1.43143219   0.13261428]
+ [ 63.36776549   1.10852874]
+ [  1.10852874  -0.7758033 ]
+ [ 64.6070949    0.        ]
+ [  0.          -0.47046851]
+ [ 63.36776549  -1.10852874]
+ [ -1.10852874  -0.7758033 ]
+ [ 62.82232971  -1.43143219]
+ [ -1.43143219   0.13261428]
+ [ 75.41009871  -0.51691021]
+ [ -0.51691021  -0.07598059]
+ [ 69.25224343  -0.60713302]
+ [ -0.60713302 -12.7503876 ]
+ [ 53.09690238  -2.58751584]
+ [ -2.58751584 -14.12508182]
+ [ 55.83154878   1.80081916]
+ [  1.80081916  -7.00210361]
+ [ 46.01087158   1.64329839]
+ [  1.64329839  -8.21999264]
+ [ 46.17031937   1.45384778]
+ [  1.45384778  -8.66247868]
+ [ 47.30819584   0.        ]
+ [  0.          -8.44413108]
+ [ 46.17031937  -1.45384778]
+ [ -1.45384778  -8.66247868]
+ [ 46.01087158  -1.64329839]
+ [ -1.64329839  -8.21999264]
+ [ 55.83154878  -1.80081916]
+ [ -1.80081916  -7.00210361]
+ [ 53.09690238   2.58751584]
+ [  2.58751584 -14.12508182]
+ [ 88.96746195 -15.86988339]
+ [-15.86988339 -14.56181325]
+ [ 86.19741531  -3.36046408]
+ [ -3.36046408  -4.15841044]
+ [ 82.72464225   0.51170056]
+ [  0.51170056  -1.46269269]
+ [ 84.45201364   1.21498548]
+ [  1.21498548  -3.02868523]
+ [ 86.00695296  -0.        ]
+ [ -0.          -2.30276574]
+ [ 84.45201364  -1.21498548]
+ [ -1.21498548  -3.02868523]
+ [ 82.72464225  -0.51170056]
+ [ -0.51170056  -1.46269269]
+ [ 86.19741531   3.36046408]
+ [  3.36046408  -4.15841044]
+ [ 88.96746195  15.86988339]
+ [ 15.86988339 -14.56181325]]
+strain_energy
+[[0.         0.3071053 ]
+ [0.         0.22481029]
+ [0.         0.15795657]
+ [0.         0.14709889]
+ [0.         0.14748747]
+ [0.         0.14709889]
+ [0.         0.15795657]
+ [0.         0.22481029]
+ [0.         0.3071053 ]
+ [0.         0.73956955]
+ [0.         0.57125439]
+ [0.         0.40774592]
+ [0.         0.3784799 ]
+ [0.         0.37689815]
+ [0.         0.3784799 ]
+ [0.         0.40774592]
+ [0.         0.57125439]
+ [0.         0.73956955]
+ [0.         0.46288999]
+ [0.         0.49806541]
+ [0.         0.40898043]
+ [0.         0.37968983]
+ [0.         0.37199403]
+ [0.         0.37968983]
+ [0.         0.40898043]
+ [0.         0.49806541]
+ [0.         0.46288999]
+ [0.         0.63250715]
+ [0.         0.70355623]
+ [0.         0.60731477]
+ [0.         0.58240674]
+ [0.         0.57634353]
+ [0.         0.58240674]
+ [0.         0.60731477]
+ [0.         0.70355623]
+ [0.         0.63250715]
+ [0.         0.60844651]
+ [0.         0.66285324]
+ [0.         0.60022281]
+ [0.         0.61108215]
+ [0.         0.61295278]
+ [0.         0.61108215]
+ [0.         0.60022281]
+ [0.         0.66285324]
+ [0.         0.60844651]
+ [0.         0.5868317 ]
+ [0.         0.6234992 ]
+ [0.         0.58517616]
+ [0.         0.60623248]
+ [0.         0.61299407]
+ [0.         0.60623248]
+ [0.         0.58517616]
+ [0.         0.6234992 ]
+ [0.         0.5868317 ]
+ [0.         0.6448836 ]
+ [0.         0.73325838]
+ [0.         0.6807449 ]
+ [0.         0.72306421]
+ [0.         0.74402462]
+ [0.         0.72306421]
+ [0.         0.6807449 ]
+ [0.         0.73325838]
+ [0.         0.6448836 ]
+ [0.         0.44798851]
+ [0.         0.46284791]
+ [0.         0.43864117]
+ [0.         0.47164686]
+ [0.         0.48616752]
+ [0.         0.47164686]
+ [0.         0.43864117]
+ [0.         0.46284791]
+ [0.         0.44798851]
+ [0.         0.99078761]
+ [0.         0.85482718]
+ [0.         0.94424118]
+ [0.         1.02676994]
+ [0.         1.04634771]
+ [0.         1.02676994]
+ [0.         0.94424118]
+ [0.         0.85482718]
+ [0.         0.99078761]]
+new 1 1 (81, 3)
+hit 0 0 (81, 3)
+touched 0 1 (81, 3)
+hit 0 0 (81, 3)
+changed 1 1 (82, 3)
+hit 0 0 (82, 3)
@@ -0,0 +1,417 @@
+iteration 1 119.99999706118888
+iteration 2 0.3530177635740861
+t_n: 3 res: 3.863390189513459e-06 Iteration # 2
+iteration 1 119.99999722618242
+iteration 2 0.34655859071209527
+t_n: 4 res: 3.6430800750928167e-06 Iteration # 2
+delta_x = 0.5
+Horizon = 1.5014999999999998
+epsilon_tensor
+[[ 0.01003764  0.00160773]
+ [ 0.00160773 -0.00146895]
+ [ 0.00895114  0.00110709]
+ [ 0.00110709 -0.00115588]
+ [ 0.00827904  0.0008978 ]
+ [ 0.0008978  -0.00079774]
+ [ 0.00798176  0.00040912]
+ [ 0.00040912 -0.00042029]
+ [ 0.00791137  0.        ]
+ [ 0.         -0.0003668 ]
+ [ 0.00798176 -0.00040912]
+ [-0.00040912 -0.00042029]
+ [ 0.00827904 -0.0008978 ]
+ [-0.0008978  -0.00079774]
+ [ 0.00895114 -0.00110709]
+ [-0.00110709 -0.00115588]
+ [ 0.01003764 -0.00160773]
+ [-0.00160773 -0.00146895]
+ [ 0.01469399  0.00446766]
+ [ 0.00446766  0.00022581]
+ [ 0.01481659  0.00300498]
+ [ 0.00300498 -0.00108781]
+ [ 0.01457015  0.00153209]
+ [ 0.00153209 -0.00167606]
+ [ 0.01418112  0.0007265 ]
+ [ 0.0007265  -0.00102519]
+ [ 0.01406354 -0.        ]
+ [-0.         -0.00093576]
+ [ 0.01418112 -0.0007265 ]
+ [-0.0007265  -0.00102519]
+ [ 0.01457015 -0.00153209]
+ [-0.00153209 -0.00167606]
+ [ 0.01481659 -0.00300498]
+ [-0.00300498 -0.00108781]
+ [ 0.01469399 -0.00446766]
+ [-0.00446766  0.00022581]
+ [ 0.01401315  0.0008302 ]
+ [ 0.0008302  -0.00608402]
+ [ 0.01401622  0.00153824]
+ [ 0.00153824 -0.00282523]
+ [ 0.01400286  0.00118209]
+ [ 0.00118209 -0.00267237]
+ [ 0.01385112  0.00051992]
+ [ 0.00051992 -0.0022437 ]
+ [ 0.01379774 -0.        ]
+ [-0.         -0.00201726]
+ [ 0.01385112 -0.00051992]
+ [-0.00051992 -0.0022437 ]
+ [ 0.01400286 -0.00118209]
+ [-0.00118209 -0.00267237]
+ [ 0.01401622 -0.00153824]
+ [-0.00153824 -0.00282523]
+ [ 0.01401315 -0.0008302 ]
+ [-0.0008302  -0.00608402]
+ [ 0.01613065  0.00145961]
+ [ 0.00145961 -0.00741699]
+ [ 0.01639611  0.00154121]
+ [ 0.00154121 -0.00428136]
+ [ 0.01651997  0.00099026]
+ [ 0.00099026 -0.00395829]
+ [ 0.0166282   0.0005181 ]
+ [ 0.0005181  -0.00341689]
+ [ 0.0166709   0.        ]
+ [ 0.         -0.00322758]
+ [ 0.0166282  -0.0005181 ]
+ [-0.0005181  -0.00341689]
+ [ 0.01651997 -0.00099026]
+ [-0.00099026 -0.00395829]
+ [ 0.01639611 -0.00154121]
+ [-0.00154121 -0.00428136]
+ [ 0.01613065 -0.00145961]
+ [-0.00145961 -0.00741699]
+ [ 0.01612157  0.00080716]
+ [ 0.00080716 -0.0075767 ]
+ [ 0.01653035  0.00074589]
+ [ 0.00074589 -0.00535757]
+ [ 0.01691584  0.00060943]
+ [ 0.00060943 -0.00503058]
+ [ 0.01735792  0.00039991]
+ [ 0.00039991 -0.00443573]
+ [ 0.01750383 -0.        ]
+ [-0.         -0.00432451]
+ [ 0.01735792 -0.00039991]
+ [-0.00039991 -0.00443573]
+ [ 0.01691584 -0.00060943]
+ [-0.00060943 -0.00503058]
+ [ 0.01653035 -0.00074589]
+ [-0.00074589 -0.00535757]
+ [ 0.01612157 -0.00080716]
+ [-0.00080716 -0.0075767 ]
+ [ 0.01546421 -0.00025009]
+ [-0.00025009 -0.00719634]
+ [ 0.01579478  0.00021968]
+ [ 0.00021968 -0.00537606]
+ [ 0.0163454   0.00037629]
+ [ 0.00037629 -0.00530082]
+ [ 0.0168949   0.00025359]
+ [ 0.00025359 -0.00491957]
+ [ 0.01708043 -0.        ]
+ [-0.         -0.00491546]
+ [ 0.0168949  -0.00025359]
+ [-0.00025359 -0.00491957]
+ [ 0.0163454  -0.00037629]
+ [-0.00037629 -0.00530082]
+ [ 0.01579478 -0.00021968]
+ [-0.00021968 -0.00537606]
+ [ 0.01546421  0.00025009]
+ [ 0.00025009 -0.00719634]
+ [ 0.01660619  0.00021041]
+ [ 0.00021041 -0.00734047]
+ [ 0.01734997  0.00016327]
+ [ 0.00016327 -0.00535817]
+ [ 0.0178578   0.00041576]
+ [ 0.00041576 -0.00526681]
+ [ 0.01850848  0.00033675]
+ [ 0.00033675 -0.00496027]
+ [ 0.01884639 -0.        ]
+ [-0.         -0.00497383]
+ [ 0.01850848 -0.00033675]
+ [-0.00033675 -0.00496027]
+ [ 0.0178578  -0.00041576]
+ [-0.00041576 -0.00526681]
+ [ 0.01734997 -0.00016327]
+ [-0.00016327 -0.00535817]
+ [ 0.01660619 -0.00021041]
+ [-0.00021041 -0.00734047]
+ [ 0.01492187  0.00232317]
+ [ 0.00232317 -0.00523822]
+ [ 0.01486589  0.00145526]
+ [ 0.00145526 -0.00481154]
+ [ 0.01549842  0.00051904]
+ [ 0.00051904 -0.00514484]
+ [ 0.01612509  0.00048735]
+ [ 0.00048735 -0.00475357]
+ [ 0.01649522  0.        ]
+ [ 0.         -0.00477911]
+ [ 0.01612509 -0.00048735]
+ [-0.00048735 -0.00475357]
+ [ 0.01549842 -0.00051904]
+ [-0.00051904 -0.00514484]
+ [ 0.01486589 -0.00145526]
+ [-0.00145526 -0.00481154]
+ [ 0.01492187 -0.00232317]
+ [-0.00232317 -0.00523822]
+ [ 0.02092182 -0.00012634]
+ [-0.00012634 -0.00614742]
+ [ 0.02001114  0.00021126]
+ [ 0.00021126 -0.00462237]
+ [ 0.02345409  0.00017733]
+ [ 0.00017733 -0.00480099]
+ [ 0.02533855  0.00045346]
+ [ 0.00045346 -0.00455935]
+ [ 0.02576872  0.        ]
+ [ 0.         -0.00448053]
+ [ 0.02533855 -0.00045346]
+ [-0.00045346 -0.00455935]
+ [ 0.02345409 -0.00017733]
+ [-0.00017733 -0.00480099]
+ [ 0.02001114 -0.00021126]
+ [-0.00021126 -0.00462237]
+ [ 0.02092182  0.00012634]
+ [ 0.00012634 -0.00614742]]
+strain_longi [0. 0. 0. 0. 0.]
+stress_tensor
+[[ 46.82134037  12.46226021]
+ [ 12.46226021   2.81310913]
+ [ 40.08836159   5.23961822]
+ [  5.23961822   3.50202768]
+ [ 29.98124926   2.59061565]
+ [  2.59061565   3.56918091]
+ [ 27.39092319   1.09620524]
+ [  1.09620524   4.10101794]
+ [ 27.18799353   0.        ]
+ [  0.           4.31256342]
+ [ 27.39092319  -1.09620524]
+ [ -1.09620524   4.10101794]
+ [ 29.98124926  -2.59061565]
+ [ -2.59061565   3.56918091]
+ [ 40.08836159  -5.23961822]
+ [ -5.23961822   3.50202768]
+ [ 46.82134037 -12.46226021]
+ [-12.46226021   2.81310913]
+ [ 65.72485298  21.88716779]
+ [ 21.88716779  15.06358791]
+ [ 61.2039212   12.26429722]
+ [ 12.26429722  10.41821701]
+ [ 46.46842123   4.85068084]
+ [  4.85068084   7.0021325 ]
+ [ 43.55283897   2.16728035]
+ [  2.16728035   8.13402089]
+ [ 43.26734278  -0.        ]
+ [ -0.           8.47058754]
+ [ 43.55283897  -2.16728035]
+ [ -2.16728035   8.13402089]
+ [ 46.46842123  -4.85068084]
+ [ -4.85068084   7.0021325 ]
+ [ 61.2039212  -12.26429722]
+ [-12.26429722  10.41821701]
+ [ 65.72485298 -21.88716779]
+ [-21.88716779  15.06358791]
+ [ 58.53447949   2.395559  ]
+ [  2.395559   -10.35095746]
+ [ 62.44870871   4.87014895]
+ [  4.87014895   4.90916878]
+ [ 50.92908695   4.06982489]
+ [  4.06982489   5.72335544]
+ [ 48.99364157   1.7114943 ]
+ [  1.7114943    5.51227267]
+ [ 49.03789449  -0.        ]
+ [ -0.           6.39472448]
+ [ 48.99364157  -1.7114943 ]
+ [ -1.7114943    5.51227267]
+ [ 50.92908695  -4.06982489]
+ [ -4.06982489   5.72335544]
+ [ 62.44870871  -4.87014895]
+ [ -4.87014895   4.90916878]
+ [ 58.53447949  -2.395559  ]
+ [ -2.395559   -10.35095746]
+ [ 74.50931521   3.91085886]
+ [  3.91085886 -13.24151111]
+ [ 77.85318413   4.59770127]
+ [  4.59770127   1.88388242]
+ [ 64.3106214    3.25974588]
+ [  3.25974588   2.99074506]
+ [ 63.09993368   1.63380874]
+ [  1.63380874   2.95660863]
+ [ 63.45999342   0.        ]
+ [  0.           3.75658537]
+ [ 63.09993368  -1.63380874]
+ [ -1.63380874   2.95660863]
+ [ 64.3106214   -3.25974588]
+ [ -3.25974588   2.99074506]
+ [ 77.85318413  -4.59770127]
+ [ -4.59770127   1.88388242]
+ [ 74.50931521  -3.91085886]
+ [ -3.91085886 -13.24151111]
+ [ 74.34021972   2.16268872]
+ [  2.16268872 -13.80313799]
+ [ 77.51763988   2.22513758]
+ [  2.22513758  -1.36862638]
+ [ 64.80573021   2.00614579]
+ [  2.00614579  -0.564368  ]
+ [ 65.00032194   1.26108853]
+ [  1.26108853  -0.3893809 ]
+ [ 65.69516269  -0.        ]
+ [ -0.           0.20140908]
+ [ 65.00032194  -1.26108853]
+ [ -1.26108853  -0.3893809 ]
+ [ 64.80573021  -2.00614579]
+ [ -2.00614579  -0.564368  ]
+ [ 77.51763988  -2.22513758]
+ [ -2.22513758  -1.36862638]
+ [ 74.34021972  -2.16268872]
+ [ -2.16268872 -13.80313799]
+ [ 71.36440103  -0.67008135]
+ [ -0.67008135 -12.99231681]
+ [ 73.82818194   0.65533787]
+ [  0.65533787  -2.11405084]
+ [ 62.14963399   1.23866736]
+ [  1.23866736  -2.17753146]
+ [ 62.66440501   0.7996762 ]
+ [  0.7996762   -2.78776445]
+ [ 63.4106658   -0.        ]
+ [ -0.          -2.5858172 ]
+ [ 62.66440501  -0.7996762 ]
+ [ -0.7996762   -2.78776445]
+ [ 62.14963399  -1.23866736]
+ [ -1.23866736  -2.17753146]
+ [ 73.82818194  -0.65533787]
+ [ -0.65533787  -2.11405084]
+ [ 71.36440103   0.67008135]
+ [  0.67008135 -12.99231681]
+ [ 69.25224345   0.60713309]
+ [  0.60713309 -12.75038766]
+ [ 75.41009883   0.51691028]
+ [  0.51691028  -0.07598064]
+ [ 62.8223299    1.43143224]
+ [  1.43143224   0.13261429]
+ [ 63.36776574   1.10852878]
+ [  1.10852878  -0.7758033 ]
+ [ 64.60709518  -0.        ]
+ [ -0.          -0.47046852]
+ [ 63.36776574  -1.10852878]
+ [ -1.10852878  -0.7758033 ]
+ [ 62.8223299   -1.43143224]
+ [ -1.43143224   0.13261429]
+ [ 75.41009883  -0.51691028]
+ [ -0.51691028  -0.07598064]
+ [ 69.25224345  -0.60713309]
+ [ -0.60713309 -12.75038766]
+ [ 53.09690238  -2.58751578]
+ [ -2.58751578 -14.12508181]
+ [ 55.83154881   1.80081926]
+ [  1.80081926  -7.00210364]
+ [ 46.01087171   1.64329845]
+ [  1.64329845  -8.2199926 ]
+ [ 46.17031955   1.45384782]
+ [  1.45384782  -8.66247867]
+ [ 47.30819604   0.        ]
+ [  0.          -8.44413109]
+ [ 46.17031955  -1.45384782]
+ [ -1.45384782  -8.66247867]
+ [ 46.01087171  -1.64329845]
+ [ -1.64329845  -8.2199926 ]
+ [ 55.83154881  -1.80081926]
+ [ -1.80081926  -7.00210364]
+ [ 53.09690238   2.58751578]
+ [  2.58751578 -14.12508181]
+ [ 88.9674621  -15.86988342]
+ [-15.86988342 -14.56181314]
+ [ 86.19741555  -3.36046411]
+ [ -3.36046411  -4.15841027]
+ [ 82.72464285   0.51170057]
+ [  0.51170057  -1.46269249]
+ [ 84.45201434   1.21498552]
+ [  1.21498552  -3.02868503]
+ [ 86.00695366   0.        ]
+ [  0.          -2.30276554]
+ [ 84.45201434  -1.21498552]
+ [ -1.21498552  -3.02868503]
+ [ 82.72464285  -0.51170057]
+ [ -0.51170057  -1.46269249]
+ [ 86.19741555   3.36046411]
+ [  3.36046411  -4.15841027]
+ [ 88.9674621   15.86988342]
+ [ 15.86988342 -14.56181314]]
+strain_energy
+[[0.         0.01937502 0.07725573 0.17328266 0.3071053 ]
+ [0.         0.01412753 0.05640644 0.12668386 0.22481029]
+ [0.         0.00991135 0.03959273 0.08896645 0.15795657]
+ [0.         0.00922782 0.03686527 0.08284445 0.14709889]
+ [0.         0.00925125 0.03696015 0.08306048 0.14748747]
+ [0.         0.00922782 0.03686527 0.08284445 0.14709889]
+ [0.         0.00991135 0.03959273 0.08896645 0.15795657]
+ [0.         0.01412753 0.05640644 0.12668386 0.22481029]
+ [0.         0.01937502 0.07725573 0.17328266 0.3071053 ]
+ [0.         0.04658017 0.18583961 0.41706799 0.73956955]
+ [0.         0.03585326 0.14321086 0.3217749  0.57125439]
+ [0.         0.02556491 0.10215032 0.22959587 0.40774592]
+ [0.         0.02371463 0.09477781 0.2130712  0.3784799 ]
+ [0.         0.02361317 0.09437543 0.21217363 0.37689815]
+ [0.         0.02371463 0.09477781 0.2130712  0.3784799 ]
+ [0.         0.02556491 0.10215032 0.22959587 0.40774592]
+ [0.         0.03585326 0.14321086 0.3217749  0.57125439]
+ [0.         0.04658017 0.18583961 0.41706799 0.73956955]
+ [0.         0.02907698 0.11611079 0.26081023 0.46288999]
+ [0.         0.03130899 0.12499293 0.28069444 0.49806541]
+ [0.         0.02570683 0.10263031 0.23048159 0.40898043]
+ [0.         0.02385071 0.09524007 0.21392992 0.37968983]
+ [0.         0.02336273 0.09329748 0.20958009 0.37199403]
+ [0.         0.02385071 0.09524007 0.21392992 0.37968983]
+ [0.         0.02570683 0.10263031 0.23048159 0.40898043]
+ [0.         0.03130899 0.12499293 0.28069444 0.49806541]
+ [0.         0.02907698 0.11611079 0.26081023 0.46288999]
+ [0.         0.03967019 0.15849523 0.35619878 0.63250715]
+ [0.         0.04422383 0.17655564 0.39649556 0.70355623]
+ [0.         0.0382123  0.15250372 0.3423681  0.60731477]
+ [0.         0.03664701 0.14625358 0.32833091 0.58240674]
+ [0.         0.03626395 0.14472665 0.32490765 0.57634354]
+ [0.         0.03664701 0.14625358 0.32833091 0.58240674]
+ [0.         0.0382123  0.15250372 0.3423681  0.60731477]
+ [0.         0.04422383 0.17655564 0.39649556 0.70355623]
+ [0.         0.03967019 0.15849523 0.35619878 0.63250715]
+ [0.         0.03812212 0.15236342 0.34253501 0.60844651]
+ [0.         0.04161877 0.16621839 0.3734201  0.66285324]
+ [0.         0.03777963 0.15075858 0.33840982 0.60022281]
+ [0.         0.03849651 0.15357376 0.34462949 0.61108215]
+ [0.         0.03861933 0.15405674 0.3456985  0.61295278]
+ [0.         0.03849651 0.15357376 0.34462949 0.61108215]
+ [0.         0.03777963 0.15075858 0.33840982 0.60022281]
+ [0.         0.04161877 0.16621839 0.3734201  0.66285324]
+ [0.         0.03812212 0.15236342 0.34253501 0.60844651]
+ [0.         0.03676233 0.14693664 0.33035131 0.5868317 ]
+ [0.         0.03915874 0.15637879 0.3512822  0.6234992 ]
+ [0.         0.03686151 0.14705573 0.33001154 0.58517616]
+ [0.         0.03823424 0.15246891 0.34202111 0.60623249]
+ [0.         0.0386768  0.15421176 0.34588266 0.61299408]
+ [0.         0.03823424 0.15246891 0.34202111 0.60623249]
+ [0.         0.03686151 0.14705573 0.33001154 0.58517616]
+ [0.         0.03915874 0.15637879 0.3512822  0.6234992 ]
+ [0.         0.03676233 0.14693664 0.33035131 0.5868317 ]
+ [0.         0.04044953 0.16160608 0.36318069 0.6448836 ]
+ [0.         0.04610891 0.18405752 0.4132887  0.73325838]
+ [0.         0.04292645 0.17119077 0.38403974 0.68074491]
+ [0.         0.045677   0.18204883 0.40815369 0.72306422]
+ [0.         0.04702185 0.18738063 0.42004581 0.74402463]
+ [0.         0.045677   0.18204883 0.40815369 0.72306422]
+ [0.         0.04292645 0.17119077 0.38403974 0.68074491]
+ [0.         0.04610891 0.18405752 0.4132887  0.73325838]
+ [0.         0.04044953 0.16160608 0.36318069 0.6448836 ]
+ [0.         0.02807564 0.11220144 0.2522241  0.44798851]
+ [0.         0.02901047 0.11593119 0.26059775 0.46284791]
+ [0.         0.02761165 0.11018031 0.24731606 0.43864118]
+ [0.         0.02973258 0.11858504 0.26605251 0.47164687]
+ [0.         0.03065918 0.12226541 0.27427619 0.48616752]
+ [0.         0.02973258 0.11858504 0.26605251 0.47164687]
+ [0.         0.02761165 0.11018031 0.24731606 0.43864118]
+ [0.         0.02901047 0.11593119 0.26059775 0.46284791]
+ [0.         0.02807564 0.11220144 0.2522241  0.44798851]
+ [0.         0.06232375 0.24875732 0.55850542 0.99078762]
+ [0.         0.05388512 0.21492112 0.48219738 0.85482719]
+ [0.         0.05966163 0.23777041 0.53304406 0.94424119]
+ [0.         0.06487877 0.25855732 0.57963738 1.02676996]
+ [0.         0.06610824 0.26346685 0.59066627 1.04634773]
+ [0.         0.06487877 0.25855732 0.57963738 1.02676996]
+ [0.         0.05966163 0.23777041 0.53304406 0.94424119]
+ [0.         0.05388512 0.21492112 0.48219738 0.85482719]
+ [0.         0.06232375 0.24875732 0.55850542 0.99078762]]
@@ -0,0 +1,420 @@
+iteration 1 240.0
+iteration 2 1.4633214856702141
+t_n: 1 res: 6.805534006221454e-05 Iteration # 2
+iteration 1 239.99995130582295
+iteration 2 1.4092916313408141
+t_n: 2 Broken bonds # 14
+iteration 1 114.75324712703826
+iteration 2 0.5729226732328208
+t_n: 2 res: 7.000492306340656e-06 Iteration # 4
+delta_x = 0.5
+Horizon = 1.5014999999999998
+epsilon_tensor
+[[ 0.01007701  0.00159103]
+ [ 0.00159103 -0.00147006]
+ [ 0.00896506  0.00108948]
+ [ 0.00108948 -0.00115672]
+ [ 0.00826889  0.00088243]
+ [ 0.00088243 -0.00079679]
+ [ 0.00795299  0.00039993]
+ [ 0.00039993 -0.00041437]
+ [ 0.00787807 -0.        ]
+ [-0.         -0.0003592 ]
+ [ 0.00795299 -0.00039993]
+ [-0.00039993 -0.00041437]
+ [ 0.00826889 -0.00088243]
+ [-0.00088243 -0.00079679]
+ [ 0.00896506 -0.00108948]
+ [-0.00108948 -0.00115672]
+ [ 0.01007701 -0.00159103]
+ [-0.00159103 -0.00147006]
+ [ 0.01473193  0.00445667]
+ [ 0.00445667  0.00021069]
+ [ 0.01485272  0.00297273]
+ [ 0.00297273 -0.001094  ]
+ [ 0.01455235  0.00150261]
+ [ 0.00150261 -0.00167213]
+ [ 0.0141239   0.0007106 ]
+ [ 0.0007106  -0.00101273]
+ [ 0.013993   -0.        ]
+ [-0.         -0.00092111]
+ [ 0.0141239  -0.0007106 ]
+ [-0.0007106  -0.00101273]
+ [ 0.01455235 -0.00150261]
+ [-0.00150261 -0.00167213]
+ [ 0.01485272 -0.00297273]
+ [-0.00297273 -0.001094  ]
+ [ 0.01473193 -0.00445667]
+ [-0.00445667  0.00021069]
+ [ 0.01408834  0.00080987]
+ [ 0.00080987 -0.00610005]
+ [ 0.01401576  0.00151537]
+ [ 0.00151537 -0.00282033]
+ [ 0.01398796  0.00115154]
+ [ 0.00115154 -0.0026682 ]
+ [ 0.01379988  0.00049411]
+ [ 0.00049411 -0.00222695]
+ [ 0.01371841  0.        ]
+ [ 0.         -0.00199752]
+ [ 0.01379988 -0.00049411]
+ [-0.00049411 -0.00222695]
+ [ 0.01398796 -0.00115154]
+ [-0.00115154 -0.0026682 ]
+ [ 0.01401576 -0.00151537]
+ [-0.00151537 -0.00282033]
+ [ 0.01408834 -0.00080987]
+ [-0.00080987 -0.00610005]
+ [ 0.01622917  0.00141835]
+ [ 0.00141835 -0.00739188]
+ [ 0.01642907  0.00149067]
+ [ 0.00149067 -0.00427383]
+ [ 0.01647729  0.00094769]
+ [ 0.00094769 -0.00397456]
+ [ 0.01652836  0.0004907 ]
+ [ 0.0004907  -0.00340679]
+ [ 0.01656092  0.        ]
+ [ 0.         -0.0032074 ]
+ [ 0.01652836 -0.0004907 ]
+ [-0.0004907  -0.00340679]
+ [ 0.01647729 -0.00094769]
+ [-0.00094769 -0.00397456]
+ [ 0.01642907 -0.00149067]
+ [-0.00149067 -0.00427383]
+ [ 0.01622917 -0.00141835]
+ [-0.00141835 -0.00739188]
+ [ 0.01604746  0.00089472]
+ [ 0.00089472 -0.007617  ]
+ [ 0.01680238  0.00067294]
+ [ 0.00067294 -0.00536757]
+ [ 0.01696589  0.00057358]
+ [ 0.00057358 -0.0050848 ]
+ [ 0.0173327   0.00038682]
+ [ 0.00038682 -0.00446976]
+ [ 0.01746351 -0.        ]
+ [-0.         -0.00435027]
+ [ 0.0173327  -0.00038682]
+ [-0.00038682 -0.00446976]
+ [ 0.01696589 -0.00057358]
+ [-0.00057358 -0.0050848 ]
+ [ 0.01680238 -0.00067294]
+ [-0.00067294 -0.00536757]
+ [ 0.01604746 -0.00089472]
+ [-0.00089472 -0.007617  ]
+ [ 0.01576856 -0.00027862]
+ [-0.00027862 -0.00723949]
+ [ 0.01535868  0.00030897]
+ [ 0.00030897 -0.00546392]
+ [ 0.01610622  0.00035082]
+ [ 0.00035082 -0.00540232]
+ [ 0.01664903  0.0001634 ]
+ [ 0.0001634  -0.00504576]
+ [ 0.01666938  0.        ]
+ [ 0.         -0.00507039]
+ [ 0.01664903 -0.0001634 ]
+ [-0.0001634  -0.00504576]
+ [ 0.01610622 -0.00035082]
+ [-0.00035082 -0.00540232]
+ [ 0.01535868 -0.00030897]
+ [-0.00030897 -0.00546392]
+ [ 0.01576856  0.00027862]
+ [ 0.00027862 -0.00723949]
+ [ 0.01761613  0.00011709]
+ [ 0.00011709 -0.00747256]
+ [ 0.01836292  0.00009761]
+ [ 0.00009761 -0.00561205]
+ [ 0.01872771  0.00049776]
+ [ 0.00049776 -0.00561042]
+ [ 0.01934892  0.00033885]
+ [ 0.00033885 -0.00525289]
+ [ 0.01977152 -0.        ]
+ [-0.         -0.0053034 ]
+ [ 0.01934892 -0.00033885]
+ [-0.00033885 -0.00525289]
+ [ 0.01872771 -0.00049776]
+ [-0.00049776 -0.00561042]
+ [ 0.01836292 -0.00009761]
+ [-0.00009761 -0.00561205]
+ [ 0.01761613 -0.00011709]
+ [-0.00011709 -0.00747256]
+ [ 0.01426625  0.00464623]
+ [ 0.00464623 -0.00513694]
+ [ 0.01637114  0.00128916]
+ [ 0.00128916 -0.00511398]
+ [ 0.01522882  0.00061834]
+ [ 0.00061834 -0.00568312]
+ [ 0.01555262  0.00066533]
+ [ 0.00066533 -0.005162  ]
+ [ 0.01617173 -0.        ]
+ [-0.         -0.00523156]
+ [ 0.01555262 -0.00066533]
+ [-0.00066533 -0.005162  ]
+ [ 0.01522882 -0.00061834]
+ [-0.00061834 -0.00568312]
+ [ 0.01637114 -0.00128916]
+ [-0.00128916 -0.00511398]
+ [ 0.01426625 -0.00464623]
+ [-0.00464623 -0.00513694]
+ [ 0.02736424 -0.00118936]
+ [-0.00118936 -0.0081244 ]
+ [ 0.02021793  0.00083684]
+ [ 0.00083684 -0.00520796]
+ [ 0.02757248  0.00029019]
+ [ 0.00029019 -0.00550185]
+ [ 0.02977601  0.00051776]
+ [ 0.00051776 -0.00530719]
+ [ 0.03045254 -0.        ]
+ [-0.         -0.00513005]
+ [ 0.02977601 -0.00051776]
+ [-0.00051776 -0.00530719]
+ [ 0.02757248 -0.00029019]
+ [-0.00029019 -0.00550185]
+ [ 0.02021793 -0.00083684]
+ [-0.00083684 -0.00520796]
+ [ 0.02736424  0.00118936]
+ [ 0.00118936 -0.0081244 ]]
+strain_longi [0. 0. 0.]
+stress_tensor
+[[ 46.95911781  12.46719829]
+ [ 12.46719829   2.79608126]
+ [ 40.13761334   5.19859687]
+ [  5.19859687   3.48427451]
+ [ 29.94446828   2.54625687]
+ [  2.54625687   3.56466633]
+ [ 27.29562702   1.0715638 ]
+ [  1.0715638    4.10817652]
+ [ 27.07827877  -0.        ]
+ [ -0.           4.3245869 ]
+ [ 27.29562702  -1.0715638 ]
+ [ -1.0715638    4.10817652]
+ [ 29.94446828  -2.54625687]
+ [ -2.54625687   3.56466633]
+ [ 40.13761334  -5.19859687]
+ [ -5.19859687   3.48427451]
+ [ 46.95911781 -12.46719829]
+ [-12.46719829   2.79608126]
+ [ 65.85141028  21.87999574]
+ [ 21.87999574  15.01598568]
+ [ 61.33034678  12.17662563]
+ [ 12.17662563  10.40954296]
+ [ 46.41356547   4.75733961]
+ [  4.75733961   7.00232364]
+ [ 43.38487918   2.11985589]
+ [  2.11985589   8.14278612]
+ [ 43.05965055  -0.        ]
+ [ -0.           8.47784446]
+ [ 43.38487918  -2.11985589]
+ [ -2.11985589   8.14278612]
+ [ 46.41356547  -4.75733961]
+ [ -4.75733961   7.00232364]
+ [ 61.33034678 -12.17662563]
+ [-12.17662563  10.40954296]
+ [ 65.85141028 -21.87999574]
+ [-21.87999574  15.01598568]
+ [ 58.86300066   2.33688097]
+ [  2.33688097 -10.34493277]
+ [ 62.45154989   4.79775796]
+ [  4.79775796   4.9248859 ]
+ [ 50.87642529   3.96464422]
+ [  3.96464422   5.72237623]
+ [ 48.82141616   1.62652803]
+ [  1.62652803   5.52691302]
+ [ 48.76464173   0.        ]
+ [  0.           6.39173247]
+ [ 48.82141616  -1.62652803]
+ [ -1.62652803   5.52691302]
+ [ 50.87642529  -3.96464422]
+ [ -3.96464422   5.72237623]
+ [ 62.45154989  -4.79775796]
+ [ -4.79775796   4.9248859 ]
+ [ 58.86300066  -2.33688097]
+ [ -2.33688097 -10.34493277]
+ [ 75.01901278   3.80030437]
+ [  3.80030437 -13.0778865 ]
+ [ 78.02475013   4.44694711]
+ [  4.44694711   1.93828927]
+ [ 64.11611229   3.11961779]
+ [  3.11961779   2.88469508]
+ [ 62.71063337   1.54738411]
+ [  1.54738411   2.89719267]
+ [ 63.04022633   0.        ]
+ [  0.           3.72737375]
+ [ 62.71063337  -1.54738411]
+ [ -1.54738411   2.89719267]
+ [ 64.11611229  -3.11961779]
+ [ -3.11961779   2.88469508]
+ [ 78.02475013  -4.44694711]
+ [ -4.44694711   1.93828927]
+ [ 75.01901278  -3.80030437]
+ [ -3.80030437 -13.0778865 ]
+ [ 73.94021888   2.39730932]
+ [  2.39730932 -14.00059524]
+ [ 78.86632861   2.00751368]
+ [  2.00751368  -1.14581095]
+ [ 64.95540618   1.88812703]
+ [  1.88812703  -0.71201079]
+ [ 64.86541859   1.2198131 ]
+ [  1.2198131   -0.55070186]
+ [ 65.508136    -0.        ]
+ [ -0.           0.0580725 ]
+ [ 64.86541859  -1.2198131 ]
+ [ -1.2198131   -0.55070186]
+ [ 64.95540618  -1.88812703]
+ [ -1.88812703  -0.71201079]
+ [ 78.86632861  -2.00751368]
+ [ -2.00751368  -1.14581095]
+ [ 73.94021888  -2.39730932]
+ [ -2.39730932 -14.00059524]
+ [ 72.84534351  -0.7465211 ]
+ [ -0.7465211  -12.90603185]
+ [ 71.56895493   0.92171647]
+ [  0.92171647  -2.797354  ]
+ [ 61.04858904   1.15482748]
+ [  1.15482748  -2.81008781]
+ [ 61.55471296   0.51527843]
+ [  0.51527843  -3.53836425]
+ [ 61.61148908   0.        ]
+ [  0.          -3.61652452]
+ [ 61.55471296  -0.51527843]
+ [ -0.51527843  -3.53836425]
+ [ 61.04858904  -1.15482748]
+ [ -1.15482748  -2.81008781]
+ [ 71.56895493  -0.92171647]
+ [ -0.92171647  -2.797354  ]
+ [ 72.84534351   0.7465211 ]
+ [  0.7465211  -12.90603185]
+ [ 73.73739717   0.33787676]
+ [  0.33787676 -12.36113883]
+ [ 79.87269344   0.30903201]
+ [  0.30903201   0.11446978]
+ [ 65.78298601   1.71372722]
+ [  1.71372722  -0.19652748]
+ [ 66.17311828   1.11542642]
+ [  1.11542642  -1.09058369]
+ [ 67.68711512  -0.        ]
+ [ -0.          -0.8479592 ]
+ [ 66.17311828  -1.11542642]
+ [ -1.11542642  -1.09058369]
+ [ 65.78298601  -1.71372722]
+ [ -1.71372722  -0.19652748]
+ [ 79.87269344  -0.30903201]
+ [ -0.30903201   0.11446978]
+ [ 73.73739717  -0.33787676]
+ [ -0.33787676 -12.36113883]
+ [ 47.27306051   3.82506187]
+ [  3.82506187 -15.81347578]
+ [ 61.80702086   1.01291446]
+ [  1.01291446  -6.79890835]
+ [ 44.57225918   1.95770913]
+ [  1.95770913 -11.00265959]
+ [ 43.9918357    1.98479101]
+ [  1.98479101 -11.23645138]
+ [ 45.87005335  -0.        ]
+ [ -0.         -11.00516676]
+ [ 43.9918357   -1.98479101]
+ [ -1.98479101 -11.23645138]
+ [ 44.57225918  -1.95770913]
+ [ -1.95770913 -11.00265959]
+ [ 61.80702086  -1.01291446]
+ [ -1.01291446  -6.79890835]
+ [ 47.27306051  -3.82506187]
+ [ -3.82506187 -15.81347578]
+ [118.47658579 -22.84253247]
+ [-22.84253247 -17.25357039]
+ [ 86.24565909  -1.41131565]
+ [ -1.41131565  -7.24481439]
+ [ 97.37422995   0.83734593]
+ [  0.83734593  -1.07204362]
+ [ 99.28111429   1.38728606]
+ [  1.38728606  -3.30718611]
+ [101.76782886  -0.        ]
+ [ -0.          -1.90093778]
+ [ 99.28111429  -1.38728606]
+ [ -1.38728606  -3.30718611]
+ [ 97.37422995  -0.83734593]
+ [ -0.83734593  -1.07204362]
+ [ 86.24565909   1.41131565]
+ [  1.41131565  -7.24481439]
+ [118.47658579  22.84253247]
+ [ 22.84253247 -17.25357039]]
+strain_energy
+[[0.         0.07725575 0.30912377]
+ [0.         0.05640645 0.22528073]
+ [0.         0.03959273 0.15735611]
+ [0.         0.03686527 0.14598168]
+ [0.         0.03696015 0.14620763]
+ [0.         0.03686527 0.14598168]
+ [0.         0.03959273 0.15735611]
+ [0.         0.05640645 0.22528073]
+ [0.         0.07725575 0.30912377]
+ [0.         0.18583964 0.74256695]
+ [0.         0.14321087 0.57403676]
+ [0.         0.10215032 0.40615621]
+ [0.         0.09477782 0.37517984]
+ [0.         0.09437544 0.37294174]
+ [0.         0.09477782 0.37517984]
+ [0.         0.10215032 0.40615621]
+ [0.         0.14321087 0.57403676]
+ [0.         0.18583964 0.74256695]
+ [0.         0.1161108  0.46973149]
+ [0.         0.12499294 0.49811599]
+ [0.         0.10263032 0.40735098]
+ [0.         0.09524008 0.37554748]
+ [0.         0.09329749 0.36623329]
+ [0.         0.09524008 0.37554748]
+ [0.         0.10263032 0.40735098]
+ [0.         0.12499294 0.49811599]
+ [0.         0.1161108  0.46973149]
+ [0.         0.15849523 0.64563667]
+ [0.         0.17655565 0.7083426 ]
+ [0.         0.15250374 0.60338035]
+ [0.         0.1462536  0.57493845]
+ [0.         0.14472667 0.56850289]
+ [0.         0.1462536  0.57493845]
+ [0.         0.15250374 0.60338035]
+ [0.         0.17655565 0.7083426 ]
+ [0.         0.15849523 0.64563667]
+ [0.         0.15236342 0.6104721 ]
+ [0.         0.1662184  0.68897878]
+ [0.         0.1507586  0.60245596]
+ [0.         0.15357378 0.60866302]
+ [0.         0.15405677 0.60868122]
+ [0.         0.15357378 0.60866302]
+ [0.         0.1507586  0.60245596]
+ [0.         0.1662184  0.68897878]
+ [0.         0.15236342 0.6104721 ]
+ [0.         0.14693663 0.66810118]
+ [0.         0.1563788  0.60773613]
+ [0.         0.14705575 0.59280418]
+ [0.         0.15246894 0.60535508]
+ [0.         0.1542118  0.60713131]
+ [0.         0.15246894 0.60535508]
+ [0.         0.14705575 0.59280418]
+ [0.         0.1563788  0.60773613]
+ [0.         0.14693663 0.66810118]
+ [0.         0.16160607 0.8151863 ]
+ [0.         0.18405754 0.87133234]
+ [0.         0.17119082 0.78570734]
+ [0.         0.18204889 0.84018621]
+ [0.         0.18738071 0.87689641]
+ [0.         0.18204889 0.84018621]
+ [0.         0.17119082 0.78570734]
+ [0.         0.18405754 0.87133234]
+ [0.         0.16160607 0.8151863 ]
+ [0.         0.11220143 0.26063828]
+ [0.         0.11593121 0.54115153]
+ [0.         0.11018034 0.35289976]
+ [0.         0.11858508 0.38886592]
+ [0.         0.12226546 0.40677904]
+ [0.         0.11858508 0.38886592]
+ [0.         0.11018034 0.35289976]
+ [0.         0.11593121 0.54115153]
+ [0.         0.11220143 0.26063828]
+ [0.         0.24875734 1.40886883]
+ [0.         0.21492115 0.85713058]
+ [0.         0.23777051 1.11562347]
+ [0.         0.25855744 1.23184352]
+ [0.         0.26346697 1.24835987]
+ [0.         0.25855744 1.23184352]
+ [0.         0.23777051 1.11562347]
+ [0.         0.21492115 0.85713058]
+ [0.         0.24875734 1.40886883]]
@@ -0,0 +1,412 @@
+t_n: 1 res: 0.0008488227129686045 Iteration # 75
+delta_x = 0.5
+Horizon = 1.5014999999999998
+epsilon_tensor
+[[ 0.0100376   0.00160772]
+ [ 0.00160772 -0.00146894]
+ [ 0.0089511   0.00110708]
+ [ 0.00110708 -0.00115587]
+ [ 0.008279    0.0008978 ]
+ [ 0.0008978  -0.00079773]
+ [ 0.00798172  0.00040912]
+ [ 0.00040912 -0.00042029]
+ [ 0.00791133  0.        ]
+ [ 0.         -0.0003668 ]
+ [ 0.00798172 -0.00040912]
+ [-0.00040912 -0.00042029]
+ [ 0.008279   -0.0008978 ]
+ [-0.0008978  -0.00079773]
+ [ 0.0089511  -0.00110708]
+ [-0.00110708 -0.00115587]
+ [ 0.0100376  -0.00160772]
+ [-0.00160772 -0.00146894]
+ [ 0.01469393  0.00446764]
+ [ 0.00446764  0.0002258 ]
+ [ 0.01481653  0.00300496]
+ [ 0.00300496 -0.00108781]
+ [ 0.01457008  0.00153208]
+ [ 0.00153208 -0.00167605]
+ [ 0.01418106  0.0007265 ]
+ [ 0.0007265  -0.00102519]
+ [ 0.01406348 -0.        ]
+ [-0.         -0.00093576]
+ [ 0.01418106 -0.0007265 ]
+ [-0.0007265  -0.00102519]
+ [ 0.01457008 -0.00153208]
+ [-0.00153208 -0.00167605]
+ [ 0.01481653 -0.00300496]
+ [-0.00300496 -0.00108781]
+ [ 0.01469393 -0.00446764]
+ [-0.00446764  0.0002258 ]
+ [ 0.0140131   0.0008302 ]
+ [ 0.0008302  -0.00608399]
+ [ 0.01401616  0.00153823]
+ [ 0.00153823 -0.00282521]
+ [ 0.0140028   0.00118209]
+ [ 0.00118209 -0.00267235]
+ [ 0.01385106  0.00051992]
+ [ 0.00051992 -0.00224368]
+ [ 0.01379768  0.        ]
+ [ 0.         -0.00201724]
+ [ 0.01385106 -0.00051992]
+ [-0.00051992 -0.00224368]
+ [ 0.0140028  -0.00118209]
+ [-0.00118209 -0.00267235]
+ [ 0.01401616 -0.00153823]
+ [-0.00153823 -0.00282521]
+ [ 0.0140131  -0.0008302 ]
+ [-0.0008302  -0.00608399]
+ [ 0.01613059  0.0014596 ]
+ [ 0.0014596  -0.00741696]
+ [ 0.01639605  0.0015412 ]
+ [ 0.0015412  -0.00428133]
+ [ 0.01651991  0.00099025]
+ [ 0.00099025 -0.00395827]
+ [ 0.01662814  0.0005181 ]
+ [ 0.0005181  -0.00341688]
+ [ 0.01667083  0.        ]
+ [ 0.         -0.00322756]
+ [ 0.01662814 -0.0005181 ]
+ [-0.0005181  -0.00341688]
+ [ 0.01651991 -0.00099025]
+ [-0.00099025 -0.00395827]
+ [ 0.01639605 -0.0015412 ]
+ [-0.0015412  -0.00428133]
+ [ 0.01613059 -0.0014596 ]
+ [-0.0014596  -0.00741696]
+ [ 0.01612152  0.00080715]
+ [ 0.00080715 -0.00757666]
+ [ 0.01653029  0.00074589]
+ [ 0.00074589 -0.00535754]
+ [ 0.01691578  0.00060943]
+ [ 0.00060943 -0.00503055]
+ [ 0.01735786  0.00039991]
+ [ 0.00039991 -0.00443571]
+ [ 0.01750376 -0.        ]
+ [-0.         -0.00432449]
+ [ 0.01735786 -0.00039991]
+ [-0.00039991 -0.00443571]
+ [ 0.01691578 -0.00060943]
+ [-0.00060943 -0.00503055]
+ [ 0.01653029 -0.00074589]
+ [-0.00074589 -0.00535754]
+ [ 0.01612152 -0.00080715]
+ [-0.00080715 -0.00757666]
+ [ 0.01546417 -0.00025009]
+ [-0.00025009 -0.00719631]
+ [ 0.01579473  0.00021968]
+ [ 0.00021968 -0.00537604]
+ [ 0.01634535  0.00037628]
+ [ 0.00037628 -0.0053008 ]
+ [ 0.01689485  0.00025359]
+ [ 0.00025359 -0.00491955]
+ [ 0.01708037 -0.        ]
+ [-0.         -0.00491544]
+ [ 0.01689485 -0.00025359]
+ [-0.00025359 -0.00491955]
+ [ 0.01634535 -0.00037628]
+ [-0.00037628 -0.0053008 ]
+ [ 0.01579473 -0.00021968]
+ [-0.00021968 -0.00537604]
+ [ 0.01546417  0.00025009]
+ [ 0.00025009 -0.00719631]
+ [ 0.01660616  0.00021041]
+ [ 0.00021041 -0.00734045]
+ [ 0.01734994  0.00016327]
+ [ 0.00016327 -0.00535815]
+ [ 0.01785776  0.00041576]
+ [ 0.00041576 -0.0052668 ]
+ [ 0.01850844  0.00033675]
+ [ 0.00033675 -0.00496026]
+ [ 0.01884635  0.        ]
+ [ 0.         -0.00497382]
+ [ 0.01850844 -0.00033675]
+ [-0.00033675 -0.00496026]
+ [ 0.01785776 -0.00041576]
+ [-0.00041576 -0.0052668 ]
+ [ 0.01734994 -0.00016327]
+ [-0.00016327 -0.00535815]
+ [ 0.01660616 -0.00021041]
+ [-0.00021041 -0.00734045]
+ [ 0.01492184  0.00232316]
+ [ 0.00232316 -0.00523821]
+ [ 0.01486586  0.00145526]
+ [ 0.00145526 -0.00481153]
+ [ 0.01549839  0.00051904]
+ [ 0.00051904 -0.00514483]
+ [ 0.01612505  0.00048735]
+ [ 0.00048735 -0.00475356]
+ [ 0.01649518  0.        ]
+ [ 0.         -0.0047791 ]
+ [ 0.01612505 -0.00048735]
+ [-0.00048735 -0.00475356]
+ [ 0.01549839 -0.00051904]
+ [-0.00051904 -0.00514483]
+ [ 0.01486586 -0.00145526]
+ [-0.00145526 -0.00481153]
+ [ 0.01492184 -0.00232316]
+ [-0.00232316 -0.00523821]
+ [ 0.02092181 -0.00012634]
+ [-0.00012634 -0.00614742]
+ [ 0.02001112  0.00021126]
+ [ 0.00021126 -0.00462237]
+ [ 0.02345407  0.00017733]
+ [ 0.00017733 -0.00480098]
+ [ 0.02533852  0.00045346]
+ [ 0.00045346 -0.00455934]
+ [ 0.02576869 -0.        ]
+ [-0.         -0.00448052]
+ [ 0.02533852 -0.00045346]
+ [-0.00045346 -0.00455934]
+ [ 0.02345407 -0.00017733]
+ [-0.00017733 -0.00480098]
+ [ 0.02001112 -0.00021126]
+ [-0.00021126 -0.00462237]
+ [ 0.02092181  0.00012634]
+ [ 0.00012634 -0.00614742]]
+strain_longi [0. 0.]
+stress_tensor
+[[ 46.82113826  12.46220282]
+ [ 12.46220282   2.81309544]
+ [ 40.08818858   5.23959029]
+ [  5.23959029   3.50201279]
+ [ 29.98111866   2.5905994 ]
+ [  2.5905994    3.56916836]
+ [ 27.39080199   1.09619791]
+ [  1.09619791   4.10100357]
+ [ 27.18787253   0.        ]
+ [  0.           4.31254831]
+ [ 27.39080199  -1.09619791]
+ [ -1.09619791   4.10100357]
+ [ 29.98111866  -2.5905994 ]
+ [ -2.5905994    3.56916836]
+ [ 40.08818858  -5.23959029]
+ [ -5.23959029   3.50201279]
+ [ 46.82113826 -12.46220282]
+ [-12.46220282   2.81309544]
+ [ 65.72457841  21.88706754]
+ [ 21.88706754  15.06351642]
+ [ 61.20366279  12.26423474]
+ [ 12.26423474  10.41817223]
+ [ 46.46822297   4.85065093]
+ [  4.85065093   7.00210919]
+ [ 43.55264956   2.16726625]
+ [  2.16726625   8.13399396]
+ [ 43.26715332  -0.        ]
+ [ -0.           8.47055956]
+ [ 43.55264956  -2.16726625]
+ [ -2.16726625   8.13399396]
+ [ 46.46822297  -4.85065093]
+ [ -4.85065093   7.00210919]
+ [ 61.20366279 -12.26423474]
+ [-12.26423474  10.41817223]
+ [ 65.72457841 -21.88706754]
+ [-21.88706754  15.06351642]
+ [ 58.5342568    2.39554559]
+ [  2.39554559 -10.3508963 ]
+ [ 62.44845945   4.87012041]
+ [  4.87012041   4.90916   ]
+ [ 50.92887807   4.06979904]
+ [  4.06979904   5.72334159]
+ [ 48.99343601   1.71148236]
+ [  1.71148236   5.51226278]
+ [ 49.03768705   0.        ]
+ [  0.           6.39471155]
+ [ 48.99343601  -1.71148236]
+ [ -1.71148236   5.51226278]
+ [ 50.92887807  -4.06979904]
+ [ -4.06979904   5.72334159]
+ [ 62.44845945  -4.87012041]
+ [ -4.87012041   4.90916   ]
+ [ 58.5342568   -2.39554559]
+ [ -2.39554559 -10.3508963 ]
+ [ 74.50904901   3.91083966]
+ [  3.91083966 -13.24143391]
+ [ 77.85289283   4.59767503]
+ [  4.59767503   1.88389326]
+ [ 64.31037242   3.25972382]
+ [  3.25972382   2.9907476 ]
+ [ 63.0996816    1.63379714]
+ [  1.63379714   2.9566155 ]
+ [ 63.4597373    0.        ]
+ [  0.           3.75659021]
+ [ 63.0996816   -1.63379714]
+ [ -1.63379714   2.9566155 ]
+ [ 64.31037242  -3.25972382]
+ [ -3.25972382   2.9907476 ]
+ [ 77.85289283  -4.59767503]
+ [ -4.59767503   1.88389326]
+ [ 74.50904901  -3.91083966]
+ [ -3.91083966 -13.24143391]
+ [ 74.3399869    2.1626804 ]
+ [  2.1626804  -13.80306324]
+ [ 77.51738475   2.22512671]
+ [  2.22512671  -1.36859897]
+ [ 64.80550831   2.00613257]
+ [  2.00613257  -0.5643472 ]
+ [ 65.00009026   1.26107986]
+ [  1.26107986  -0.38935576]
+ [ 65.69492565  -0.        ]
+ [ -0.           0.20143371]
+ [ 65.00009026  -1.26107986]
+ [ -1.26107986  -0.38935576]
+ [ 64.80550831  -2.00613257]
+ [ -2.00613257  -0.5643472 ]
+ [ 77.51738475  -2.22512671]
+ [ -2.22512671  -1.36859897]
+ [ 74.3399869   -2.1626804 ]
+ [ -2.1626804  -13.80306324]
+ [ 71.36421689  -0.67007894]
+ [ -0.67007894 -12.99225052]
+ [ 73.8279714    0.65533621]
+ [  0.65533621  -2.11402373]
+ [ 62.14944806   1.23865992]
+ [  1.23865992  -2.17750818]
+ [ 62.66420973   0.79967077]
+ [  0.79967077  -2.78773403]
+ [ 63.4104655   -0.        ]
+ [ -0.          -2.58578591]
+ [ 62.66420973  -0.79967077]
+ [ -0.79967077  -2.78773403]
+ [ 62.14944806  -1.23865992]
+ [ -1.23865992  -2.17750818]
+ [ 73.8279714   -0.65533621]
+ [ -0.65533621  -2.11402373]
+ [ 71.36421689   0.67007894]
+ [  0.67007894 -12.99225052]
+ [ 69.25211363   0.60713434]
+ [  0.60713434 -12.75034381]
+ [ 75.40995052   0.5169112 ]
+ [  0.5169112   -0.07596205]
+ [ 62.82220087   1.43142701]
+ [  1.43142701   0.13263106]
+ [ 63.36762917   1.10852432]
+ [  1.10852432  -0.77578048]
+ [ 64.60695462   0.        ]
+ [  0.          -0.4704446 ]
+ [ 63.36762917  -1.10852432]
+ [ -1.10852432  -0.77578048]
+ [ 62.82220087  -1.43142701]
+ [ -1.43142701   0.13263106]
+ [ 75.40995052  -0.5169112 ]
+ [ -0.5169112   -0.07596205]
+ [ 69.25211363  -0.60713434]
+ [ -0.60713434 -12.75034381]
+ [ 53.09681182  -2.58750592]
+ [ -2.58750592 -14.12505767]
+ [ 55.83144153   1.80082157]
+ [  1.80082157  -7.00208641]
+ [ 46.01077138   1.64329384]
+ [  1.64329384  -8.21997407]
+ [ 46.1702142    1.45384327]
+ [  1.45384327  -8.66245597]
+ [ 47.30808829   0.        ]
+ [  0.          -8.44410676]
+ [ 46.1702142   -1.45384327]
+ [ -1.45384327  -8.66245597]
+ [ 46.01077138  -1.64329384]
+ [ -1.64329384  -8.21997407]
+ [ 55.83144153  -1.80082157]
+ [ -1.80082157  -7.00208641]
+ [ 53.09681182   2.58750592]
+ [  2.58750592 -14.12505767]
+ [ 88.96739577 -15.86987353]
+ [-15.86987353 -14.56180048]
+ [ 86.19733371  -3.36046111]
+ [ -3.36046111  -4.15840334]
+ [ 82.72455009   0.51170044]
+ [  0.51170044  -1.46268621]
+ [ 84.45191708   1.21498344]
+ [  1.21498344  -3.02867763]
+ [ 86.00685539  -0.        ]
+ [ -0.          -2.30275702]
+ [ 84.45191708  -1.21498344]
+ [ -1.21498344  -3.02867763]
+ [ 82.72455009  -0.51170044]
+ [ -0.51170044  -1.46268621]
+ [ 86.19733371   3.36046111]
+ [  3.36046111  -4.15840334]
+ [ 88.96739577  15.86987353]
+ [ 15.86987353 -14.56180048]]
+strain_energy
+[[0.         0.30710266]
+ [0.         0.22480836]
+ [0.         0.1579552 ]
+ [0.         0.1470976 ]
+ [0.         0.14748618]
+ [0.         0.1470976 ]
+ [0.         0.1579552 ]
+ [0.         0.22480836]
+ [0.         0.30710266]
+ [0.         0.73956333]
+ [0.         0.57124957]
+ [0.         0.40774242]
+ [0.         0.37847663]
+ [0.         0.37689487]
+ [0.         0.37847663]
+ [0.         0.40774242]
+ [0.         0.57124957]
+ [0.         0.73956333]
+ [0.         0.4628865 ]
+ [0.         0.49806141]
+ [0.         0.40897701]
+ [0.         0.3796866 ]
+ [0.         0.37199085]
+ [0.         0.3796866 ]
+ [0.         0.40897701]
+ [0.         0.49806141]
+ [0.         0.4628865 ]
+ [0.         0.63250272]
+ [0.         0.70355093]
+ [0.         0.60730995]
+ [0.         0.58240199]
+ [0.         0.57633881]
+ [0.         0.58240199]
+ [0.         0.60730995]
+ [0.         0.70355093]
+ [0.         0.63250272]
+ [0.         0.60844275]
+ [0.         0.6628488 ]
+ [0.         0.60021851]
+ [0.         0.61107763]
+ [0.         0.6129482 ]
+ [0.         0.61107763]
+ [0.         0.60021851]
+ [0.         0.6628488 ]
+ [0.         0.60844275]
+ [0.         0.58682885]
+ [0.         0.6234956 ]
+ [0.         0.58517252]
+ [0.         0.60622859]
+ [0.         0.6129901 ]
+ [0.         0.60622859]
+ [0.         0.58517252]
+ [0.         0.6234956 ]
+ [0.         0.58682885]
+ [0.         0.64488137]
+ [0.         0.73325552]
+ [0.         0.68074201]
+ [0.         0.72306104]
+ [0.         0.74402134]
+ [0.         0.72306104]
+ [0.         0.68074201]
+ [0.         0.73325552]
+ [0.         0.64488137]
+ [0.         0.44798726]
+ [0.         0.4628464 ]
+ [0.         0.43863961]
+ [0.         0.47164514]
+ [0.         0.48616572]
+ [0.         0.47164514]
+ [0.         0.43863961]
+ [0.         0.4628464 ]
+ [0.         0.44798726]
+ [0.         0.99078631]
+ [0.         0.85482574]
+ [0.         0.94423942]
+ [0.         1.02676802]
+ [0.         1.04634576]
+ [0.         1.02676802]
+ [0.         0.94423942]
+ [0.         0.85482574]
+ [0.         0.99078631]]
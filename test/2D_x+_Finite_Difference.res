@@ -0,0 +1,433 @@
+iteration 1 480.0
+iteration 2 181.0700038415727
+iteration 3 59.6364248401318
+iteration 4 18.32594161354336
+iteration 5 8.535597740161123
+iteration 6 3.136792300703023
+iteration 7 1.761023489283589
+iteration 8 0.8917794431018684
+iteration 9 0.5232015769828362
+iteration 10 0.3030564745383724
+iteration 11 0.17920088942559795
+iteration 12 0.1069465684780844
+iteration 13 0.0636376387884825
+iteration 14 0.03814484020141483
+iteration 15 0.022802259479257618
+iteration 16 0.013663298612621156
+iteration 17 0.008189910875018197
+iteration 18 0.0049037619831753965
+iteration 19 0.0029436292233622624
+iteration 20 0.001761621543247803
+iteration 21 0.0010582415517314191
+t_n: 1 res: 0.0006331305716250207 Iteration # 21
+delta_x = 0.5
+Horizon = 1.5014999999999998
+epsilon_tensor
+[[ 0.01003764  0.00160773]
+ [ 0.00160773 -0.00146895]
+ [ 0.00895114  0.00110709]
+ [ 0.00110709 -0.00115588]
+ [ 0.00827904  0.0008978 ]
+ [ 0.0008978  -0.00079774]
+ [ 0.00798176  0.00040912]
+ [ 0.00040912 -0.00042029]
+ [ 0.00791137  0.        ]
+ [ 0.         -0.0003668 ]
+ [ 0.00798176 -0.00040912]
+ [-0.00040912 -0.00042029]
+ [ 0.00827904 -0.0008978 ]
+ [-0.0008978  -0.00079774]
+ [ 0.00895114 -0.00110709]
+ [-0.00110709 -0.00115588]
+ [ 0.01003764 -0.00160773]
+ [-0.00160773 -0.00146895]
+ [ 0.01469399  0.00446765]
+ [ 0.00446765  0.0002258 ]
+ [ 0.01481659  0.00300497]
+ [ 0.00300497 -0.00108781]
+ [ 0.01457015  0.00153209]
+ [ 0.00153209 -0.00167606]
+ [ 0.01418112  0.0007265 ]
+ [ 0.0007265  -0.00102519]
+ [ 0.01406354  0.        ]
+ [ 0.         -0.00093576]
+ [ 0.01418112 -0.0007265 ]
+ [-0.0007265  -0.00102519]
+ [ 0.01457015 -0.00153209]
+ [-0.00153209 -0.00167606]
+ [ 0.01481659 -0.00300497]
+ [-0.00300497 -0.00108781]
+ [ 0.01469399 -0.00446765]
+ [-0.00446765  0.0002258 ]
+ [ 0.01401315  0.0008302 ]
+ [ 0.0008302  -0.00608402]
+ [ 0.01401622  0.00153823]
+ [ 0.00153823 -0.00282522]
+ [ 0.01400285  0.00118209]
+ [ 0.00118209 -0.00267236]
+ [ 0.01385112  0.00051992]
+ [ 0.00051992 -0.00224369]
+ [ 0.01379774  0.        ]
+ [ 0.         -0.00201725]
+ [ 0.01385112 -0.00051992]
+ [-0.00051992 -0.00224369]
+ [ 0.01400285 -0.00118209]
+ [-0.00118209 -0.00267236]
+ [ 0.01401622 -0.00153823]
+ [-0.00153823 -0.00282522]
+ [ 0.01401315 -0.0008302 ]
+ [-0.0008302  -0.00608402]
+ [ 0.01613065  0.0014596 ]
+ [ 0.0014596  -0.00741699]
+ [ 0.01639611  0.0015412 ]
+ [ 0.0015412  -0.00428135]
+ [ 0.01651997  0.00099025]
+ [ 0.00099025 -0.00395828]
+ [ 0.0166282   0.0005181 ]
+ [ 0.0005181  -0.00341688]
+ [ 0.01667089  0.        ]
+ [ 0.         -0.00322757]
+ [ 0.0166282  -0.0005181 ]
+ [-0.0005181  -0.00341688]
+ [ 0.01651997 -0.00099025]
+ [-0.00099025 -0.00395828]
+ [ 0.01639611 -0.0015412 ]
+ [-0.0015412  -0.00428135]
+ [ 0.01613065 -0.0014596 ]
+ [-0.0014596  -0.00741699]
+ [ 0.01612157  0.00080715]
+ [ 0.00080715 -0.00757669]
+ [ 0.01653035  0.00074589]
+ [ 0.00074589 -0.00535756]
+ [ 0.01691583  0.00060943]
+ [ 0.00060943 -0.00503057]
+ [ 0.01735792  0.00039991]
+ [ 0.00039991 -0.00443572]
+ [ 0.01750382  0.        ]
+ [ 0.         -0.0043245 ]
+ [ 0.01735792 -0.00039991]
+ [-0.00039991 -0.00443572]
+ [ 0.01691583 -0.00060943]
+ [-0.00060943 -0.00503057]
+ [ 0.01653035 -0.00074589]
+ [-0.00074589 -0.00535756]
+ [ 0.01612157 -0.00080715]
+ [-0.00080715 -0.00757669]
+ [ 0.01546421 -0.00025009]
+ [-0.00025009 -0.00719633]
+ [ 0.01579478  0.00021968]
+ [ 0.00021968 -0.00537605]
+ [ 0.0163454   0.00037629]
+ [ 0.00037629 -0.00530081]
+ [ 0.0168949   0.00025359]
+ [ 0.00025359 -0.00491956]
+ [ 0.01708042  0.        ]
+ [ 0.         -0.00491545]
+ [ 0.0168949  -0.00025359]
+ [-0.00025359 -0.00491956]
+ [ 0.0163454  -0.00037629]
+ [-0.00037629 -0.00530081]
+ [ 0.01579478 -0.00021968]
+ [-0.00021968 -0.00537605]
+ [ 0.01546421  0.00025009]
+ [ 0.00025009 -0.00719633]
+ [ 0.0166062   0.00021041]
+ [ 0.00021041 -0.00734047]
+ [ 0.01734997  0.00016327]
+ [ 0.00016327 -0.00535816]
+ [ 0.0178578   0.00041577]
+ [ 0.00041577 -0.00526681]
+ [ 0.01850847  0.00033676]
+ [ 0.00033676 -0.00496027]
+ [ 0.01884639  0.        ]
+ [ 0.         -0.00497383]
+ [ 0.01850847 -0.00033676]
+ [-0.00033676 -0.00496027]
+ [ 0.0178578  -0.00041577]
+ [-0.00041577 -0.00526681]
+ [ 0.01734997 -0.00016327]
+ [-0.00016327 -0.00535816]
+ [ 0.0166062  -0.00021041]
+ [-0.00021041 -0.00734047]
+ [ 0.01492187  0.00232317]
+ [ 0.00232317 -0.00523822]
+ [ 0.01486589  0.00145527]
+ [ 0.00145527 -0.00481154]
+ [ 0.01549842  0.00051904]
+ [ 0.00051904 -0.00514485]
+ [ 0.01612508  0.00048735]
+ [ 0.00048735 -0.00475357]
+ [ 0.01649521  0.        ]
+ [ 0.         -0.00477912]
+ [ 0.01612508 -0.00048735]
+ [-0.00048735 -0.00475357]
+ [ 0.01549842 -0.00051904]
+ [-0.00051904 -0.00514485]
+ [ 0.01486589 -0.00145527]
+ [-0.00145527 -0.00481154]
+ [ 0.01492187 -0.00232317]
+ [-0.00232317 -0.00523822]
+ [ 0.02092183 -0.00012632]
+ [-0.00012632 -0.00614744]
+ [ 0.02001114  0.00021127]
+ [ 0.00021127 -0.00462239]
+ [ 0.02345409  0.00017735]
+ [ 0.00017735 -0.004801  ]
+ [ 0.02533854  0.00045346]
+ [ 0.00045346 -0.00455936]
+ [ 0.02576872  0.        ]
+ [ 0.         -0.00448055]
+ [ 0.02533854 -0.00045346]
+ [-0.00045346 -0.00455936]
+ [ 0.02345409 -0.00017735]
+ [-0.00017735 -0.004801  ]
+ [ 0.02001114 -0.00021127]
+ [-0.00021127 -0.00462239]
+ [ 0.02092183  0.00012632]
+ [ 0.00012632 -0.00614744]]
+strain_longi [0. 0.]
+stress_tensor
+[[ 46.82133136  12.46225405]
+ [ 12.46225405   2.81310801]
+ [ 40.0883594    5.23961168]
+ [  5.23961168   3.50202802]
+ [ 29.98125054   2.59060958]
+ [  2.59060958   3.56918485]
+ [ 27.39092542   1.09620205]
+ [  1.09620205   4.10102343]
+ [ 27.18799613   0.        ]
+ [  0.           4.31256978]
+ [ 27.39092542  -1.09620205]
+ [ -1.09620205   4.10102343]
+ [ 29.98125054  -2.59060958]
+ [ -2.59060958   3.56918485]
+ [ 40.0883594   -5.23961168]
+ [ -5.23961168   3.50202802]
+ [ 46.82133136 -12.46225405]
+ [-12.46225405   2.81310801]
+ [ 65.72484308  21.88715236]
+ [ 21.88715236  15.06357479]
+ [ 61.20391757  12.26428103]
+ [ 12.26428103  10.41821472]
+ [ 46.46842234   4.85066713]
+ [  4.85066713   7.00214239]
+ [ 43.55284075   2.16727297]
+ [  2.16727297   8.13403544]
+ [ 43.26734493   0.        ]
+ [  0.           8.47060412]
+ [ 43.55284075  -2.16727297]
+ [ -2.16727297   8.13403544]
+ [ 46.46842234  -4.85066713]
+ [ -4.85066713   7.00214239]
+ [ 61.20391757 -12.26428103]
+ [-12.26428103  10.41821472]
+ [ 65.72484308 -21.88715236]
+ [-21.88715236  15.06357479]
+ [ 58.53448335   2.39554646]
+ [  2.39554646 -10.3509557 ]
+ [ 62.44870969   4.87013249]
+ [  4.87013249   4.90917545]
+ [ 50.92908807   4.06981011]
+ [  4.06981011   5.72337127]
+ [ 48.99364223   1.7114863 ]
+ [  1.7114863    5.51229711]
+ [ 49.03789509   0.        ]
+ [  0.           6.39475153]
+ [ 48.99364223  -1.7114863 ]
+ [ -1.7114863    5.51229711]
+ [ 50.92908807  -4.06981011]
+ [ -4.06981011   5.72337127]
+ [ 62.44870969  -4.87013249]
+ [ -4.87013249   4.90917545]
+ [ 58.53448335  -2.39554646]
+ [ -2.39554646 -10.3509557 ]
+ [ 74.5093246    3.91084698]
+ [  3.91084698 -13.24150071]
+ [ 77.85318851   4.59768485]
+ [  4.59768485   1.88390243]
+ [ 64.31062143   3.25973053]
+ [  3.25973053   2.99076987]
+ [ 63.09993027   1.63380018]
+ [  1.63380018   2.95664706]
+ [ 63.45998906   0.        ]
+ [  0.           3.75662846]
+ [ 63.09993027  -1.63380018]
+ [ -1.63380018   2.95664706]
+ [ 64.31062143  -3.25973053]
+ [ -3.25973053   2.99076987]
+ [ 77.85318851  -4.59768485]
+ [ -4.59768485   1.88390243]
+ [ 74.5093246   -3.91084698]
+ [ -3.91084698 -13.24150071]
+ [ 74.34023613   2.16268162]
+ [  2.16268162 -13.80311758]
+ [ 77.51764832   2.22512728]
+ [  2.22512728  -1.36859297]
+ [ 64.80572867   2.00613572]
+ [  2.00613572  -0.56433756]
+ [ 65.0003135    1.26108264]
+ [  1.26108264  -0.3893333 ]
+ [ 65.69515215   0.        ]
+ [  0.           0.20146282]
+ [ 65.0003135   -1.26108264]
+ [ -1.26108264  -0.3893333 ]
+ [ 64.80572867  -2.00613572]
+ [ -2.00613572  -0.56433756]
+ [ 77.51764832  -2.22512728]
+ [ -2.22512728  -1.36859297]
+ [ 74.34023613  -2.16268162]
+ [ -2.16268162 -13.80311758]
+ [ 71.36442301  -0.67007757]
+ [ -0.67007757 -12.99228926]
+ [ 73.82819249   0.65534114]
+ [  0.65534114  -2.11401429]
+ [ 62.14963075   1.23866953]
+ [  1.23866953  -2.17750699]
+ [ 62.66439364   0.79967697]
+ [  0.79967697  -2.78772411]
+ [ 63.41065176   0.        ]
+ [  0.          -2.58577155]
+ [ 62.66439364  -0.79967697]
+ [ -0.79967697  -2.78772411]
+ [ 62.14963075  -1.23866953]
+ [ -1.23866953  -2.17750699]
+ [ 73.82819249  -0.65534114]
+ [ -0.65534114  -2.11401429]
+ [ 71.36442301   0.67007757]
+ [  0.67007757 -12.99228926]
+ [ 69.25226613   0.60714709]
+ [  0.60714709 -12.75036077]
+ [ 75.4101106    0.51692864]
+ [  0.51692864  -0.07595692]
+ [ 62.82232615   1.43144818]
+ [  1.43144818   0.13261609]
+ [ 63.367755     1.10853688]
+ [  1.10853688  -0.77579297]
+ [ 64.60708179   0.        ]
+ [  0.          -0.47045657]
+ [ 63.367755    -1.10853688]
+ [ -1.10853688  -0.77579297]
+ [ 62.82232615  -1.43144818]
+ [ -1.43144818   0.13261609]
+ [ 75.4101106   -0.51692864]
+ [ -0.51692864  -0.07595692]
+ [ 69.25226613  -0.60714709]
+ [ -0.60714709 -12.75036077]
+ [ 53.09690775  -2.58749717]
+ [ -2.58749717 -14.12510307]
+ [ 55.83154512   1.80084448]
+ [  1.80084448  -7.00212102]
+ [ 46.01085612   1.64332119]
+ [  1.64332119  -8.22002051]
+ [ 46.17029797   1.45385963]
+ [  1.45385963  -8.66250519]
+ [ 47.3081719    0.        ]
+ [  0.          -8.4441596 ]
+ [ 46.17029797  -1.45385963]
+ [ -1.45385963  -8.66250519]
+ [ 46.01085612  -1.64332119]
+ [ -1.64332119  -8.22002051]
+ [ 55.83154512  -1.80084448]
+ [ -1.80084448  -7.00212102]
+ [ 53.09690775   2.58749717]
+ [  2.58749717 -14.12510307]
+ [ 88.96745073 -15.86983932]
+ [-15.86983932 -14.56192123]
+ [ 86.19740204  -3.36041418]
+ [ -3.36041418  -4.15848888]
+ [ 82.72462428   0.5117425 ]
+ [  0.5117425   -1.46275553]
+ [ 84.45199516   1.21500678]
+ [  1.21500678  -3.02876156]
+ [ 86.00693444   0.        ]
+ [  0.          -2.30284653]
+ [ 84.45199516  -1.21500678]
+ [ -1.21500678  -3.02876156]
+ [ 82.72462428  -0.5117425 ]
+ [ -0.5117425   -1.46275553]
+ [ 86.19740204   3.36041418]
+ [  3.36041418  -4.15848888]
+ [ 88.96745073  15.86983932]
+ [ 15.86983932 -14.56192123]]
+strain_energy
+[[0.         0.30710519]
+ [0.         0.22481028]
+ [0.         0.1579566 ]
+ [0.         0.14709893]
+ [0.         0.14748753]
+ [0.         0.14709893]
+ [0.         0.1579566 ]
+ [0.         0.22481028]
+ [0.         0.30710519]
+ [0.         0.73956924]
+ [0.         0.5712543 ]
+ [0.         0.40774595]
+ [0.         0.37847999]
+ [0.         0.37689826]
+ [0.         0.37847999]
+ [0.         0.40774595]
+ [0.         0.5712543 ]
+ [0.         0.73956924]
+ [0.         0.46288998]
+ [0.         0.49806534]
+ [0.         0.40898036]
+ [0.         0.37968978]
+ [0.         0.37199399]
+ [0.         0.37968978]
+ [0.         0.40898036]
+ [0.         0.49806534]
+ [0.         0.46288998]
+ [0.         0.63250731]
+ [0.         0.70355618]
+ [0.         0.6073146 ]
+ [0.         0.5824065 ]
+ [0.         0.57634328]
+ [0.         0.5824065 ]
+ [0.         0.6073146 ]
+ [0.         0.70355618]
+ [0.         0.63250731]
+ [0.         0.60844689]
+ [0.         0.66285325]
+ [0.         0.60022254]
+ [0.         0.61108169]
+ [0.         0.61295226]
+ [0.         0.61108169]
+ [0.         0.60022254]
+ [0.         0.66285325]
+ [0.         0.60844689]
+ [0.         0.58683228]
+ [0.         0.62349926]
+ [0.         0.58517585]
+ [0.         0.60623194]
+ [0.         0.61299345]
+ [0.         0.60623194]
+ [0.         0.58517585]
+ [0.         0.62349926]
+ [0.         0.58683228]
+ [0.         0.64488432]
+ [0.         0.73325852]
+ [0.         0.68074465]
+ [0.         0.72306372]
+ [0.         0.74402403]
+ [0.         0.72306372]
+ [0.         0.68074465]
+ [0.         0.73325852]
+ [0.         0.64488432]
+ [0.         0.44798902]
+ [0.         0.462848  ]
+ [0.         0.43864109]
+ [0.         0.47164665]
+ [0.         0.48616723]
+ [0.         0.47164665]
+ [0.         0.43864109]
+ [0.         0.462848  ]
+ [0.         0.44798902]
+ [0.         0.99078788]
+ [0.         0.85482742]
+ [0.         0.94424155]
+ [0.         1.02677049]
+ [0.         1.04634826]
+ [0.         1.02677049]
+ [0.         0.94424155]
+ [0.         0.85482742]
+ [0.         0.99078788]]
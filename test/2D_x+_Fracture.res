@@ -0,0 +1,33 @@
+iteration 1 240.0
+iteration 2 1.4633214856702141
+t_n: 1 res: 6.805534006221454e-05 Iteration # 2
+iteration 1 239.99995130582295
+iteration 2 1.4092916313408141
+t_n: 2 Broken bonds # 52
+iteration 1 214.44481018063198
+iteration 2 3.4325420594563667
+t_n: 2 Broken bonds # 80
+iteration 1 347.2686758791227
+iteration 2 44.462636523052325
+iteration 3 0.37153893900316187
+t_n: 2 Broken bonds # 114
+iteration 1 520.2463013337597
+iteration 2 32669.032249663098
+iteration 3 1979.5624024734955
+iteration 4 1810.1998809864795
+iteration 5 464.4072398410562
+iteration 6 38363.07413181515
+iteration 7 2238.3023649164534
+iteration 8 3698.8348148523373
+iteration 9 357.19368291381835
+iteration 10 28858.174384874757
+iteration 11 1840.2852275662722
+iteration 12 299.96343778779004
+iteration 13 101.80534433818544
+iteration 14 15.712259856246101
+iteration 15 0.2811659146775734
+t_n: 2 Broken bonds # 156
+iteration 1 776.4148142606228
+iteration 2 567556.764278622
+Error: The Jacobian matrix is singular
+Exit code 1
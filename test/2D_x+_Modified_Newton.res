@@ -0,0 +1,424 @@
+iteration 1 160.0
+iteration 2 0.6512155047143778
+iteration 3 0.005868160194722442
+t_n: 1 res: 5.4679885592489325e-05 Iteration # 3
+iteration 1 159.99996489152733
+iteration 2 1.9412256276995474
+iteration 3 0.03473838243051156
+t_n: 2 res: 0.000642217664426236 Iteration # 3
+iteration 1 159.99958818838093
+iteration 2 3.210163942385553
+iteration 3 0.0855024820023172
+iteration 4 0.0023520642355400355
+t_n: 3 res: 7.239183416830609e-05 Iteration # 4
+delta_x = 0.5
+Horizon = 1.5014999999999998
+epsilon_tensor
+[[ 0.01003764  0.00160773]
+ [ 0.00160773 -0.00146895]
+ [ 0.00895114  0.00110709]
+ [ 0.00110709 -0.00115588]
+ [ 0.00827904  0.0008978 ]
+ [ 0.0008978  -0.00079774]
+ [ 0.00798176  0.00040912]
+ [ 0.00040912 -0.00042029]
+ [ 0.00791137 -0.        ]
+ [-0.         -0.0003668 ]
+ [ 0.00798176 -0.00040912]
+ [-0.00040912 -0.00042029]
+ [ 0.00827904 -0.0008978 ]
+ [-0.0008978  -0.00079774]
+ [ 0.00895114 -0.00110709]
+ [-0.00110709 -0.00115588]
+ [ 0.01003764 -0.00160773]
+ [-0.00160773 -0.00146895]
+ [ 0.01469399  0.00446766]
+ [ 0.00446766  0.00022581]
+ [ 0.01481659  0.00300498]
+ [ 0.00300498 -0.00108781]
+ [ 0.01457015  0.00153209]
+ [ 0.00153209 -0.00167606]
+ [ 0.01418112  0.0007265 ]
+ [ 0.0007265  -0.00102519]
+ [ 0.01406354 -0.        ]
+ [-0.         -0.00093576]
+ [ 0.01418112 -0.0007265 ]
+ [-0.0007265  -0.00102519]
+ [ 0.01457015 -0.00153209]
+ [-0.00153209 -0.00167606]
+ [ 0.01481659 -0.00300498]
+ [-0.00300498 -0.00108781]
+ [ 0.01469399 -0.00446766]
+ [-0.00446766  0.00022581]
+ [ 0.01401315  0.0008302 ]
+ [ 0.0008302  -0.00608402]
+ [ 0.01401622  0.00153824]
+ [ 0.00153824 -0.00282523]
+ [ 0.01400286  0.00118209]
+ [ 0.00118209 -0.00267237]
+ [ 0.01385112  0.00051992]
+ [ 0.00051992 -0.0022437 ]
+ [ 0.01379774 -0.        ]
+ [-0.         -0.00201725]
+ [ 0.01385112 -0.00051992]
+ [-0.00051992 -0.0022437 ]
+ [ 0.01400286 -0.00118209]
+ [-0.00118209 -0.00267237]
+ [ 0.01401622 -0.00153824]
+ [-0.00153824 -0.00282523]
+ [ 0.01401315 -0.0008302 ]
+ [-0.0008302  -0.00608402]
+ [ 0.01613065  0.00145961]
+ [ 0.00145961 -0.00741699]
+ [ 0.01639611  0.00154121]
+ [ 0.00154121 -0.00428136]
+ [ 0.01651997  0.00099026]
+ [ 0.00099026 -0.00395829]
+ [ 0.0166282   0.0005181 ]
+ [ 0.0005181  -0.00341689]
+ [ 0.0166709  -0.        ]
+ [-0.         -0.00322758]
+ [ 0.0166282  -0.0005181 ]
+ [-0.0005181  -0.00341689]
+ [ 0.01651997 -0.00099026]
+ [-0.00099026 -0.00395829]
+ [ 0.01639611 -0.00154121]
+ [-0.00154121 -0.00428136]
+ [ 0.01613065 -0.00145961]
+ [-0.00145961 -0.00741699]
+ [ 0.01612157  0.00080716]
+ [ 0.00080716 -0.0075767 ]
+ [ 0.01653035  0.00074589]
+ [ 0.00074589 -0.00535757]
+ [ 0.01691583  0.00060943]
+ [ 0.00060943 -0.00503057]
+ [ 0.01735792  0.00039991]
+ [ 0.00039991 -0.00443573]
+ [ 0.01750382 -0.        ]
+ [-0.         -0.00432451]
+ [ 0.01735792 -0.00039991]
+ [-0.00039991 -0.00443573]
+ [ 0.01691583 -0.00060943]
+ [-0.00060943 -0.00503057]
+ [ 0.01653035 -0.00074589]
+ [-0.00074589 -0.00535757]
+ [ 0.01612157 -0.00080716]
+ [-0.00080716 -0.0075767 ]
+ [ 0.01546421 -0.00025009]
+ [-0.00025009 -0.00719634]
+ [ 0.01579478  0.00021968]
+ [ 0.00021968 -0.00537606]
+ [ 0.0163454   0.00037629]
+ [ 0.00037629 -0.00530082]
+ [ 0.0168949   0.00025359]
+ [ 0.00025359 -0.00491957]
+ [ 0.01708043 -0.        ]
+ [-0.         -0.00491546]
+ [ 0.0168949  -0.00025359]
+ [-0.00025359 -0.00491957]
+ [ 0.0163454  -0.00037629]
+ [-0.00037629 -0.00530082]
+ [ 0.01579478 -0.00021968]
+ [-0.00021968 -0.00537606]
+ [ 0.01546421  0.00025009]
+ [ 0.00025009 -0.00719634]
+ [ 0.0166062   0.00021041]
+ [ 0.00021041 -0.00734047]
+ [ 0.01734997  0.00016327]
+ [ 0.00016327 -0.00535817]
+ [ 0.0178578   0.00041576]
+ [ 0.00041576 -0.00526681]
+ [ 0.01850848  0.00033675]
+ [ 0.00033675 -0.00496027]
+ [ 0.01884639  0.        ]
+ [ 0.         -0.00497383]
+ [ 0.01850848 -0.00033675]
+ [-0.00033675 -0.00496027]
+ [ 0.0178578  -0.00041576]
+ [-0.00041576 -0.00526681]
+ [ 0.01734997 -0.00016327]
+ [-0.00016327 -0.00535817]
+ [ 0.0166062  -0.00021041]
+ [-0.00021041 -0.00734047]
+ [ 0.01492187  0.00232317]
+ [ 0.00232317 -0.00523822]
+ [ 0.01486589  0.00145526]
+ [ 0.00145526 -0.00481154]
+ [ 0.01549842  0.00051904]
+ [ 0.00051904 -0.00514484]
+ [ 0.01612508  0.00048735]
+ [ 0.00048735 -0.00475357]
+ [ 0.01649522 -0.        ]
+ [-0.         -0.00477911]
+ [ 0.01612508 -0.00048735]
+ [-0.00048735 -0.00475357]
+ [ 0.01549842 -0.00051904]
+ [-0.00051904 -0.00514484]
+ [ 0.01486589 -0.00145526]
+ [-0.00145526 -0.00481154]
+ [ 0.01492187 -0.00232317]
+ [-0.00232317 -0.00523822]
+ [ 0.02092182 -0.00012634]
+ [-0.00012634 -0.00614742]
+ [ 0.02001114  0.00021126]
+ [ 0.00021126 -0.00462237]
+ [ 0.02345409  0.00017733]
+ [ 0.00017733 -0.00480099]
+ [ 0.02533854  0.00045346]
+ [ 0.00045346 -0.00455935]
+ [ 0.02576872 -0.        ]
+ [-0.         -0.00448053]
+ [ 0.02533854 -0.00045346]
+ [-0.00045346 -0.00455935]
+ [ 0.02345409 -0.00017733]
+ [-0.00017733 -0.00480099]
+ [ 0.02001114 -0.00021126]
+ [-0.00021126 -0.00462237]
+ [ 0.02092182  0.00012634]
+ [ 0.00012634 -0.00614742]]
+strain_longi [0. 0. 0. 0.]
+stress_tensor
+[[ 46.8213386   12.46225942]
+ [ 12.46225942   2.81310901]
+ [ 40.08836078   5.23961756]
+ [  5.23961756   3.50202764]
+ [ 29.98124895   2.59061505]
+ [  2.59061505   3.5691812 ]
+ [ 27.39092298   1.09620489]
+ [  1.09620489   4.1010184 ]
+ [ 27.1879933   -0.        ]
+ [ -0.           4.31256398]
+ [ 27.39092298  -1.09620489]
+ [ -1.09620489   4.1010184 ]
+ [ 29.98124895  -2.59061505]
+ [ -2.59061505   3.5691812 ]
+ [ 40.08836078  -5.23961756]
+ [ -5.23961756   3.50202764]
+ [ 46.8213386  -12.46225942]
+ [-12.46225942   2.81310901]
+ [ 65.72485117  21.88716596]
+ [ 21.88716596  15.06358647]
+ [ 61.20391988  12.26429545]
+ [ 12.26429545  10.41821663]
+ [ 46.4684204    4.85067942]
+ [  4.85067942   7.00213328]
+ [ 43.55283811   2.16727953]
+ [  2.16727953   8.13402205]
+ [ 43.26734187  -0.        ]
+ [ -0.           8.47058891]
+ [ 43.55283811  -2.16727953]
+ [ -2.16727953   8.13402205]
+ [ 46.4684204   -4.85067942]
+ [ -4.85067942   7.00213328]
+ [ 61.20391988 -12.26429545]
+ [-12.26429545  10.41821663]
+ [ 65.72485117 -21.88716596]
+ [-21.88716596  15.06358647]
+ [ 58.53447965   2.39555803]
+ [  2.39555803 -10.35095732]
+ [ 62.44870775   4.87014693]
+ [  4.87014693   4.90916925]
+ [ 50.92908572   4.06982315]
+ [  4.06982315   5.72335681]
+ [ 48.99363988   1.71149334]
+ [  1.71149334   5.51227467]
+ [ 49.03789262  -0.        ]
+ [ -0.           6.39472664]
+ [ 48.99363988  -1.71149334]
+ [ -1.71149334   5.51227467]
+ [ 50.92908572  -4.06982315]
+ [ -4.06982315   5.72335681]
+ [ 62.44870775  -4.87014693]
+ [ -4.87014693   4.90916925]
+ [ 58.53447965  -2.39555803]
+ [ -2.39555803 -10.35095732]
+ [ 74.50931646   3.91085759]
+ [  3.91085759 -13.24150934]
+ [ 77.85318336   4.59769882]
+ [  4.59769882   1.88388453]
+ [ 64.31061937   3.25974362]
+ [  3.25974362   2.99074735]
+ [ 63.09993025   1.63380748]
+ [  1.63380748   2.95661185]
+ [ 63.45998951  -0.        ]
+ [ -0.           3.75658886]
+ [ 63.09993025  -1.63380748]
+ [ -1.63380748   2.95661185]
+ [ 64.31061937  -3.25974362]
+ [ -3.25974362   2.99074735]
+ [ 77.85318336  -4.59769882]
+ [ -4.59769882   1.88388453]
+ [ 74.50931646  -3.91085759]
+ [ -3.91085759 -13.24150934]
+ [ 74.34022231   2.1626868 ]
+ [  2.1626868  -13.80313474]
+ [ 77.51763948   2.22513482]
+ [  2.22513482  -1.3686227 ]
+ [ 64.8057275    2.00614318]
+ [  2.00614318  -0.56436501]
+ [ 65.00031686   1.26108705]
+ [  1.26108705  -0.38937675]
+ [ 65.69515681  -0.        ]
+ [ -0.           0.20141354]
+ [ 65.00031686  -1.26108705]
+ [ -1.26108705  -0.38937675]
+ [ 64.8057275   -2.00614318]
+ [ -2.00614318  -0.56436501]
+ [ 77.51763948  -2.22513482]
+ [ -2.22513482  -1.3686227 ]
+ [ 74.34022231  -2.1626868 ]
+ [ -2.1626868  -13.80313474]
+ [ 71.36440507  -0.67008348]
+ [ -0.67008348 -12.99231244]
+ [ 73.8281822    0.65533565]
+ [  0.65533565  -2.11404673]
+ [ 62.14963129   1.23866519]
+ [  1.23866519  -2.17752881]
+ [ 62.66439972   0.79967493]
+ [  0.79967493  -2.78776072]
+ [ 63.41065958   0.        ]
+ [  0.          -2.58581331]
+ [ 62.66439972  -0.79967493]
+ [ -0.79967493  -2.78776072]
+ [ 62.14963129  -1.23866519]
+ [ -1.23866519  -2.17752881]
+ [ 73.8281822   -0.65533565]
+ [ -0.65533565  -2.11404673]
+ [ 71.36440507   0.67008348]
+ [  0.67008348 -12.99231244]
+ [ 69.25224668   0.60712983]
+ [  0.60712983 -12.75038253]
+ [ 75.41009814   0.51690806]
+ [  0.51690806  -0.0759773 ]
+ [ 62.82232612   1.43143028]
+ [  1.43143028   0.13261432]
+ [ 63.3677593    1.10852757]
+ [  1.10852757  -0.77580275]
+ [ 64.60708766   0.        ]
+ [  0.          -0.47046789]
+ [ 63.3677593   -1.10852757]
+ [ -1.10852757  -0.77580275]
+ [ 62.82232612  -1.43143028]
+ [ -1.43143028   0.13261432]
+ [ 75.41009814  -0.51690806]
+ [ -0.51690806  -0.0759773 ]
+ [ 69.25224668  -0.60712983]
+ [ -0.60712983 -12.75038253]
+ [ 53.09690642  -2.58751894]
+ [ -2.58751894 -14.1250814 ]
+ [ 55.83154806   1.80081707]
+ [  1.80081707  -7.0021039 ]
+ [ 46.01086731   1.6432969 ]
+ [  1.6432969   -8.21999523]
+ [ 46.17031368   1.45384689]
+ [  1.45384689  -8.66248104]
+ [ 47.30818975  -0.        ]
+ [ -0.          -8.44413332]
+ [ 46.17031368  -1.45384689]
+ [ -1.45384689  -8.66248104]
+ [ 46.01086731  -1.6432969 ]
+ [ -1.6432969   -8.21999523]
+ [ 55.83154806  -1.80081707]
+ [ -1.80081707  -7.0021039 ]
+ [ 53.09690642   2.58751894]
+ [  2.58751894 -14.1250814 ]
+ [ 88.96746559 -15.86988339]
+ [-15.86988339 -14.56181997]
+ [ 86.19741136  -3.36046234]
+ [ -3.36046234  -4.15841727]
+ [ 82.72462984   0.51170048]
+ [  0.51170048  -1.46270023]
+ [ 84.45199966   1.21498498]
+ [  1.21498498  -3.028694  ]
+ [ 86.00693906  -0.        ]
+ [ -0.          -2.30277486]
+ [ 84.45199966  -1.21498498]
+ [ -1.21498498  -3.028694  ]
+ [ 82.72462984  -0.51170048]
+ [ -0.51170048  -1.46270023]
+ [ 86.19741136   3.36046234]
+ [  3.36046234  -4.15841727]
+ [ 88.96746559  15.86988339]
+ [ 15.86988339 -14.56181997]]
+strain_energy
+[[0.         0.03440813 0.1370572  0.30710528]
+ [0.         0.02510019 0.10015647 0.22481029]
+ [0.         0.01761235 0.07032524 0.15795657]
+ [0.         0.01639817 0.06548423 0.14709889]
+ [0.         0.01644    0.06565424 0.14748747]
+ [0.         0.01639817 0.06548423 0.14709889]
+ [0.         0.01761235 0.07032524 0.15795657]
+ [0.         0.02510019 0.10015647 0.22481029]
+ [0.         0.03440813 0.1370572  0.30710528]
+ [0.         0.08273768 0.3298167  0.7395695 ]
+ [0.         0.06370906 0.25436    0.57125437]
+ [0.         0.04543246 0.18147267 0.40774591]
+ [0.         0.04214733 0.16839949 0.37847989]
+ [0.         0.04196747 0.16768825 0.37689813]
+ [0.         0.04214733 0.16839949 0.37847989]
+ [0.         0.04543246 0.18147267 0.40774591]
+ [0.         0.06370906 0.25436    0.57125437]
+ [0.         0.08273768 0.3298167  0.7395695 ]
+ [0.         0.05166311 0.2061876  0.46288999]
+ [0.         0.05562427 0.22192492 0.49806539]
+ [0.         0.04567171 0.1822235  0.4089804 ]
+ [0.         0.04237702 0.16912558 0.37968979]
+ [0.         0.04151088 0.16568316 0.37199399]
+ [0.         0.04237702 0.16912558 0.37968979]
+ [0.         0.04567171 0.1822235  0.4089804 ]
+ [0.         0.05562427 0.22192492 0.49806539]
+ [0.         0.05166311 0.2061876  0.46288999]
+ [0.         0.07049725 0.28155022 0.63250718]
+ [0.         0.07856961 0.31347854 0.70355621]
+ [0.         0.06788154 0.27071392 0.60731471]
+ [0.         0.06510042 0.25961607 0.58240665]
+ [0.         0.06442021 0.25690802 0.57634344]
+ [0.         0.06510042 0.25961607 0.58240665]
+ [0.         0.06788154 0.27071392 0.60731471]
+ [0.         0.07856961 0.31347854 0.70355621]
+ [0.         0.07049725 0.28155022 0.63250718]
+ [0.         0.06775416 0.2707193  0.60844657]
+ [0.         0.07395076 0.29519803 0.66285322]
+ [0.         0.06711019 0.26759476 0.60022273]
+ [0.         0.06837682 0.27253912 0.61108203]
+ [0.         0.06859392 0.27338841 0.61295264]
+ [0.         0.06837682 0.27253912 0.61108203]
+ [0.         0.06711019 0.26759476 0.60022273]
+ [0.         0.07395076 0.29519803 0.66285322]
+ [0.         0.06775416 0.2707193  0.60844657]
+ [0.         0.06533861 0.26108561 0.58683181]
+ [0.         0.06957745 0.27770598 0.6234992 ]
+ [0.         0.06547345 0.2609766  0.58517607]
+ [0.         0.06790224 0.27051025 0.60623234]
+ [0.         0.06868492 0.27357705 0.61299391]
+ [0.         0.06790224 0.27051025 0.60623234]
+ [0.         0.06547345 0.2609766  0.58517607]
+ [0.         0.06957745 0.27770598 0.6234992 ]
+ [0.         0.06533861 0.26108561 0.58683181]
+ [0.         0.07188184 0.28707138 0.64488371]
+ [0.         0.08191516 0.32676993 0.73325835]
+ [0.         0.07623699 0.30373797 0.68074477]
+ [0.         0.08110534 0.32287403 0.72306402]
+ [0.         0.08348907 0.33229767 0.74402441]
+ [0.         0.08110534 0.32287403 0.72306402]
+ [0.         0.07623699 0.30373797 0.68074477]
+ [0.         0.08191516 0.32676993 0.73325835]
+ [0.         0.07188184 0.28707138 0.64488371]
+ [0.         0.04989729 0.19934842 0.44798859]
+ [0.         0.05155774 0.20596959 0.46284788]
+ [0.         0.04904773 0.19556515 0.43864109]
+ [0.         0.0528065  0.210415   0.47164675]
+ [0.         0.0544499  0.21692771 0.4861674 ]
+ [0.         0.0528065  0.210415   0.47164675]
+ [0.         0.04904773 0.19556515 0.43864109]
+ [0.         0.05155774 0.20596959 0.46284788]
+ [0.         0.04989729 0.19934842 0.44798859]
+ [0.         0.11071786 0.44160269 0.99078776]
+ [0.         0.09570362 0.38135635 0.85482718]
+ [0.         0.10593466 0.42167986 0.944241  ]
+ [0.         0.11519735 0.45854075 1.02676972]
+ [0.         0.11738181 0.46725948 1.04634749]
+ [0.         0.11519735 0.45854075 1.02676972]
+ [0.         0.10593466 0.42167986 0.944241  ]
+ [0.         0.09570362 0.38135635 0.85482718]
+ [0.         0.11071786 0.44160269 0.99078776]]
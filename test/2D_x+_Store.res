@@ -0,0 +1,444 @@
+iteration 1 240.0
+iteration 2 1.4633214856702141
+t_n: 1 res: 6.805534006221454e-05 Iteration # 2
+iteration 1 239.99995130582295
+iteration 2 1.4092916313408141
+t_n: 2 res: 6.038908978625449e-05 Iteration # 2
+delta_x = 0.5
+Horizon = 1.5014999999999998
+epsilon_tensor
+[[ 0.01003764  0.00160773]
+ [ 0.00160773 -0.00146895]
+ [ 0.00895114  0.00110709]
+ [ 0.00110709 -0.00115588]
+ [ 0.00827904  0.0008978 ]
+ [ 0.0008978  -0.00079774]
+ [ 0.00798176  0.00040913]
+ [ 0.00040913 -0.00042029]
+ [ 0.00791137 -0.        ]
+ [-0.         -0.0003668 ]
+ [ 0.00798176 -0.00040913]
+ [-0.00040913 -0.00042029]
+ [ 0.00827904 -0.0008978 ]
+ [-0.0008978  -0.00079774]
+ [ 0.00895114 -0.00110709]
+ [-0.00110709 -0.00115588]
+ [ 0.01003764 -0.00160773]
+ [-0.00160773 -0.00146895]
+ [ 0.01469399  0.00446766]
+ [ 0.00446766  0.00022581]
+ [ 0.01481659  0.00300498]
+ [ 0.00300498 -0.00108781]
+ [ 0.01457015  0.00153209]
+ [ 0.00153209 -0.00167606]
+ [ 0.01418112  0.0007265 ]
+ [ 0.0007265  -0.00102519]
+ [ 0.01406354 -0.        ]
+ [-0.         -0.00093577]
+ [ 0.01418112 -0.0007265 ]
+ [-0.0007265  -0.00102519]
+ [ 0.01457015 -0.00153209]
+ [-0.00153209 -0.00167606]
+ [ 0.01481659 -0.00300498]
+ [-0.00300498 -0.00108781]
+ [ 0.01469399 -0.00446766]
+ [-0.00446766  0.00022581]
+ [ 0.01401315  0.0008302 ]
+ [ 0.0008302  -0.00608402]
+ [ 0.01401622  0.00153824]
+ [ 0.00153824 -0.00282523]
+ [ 0.01400286  0.00118209]
+ [ 0.00118209 -0.00267237]
+ [ 0.01385112  0.00051992]
+ [ 0.00051992 -0.0022437 ]
+ [ 0.01379774  0.        ]
+ [ 0.         -0.00201726]
+ [ 0.01385112 -0.00051992]
+ [-0.00051992 -0.0022437 ]
+ [ 0.01400286 -0.00118209]
+ [-0.00118209 -0.00267237]
+ [ 0.01401622 -0.00153824]
+ [-0.00153824 -0.00282523]
+ [ 0.01401315 -0.0008302 ]
+ [-0.0008302  -0.00608402]
+ [ 0.01613065  0.00145961]
+ [ 0.00145961 -0.00741699]
+ [ 0.01639611  0.00154121]
+ [ 0.00154121 -0.00428136]
+ [ 0.01651997  0.00099026]
+ [ 0.00099026 -0.00395829]
+ [ 0.0166282   0.0005181 ]
+ [ 0.0005181  -0.00341689]
+ [ 0.0166709   0.        ]
+ [ 0.         -0.00322758]
+ [ 0.0166282  -0.0005181 ]
+ [-0.0005181  -0.00341689]
+ [ 0.01651997 -0.00099026]
+ [-0.00099026 -0.00395829]
+ [ 0.01639611 -0.00154121]
+ [-0.00154121 -0.00428136]
+ [ 0.01613065 -0.00145961]
+ [-0.00145961 -0.00741699]
+ [ 0.01612157  0.00080716]
+ [ 0.00080716 -0.0075767 ]
+ [ 0.01653035  0.0007459 ]
+ [ 0.0007459  -0.00535757]
+ [ 0.01691584  0.00060943]
+ [ 0.00060943 -0.00503058]
+ [ 0.01735792  0.00039991]
+ [ 0.00039991 -0.00443573]
+ [ 0.01750383  0.        ]
+ [ 0.         -0.00432451]
+ [ 0.01735792 -0.00039991]
+ [-0.00039991 -0.00443573]
+ [ 0.01691584 -0.00060943]
+ [-0.00060943 -0.00503058]
+ [ 0.01653035 -0.0007459 ]
+ [-0.0007459  -0.00535757]
+ [ 0.01612157 -0.00080716]
+ [-0.00080716 -0.0075767 ]
+ [ 0.01546421 -0.00025009]
+ [-0.00025009 -0.00719634]
+ [ 0.01579478  0.00021968]
+ [ 0.00021968 -0.00537606]
+ [ 0.0163454   0.00037629]
+ [ 0.00037629 -0.00530082]
+ [ 0.0168949   0.00025359]
+ [ 0.00025359 -0.00491957]
+ [ 0.01708043  0.        ]
+ [ 0.         -0.00491546]
+ [ 0.0168949  -0.00025359]
+ [-0.00025359 -0.00491957]
+ [ 0.0163454  -0.00037629]
+ [-0.00037629 -0.00530082]
+ [ 0.01579478 -0.00021968]
+ [-0.00021968 -0.00537606]
+ [ 0.01546421  0.00025009]
+ [ 0.00025009 -0.00719634]
+ [ 0.0166062   0.00021041]
+ [ 0.00021041 -0.00734047]
+ [ 0.01734997  0.00016327]
+ [ 0.00016327 -0.00535817]
+ [ 0.0178578   0.00041576]
+ [ 0.00041576 -0.00526681]
+ [ 0.01850848  0.00033675]
+ [ 0.00033675 -0.00496027]
+ [ 0.0188464  -0.        ]
+ [-0.         -0.00497383]
+ [ 0.01850848 -0.00033675]
+ [-0.00033675 -0.00496027]
+ [ 0.0178578  -0.00041576]
+ [-0.00041576 -0.00526681]
+ [ 0.01734997 -0.00016327]
+ [-0.00016327 -0.00535817]
+ [ 0.0166062  -0.00021041]
+ [-0.00021041 -0.00734047]
+ [ 0.01492187  0.00232317]
+ [ 0.00232317 -0.00523822]
+ [ 0.01486589  0.00145526]
+ [ 0.00145526 -0.00481154]
+ [ 0.01549842  0.00051904]
+ [ 0.00051904 -0.00514484]
+ [ 0.01612509  0.00048735]
+ [ 0.00048735 -0.00475357]
+ [ 0.01649522  0.        ]
+ [ 0.         -0.00477911]
+ [ 0.01612509 -0.00048735]
+ [-0.00048735 -0.00475357]
+ [ 0.01549842 -0.00051904]
+ [-0.00051904 -0.00514484]
+ [ 0.01486589 -0.00145526]
+ [-0.00145526 -0.00481154]
+ [ 0.01492187 -0.00232317]
+ [-0.00232317 -0.00523822]
+ [ 0.02092182 -0.00012634]
+ [-0.00012634 -0.00614742]
+ [ 0.02001114  0.00021126]
+ [ 0.00021126 -0.00462237]
+ [ 0.02345409  0.00017733]
+ [ 0.00017733 -0.00480098]
+ [ 0.02533855  0.00045346]
+ [ 0.00045346 -0.00455935]
+ [ 0.02576872 -0.        ]
+ [-0.         -0.00448053]
+ [ 0.02533855 -0.00045346]
+ [-0.00045346 -0.00455935]
+ [ 0.02345409 -0.00017733]
+ [-0.00017733 -0.00480098]
+ [ 0.02001114 -0.00021126]
+ [-0.00021126 -0.00462237]
+ [ 0.02092182  0.00012634]
+ [ 0.00012634 -0.00614742]]
+strain_longi [0. 0. 0.]
+stress_tensor
+[[ 46.82134181  12.46226068]
+ [ 12.46226068   2.81310925]
+ [ 40.08836244   5.23961851]
+ [  5.23961851   3.50202771]
+ [ 29.9812497    2.59061588]
+ [  2.59061588   3.5691808 ]
+ [ 27.39092348   1.09620537]
+ [  1.09620537   4.10101779]
+ [ 27.18799381  -0.        ]
+ [ -0.           4.31256322]
+ [ 27.39092348  -1.09620537]
+ [ -1.09620537   4.10101779]
+ [ 29.9812497   -2.59061588]
+ [ -2.59061588   3.5691808 ]
+ [ 40.08836244  -5.23961851]
+ [ -5.23961851   3.50202771]
+ [ 46.82134181 -12.46226068]
+ [-12.46226068   2.81310925]
+ [ 65.72485462  21.88716861]
+ [ 21.88716861  15.06358866]
+ [ 61.20392248  12.26429784]
+ [ 12.26429784  10.41821728]
+ [ 46.46842202   4.85068127]
+ [  4.85068127   7.0021323 ]
+ [ 43.55283958   2.16728061]
+ [  2.16728061   8.13402054]
+ [ 43.26734336  -0.        ]
+ [ -0.           8.47058712]
+ [ 43.55283958  -2.16728061]
+ [ -2.16728061   8.13402054]
+ [ 46.46842202  -4.85068127]
+ [ -4.85068127   7.0021323 ]
+ [ 61.20392248 -12.26429784]
+ [-12.26429784  10.41821728]
+ [ 65.72485462 -21.88716861]
+ [-21.88716861  15.06358866]
+ [ 58.53448015   2.39555895]
+ [  2.39555895 -10.35095811]
+ [ 62.44870976   4.87014946]
+ [  4.87014946   4.90916859]
+ [ 50.92908787   4.0698253 ]
+ [  4.0698253    5.72335508]
+ [ 48.99364248   1.71149454]
+ [  1.71149454   5.51227203]
+ [ 49.03789542   0.        ]
+ [  0.           6.39472381]
+ [ 48.99364248  -1.71149454]
+ [ -1.71149454   5.51227203]
+ [ 50.92908787  -4.0698253 ]
+ [ -4.0698253    5.72335508]
+ [ 62.44870976  -4.87014946]
+ [ -4.87014946   4.90916859]
+ [ 58.53448015  -2.39555895]
+ [ -2.39555895 -10.35095811]
+ [ 74.50931579   3.91085884]
+ [  3.91085884 -13.24151161]
+ [ 77.85318521   4.59770179]
+ [  4.59770179   1.88388185]
+ [ 64.31062266   3.25974638]
+ [  3.25974638   2.99074447]
+ [ 63.09993528   1.63380905]
+ [  1.63380905   2.95660768]
+ [ 63.45999516   0.        ]
+ [  0.           3.75658431]
+ [ 63.09993528  -1.63380905]
+ [ -1.63380905   2.95660768]
+ [ 64.31062266  -3.25974638]
+ [ -3.25974638   2.99074447]
+ [ 77.85318521  -4.59770179]
+ [ -4.59770179   1.88388185]
+ [ 74.50931579  -3.91085884]
+ [ -3.91085884 -13.24151161]
+ [ 74.34021982   2.16268902]
+ [  2.16268902 -13.80313833]
+ [ 77.51764069   2.22513825]
+ [  2.22513825  -1.36862725]
+ [ 64.80573168   2.00614648]
+ [  2.00614648  -0.56436877]
+ [ 65.00032414   1.26108898]
+ [  1.26108898  -0.38938218]
+ [ 65.69516513   0.        ]
+ [  0.           0.20140763]
+ [ 65.00032414  -1.26108898]
+ [ -1.26108898  -0.38938218]
+ [ 64.80573168  -2.00614648]
+ [ -2.00614648  -0.56436877]
+ [ 77.51764069  -2.22513825]
+ [ -2.22513825  -1.36862725]
+ [ 74.34021982  -2.16268902]
+ [ -2.16268902 -13.80313833]
+ [ 71.36440044  -0.67008094]
+ [ -0.67008094 -12.99231711]
+ [ 73.82818237   0.65533852]
+ [  0.65533852  -2.11405171]
+ [ 62.14963541   1.23866806]
+ [  1.23866806  -2.17753216]
+ [ 62.66440728   0.79967667]
+ [  0.79967667  -2.78776575]
+ [ 63.41066839   0.        ]
+ [  0.          -2.58581867]
+ [ 62.66440728  -0.79967667]
+ [ -0.79967667  -2.78776575]
+ [ 62.14963541  -1.23866806]
+ [ -1.23866806  -2.17753216]
+ [ 73.82818237  -0.65533852]
+ [ -0.65533852  -2.11405171]
+ [ 71.36440044   0.67008094]
+ [  0.67008094 -12.99231711]
+ [ 69.25224378   0.60713411]
+ [  0.60713411 -12.75038852]
+ [ 75.41010071   0.51691131]
+ [  0.51691131  -0.07598141]
+ [ 62.82233272   1.43143312]
+ [  1.43143312   0.13261458]
+ [ 63.36776966   1.10852937]
+ [  1.10852937  -0.77580343]
+ [ 64.60709967  -0.        ]
+ [ -0.          -0.47046878]
+ [ 63.36776966  -1.10852937]
+ [ -1.10852937  -0.77580343]
+ [ 62.82233272  -1.43143312]
+ [ -1.43143312   0.13261458]
+ [ 75.41010071  -0.51691131]
+ [ -0.51691131  -0.07598141]
+ [ 69.25224378  -0.60713411]
+ [ -0.60713411 -12.75038852]
+ [ 53.09690227  -2.58751474]
+ [ -2.58751474 -14.12508163]
+ [ 55.83154927   1.80082094]
+ [  1.80082094  -7.00210417]
+ [ 46.01087376   1.64329948]
+ [  1.64329948  -8.21999198]
+ [ 46.17032238   1.45384844]
+ [  1.45384844  -8.66247845]
+ [ 47.30819911   0.        ]
+ [  0.          -8.4441312 ]
+ [ 46.17032238  -1.45384844]
+ [ -1.45384844  -8.66247845]
+ [ 46.01087376  -1.64329948]
+ [ -1.64329948  -8.21999198]
+ [ 55.83154927  -1.80082094]
+ [ -1.80082094  -7.00210417]
+ [ 53.09690227   2.58751474]
+ [  2.58751474 -14.12508163]
+ [ 88.96746428 -15.8698839 ]
+ [-15.8698839  -14.56181127]
+ [ 86.19741932  -3.36046461]
+ [ -3.36046461  -4.15840769]
+ [ 82.72465225   0.51170082]
+ [  0.51170082  -1.46268933]
+ [ 84.45202529   1.21498605]
+ [  1.21498605  -3.02868181]
+ [ 86.0069645   -0.        ]
+ [ -0.          -2.30276229]
+ [ 84.45202529  -1.21498605]
+ [ -1.21498605  -3.02868181]
+ [ 82.72465225  -0.51170082]
+ [ -0.51170082  -1.46268933]
+ [ 86.19741932   3.36046461]
+ [  3.36046461  -4.15840769]
+ [ 88.96746428  15.8698839 ]
+ [ 15.8698839  -14.56181127]]
+strain_energy
+[[0.         0.07725575 0.30710532]
+ [0.         0.05640645 0.2248103 ]
+ [0.         0.03959273 0.15795658]
+ [0.         0.03686527 0.14709889]
+ [0.         0.03696015 0.14748748]
+ [0.         0.03686527 0.14709889]
+ [0.         0.03959273 0.15795658]
+ [0.         0.05640645 0.2248103 ]
+ [0.         0.07725575 0.30710532]
+ [0.         0.18583964 0.7395696 ]
+ [0.         0.14321087 0.57125442]
+ [0.         0.10215032 0.40774593]
+ [0.         0.09477782 0.37847991]
+ [0.         0.09437544 0.37689816]
+ [0.         0.09477782 0.37847991]
+ [0.         0.10215032 0.40774593]
+ [0.         0.14321087 0.57125442]
+ [0.         0.18583964 0.7395696 ]
+ [0.         0.1161108  0.46289   ]
+ [0.         0.12499294 0.49806543]
+ [0.         0.10263032 0.40898045]
+ [0.         0.09524008 0.37968984]
+ [0.         0.09329749 0.37199405]
+ [0.         0.09524008 0.37968984]
+ [0.         0.10263032 0.40898045]
+ [0.         0.12499294 0.49806543]
+ [0.         0.1161108  0.46289   ]
+ [0.         0.15849523 0.63250715]
+ [0.         0.17655565 0.70355625]
+ [0.         0.15250374 0.6073148 ]
+ [0.         0.1462536  0.58240678]
+ [0.         0.14472667 0.57634358]
+ [0.         0.1462536  0.58240678]
+ [0.         0.15250374 0.6073148 ]
+ [0.         0.17655565 0.70355625]
+ [0.         0.15849523 0.63250715]
+ [0.         0.15236342 0.6084465 ]
+ [0.         0.1662184  0.66285326]
+ [0.         0.1507586  0.60022285]
+ [0.         0.15357378 0.6110822 ]
+ [0.         0.15405677 0.61295284]
+ [0.         0.15357378 0.6110822 ]
+ [0.         0.1507586  0.60022285]
+ [0.         0.1662184  0.66285326]
+ [0.         0.15236342 0.6084465 ]
+ [0.         0.14693663 0.58683168]
+ [0.         0.1563788  0.62349921]
+ [0.         0.14705575 0.5851762 ]
+ [0.         0.15246894 0.60623255]
+ [0.         0.1542118  0.61299415]
+ [0.         0.15246894 0.60623255]
+ [0.         0.14705575 0.5851762 ]
+ [0.         0.1563788  0.62349921]
+ [0.         0.14693663 0.58683168]
+ [0.         0.16160607 0.64488359]
+ [0.         0.18405754 0.73325843]
+ [0.         0.17119082 0.68074499]
+ [0.         0.18204889 0.72306433]
+ [0.         0.18738071 0.74402476]
+ [0.         0.18204889 0.72306433]
+ [0.         0.17119082 0.68074499]
+ [0.         0.18405754 0.73325843]
+ [0.         0.16160607 0.64488359]
+ [0.         0.11220143 0.4479885 ]
+ [0.         0.11593121 0.46284793]
+ [0.         0.11018034 0.43864124]
+ [0.         0.11858508 0.47164695]
+ [0.         0.12226546 0.48616761]
+ [0.         0.11858508 0.47164695]
+ [0.         0.11018034 0.43864124]
+ [0.         0.11593121 0.46284793]
+ [0.         0.11220143 0.4479885 ]
+ [0.         0.24875734 0.99078764]
+ [0.         0.21492115 0.85482724]
+ [0.         0.23777051 0.94424137]
+ [0.         0.25855744 1.02677018]
+ [0.         0.26346697 1.04634795]
+ [0.         0.25855744 1.02677018]
+ [0.         0.23777051 0.94424137]
+ [0.         0.21492115 0.85482724]
+ [0.         0.24875734 0.99078764]]
+[[ 2.31178619 -1.73986749]
+ [ 2.31098268 -1.24424338]
+ [ 2.31474022 -0.74633546]
+ [ 2.31690872 -0.24795129]
+ [ 2.31747477  0.25      ]
+ [ 2.31690872  0.74795129]
+ [ 2.31474022  1.24633546]
+ [ 2.31098268  1.74424338]
+ [ 2.31178619  2.23986749]]
+[[[  34.29712972    6.47399232]
+  [   0.000001     -0.        ]
+  [ -80.00000505   -0.00000621]]
+
+ [[  68.3899302    13.04656052]
+  [   0.00000089   -0.        ]
+  [-160.00000474   -0.00000521]]]
+[[[ 0.01003764  0.00160773]
+  [ 0.00160773 -0.00146895]]
+
+ [[ 0.00895114  0.00110709]
+  [ 0.00110709 -0.00115588]]
+
+ [[ 0.00827904  0.0008978 ]
+  [ 0.0008978  -0.00079774]]
+
+ [[ 0.00798176  0.00040913]
+  [ 0.00040913 -0.00042029]]]
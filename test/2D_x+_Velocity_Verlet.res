@@ -0,0 +1,416 @@
+Stable time step: 0.023273594125258406 Substeps per time step: 11
+t_n: 1 Substeps # 11
+t_n: 2 Substeps # 11
+t_n: 3 Substeps # 11
+t_n: 4 Substeps # 11
+delta_x = 0.5
+Horizon = 1.5014999999999998
+epsilon_tensor
+[[ 0.00945013  0.00153897]
+ [ 0.00153897 -0.00138914]
+ [ 0.00842213  0.00107467]
+ [ 0.00107467 -0.00110988]
+ [ 0.00777305  0.00086403]
+ [ 0.00086403 -0.00076823]
+ [ 0.00748514  0.00039573]
+ [ 0.00039573 -0.00040819]
+ [ 0.00741377 -0.        ]
+ [-0.         -0.00035367]
+ [ 0.00748514 -0.00039573]
+ [-0.00039573 -0.00040819]
+ [ 0.00777305 -0.00086403]
+ [-0.00086403 -0.00076823]
+ [ 0.00842213 -0.00107467]
+ [-0.00107467 -0.00110988]
+ [ 0.00945013 -0.00153897]
+ [-0.00153897 -0.00138914]
+ [ 0.01381295  0.00422665]
+ [ 0.00422665  0.00023085]
+ [ 0.01392586  0.00284352]
+ [ 0.00284352 -0.00102485]
+ [ 0.01368502  0.00145126]
+ [ 0.00145126 -0.00159649]
+ [ 0.01330126  0.00069214]
+ [ 0.00069214 -0.00098778]
+ [ 0.01317413 -0.        ]
+ [-0.         -0.00089549]
+ [ 0.01330126 -0.00069214]
+ [-0.00069214 -0.00098778]
+ [ 0.01368502 -0.00145126]
+ [-0.00145126 -0.00159649]
+ [ 0.01392586 -0.00284352]
+ [-0.00284352 -0.00102485]
+ [ 0.01381295 -0.00422665]
+ [-0.00422665  0.00023085]
+ [ 0.01314778  0.00076973]
+ [ 0.00076973 -0.00584548]
+ [ 0.01316562  0.0014584 ]
+ [ 0.0014584  -0.00272965]
+ [ 0.01315216  0.00111538]
+ [ 0.00111538 -0.00254016]
+ [ 0.01301205  0.00049122]
+ [ 0.00049122 -0.00215057]
+ [ 0.01297097 -0.        ]
+ [-0.         -0.00193109]
+ [ 0.01301205 -0.00049122]
+ [-0.00049122 -0.00215057]
+ [ 0.01315216 -0.00111538]
+ [-0.00111538 -0.00254016]
+ [ 0.01316562 -0.0014584 ]
+ [-0.0014584  -0.00272965]
+ [ 0.01314778 -0.00076973]
+ [-0.00076973 -0.00584548]
+ [ 0.01510654  0.00133454]
+ [ 0.00133454 -0.00689994]
+ [ 0.01536413  0.00143498]
+ [ 0.00143498 -0.00408377]
+ [ 0.01549017  0.00093284]
+ [ 0.00093284 -0.00375337]
+ [ 0.01560775  0.00048625]
+ [ 0.00048625 -0.00325439]
+ [ 0.01565391  0.        ]
+ [ 0.         -0.00308178]
+ [ 0.01560775 -0.00048625]
+ [-0.00048625 -0.00325439]
+ [ 0.01549017 -0.00093284]
+ [-0.00093284 -0.00375337]
+ [ 0.01536413 -0.00143498]
+ [-0.00143498 -0.00408377]
+ [ 0.01510654 -0.00133454]
+ [-0.00133454 -0.00689994]
+ [ 0.01508969  0.00077409]
+ [ 0.00077409 -0.00716892]
+ [ 0.01550013  0.00069529]
+ [ 0.00069529 -0.00505845]
+ [ 0.01588759  0.00057275]
+ [ 0.00057275 -0.00475354]
+ [ 0.01634007  0.00038032]
+ [ 0.00038032 -0.00422231]
+ [ 0.01649264 -0.        ]
+ [-0.         -0.00411665]
+ [ 0.01634007 -0.00038032]
+ [-0.00038032 -0.00422231]
+ [ 0.01588759 -0.00057275]
+ [-0.00057275 -0.00475354]
+ [ 0.01550013 -0.00069529]
+ [-0.00069529 -0.00505845]
+ [ 0.01508969 -0.00077409]
+ [-0.00077409 -0.00716892]
+ [ 0.01451741 -0.00020987]
+ [-0.00020987 -0.00682847]
+ [ 0.01483032  0.00022032]
+ [ 0.00022032 -0.00505073]
+ [ 0.01538202  0.00035471]
+ [ 0.00035471 -0.00499182]
+ [ 0.01593682  0.00023811]
+ [ 0.00023811 -0.00465227]
+ [ 0.01612604  0.        ]
+ [ 0.         -0.00464609]
+ [ 0.01593682 -0.00023811]
+ [-0.00023811 -0.00465227]
+ [ 0.01538202 -0.00035471]
+ [-0.00035471 -0.00499182]
+ [ 0.01483032 -0.00022032]
+ [-0.00022032 -0.00505073]
+ [ 0.01451741  0.00020987]
+ [ 0.00020987 -0.00682847]
+ [ 0.01579297  0.0002568 ]
+ [ 0.0002568  -0.00680167]
+ [ 0.01652544  0.00018346]
+ [ 0.00018346 -0.00506417]
+ [ 0.01703842  0.00040939]
+ [ 0.00040939 -0.00495074]
+ [ 0.01767732  0.00033226]
+ [ 0.00033226 -0.0046422 ]
+ [ 0.01800504 -0.        ]
+ [-0.         -0.00466503]
+ [ 0.01767732 -0.00033226]
+ [-0.00033226 -0.0046422 ]
+ [ 0.01703842 -0.00040939]
+ [-0.00040939 -0.00495074]
+ [ 0.01652544 -0.00018346]
+ [-0.00018346 -0.00506417]
+ [ 0.01579297 -0.0002568 ]
+ [-0.0002568  -0.00680167]
+ [ 0.01422877  0.00232604]
+ [ 0.00232604 -0.00494806]
+ [ 0.01417238  0.00141998]
+ [ 0.00141998 -0.0044616 ]
+ [ 0.01472009  0.00049251]
+ [ 0.00049251 -0.00480958]
+ [ 0.01540135  0.00046162]
+ [ 0.00046162 -0.00441902]
+ [ 0.01582086 -0.        ]
+ [-0.         -0.00443938]
+ [ 0.01540135 -0.00046162]
+ [-0.00046162 -0.00441902]
+ [ 0.01472009 -0.00049251]
+ [-0.00049251 -0.00480958]
+ [ 0.01417238 -0.00141998]
+ [-0.00141998 -0.0044616 ]
+ [ 0.01422877 -0.00232604]
+ [-0.00232604 -0.00494806]
+ [ 0.02044601 -0.00014902]
+ [-0.00014902 -0.00592359]
+ [ 0.01950173  0.000184  ]
+ [ 0.000184   -0.00430687]
+ [ 0.02280717  0.00017924]
+ [ 0.00017924 -0.00447003]
+ [ 0.02470475  0.00039796]
+ [ 0.00039796 -0.004215  ]
+ [ 0.02520811 -0.        ]
+ [-0.         -0.00411925]
+ [ 0.02470475 -0.00039796]
+ [-0.00039796 -0.004215  ]
+ [ 0.02280717 -0.00017924]
+ [-0.00017924 -0.00447003]
+ [ 0.01950173 -0.000184  ]
+ [-0.000184   -0.00430687]
+ [ 0.02044601  0.00014902]
+ [ 0.00014902 -0.00592359]]
+strain_longi [0. 0. 0. 0. 0.]
+stress_tensor
+[[ 44.13071728  11.78011582]
+ [ 11.78011582   2.67473771]
+ [ 37.72620681   4.99944473]
+ [  4.99944473   3.25122172]
+ [ 28.13214109   2.49317147]
+ [  2.49317147   3.26337641]
+ [ 25.67580803   1.0603157 ]
+ [  1.0603157    3.77597336]
+ [ 25.47026104  -0.        ]
+ [ -0.           3.99188568]
+ [ 25.67580803  -1.0603157 ]
+ [ -1.0603157    3.77597336]
+ [ 28.13214109  -2.49317147]
+ [ -2.49317147   3.26337641]
+ [ 37.72620681  -4.99944473]
+ [ -4.99944473   3.25122172]
+ [ 44.13071728 -11.78011582]
+ [-11.78011582   2.67473771]
+ [ 61.83538935  20.65073739]
+ [ 20.65073739  14.26294274]
+ [ 57.53181118  11.58300028]
+ [ 11.58300028   9.79144064]
+ [ 43.62285632   4.59475906]
+ [  4.59475906   6.47303285]
+ [ 40.82614821   2.06476997]
+ [  2.06476997   7.4985767 ]
+ [ 40.513358    -0.        ]
+ [ -0.           7.84050434]
+ [ 40.82614821  -2.06476997]
+ [ -2.06476997   7.4985767 ]
+ [ 43.62285632  -4.59475906]
+ [ -4.59475906   6.47303285]
+ [ 57.53181118 -11.58300028]
+ [-11.58300028   9.79144064]
+ [ 61.83538935 -20.65073739]
+ [-20.65073739  14.26294274]
+ [ 54.80039507   2.22106633]
+ [  2.22106633 -10.21997321]
+ [ 58.58174396   4.61737358]
+ [  4.61737358   4.36037152]
+ [ 47.80055976   3.84014002]
+ [  3.84014002   5.25941706]
+ [ 45.97990971   1.61699908]
+ [  1.61699908   5.0007977 ]
+ [ 46.06233672  -0.        ]
+ [ -0.           5.86751664]
+ [ 45.97990971  -1.61699908]
+ [ -1.61699908   5.0007977 ]
+ [ 47.80055976  -3.84014002]
+ [ -3.84014002   5.25941706]
+ [ 58.58174396  -4.61737358]
+ [ -4.61737358   4.36037152]
+ [ 54.80039507  -2.22106633]
+ [ -2.22106633 -10.21997321]
+ [ 69.81462107   3.57575934]
+ [  3.57575934 -12.24054979]
+ [ 72.88588573   4.28080691]
+ [  4.28080691   1.53968596]
+ [ 60.256922     3.07074311]
+ [  3.07074311   2.64909185]
+ [ 59.18037704   1.53334869]
+ [  1.53334869   2.5864214 ]
+ [ 59.53760882   0.        ]
+ [  0.           3.32302538]
+ [ 59.18037704  -1.53334869]
+ [ -1.53334869   2.5864214 ]
+ [ 60.256922    -3.07074311]
+ [ -3.07074311   2.64909185]
+ [ 72.88588573  -4.28080691]
+ [ -4.28080691   1.53968596]
+ [ 69.81462107  -3.57575934]
+ [ -3.57575934 -12.24054979]
+ [ 69.52211637   2.07408882]
+ [  2.07408882 -13.18766094]
+ [ 72.65401936   2.0741624 ]
+ [  2.0741624   -1.39249242]
+ [ 60.83569246   1.88540415]
+ [  1.88540415  -0.63675846]
+ [ 61.1421039    1.19932111]
+ [  1.19932111  -0.5532758 ]
+ [ 61.85803557  -0.        ]
+ [ -0.           0.02191266]
+ [ 61.1421039   -1.19932111]
+ [ -1.19932111  -0.5532758 ]
+ [ 60.83569246  -1.88540415]
+ [ -1.88540415  -0.63675846]
+ [ 72.65401936  -2.0741624 ]
+ [ -2.0741624   -1.39249242]
+ [ 69.52211637  -2.07408882]
+ [ -2.07408882 -13.18766094]
+ [ 66.93868982  -0.56231729]
+ [ -0.56231729 -12.44939204]
+ [ 69.31733869   0.65724946]
+ [  0.65724946  -1.99418997]
+ [ 58.48294612   1.16762909]
+ [  1.16762909  -2.06188177]
+ [ 59.09913617   0.75086886]
+ [  0.75086886  -2.67639348]
+ [ 59.86223974   0.        ]
+ [  0.          -2.46248674]
+ [ 59.09913617  -0.75086886]
+ [ -0.75086886  -2.67639348]
+ [ 58.48294612  -1.16762909]
+ [ -1.16762909  -2.06188177]
+ [ 69.31733869  -0.65724946]
+ [ -0.65724946  -1.99418997]
+ [ 66.93868982   0.56231729]
+ [  0.56231729 -12.44939204]
+ [ 66.01689847   0.74098542]
+ [  0.74098542 -11.46152981]
+ [ 71.86634005   0.58085764]
+ [  0.58085764   0.05776148]
+ [ 60.02498427   1.40947669]
+ [  1.40947669   0.41341929]
+ [ 60.62411562   1.0937298 ]
+ [  1.0937298   -0.34543638]
+ [ 61.81570903  -0.        ]
+ [ -0.          -0.08947076]
+ [ 60.62411562  -1.0937298 ]
+ [ -1.0937298   -0.34543638]
+ [ 60.02498427  -1.40947669]
+ [ -1.40947669   0.41341929]
+ [ 71.86634005  -0.58085764]
+ [ -0.58085764   0.05776148]
+ [ 66.01689847  -0.74098542]
+ [ -0.74098542 -11.46152981]
+ [ 50.51016515  -2.19841856]
+ [ -2.19841856 -13.33788925]
+ [ 53.32414409   1.78189957]
+ [  1.78189957  -6.1775939 ]
+ [ 43.77837622   1.5593191 ]
+ [  1.5593191   -7.44884505]
+ [ 44.21132726   1.37710774]
+ [  1.37710774  -7.66865303]
+ [ 45.50905063  -0.        ]
+ [ -0.          -7.37823735]
+ [ 44.21132726  -1.37710774]
+ [ -1.37710774  -7.66865303]
+ [ 43.77837622  -1.5593191 ]
+ [ -1.5593191   -7.44884505]
+ [ 53.32414409  -1.78189957]
+ [ -1.78189957  -6.1775939 ]
+ [ 50.51016515   2.19841856]
+ [  2.19841856 -13.33788925]
+ [ 87.04748084 -15.65196057]
+ [-15.65196057 -13.80593508]
+ [ 84.16503479  -3.46985009]
+ [ -3.46985009  -3.22349905]
+ [ 80.6156248    0.51720109]
+ [  0.51720109  -0.51805781]
+ [ 82.5182671    1.06629096]
+ [  1.06629096  -1.80698172]
+ [ 84.34050024  -0.        ]
+ [ -0.          -0.94001766]
+ [ 82.5182671   -1.06629096]
+ [ -1.06629096  -1.80698172]
+ [ 80.6156248   -0.51720109]
+ [ -0.51720109  -0.51805781]
+ [ 84.16503479   3.46985009]
+ [  3.46985009  -3.22349905]
+ [ 87.04748084  15.65196057]
+ [ 15.65196057 -13.80593508]]
+strain_energy
+[[0.         0.00593479 0.12700459 0.15341056 0.27305651]
+ [0.         0.00465602 0.09359047 0.11301415 0.1986954 ]
+ [0.         0.00335977 0.06715538 0.07981193 0.13867051]
+ [0.         0.00311792 0.06408634 0.0740311  0.12891225]
+ [0.         0.00311236 0.06491571 0.07417862 0.12899751]
+ [0.         0.00311792 0.06408634 0.0740311  0.12891225]
+ [0.         0.00335977 0.06715538 0.07981193 0.13867051]
+ [0.         0.00465602 0.09359047 0.11301415 0.1986954 ]
+ [0.         0.00593479 0.12700459 0.15341056 0.27305651]
+ [0.         0.0149111  0.29964867 0.37119865 0.65581147]
+ [0.         0.0119533  0.23278581 0.2878793  0.50472561]
+ [0.         0.00860943 0.16863016 0.20473781 0.35932977]
+ [0.         0.00807755 0.15935653 0.18892149 0.33223195]
+ [0.         0.00804592 0.15999183 0.18786738 0.32969825]
+ [0.         0.00807755 0.15935653 0.18892149 0.33223195]
+ [0.         0.00860943 0.16863016 0.20473781 0.35932977]
+ [0.         0.0119533  0.23278581 0.2878793  0.50472561]
+ [0.         0.0149111  0.29964867 0.37119865 0.65581147]
+ [0.         0.01148523 0.18039638 0.23647656 0.40652404]
+ [0.         0.0109427  0.198418   0.24998333 0.43924411]
+ [0.         0.0084474  0.16527663 0.20161697 0.36121723]
+ [0.         0.00780971 0.15545404 0.18541365 0.33527583]
+ [0.         0.00767381 0.15346327 0.18076522 0.3288432 ]
+ [0.         0.00780971 0.15545404 0.18541365 0.33527583]
+ [0.         0.0084474  0.16527663 0.20161697 0.36121723]
+ [0.         0.0109427  0.198418   0.24998333 0.43924411]
+ [0.         0.01148523 0.18039638 0.23647656 0.40652404]
+ [0.         0.01701726 0.23637789 0.32323961 0.55282998]
+ [0.         0.01689189 0.2697548  0.35289083 0.61663206]
+ [0.         0.01341258 0.23804504 0.29926543 0.53460999]
+ [0.         0.01246199 0.23168158 0.28463169 0.51326612]
+ [0.         0.01226527 0.23072374 0.28089118 0.50820439]
+ [0.         0.01246199 0.23168158 0.28463169 0.51326612]
+ [0.         0.01341258 0.23804504 0.29926543 0.53460999]
+ [0.         0.01689189 0.2697548  0.35289083 0.61663206]
+ [0.         0.01701726 0.23637789 0.32323961 0.55282998]
+ [0.         0.01783857 0.21244918 0.31048292 0.53282564]
+ [0.         0.01767481 0.24028633 0.33167237 0.58316273]
+ [0.         0.01469312 0.22452727 0.29605096 0.53027006]
+ [0.         0.014246   0.23343086 0.29818297 0.54251504]
+ [0.         0.01410788 0.23605419 0.29761546 0.54546052]
+ [0.         0.014246   0.23343086 0.29818297 0.54251504]
+ [0.         0.01469312 0.22452727 0.29605096 0.53027006]
+ [0.         0.01767481 0.24028633 0.33167237 0.58316273]
+ [0.         0.01783857 0.21244918 0.31048292 0.53282564]
+ [0.         0.01996684 0.18885416 0.30410485 0.51913386]
+ [0.         0.01886844 0.21430005 0.31512448 0.55060888]
+ [0.         0.01680965 0.20802193 0.2917452  0.51980766]
+ [0.         0.01709112 0.22006023 0.29957732 0.54260073]
+ [0.         0.01721698 0.22450102 0.30199202 0.55140237]
+ [0.         0.01709112 0.22006023 0.29957732 0.54260073]
+ [0.         0.01680965 0.20802193 0.2917452  0.51980766]
+ [0.         0.01886844 0.21430005 0.31512448 0.55060888]
+ [0.         0.01996684 0.18885416 0.30410485 0.51913386]
+ [0.         0.02597164 0.19128716 0.3395866  0.58639841]
+ [0.         0.02851148 0.22590959 0.37913321 0.66663488]
+ [0.         0.02577053 0.21777817 0.34770275 0.62139265]
+ [0.         0.02712729 0.23617434 0.36803693 0.66401316]
+ [0.         0.0278237  0.24492284 0.37811018 0.68570609]
+ [0.         0.02712729 0.23617434 0.36803693 0.66401316]
+ [0.         0.02577053 0.21777817 0.34770275 0.62139265]
+ [0.         0.02851148 0.22590959 0.37913321 0.66663488]
+ [0.         0.02597164 0.19128716 0.3395866  0.58639841]
+ [0.         0.01943534 0.12807943 0.2382706  0.41416974]
+ [0.         0.01940721 0.13843671 0.23958378 0.4267973 ]
+ [0.         0.01798229 0.13480805 0.22590457 0.40356751]
+ [0.         0.01920228 0.14773474 0.24290999 0.43663523]
+ [0.         0.01971478 0.15405706 0.2500248  0.45217154]
+ [0.         0.01920228 0.14773474 0.24290999 0.43663523]
+ [0.         0.01798229 0.13480805 0.22590457 0.40356751]
+ [0.         0.01940721 0.13843671 0.23958378 0.4267973 ]
+ [0.         0.01943534 0.12807943 0.2382706  0.41416974]
+ [0.         0.05148332 0.26822178 0.54450392 0.95065789]
+ [0.         0.04374956 0.23788991 0.45972534 0.81488855]
+ [0.         0.04678421 0.26314509 0.50302539 0.8959295 ]
+ [0.         0.05121974 0.29174624 0.54604994 0.97639239]
+ [0.         0.05260005 0.30156863 0.56219154 0.99940802]
+ [0.         0.05121974 0.29174624 0.54604994 0.97639239]
+ [0.         0.04678421 0.26314509 0.50302539 0.8959295 ]
+ [0.         0.04374956 0.23788991 0.45972534 0.81488855]
+ [0.         0.05148332 0.26822178 0.54450392 0.95065789]]
@@ -1,172 +1,154 @@
 iteration 1 480.0
-iteration 2 181.070003820859
-iteration 3 59.63642483703567
-iteration 4 18.3259416136047
-iteration 5 8.535597742167006
-iteration 6 3.1367923033091625
-iteration 7 1.761023491200188
-iteration 8 0.8917794445596613
-iteration 9 0.523201577881178
-iteration 10 0.3030564751174158
-iteration 11 0.17920088977805923
-iteration 12 0.10694656869770572
-iteration 13 0.06363763892383822
-iteration 14 0.03814484028653959
-iteration 15 0.02280225953153786
-iteration 16 0.013663298646362433
-iteration 17 0.008189910892807436
-iteration 18 0.0049037619952641475
-iteration 19 0.00294362923200884
-iteration 20 0.0017616215471746414
-iteration 21 0.0010582415545012567
-t_n: 1 res: 0.0006331305737201885 Iteration # 21
+iteration 2 5.830243992527973
+iteration 3 0.0010385035759223021
+t_n: 1 res: 5.079121174024025e-11 Iteration # 3
 delta_x = 0.5
 Horizon = 1.5014999999999998
 epsilon_tensor
-[[ 0.02092183  0.00012632]
- [ 0.00012632 -0.00614744]
- [ 0.02001114 -0.00021127]
- [-0.00021127 -0.00462239]
- [ 0.02345409 -0.00017735]
- [-0.00017735 -0.004801  ]
- [ 0.02533854 -0.00045346]
- [-0.00045346 -0.00455936]
+[[ 0.02092182  0.00012634]
+ [ 0.00012634 -0.00614742]
+ [ 0.02001114 -0.00021126]
+ [-0.00021126 -0.00462237]
+ [ 0.02345409 -0.00017733]
+ [-0.00017733 -0.00480099]
+ [ 0.02533855 -0.00045346]
+ [-0.00045346 -0.00455935]
  [ 0.02576872  0.        ]
- [ 0.         -0.00448055]
- [ 0.02533854  0.00045346]
- [ 0.00045346 -0.00455936]
- [ 0.02345409  0.00017735]
- [ 0.00017735 -0.004801  ]
- [ 0.02001114  0.00021127]
- [ 0.00021127 -0.00462239]
- [ 0.02092183 -0.00012632]
- [-0.00012632 -0.00614744]
+ [ 0.         -0.00448053]
+ [ 0.02533855  0.00045346]
+ [ 0.00045346 -0.00455935]
+ [ 0.02345409  0.00017733]
+ [ 0.00017733 -0.00480099]
+ [ 0.02001114  0.00021126]
+ [ 0.00021126 -0.00462237]
+ [ 0.02092182 -0.00012634]
+ [-0.00012634 -0.00614742]
  [ 0.01492187 -0.00232317]
  [-0.00232317 -0.00523822]
- [ 0.01486589 -0.00145527]
- [-0.00145527 -0.00481154]
+ [ 0.01486589 -0.00145526]
+ [-0.00145526 -0.00481154]
  [ 0.01549842 -0.00051904]
- [-0.00051904 -0.00514485]
- [ 0.01612508 -0.00048735]
+ [-0.00051904 -0.00514484]
+ [ 0.01612509 -0.00048735]
  [-0.00048735 -0.00475357]
- [ 0.01649521  0.        ]
- [ 0.         -0.00477912]
- [ 0.01612508  0.00048735]
+ [ 0.01649522 -0.        ]
+ [-0.         -0.00477911]
+ [ 0.01612509  0.00048735]
  [ 0.00048735 -0.00475357]
  [ 0.01549842  0.00051904]
- [ 0.00051904 -0.00514485]
- [ 0.01486589  0.00145527]
- [ 0.00145527 -0.00481154]
+ [ 0.00051904 -0.00514484]
+ [ 0.01486589  0.00145526]
+ [ 0.00145526 -0.00481154]
  [ 0.01492187  0.00232317]
  [ 0.00232317 -0.00523822]
- [ 0.0166062  -0.00021041]
+ [ 0.01660619 -0.00021041]
  [-0.00021041 -0.00734047]
  [ 0.01734997 -0.00016327]
- [-0.00016327 -0.00535816]
- [ 0.0178578  -0.00041577]
- [-0.00041577 -0.00526681]
- [ 0.01850847 -0.00033676]
- [-0.00033676 -0.00496027]
- [ 0.01884639  0.        ]
- [ 0.         -0.00497383]
- [ 0.01850847  0.00033676]
- [ 0.00033676 -0.00496027]
- [ 0.0178578   0.00041577]
- [ 0.00041577 -0.00526681]
+ [-0.00016327 -0.00535817]
+ [ 0.0178578  -0.00041576]
+ [-0.00041576 -0.00526681]
+ [ 0.01850848 -0.00033675]
+ [-0.00033675 -0.00496027]
+ [ 0.01884639 -0.        ]
+ [-0.         -0.00497383]
+ [ 0.01850848  0.00033675]
+ [ 0.00033675 -0.00496027]
+ [ 0.0178578   0.00041576]
+ [ 0.00041576 -0.00526681]
  [ 0.01734997  0.00016327]
- [ 0.00016327 -0.00535816]
- [ 0.0166062   0.00021041]
+ [ 0.00016327 -0.00535817]
+ [ 0.01660619  0.00021041]
  [ 0.00021041 -0.00734047]
  [ 0.01546421  0.00025009]
- [ 0.00025009 -0.00719633]
+ [ 0.00025009 -0.00719634]
  [ 0.01579478 -0.00021968]
- [-0.00021968 -0.00537605]
+ [-0.00021968 -0.00537606]
  [ 0.0163454  -0.00037629]
- [-0.00037629 -0.00530081]
+ [-0.00037629 -0.00530082]
  [ 0.0168949  -0.00025359]
- [-0.00025359 -0.00491956]
- [ 0.01708042  0.        ]
- [ 0.         -0.00491545]
+ [-0.00025359 -0.00491957]
+ [ 0.01708043 -0.        ]
+ [-0.         -0.00491546]
  [ 0.0168949   0.00025359]
- [ 0.00025359 -0.00491956]
+ [ 0.00025359 -0.00491957]
  [ 0.0163454   0.00037629]
- [ 0.00037629 -0.00530081]
+ [ 0.00037629 -0.00530082]
  [ 0.01579478  0.00021968]
- [ 0.00021968 -0.00537605]
+ [ 0.00021968 -0.00537606]
  [ 0.01546421 -0.00025009]
- [-0.00025009 -0.00719633]
- [ 0.01612157 -0.00080715]
- [-0.00080715 -0.00757669]
+ [-0.00025009 -0.00719634]
+ [ 0.01612157 -0.00080716]
+ [-0.00080716 -0.0075767 ]
  [ 0.01653035 -0.00074589]
- [-0.00074589 -0.00535756]
- [ 0.01691583 -0.00060943]
- [-0.00060943 -0.00503057]
+ [-0.00074589 -0.00535757]
+ [ 0.01691584 -0.00060943]
+ [-0.00060943 -0.00503058]
  [ 0.01735792 -0.00039991]
- [-0.00039991 -0.00443572]
- [ 0.01750382  0.        ]
- [ 0.         -0.0043245 ]
+ [-0.00039991 -0.00443573]
+ [ 0.01750383  0.        ]
+ [ 0.         -0.00432451]
  [ 0.01735792  0.00039991]
- [ 0.00039991 -0.00443572]
- [ 0.01691583  0.00060943]
- [ 0.00060943 -0.00503057]
+ [ 0.00039991 -0.00443573]
+ [ 0.01691584  0.00060943]
+ [ 0.00060943 -0.00503058]
  [ 0.01653035  0.00074589]
- [ 0.00074589 -0.00535756]
- [ 0.01612157  0.00080715]
- [ 0.00080715 -0.00757669]
- [ 0.01613065 -0.0014596 ]
- [-0.0014596  -0.00741699]
- [ 0.01639611 -0.0015412 ]
- [-0.0015412  -0.00428135]
- [ 0.01651997 -0.00099025]
- [-0.00099025 -0.00395828]
+ [ 0.00074589 -0.00535757]
+ [ 0.01612157  0.00080716]
+ [ 0.00080716 -0.0075767 ]
+ [ 0.01613065 -0.00145961]
+ [-0.00145961 -0.00741699]
+ [ 0.01639611 -0.00154121]
+ [-0.00154121 -0.00428136]
+ [ 0.01651997 -0.00099026]
+ [-0.00099026 -0.00395829]
  [ 0.0166282  -0.0005181 ]
- [-0.0005181  -0.00341688]
- [ 0.01667089  0.        ]
- [ 0.         -0.00322757]
+ [-0.0005181  -0.00341689]
+ [ 0.0166709   0.        ]
+ [ 0.         -0.00322758]
  [ 0.0166282   0.0005181 ]
- [ 0.0005181  -0.00341688]
- [ 0.01651997  0.00099025]
- [ 0.00099025 -0.00395828]
- [ 0.01639611  0.0015412 ]
- [ 0.0015412  -0.00428135]
- [ 0.01613065  0.0014596 ]
- [ 0.0014596  -0.00741699]
+ [ 0.0005181  -0.00341689]
+ [ 0.01651997  0.00099026]
+ [ 0.00099026 -0.00395829]
+ [ 0.01639611  0.00154121]
+ [ 0.00154121 -0.00428136]
+ [ 0.01613065  0.00145961]
+ [ 0.00145961 -0.00741699]
  [ 0.01401315 -0.0008302 ]
  [-0.0008302  -0.00608402]
- [ 0.01401622 -0.00153823]
- [-0.00153823 -0.00282522]
- [ 0.01400285 -0.00118209]
- [-0.00118209 -0.00267236]
+ [ 0.01401622 -0.00153824]
+ [-0.00153824 -0.00282523]
+ [ 0.01400286 -0.00118209]
+ [-0.00118209 -0.00267237]
  [ 0.01385112 -0.00051992]
- [-0.00051992 -0.00224369]
- [ 0.01379774  0.        ]
- [ 0.         -0.00201725]
+ [-0.00051992 -0.0022437 ]
+ [ 0.01379774 -0.        ]
+ [-0.         -0.00201726]
  [ 0.01385112  0.00051992]
- [ 0.00051992 -0.00224369]
- [ 0.01400285  0.00118209]
- [ 0.00118209 -0.00267236]
- [ 0.01401622  0.00153823]
- [ 0.00153823 -0.00282522]
+ [ 0.00051992 -0.0022437 ]
+ [ 0.01400286  0.00118209]
+ [ 0.00118209 -0.00267237]
+ [ 0.01401622  0.00153824]
+ [ 0.00153824 -0.00282523]
  [ 0.01401315  0.0008302 ]
  [ 0.0008302  -0.00608402]
- [ 0.01469399 -0.00446765]
- [-0.00446765  0.0002258 ]
- [ 0.01481659 -0.00300497]
- [-0.00300497 -0.00108781]
+ [ 0.01469399 -0.00446766]
+ [-0.00446766  0.00022581]
+ [ 0.01481659 -0.00300498]
+ [-0.00300498 -0.00108781]
  [ 0.01457015 -0.00153209]
  [-0.00153209 -0.00167606]
  [ 0.01418112 -0.0007265 ]
  [-0.0007265  -0.00102519]
- [ 0.01406354  0.        ]
- [ 0.         -0.00093576]
+ [ 0.01406354 -0.        ]
+ [-0.         -0.00093576]
  [ 0.01418112  0.0007265 ]
  [ 0.0007265  -0.00102519]
  [ 0.01457015  0.00153209]
  [ 0.00153209 -0.00167606]
- [ 0.01481659  0.00300497]
- [ 0.00300497 -0.00108781]
- [ 0.01469399  0.00446765]
- [ 0.00446765  0.0002258 ]
+ [ 0.01481659  0.00300498]
+ [ 0.00300498 -0.00108781]
+ [ 0.01469399  0.00446766]
+ [ 0.00446766  0.00022581]
  [ 0.01003764 -0.00160773]
  [-0.00160773 -0.00146895]
  [ 0.00895114 -0.00110709]
@@ -175,8 +157,8 @@ epsilon_tensor
  [-0.0008978  -0.00079774]
  [ 0.00798176 -0.00040912]
  [-0.00040912 -0.00042029]
- [ 0.00791137  0.        ]
- [ 0.         -0.0003668 ]
+ [ 0.00791137 -0.        ]
+ [-0.         -0.0003668 ]
  [ 0.00798176  0.00040912]
  [ 0.00040912 -0.00042029]
  [ 0.00827904  0.0008978 ]
@@ -185,250 +167,249 @@ epsilon_tensor
  [ 0.00110709 -0.00115588]
  [ 0.01003764  0.00160773]
  [ 0.00160773 -0.00146895]]
-strain_longi [ 0.         -0.00369031]
+strain_longi [ 0.         -0.00369029]
 stress_tensor
-[[ 88.96745073  15.86983932]
- [ 15.86983932 -14.56192123]
- [ 86.19740204   3.36041418]
- [  3.36041418  -4.15848888]
- [ 82.72462428  -0.5117425 ]
- [ -0.5117425   -1.46275553]
- [ 84.45199516  -1.21500678]
- [ -1.21500678  -3.02876156]
- [ 86.00693444   0.        ]
- [  0.          -2.30284653]
- [ 84.45199516   1.21500678]
- [  1.21500678  -3.02876156]
- [ 82.72462428   0.5117425 ]
- [  0.5117425   -1.46275553]
- [ 86.19740204  -3.36041418]
- [ -3.36041418  -4.15848888]
- [ 88.96745073 -15.86983932]
- [-15.86983932 -14.56192123]
- [ 53.09690775   2.58749717]
- [  2.58749717 -14.12510307]
- [ 55.83154512  -1.80084448]
- [ -1.80084448  -7.00212102]
- [ 46.01085612  -1.64332119]
- [ -1.64332119  -8.22002051]
- [ 46.17029797  -1.45385963]
- [ -1.45385963  -8.66250519]
- [ 47.3081719    0.        ]
- [  0.          -8.4441596 ]
- [ 46.17029797   1.45385963]
- [  1.45385963  -8.66250519]
- [ 46.01085612   1.64332119]
- [  1.64332119  -8.22002051]
- [ 55.83154512   1.80084448]
- [  1.80084448  -7.00212102]
- [ 53.09690775  -2.58749717]
- [ -2.58749717 -14.12510307]
- [ 69.25226613  -0.60714709]
- [ -0.60714709 -12.75036077]
- [ 75.4101106   -0.51692864]
- [ -0.51692864  -0.07595692]
- [ 62.82232615  -1.43144818]
- [ -1.43144818   0.13261609]
- [ 63.367755    -1.10853688]
- [ -1.10853688  -0.77579297]
- [ 64.60708179   0.        ]
- [  0.          -0.47045657]
- [ 63.367755     1.10853688]
- [  1.10853688  -0.77579297]
- [ 62.82232615   1.43144818]
- [  1.43144818   0.13261609]
- [ 75.4101106    0.51692864]
- [  0.51692864  -0.07595692]
- [ 69.25226613   0.60714709]
- [  0.60714709 -12.75036077]
- [ 71.36442301   0.67007757]
- [  0.67007757 -12.99228926]
- [ 73.82819249  -0.65534114]
- [ -0.65534114  -2.11401429]
- [ 62.14963075  -1.23866953]
- [ -1.23866953  -2.17750699]
- [ 62.66439364  -0.79967697]
- [ -0.79967697  -2.78772411]
- [ 63.41065176   0.        ]
- [  0.          -2.58577155]
- [ 62.66439364   0.79967697]
- [  0.79967697  -2.78772411]
- [ 62.14963075   1.23866953]
- [  1.23866953  -2.17750699]
- [ 73.82819249   0.65534114]
- [  0.65534114  -2.11401429]
- [ 71.36442301  -0.67007757]
- [ -0.67007757 -12.99228926]
- [ 74.34023613  -2.16268162]
- [ -2.16268162 -13.80311758]
- [ 77.51764832  -2.22512728]
- [ -2.22512728  -1.36859297]
- [ 64.80572867  -2.00613572]
- [ -2.00613572  -0.56433756]
- [ 65.0003135   -1.26108264]
- [ -1.26108264  -0.3893333 ]
- [ 65.69515215   0.        ]
- [  0.           0.20146282]
- [ 65.0003135    1.26108264]
- [  1.26108264  -0.3893333 ]
- [ 64.80572867   2.00613572]
- [  2.00613572  -0.56433756]
- [ 77.51764832   2.22512728]
- [  2.22512728  -1.36859297]
- [ 74.34023613   2.16268162]
- [  2.16268162 -13.80311758]
- [ 74.5093246   -3.91084698]
- [ -3.91084698 -13.24150071]
- [ 77.85318851  -4.59768485]
- [ -4.59768485   1.88390243]
- [ 64.31062143  -3.25973053]
- [ -3.25973053   2.99076987]
- [ 63.09993027  -1.63380018]
- [ -1.63380018   2.95664706]
- [ 63.45998906   0.        ]
- [  0.           3.75662846]
- [ 63.09993027   1.63380018]
- [  1.63380018   2.95664706]
- [ 64.31062143   3.25973053]
- [  3.25973053   2.99076987]
- [ 77.85318851   4.59768485]
- [  4.59768485   1.88390243]
- [ 74.5093246    3.91084698]
- [  3.91084698 -13.24150071]
- [ 58.53448335  -2.39554646]
- [ -2.39554646 -10.3509557 ]
- [ 62.44870969  -4.87013249]
- [ -4.87013249   4.90917545]
- [ 50.92908807  -4.06981011]
- [ -4.06981011   5.72337127]
- [ 48.99364223  -1.7114863 ]
- [ -1.7114863    5.51229711]
- [ 49.03789509   0.        ]
- [  0.           6.39475153]
- [ 48.99364223   1.7114863 ]
- [  1.7114863    5.51229711]
- [ 50.92908807   4.06981011]
- [  4.06981011   5.72337127]
- [ 62.44870969   4.87013249]
- [  4.87013249   4.90917545]
- [ 58.53448335   2.39554646]
- [  2.39554646 -10.3509557 ]
- [ 65.72484308 -21.88715236]
- [-21.88715236  15.06357479]
- [ 61.20391757 -12.26428103]
- [-12.26428103  10.41821472]
- [ 46.46842234  -4.85066713]
- [ -4.85066713   7.00214239]
- [ 43.55284075  -2.16727297]
- [ -2.16727297   8.13403544]
- [ 43.26734493   0.        ]
- [  0.           8.47060412]
- [ 43.55284075   2.16727297]
- [  2.16727297   8.13403544]
- [ 46.46842234   4.85066713]
- [  4.85066713   7.00214239]
- [ 61.20391757  12.26428103]
- [ 12.26428103  10.41821472]
- [ 65.72484308  21.88715236]
- [ 21.88715236  15.06357479]
- [ 46.82133136 -12.46225405]
- [-12.46225405   2.81310801]
- [ 40.0883594   -5.23961168]
- [ -5.23961168   3.50202802]
- [ 29.98125054  -2.59060958]
- [ -2.59060958   3.56918485]
- [ 27.39092542  -1.09620205]
- [ -1.09620205   4.10102343]
- [ 27.18799613   0.        ]
- [  0.           4.31256978]
- [ 27.39092542   1.09620205]
- [  1.09620205   4.10102343]
- [ 29.98125054   2.59060958]
- [  2.59060958   3.56918485]
- [ 40.0883594    5.23961168]
- [  5.23961168   3.50202802]
- [ 46.82133136  12.46225405]
- [ 12.46225405   2.81310801]]
+[[ 88.96746195  15.86988339]
+ [ 15.86988339 -14.56181325]
+ [ 86.19741531   3.36046408]
+ [  3.36046408  -4.15841044]
+ [ 82.72464225  -0.51170056]
+ [ -0.51170056  -1.46269269]
+ [ 84.45201364  -1.21498548]
+ [ -1.21498548  -3.02868523]
+ [ 86.00695296   0.        ]
+ [  0.          -2.30276574]
+ [ 84.45201364   1.21498548]
+ [  1.21498548  -3.02868523]
+ [ 82.72464225   0.51170056]
+ [  0.51170056  -1.46269269]
+ [ 86.19741531  -3.36046408]
+ [ -3.36046408  -4.15841044]
+ [ 88.96746195 -15.86988339]
+ [-15.86988339 -14.56181325]
+ [ 53.09690238   2.58751584]
+ [  2.58751584 -14.12508182]
+ [ 55.83154878  -1.80081916]
+ [ -1.80081916  -7.00210361]
+ [ 46.01087158  -1.64329839]
+ [ -1.64329839  -8.21999264]
+ [ 46.17031937  -1.45384778]
+ [ -1.45384778  -8.66247868]
+ [ 47.30819584  -0.        ]
+ [ -0.          -8.44413108]
+ [ 46.17031937   1.45384778]
+ [  1.45384778  -8.66247868]
+ [ 46.01087158   1.64329839]
+ [  1.64329839  -8.21999264]
+ [ 55.83154878   1.80081916]
+ [  1.80081916  -7.00210361]
+ [ 53.09690238  -2.58751584]
+ [ -2.58751584 -14.12508182]
+ [ 69.25224343  -0.60713302]
+ [ -0.60713302 -12.7503876 ]
+ [ 75.41009871  -0.51691021]
+ [ -0.51691021  -0.07598059]
+ [ 62.82232971  -1.43143219]
+ [ -1.43143219   0.13261428]
+ [ 63.36776549  -1.10852874]
+ [ -1.10852874  -0.7758033 ]
+ [ 64.6070949   -0.        ]
+ [ -0.          -0.47046851]
+ [ 63.36776549   1.10852874]
+ [  1.10852874  -0.7758033 ]
+ [ 62.82232971   1.43143219]
+ [  1.43143219   0.13261428]
+ [ 75.41009871   0.51691021]
+ [  0.51691021  -0.07598059]
+ [ 69.25224343   0.60713302]
+ [  0.60713302 -12.7503876 ]
+ [ 71.36440106   0.67008137]
+ [  0.67008137 -12.9923168 ]
+ [ 73.82818191  -0.65533783]
+ [ -0.65533783  -2.11405079]
+ [ 62.1496339   -1.23866732]
+ [ -1.23866732  -2.17753141]
+ [ 62.66440487  -0.79967617]
+ [ -0.79967617  -2.78776436]
+ [ 63.41066563  -0.        ]
+ [ -0.          -2.58581711]
+ [ 62.66440487   0.79967617]
+ [  0.79967617  -2.78776436]
+ [ 62.1496339    1.23866732]
+ [  1.23866732  -2.17753141]
+ [ 73.82818191   0.65533783]
+ [  0.65533783  -2.11405079]
+ [ 71.36440106  -0.67008137]
+ [ -0.67008137 -12.9923168 ]
+ [ 74.34021972  -2.1626887 ]
+ [ -2.1626887  -13.80313797]
+ [ 77.51763982  -2.22513754]
+ [ -2.22513754  -1.36862632]
+ [ 64.80573011  -2.00614575]
+ [ -2.00614575  -0.56436795]
+ [ 65.0003218   -1.2610885 ]
+ [ -1.2610885   -0.38938082]
+ [ 65.69516254   0.        ]
+ [  0.           0.20140917]
+ [ 65.0003218    1.2610885 ]
+ [  1.2610885   -0.38938082]
+ [ 64.80573011   2.00614575]
+ [  2.00614575  -0.56436795]
+ [ 77.51763982   2.22513754]
+ [  2.22513754  -1.36862632]
+ [ 74.34021972   2.1626887 ]
+ [  2.1626887  -13.80313797]
+ [ 74.50931517  -3.91085886]
+ [ -3.91085886 -13.24151108]
+ [ 77.85318406  -4.59770124]
+ [ -4.59770124   1.88388245]
+ [ 64.31062132  -3.25974584]
+ [ -3.25974584   2.99074509]
+ [ 63.09993358  -1.63380872]
+ [ -1.63380872   2.95660869]
+ [ 63.45999331   0.        ]
+ [  0.           3.75658544]
+ [ 63.09993358   1.63380872]
+ [  1.63380872   2.95660869]
+ [ 64.31062132   3.25974584]
+ [  3.25974584   2.99074509]
+ [ 77.85318406   4.59770124]
+ [  4.59770124   1.88388245]
+ [ 74.50931517   3.91085886]
+ [  3.91085886 -13.24151108]
+ [ 58.53447944  -2.395559  ]
+ [ -2.395559   -10.35095741]
+ [ 62.44870865  -4.87014892]
+ [ -4.87014892   4.90916879]
+ [ 50.92908689  -4.06982487]
+ [ -4.06982487   5.72335547]
+ [ 48.99364151  -1.71149429]
+ [ -1.71149429   5.51227271]
+ [ 49.03789443  -0.        ]
+ [ -0.           6.39472453]
+ [ 48.99364151   1.71149429]
+ [  1.71149429   5.51227271]
+ [ 50.92908689   4.06982487]
+ [  4.06982487   5.72335547]
+ [ 62.44870865   4.87014892]
+ [  4.87014892   4.90916879]
+ [ 58.53447944   2.395559  ]
+ [  2.395559   -10.35095741]
+ [ 65.72485288 -21.88716773]
+ [-21.88716773  15.06358786]
+ [ 61.20392112 -12.26429718]
+ [-12.26429718  10.41821699]
+ [ 46.46842118  -4.85068082]
+ [ -4.85068082   7.00213252]
+ [ 43.55283893  -2.16728033]
+ [ -2.16728033   8.13402091]
+ [ 43.26734274  -0.        ]
+ [ -0.           8.47058757]
+ [ 43.55283893   2.16728033]
+ [  2.16728033   8.13402091]
+ [ 46.46842118   4.85068082]
+ [  4.85068082   7.00213252]
+ [ 61.20392112  12.26429718]
+ [ 12.26429718  10.41821699]
+ [ 65.72485288  21.88716773]
+ [ 21.88716773  15.06358786]
+ [ 46.82134028 -12.46226017]
+ [-12.46226017   2.81310913]
+ [ 40.08836153  -5.2396182 ]
+ [ -5.2396182    3.50202768]
+ [ 29.98124923  -2.59061563]
+ [ -2.59061563   3.56918092]
+ [ 27.39092317  -1.09620523]
+ [ -1.09620523   4.10101795]
+ [ 27.18799351  -0.        ]
+ [ -0.           4.31256343]
+ [ 27.39092317   1.09620523]
+ [  1.09620523   4.10101795]
+ [ 29.98124923   2.59061563]
+ [  2.59061563   3.56918092]
+ [ 40.08836153   5.2396182 ]
+ [  5.2396182    3.50202768]
+ [ 46.82134028  12.46226017]
+ [ 12.46226017   2.81310913]]
 strain_energy
-[[0.         0.99078788]
- [0.         0.85482742]
- [0.         0.94424155]
- [0.         1.02677049]
- [0.         1.04634826]
- [0.         1.02677049]
- [0.         0.94424155]
- [0.         0.85482742]
- [0.         0.99078788]
- [0.         0.44798902]
- [0.         0.462848  ]
- [0.         0.43864109]
- [0.         0.47164665]
- [0.         0.48616723]
- [0.         0.47164665]
- [0.         0.43864109]
- [0.         0.462848  ]
- [0.         0.44798902]
- [0.         0.64488432]
- [0.         0.73325852]
- [0.         0.68074465]
- [0.         0.72306372]
- [0.         0.74402403]
- [0.         0.72306372]
- [0.         0.68074465]
- [0.         0.73325852]
- [0.         0.64488432]
- [0.         0.58683228]
- [0.         0.62349926]
- [0.         0.58517585]
- [0.         0.60623194]
- [0.         0.61299345]
- [0.         0.60623194]
- [0.         0.58517585]
- [0.         0.62349926]
- [0.         0.58683228]
- [0.         0.60844689]
- [0.         0.66285325]
- [0.         0.60022254]
- [0.         0.61108169]
- [0.         0.61295226]
- [0.         0.61108169]
- [0.         0.60022254]
- [0.         0.66285325]
- [0.         0.60844689]
- [0.         0.63250731]
- [0.         0.70355618]
- [0.         0.6073146 ]
- [0.         0.5824065 ]
- [0.         0.57634328]
- [0.         0.5824065 ]
- [0.         0.6073146 ]
- [0.         0.70355618]
- [0.         0.63250731]
- [0.         0.46288998]
- [0.         0.49806534]
- [0.         0.40898036]
- [0.         0.37968978]
- [0.         0.37199399]
- [0.         0.37968978]
- [0.         0.40898036]
- [0.         0.49806534]
- [0.         0.46288998]
- [0.         0.73956924]
- [0.         0.5712543 ]
- [0.         0.40774595]
- [0.         0.37847999]
- [0.         0.37689826]
- [0.         0.37847999]
- [0.         0.40774595]
- [0.         0.5712543 ]
- [0.         0.73956924]
- [0.         0.30710519]
- [0.         0.22481028]
- [0.         0.1579566 ]
- [0.         0.14709893]
- [0.         0.14748753]
- [0.         0.14709893]
- [0.         0.1579566 ]
- [0.         0.22481028]
- [0.         0.30710519]]
-Duration: 173.48742953936258 minutes
+[[0.         0.99078761]
+ [0.         0.85482718]
+ [0.         0.94424118]
+ [0.         1.02676994]
+ [0.         1.04634771]
+ [0.         1.02676994]
+ [0.         0.94424118]
+ [0.         0.85482718]
+ [0.         0.99078761]
+ [0.         0.44798851]
+ [0.         0.46284791]
+ [0.         0.43864117]
+ [0.         0.47164686]
+ [0.         0.48616752]
+ [0.         0.47164686]
+ [0.         0.43864117]
+ [0.         0.46284791]
+ [0.         0.44798851]
+ [0.         0.6448836 ]
+ [0.         0.73325838]
+ [0.         0.6807449 ]
+ [0.         0.72306421]
+ [0.         0.74402462]
+ [0.         0.72306421]
+ [0.         0.6807449 ]
+ [0.         0.73325838]
+ [0.         0.6448836 ]
+ [0.         0.5868317 ]
+ [0.         0.6234992 ]
+ [0.         0.58517616]
+ [0.         0.60623248]
+ [0.         0.61299407]
+ [0.         0.60623248]
+ [0.         0.58517616]
+ [0.         0.6234992 ]
+ [0.         0.5868317 ]
+ [0.         0.60844651]
+ [0.         0.66285324]
+ [0.         0.60022281]
+ [0.         0.61108215]
+ [0.         0.61295278]
+ [0.         0.61108215]
+ [0.         0.60022281]
+ [0.         0.66285324]
+ [0.         0.60844651]
+ [0.         0.63250715]
+ [0.         0.70355623]
+ [0.         0.60731477]
+ [0.         0.58240674]
+ [0.         0.57634353]
+ [0.         0.58240674]
+ [0.         0.60731477]
+ [0.         0.70355623]
+ [0.         0.63250715]
+ [0.         0.46288999]
+ [0.         0.49806541]
+ [0.         0.40898043]
+ [0.         0.37968983]
+ [0.         0.37199403]
+ [0.         0.37968983]
+ [0.         0.40898043]
+ [0.         0.49806541]
+ [0.         0.46288999]
+ [0.         0.73956955]
+ [0.         0.57125439]
+ [0.         0.40774592]
+ [0.         0.3784799 ]
+ [0.         0.37689815]
+ [0.         0.3784799 ]
+ [0.         0.40774592]
+ [0.         0.57125439]
+ [0.         0.73956955]
+ [0.         0.3071053 ]
+ [0.         0.22481029]
+ [0.         0.15795657]
+ [0.         0.14709889]
+ [0.         0.14748747]
+ [0.         0.14709889]
+ [0.         0.15795657]
+ [0.         0.22481029]
+ [0.         0.3071053 ]]
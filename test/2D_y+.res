@@ -1,434 +1,415 @@
 iteration 1 480.0
-iteration 2 181.07000384157303
-iteration 3 59.63642484045434
-iteration 4 18.325941614227748
-iteration 5 8.535597740624068
-iteration 6 3.13679230095609
-iteration 7 1.761023489409903
-iteration 8 0.8917794431792232
-iteration 9 0.5232015770348074
-iteration 10 0.303056474571264
-iteration 11 0.1792008894421149
-iteration 12 0.10694656848489803
-iteration 13 0.06363763879196457
-iteration 14 0.03814484020422977
-iteration 15 0.022802259479790303
-iteration 16 0.01366329861363433
-iteration 17 0.008189910876961401
-iteration 18 0.004903761987440003
-iteration 19 0.0029436292247025375
-iteration 20 0.0017616215427076207
-iteration 21 0.0010582415527062617
-t_n: 1 res: 0.0006331305719290145 Iteration # 21
+iteration 2 5.830243992529672
+iteration 3 0.0010385035756275544
+t_n: 1 res: 4.948300657785781e-11 Iteration # 3
 delta_x = 0.5
 Horizon = 1.5014999999999998
 epsilon_tensor
 [[-0.00146895  0.00160773]
  [ 0.00160773  0.01003764]
- [ 0.0002258   0.00446765]
- [ 0.00446765  0.01469399]
+ [ 0.00022581  0.00446766]
+ [ 0.00446766  0.01469399]
  [-0.00608402  0.0008302 ]
  [ 0.0008302   0.01401315]
- [-0.00741699  0.0014596 ]
- [ 0.0014596   0.01613065]
- [-0.00757669  0.00080715]
- [ 0.00080715  0.01612157]
- [-0.00719633 -0.00025009]
+ [-0.00741699  0.00145961]
+ [ 0.00145961  0.01613065]
+ [-0.0075767   0.00080716]
+ [ 0.00080716  0.01612157]
+ [-0.00719634 -0.00025009]
  [-0.00025009  0.01546421]
  [-0.00734047  0.00021041]
- [ 0.00021041  0.0166062 ]
+ [ 0.00021041  0.01660619]
  [-0.00523822  0.00232317]
  [ 0.00232317  0.01492187]
- [-0.00614744 -0.00012632]
- [-0.00012632  0.02092183]
+ [-0.00614742 -0.00012634]
+ [-0.00012634  0.02092182]
  [-0.00115588  0.00110709]
  [ 0.00110709  0.00895114]
- [-0.00108781  0.00300497]
- [ 0.00300497  0.01481659]
- [-0.00282522  0.00153823]
- [ 0.00153823  0.01401622]
- [-0.00428135  0.0015412 ]
- [ 0.0015412   0.01639611]
- [-0.00535756  0.00074589]
+ [-0.00108781  0.00300498]
+ [ 0.00300498  0.01481659]
+ [-0.00282523  0.00153824]
+ [ 0.00153824  0.01401622]
+ [-0.00428136  0.00154121]
+ [ 0.00154121  0.01639611]
+ [-0.00535757  0.00074589]
  [ 0.00074589  0.01653035]
- [-0.00537605  0.00021968]
+ [-0.00537606  0.00021968]
  [ 0.00021968  0.01579478]
- [-0.00535816  0.00016327]
+ [-0.00535817  0.00016327]
  [ 0.00016327  0.01734997]
- [-0.00481154  0.00145527]
- [ 0.00145527  0.01486589]
- [-0.00462239  0.00021127]
- [ 0.00021127  0.02001114]
+ [-0.00481154  0.00145526]
+ [ 0.00145526  0.01486589]
+ [-0.00462237  0.00021126]
+ [ 0.00021126  0.02001114]
  [-0.00079774  0.0008978 ]
  [ 0.0008978   0.00827904]
  [-0.00167606  0.00153209]
  [ 0.00153209  0.01457015]
- [-0.00267236  0.00118209]
- [ 0.00118209  0.01400285]
- [-0.00395828  0.00099025]
- [ 0.00099025  0.01651997]
- [-0.00503057  0.00060943]
- [ 0.00060943  0.01691583]
- [-0.00530081  0.00037629]
+ [-0.00267237  0.00118209]
+ [ 0.00118209  0.01400286]
+ [-0.00395829  0.00099026]
+ [ 0.00099026  0.01651997]
+ [-0.00503058  0.00060943]
+ [ 0.00060943  0.01691584]
+ [-0.00530082  0.00037629]
  [ 0.00037629  0.0163454 ]
- [-0.00526681  0.00041577]
- [ 0.00041577  0.0178578 ]
- [-0.00514485  0.00051904]
+ [-0.00526681  0.00041576]
+ [ 0.00041576  0.0178578 ]
+ [-0.00514484  0.00051904]
  [ 0.00051904  0.01549842]
- [-0.004801    0.00017735]
- [ 0.00017735  0.02345409]
+ [-0.00480099  0.00017733]
+ [ 0.00017733  0.02345409]
  [-0.00042029  0.00040912]
  [ 0.00040912  0.00798176]
  [-0.00102519  0.0007265 ]
  [ 0.0007265   0.01418112]
- [-0.00224369  0.00051992]
+ [-0.0022437   0.00051992]
  [ 0.00051992  0.01385112]
- [-0.00341688  0.0005181 ]
+ [-0.00341689  0.0005181 ]
  [ 0.0005181   0.0166282 ]
- [-0.00443572  0.00039991]
+ [-0.00443573  0.00039991]
  [ 0.00039991  0.01735792]
- [-0.00491956  0.00025359]
+ [-0.00491957  0.00025359]
  [ 0.00025359  0.0168949 ]
- [-0.00496027  0.00033676]
- [ 0.00033676  0.01850847]
+ [-0.00496027  0.00033675]
+ [ 0.00033675  0.01850848]
  [-0.00475357  0.00048735]
- [ 0.00048735  0.01612508]
- [-0.00455936  0.00045346]
- [ 0.00045346  0.02533854]
- [-0.0003668  -0.        ]
- [-0.          0.00791137]
- [-0.00093576 -0.        ]
- [-0.          0.01406354]
- [-0.00201725 -0.        ]
- [-0.          0.01379774]
- [-0.00322757 -0.        ]
- [-0.          0.01667089]
- [-0.0043245  -0.        ]
- [-0.          0.01750382]
- [-0.00491545 -0.        ]
- [-0.          0.01708042]
+ [ 0.00048735  0.01612509]
+ [-0.00455935  0.00045346]
+ [ 0.00045346  0.02533855]
+ [-0.0003668   0.        ]
+ [ 0.          0.00791137]
+ [-0.00093576  0.        ]
+ [ 0.          0.01406354]
+ [-0.00201726  0.        ]
+ [ 0.          0.01379774]
+ [-0.00322758 -0.        ]
+ [-0.          0.0166709 ]
+ [-0.00432451  0.        ]
+ [ 0.          0.01750383]
+ [-0.00491546  0.        ]
+ [ 0.          0.01708043]
  [-0.00497383 -0.        ]
  [-0.          0.01884639]
- [-0.00477912 -0.        ]
- [-0.          0.01649521]
- [-0.00448055 -0.        ]
+ [-0.00477911 -0.        ]
+ [-0.          0.01649522]
+ [-0.00448053 -0.        ]
  [-0.          0.02576872]
  [-0.00042029 -0.00040912]
  [-0.00040912  0.00798176]
  [-0.00102519 -0.0007265 ]
  [-0.0007265   0.01418112]
- [-0.00224369 -0.00051992]
+ [-0.0022437  -0.00051992]
  [-0.00051992  0.01385112]
- [-0.00341688 -0.0005181 ]
+ [-0.00341689 -0.0005181 ]
  [-0.0005181   0.0166282 ]
- [-0.00443572 -0.00039991]
+ [-0.00443573 -0.00039991]
  [-0.00039991  0.01735792]
- [-0.00491956 -0.00025359]
+ [-0.00491957 -0.00025359]
  [-0.00025359  0.0168949 ]
- [-0.00496027 -0.00033676]
- [-0.00033676  0.01850847]
+ [-0.00496027 -0.00033675]
+ [-0.00033675  0.01850848]
  [-0.00475357 -0.00048735]
- [-0.00048735  0.01612508]
- [-0.00455936 -0.00045346]
- [-0.00045346  0.02533854]
+ [-0.00048735  0.01612509]
+ [-0.00455935 -0.00045346]
+ [-0.00045346  0.02533855]
  [-0.00079774 -0.0008978 ]
  [-0.0008978   0.00827904]
  [-0.00167606 -0.00153209]
  [-0.00153209  0.01457015]
- [-0.00267236 -0.00118209]
- [-0.00118209  0.01400285]
- [-0.00395828 -0.00099025]
- [-0.00099025  0.01651997]
- [-0.00503057 -0.00060943]
- [-0.00060943  0.01691583]
- [-0.00530081 -0.00037629]
+ [-0.00267237 -0.00118209]
+ [-0.00118209  0.01400286]
+ [-0.00395829 -0.00099026]
+ [-0.00099026  0.01651997]
+ [-0.00503058 -0.00060943]
+ [-0.00060943  0.01691584]
+ [-0.00530082 -0.00037629]
  [-0.00037629  0.0163454 ]
- [-0.00526681 -0.00041577]
- [-0.00041577  0.0178578 ]
- [-0.00514485 -0.00051904]
+ [-0.00526681 -0.00041576]
+ [-0.00041576  0.0178578 ]
+ [-0.00514484 -0.00051904]
  [-0.00051904  0.01549842]
- [-0.004801   -0.00017735]
- [-0.00017735  0.02345409]
+ [-0.00480099 -0.00017733]
+ [-0.00017733  0.02345409]
  [-0.00115588 -0.00110709]
  [-0.00110709  0.00895114]
- [-0.00108781 -0.00300497]
- [-0.00300497  0.01481659]
- [-0.00282522 -0.00153823]
- [-0.00153823  0.01401622]
- [-0.00428135 -0.0015412 ]
- [-0.0015412   0.01639611]
- [-0.00535756 -0.00074589]
+ [-0.00108781 -0.00300498]
+ [-0.00300498  0.01481659]
+ [-0.00282523 -0.00153824]
+ [-0.00153824  0.01401622]
+ [-0.00428136 -0.00154121]
+ [-0.00154121  0.01639611]
+ [-0.00535757 -0.00074589]
  [-0.00074589  0.01653035]
- [-0.00537605 -0.00021968]
+ [-0.00537606 -0.00021968]
  [-0.00021968  0.01579478]
- [-0.00535816 -0.00016327]
+ [-0.00535817 -0.00016327]
  [-0.00016327  0.01734997]
- [-0.00481154 -0.00145527]
- [-0.00145527  0.01486589]
- [-0.00462239 -0.00021127]
- [-0.00021127  0.02001114]
+ [-0.00481154 -0.00145526]
+ [-0.00145526  0.01486589]
+ [-0.00462237 -0.00021126]
+ [-0.00021126  0.02001114]
  [-0.00146895 -0.00160773]
  [-0.00160773  0.01003764]
- [ 0.0002258  -0.00446765]
- [-0.00446765  0.01469399]
+ [ 0.00022581 -0.00446766]
+ [-0.00446766  0.01469399]
  [-0.00608402 -0.0008302 ]
  [-0.0008302   0.01401315]
- [-0.00741699 -0.0014596 ]
- [-0.0014596   0.01613065]
- [-0.00757669 -0.00080715]
- [-0.00080715  0.01612157]
- [-0.00719633  0.00025009]
+ [-0.00741699 -0.00145961]
+ [-0.00145961  0.01613065]
+ [-0.0075767  -0.00080716]
+ [-0.00080716  0.01612157]
+ [-0.00719634  0.00025009]
  [ 0.00025009  0.01546421]
  [-0.00734047 -0.00021041]
- [-0.00021041  0.0166062 ]
+ [-0.00021041  0.01660619]
  [-0.00523822 -0.00232317]
  [-0.00232317  0.01492187]
- [-0.00614744  0.00012632]
- [ 0.00012632  0.02092183]]
-strain_longi [0.       0.010704]
+ [-0.00614742  0.00012634]
+ [ 0.00012634  0.02092182]]
+strain_longi [0.         0.01070399]
 stress_tensor
-[[  2.81310801  12.46225405]
- [ 12.46225405  46.82133136]
- [ 15.06357479  21.88715236]
- [ 21.88715236  65.72484308]
- [-10.3509557    2.39554646]
- [  2.39554646  58.53448335]
- [-13.24150071   3.91084698]
- [  3.91084698  74.5093246 ]
- [-13.80311758   2.16268162]
- [  2.16268162  74.34023613]
- [-12.99228926  -0.67007757]
- [ -0.67007757  71.36442301]
- [-12.75036077   0.60714709]
- [  0.60714709  69.25226613]
- [-14.12510307  -2.58749717]
- [ -2.58749717  53.09690775]
- [-14.56192123 -15.86983932]
- [-15.86983932  88.96745073]
- [  3.50202802   5.23961168]
- [  5.23961168  40.0883594 ]
- [ 10.41821472  12.26428103]
- [ 12.26428103  61.20391757]
- [  4.90917545   4.87013249]
- [  4.87013249  62.44870969]
- [  1.88390243   4.59768485]
- [  4.59768485  77.85318851]
- [ -1.36859297   2.22512728]
- [  2.22512728  77.51764832]
- [ -2.11401429   0.65534114]
- [  0.65534114  73.82819249]
- [ -0.07595692   0.51692864]
- [  0.51692864  75.4101106 ]
- [ -7.00212102   1.80084448]
- [  1.80084448  55.83154512]
- [ -4.15848888  -3.36041418]
- [ -3.36041418  86.19740204]
- [  3.56918485   2.59060958]
- [  2.59060958  29.98125054]
- [  7.00214239   4.85066713]
- [  4.85066713  46.46842234]
- [  5.72337127   4.06981011]
- [  4.06981011  50.92908807]
- [  2.99076987   3.25973053]
- [  3.25973053  64.31062143]
- [ -0.56433756   2.00613572]
- [  2.00613572  64.80572867]
- [ -2.17750699   1.23866953]
- [  1.23866953  62.14963075]
- [  0.13261609   1.43144818]
- [  1.43144818  62.82232615]
- [ -8.22002051   1.64332119]
- [  1.64332119  46.01085612]
- [ -1.46275553   0.5117425 ]
- [  0.5117425   82.72462428]
- [  4.10102343   1.09620205]
- [  1.09620205  27.39092542]
- [  8.13403544   2.16727297]
- [  2.16727297  43.55284075]
- [  5.51229711   1.7114863 ]
- [  1.7114863   48.99364223]
- [  2.95664706   1.63380018]
- [  1.63380018  63.09993027]
- [ -0.3893333    1.26108264]
- [  1.26108264  65.0003135 ]
- [ -2.78772411   0.79967697]
- [  0.79967697  62.66439364]
- [ -0.77579297   1.10853688]
- [  1.10853688  63.367755  ]
- [ -8.66250519   1.45385963]
- [  1.45385963  46.17029797]
- [ -3.02876156   1.21500678]
- [  1.21500678  84.45199516]
- [  4.31256978  -0.        ]
- [ -0.          27.18799613]
- [  8.47060412  -0.        ]
- [ -0.          43.26734493]
- [  6.39475153  -0.        ]
- [ -0.          49.03789509]
- [  3.75662846  -0.        ]
- [ -0.          63.45998906]
- [  0.20146282  -0.        ]
- [ -0.          65.69515215]
- [ -2.58577155  -0.        ]
- [ -0.          63.41065176]
- [ -0.47045657  -0.        ]
- [ -0.          64.60708179]
- [ -8.4441596   -0.        ]
- [ -0.          47.3081719 ]
- [ -2.30284653  -0.        ]
- [ -0.          86.00693444]
- [  4.10102343  -1.09620205]
- [ -1.09620205  27.39092542]
- [  8.13403544  -2.16727297]
- [ -2.16727297  43.55284075]
- [  5.51229711  -1.7114863 ]
- [ -1.7114863   48.99364223]
- [  2.95664706  -1.63380018]
- [ -1.63380018  63.09993027]
- [ -0.3893333   -1.26108264]
- [ -1.26108264  65.0003135 ]
- [ -2.78772411  -0.79967697]
- [ -0.79967697  62.66439364]
- [ -0.77579297  -1.10853688]
- [ -1.10853688  63.367755  ]
- [ -8.66250519  -1.45385963]
- [ -1.45385963  46.17029797]
- [ -3.02876156  -1.21500678]
- [ -1.21500678  84.45199516]
- [  3.56918485  -2.59060958]
- [ -2.59060958  29.98125054]
- [  7.00214239  -4.85066713]
- [ -4.85066713  46.46842234]
- [  5.72337127  -4.06981011]
- [ -4.06981011  50.92908807]
- [  2.99076987  -3.25973053]
- [ -3.25973053  64.31062143]
- [ -0.56433756  -2.00613572]
- [ -2.00613572  64.80572867]
- [ -2.17750699  -1.23866953]
- [ -1.23866953  62.14963075]
- [  0.13261609  -1.43144818]
- [ -1.43144818  62.82232615]
- [ -8.22002051  -1.64332119]
- [ -1.64332119  46.01085612]
- [ -1.46275553  -0.5117425 ]
- [ -0.5117425   82.72462428]
- [  3.50202802  -5.23961168]
- [ -5.23961168  40.0883594 ]
- [ 10.41821472 -12.26428103]
- [-12.26428103  61.20391757]
- [  4.90917545  -4.87013249]
- [ -4.87013249  62.44870969]
- [  1.88390243  -4.59768485]
- [ -4.59768485  77.85318851]
- [ -1.36859297  -2.22512728]
- [ -2.22512728  77.51764832]
- [ -2.11401429  -0.65534114]
- [ -0.65534114  73.82819249]
- [ -0.07595692  -0.51692864]
- [ -0.51692864  75.4101106 ]
- [ -7.00212102  -1.80084448]
- [ -1.80084448  55.83154512]
- [ -4.15848888   3.36041418]
- [  3.36041418  86.19740204]
- [  2.81310801 -12.46225405]
- [-12.46225405  46.82133136]
- [ 15.06357479 -21.88715236]
- [-21.88715236  65.72484308]
- [-10.3509557   -2.39554646]
- [ -2.39554646  58.53448335]
- [-13.24150071  -3.91084698]
- [ -3.91084698  74.5093246 ]
- [-13.80311758  -2.16268162]
- [ -2.16268162  74.34023613]
- [-12.99228926   0.67007757]
- [  0.67007757  71.36442301]
- [-12.75036077  -0.60714709]
- [ -0.60714709  69.25226613]
- [-14.12510307   2.58749717]
- [  2.58749717  53.09690775]
- [-14.56192123  15.86983932]
- [ 15.86983932  88.96745073]]
+[[  2.81310913  12.46226017]
+ [ 12.46226017  46.82134028]
+ [ 15.06358786  21.88716773]
+ [ 21.88716773  65.72485288]
+ [-10.35095741   2.395559  ]
+ [  2.395559    58.53447944]
+ [-13.24151108   3.91085886]
+ [  3.91085886  74.50931517]
+ [-13.80313797   2.1626887 ]
+ [  2.1626887   74.34021972]
+ [-12.9923168   -0.67008137]
+ [ -0.67008137  71.36440106]
+ [-12.7503876    0.60713302]
+ [  0.60713302  69.25224343]
+ [-14.12508182  -2.58751584]
+ [ -2.58751584  53.09690238]
+ [-14.56181325 -15.86988339]
+ [-15.86988339  88.96746195]
+ [  3.50202768   5.2396182 ]
+ [  5.2396182   40.08836153]
+ [ 10.41821699  12.26429718]
+ [ 12.26429718  61.20392112]
+ [  4.90916879   4.87014892]
+ [  4.87014892  62.44870865]
+ [  1.88388245   4.59770124]
+ [  4.59770124  77.85318406]
+ [ -1.36862632   2.22513754]
+ [  2.22513754  77.51763982]
+ [ -2.11405079   0.65533783]
+ [  0.65533783  73.82818191]
+ [ -0.07598059   0.51691021]
+ [  0.51691021  75.41009871]
+ [ -7.00210361   1.80081916]
+ [  1.80081916  55.83154878]
+ [ -4.15841044  -3.36046408]
+ [ -3.36046408  86.19741531]
+ [  3.56918092   2.59061563]
+ [  2.59061563  29.98124923]
+ [  7.00213252   4.85068082]
+ [  4.85068082  46.46842118]
+ [  5.72335547   4.06982487]
+ [  4.06982487  50.92908689]
+ [  2.99074509   3.25974584]
+ [  3.25974584  64.31062132]
+ [ -0.56436795   2.00614575]
+ [  2.00614575  64.80573011]
+ [ -2.17753141   1.23866732]
+ [  1.23866732  62.1496339 ]
+ [  0.13261428   1.43143219]
+ [  1.43143219  62.82232971]
+ [ -8.21999264   1.64329839]
+ [  1.64329839  46.01087158]
+ [ -1.46269269   0.51170056]
+ [  0.51170056  82.72464225]
+ [  4.10101795   1.09620523]
+ [  1.09620523  27.39092317]
+ [  8.13402091   2.16728033]
+ [  2.16728033  43.55283893]
+ [  5.51227271   1.71149429]
+ [  1.71149429  48.99364151]
+ [  2.95660869   1.63380872]
+ [  1.63380872  63.09993358]
+ [ -0.38938082   1.2610885 ]
+ [  1.2610885   65.0003218 ]
+ [ -2.78776436   0.79967617]
+ [  0.79967617  62.66440487]
+ [ -0.7758033    1.10852874]
+ [  1.10852874  63.36776549]
+ [ -8.66247868   1.45384778]
+ [  1.45384778  46.17031937]
+ [ -3.02868523   1.21498548]
+ [  1.21498548  84.45201364]
+ [  4.31256343   0.        ]
+ [  0.          27.18799351]
+ [  8.47058757   0.        ]
+ [  0.          43.26734274]
+ [  6.39472453   0.        ]
+ [  0.          49.03789443]
+ [  3.75658544  -0.        ]
+ [ -0.          63.45999331]
+ [  0.20140917   0.        ]
+ [  0.          65.69516254]
+ [ -2.58581711   0.        ]
+ [  0.          63.41066563]
+ [ -0.47046851  -0.        ]
+ [ -0.          64.6070949 ]
+ [ -8.44413108  -0.        ]
+ [ -0.          47.30819584]
+ [ -2.30276574  -0.        ]
+ [ -0.          86.00695296]
+ [  4.10101795  -1.09620523]
+ [ -1.09620523  27.39092317]
+ [  8.13402091  -2.16728033]
+ [ -2.16728033  43.55283893]
+ [  5.51227271  -1.71149429]
+ [ -1.71149429  48.99364151]
+ [  2.95660869  -1.63380872]
+ [ -1.63380872  63.09993358]
+ [ -0.38938082  -1.2610885 ]
+ [ -1.2610885   65.0003218 ]
+ [ -2.78776436  -0.79967617]
+ [ -0.79967617  62.66440487]
+ [ -0.7758033   -1.10852874]
+ [ -1.10852874  63.36776549]
+ [ -8.66247868  -1.45384778]
+ [ -1.45384778  46.17031937]
+ [ -3.02868523  -1.21498548]
+ [ -1.21498548  84.45201364]
+ [  3.56918092  -2.59061563]
+ [ -2.59061563  29.98124923]
+ [  7.00213252  -4.85068082]
+ [ -4.85068082  46.46842118]
+ [  5.72335547  -4.06982487]
+ [ -4.06982487  50.92908689]
+ [  2.99074509  -3.25974584]
+ [ -3.25974584  64.31062132]
+ [ -0.56436795  -2.00614575]
+ [ -2.00614575  64.80573011]
+ [ -2.17753141  -1.23866732]
+ [ -1.23866732  62.1496339 ]
+ [  0.13261428  -1.43143219]
+ [ -1.43143219  62.82232971]
+ [ -8.21999264  -1.64329839]
+ [ -1.64329839  46.01087158]
+ [ -1.46269269  -0.51170056]
+ [ -0.51170056  82.72464225]
+ [  3.50202768  -5.2396182 ]
+ [ -5.2396182   40.08836153]
+ [ 10.41821699 -12.26429718]
+ [-12.26429718  61.20392112]
+ [  4.90916879  -4.87014892]
+ [ -4.87014892  62.44870865]
+ [  1.88388245  -4.59770124]
+ [ -4.59770124  77.85318406]
+ [ -1.36862632  -2.22513754]
+ [ -2.22513754  77.51763982]
+ [ -2.11405079  -0.65533783]
+ [ -0.65533783  73.82818191]
+ [ -0.07598059  -0.51691021]
+ [ -0.51691021  75.41009871]
+ [ -7.00210361  -1.80081916]
+ [ -1.80081916  55.83154878]
+ [ -4.15841044   3.36046408]
+ [  3.36046408  86.19741531]
+ [  2.81310913 -12.46226017]
+ [-12.46226017  46.82134028]
+ [ 15.06358786 -21.88716773]
+ [-21.88716773  65.72485288]
+ [-10.35095741  -2.395559  ]
+ [ -2.395559    58.53447944]
+ [-13.24151108  -3.91085886]
+ [ -3.91085886  74.50931517]
+ [-13.80313797  -2.1626887 ]
+ [ -2.1626887   74.34021972]
+ [-12.9923168    0.67008137]
+ [  0.67008137  71.36440106]
+ [-12.7503876   -0.60713302]
+ [ -0.60713302  69.25224343]
+ [-14.12508182   2.58751584]
+ [  2.58751584  53.09690238]
+ [-14.56181325  15.86988339]
+ [ 15.86988339  88.96746195]]
 strain_energy
-[[0.         0.30710519]
- [0.         0.73956924]
- [0.         0.46288998]
- [0.         0.63250731]
- [0.         0.60844689]
- [0.         0.58683228]
- [0.         0.64488432]
- [0.         0.44798902]
- [0.         0.99078788]
- [0.         0.22481028]
- [0.         0.5712543 ]
- [0.         0.49806534]
- [0.         0.70355618]
- [0.         0.66285325]
- [0.         0.62349926]
- [0.         0.73325852]
- [0.         0.462848  ]
- [0.         0.85482742]
- [0.         0.1579566 ]
- [0.         0.40774595]
- [0.         0.40898036]
- [0.         0.6073146 ]
- [0.         0.60022254]
- [0.         0.58517585]
- [0.         0.68074465]
- [0.         0.43864109]
- [0.         0.94424155]
- [0.         0.14709893]
- [0.         0.37847999]
- [0.         0.37968978]
- [0.         0.5824065 ]
- [0.         0.61108169]
- [0.         0.60623194]
- [0.         0.72306372]
- [0.         0.47164665]
- [0.         1.02677049]
- [0.         0.14748753]
- [0.         0.37689826]
- [0.         0.37199399]
- [0.         0.57634328]
- [0.         0.61295226]
- [0.         0.61299345]
- [0.         0.74402403]
- [0.         0.48616723]
- [0.         1.04634826]
- [0.         0.14709893]
- [0.         0.37847999]
- [0.         0.37968978]
- [0.         0.5824065 ]
- [0.         0.61108169]
- [0.         0.60623194]
- [0.         0.72306372]
- [0.         0.47164665]
- [0.         1.02677049]
- [0.         0.1579566 ]
- [0.         0.40774595]
- [0.         0.40898036]
- [0.         0.6073146 ]
- [0.         0.60022254]
- [0.         0.58517585]
- [0.         0.68074465]
- [0.         0.43864109]
- [0.         0.94424155]
- [0.         0.22481028]
- [0.         0.5712543 ]
- [0.         0.49806534]
- [0.         0.70355618]
- [0.         0.66285325]
- [0.         0.62349926]
- [0.         0.73325852]
- [0.         0.462848  ]
- [0.         0.85482742]
- [0.         0.30710519]
- [0.         0.73956924]
- [0.         0.46288998]
- [0.         0.63250731]
- [0.         0.60844689]
- [0.         0.58683228]
- [0.         0.64488432]
- [0.         0.44798902]
- [0.         0.99078788]]
-Duration: 175.99393534262975 minutes
+[[0.         0.3071053 ]
+ [0.         0.73956955]
+ [0.         0.46288999]
+ [0.         0.63250715]
+ [0.         0.60844651]
+ [0.         0.5868317 ]
+ [0.         0.6448836 ]
+ [0.         0.44798851]
+ [0.         0.99078761]
+ [0.         0.22481029]
+ [0.         0.57125439]
+ [0.         0.49806541]
+ [0.         0.70355623]
+ [0.         0.66285324]
+ [0.         0.6234992 ]
+ [0.         0.73325838]
+ [0.         0.46284791]
+ [0.         0.85482718]
+ [0.         0.15795657]
+ [0.         0.40774592]
+ [0.         0.40898043]
+ [0.         0.60731477]
+ [0.         0.60022281]
+ [0.         0.58517616]
+ [0.         0.6807449 ]
+ [0.         0.43864117]
+ [0.         0.94424118]
+ [0.         0.14709889]
+ [0.         0.3784799 ]
+ [0.         0.37968983]
+ [0.         0.58240674]
+ [0.         0.61108215]
+ [0.         0.60623248]
+ [0.         0.72306421]
+ [0.         0.47164686]
+ [0.         1.02676994]
+ [0.         0.14748747]
+ [0.         0.37689815]
+ [0.         0.37199403]
+ [0.         0.57634353]
+ [0.         0.61295278]
+ [0.         0.61299407]
+ [0.         0.74402462]
+ [0.         0.48616752]
+ [0.         1.04634771]
+ [0.         0.14709889]
+ [0.         0.3784799 ]
+ [0.         0.37968983]
+ [0.         0.58240674]
+ [0.         0.61108215]
+ [0.         0.60623248]
+ [0.         0.72306421]
+ [0.         0.47164686]
+ [0.         1.02676994]
+ [0.         0.15795657]
+ [0.         0.40774592]
+ [0.         0.40898043]
+ [0.         0.60731477]
+ [0.         0.60022281]
+ [0.         0.58517616]
+ [0.         0.6807449 ]
+ [0.         0.43864117]
+ [0.         0.94424118]
+ [0.         0.22481029]
+ [0.         0.57125439]
+ [0.         0.49806541]
+ [0.         0.70355623]
+ [0.         0.66285324]
+ [0.         0.6234992 ]
+ [0.         0.73325838]
+ [0.         0.46284791]
+ [0.         0.85482718]
+ [0.         0.3071053 ]
+ [0.         0.73956955]
+ [0.         0.46288999]
+ [0.         0.63250715]
+ [0.         0.60844651]
+ [0.         0.5868317 ]
+ [0.         0.6448836 ]
+ [0.         0.44798851]
+ [0.         0.99078761]]
@@ -3,8 +3,8 @@
 cd ../test
 echo "--2D direction x+"
 python ../pd_dic.py -i input_elas_2D_x+.yaml -t pd > 2D_x+.dat
-sed -i '$ d' 2D_x+.res
-DIFF=$(diff 2D_x+.dat 2D_x+.res )
+sed -i '$ d' 2D_x+.dat
+DIFF=$(diff 2D_x+.res 2D_x+.dat )
 if [ "$DIFF" != "" ]
 then
         echo "Test failed"
@@ -13,8 +13,8 @@ else
 fi
 echo "--2D direction x-"
 python ../pd_dic.py -i input_elas_2D_x-.yaml -t pd > 2D_x-.dat
-sed -i '$ d' 2D_x-.res
-DIFF=$(diff 2D_x-.dat 2D_x-.res )
+sed -i '$ d' 2D_x-.dat
+DIFF=$(diff 2D_x-.res 2D_x-.dat )
 if [ "$DIFF" != "" ]
 then
         echo "Test failed"
@@ -23,8 +23,8 @@ else
 fi
 echo "--2D direction y+"
 python ../pd_dic.py -i input_elas_2D_y+.yaml -t pd > 2D_y+.dat
-sed -i '$ d' 2D_y+.res
-DIFF=$(diff 2D_y+.dat 2D_y+.res )
+sed -i '$ d' 2D_y+.dat
+DIFF=$(diff 2D_y+.res 2D_y+.dat )
 if [ "$DIFF" != "" ]
 then
         echo "Test failed"
@@ -33,13 +33,240 @@ else
 fi
 echo "--2D direction y-"
 python ../pd_dic.py -i input_elas_2D_y-.yaml -t pd > 2D_y-.dat
-sed -i '$ d' 2D_y-.res
-DIFF=$(diff 2D_y-.dat 2D_y-.res )
+sed -i '$ d' 2D_y-.dat
+DIFF=$(diff 2D_y-.res 2D_y-.dat )
+if [ "$DIFF" != "" ]
+then
+        echo "Test failed"
+else
+        echo "Test passed"
+fi
+echo "--2D direction x+ Modified_Newton"
+python ../pd_dic.py -i input_elas_2D_x+_Modified_Newton.yaml -t pd > 2D_x+_Modified_Newton.dat
+sed -i '$ d' 2D_x+_Modified_Newton.dat
+DIFF=$(diff 2D_x+_Modified_Newton.res 2D_x+_Modified_Newton.dat )
+if [ "$DIFF" != "" ]
+then
+        echo "Test failed"
+else
+        echo "Test passed"
+fi
+echo "--2D direction x+ Broyden"
+python ../pd_dic.py -i input_elas_2D_x+_Broyden.yaml -t pd > 2D_x+_Broyden.dat
+sed -i '$ d' 2D_x+_Broyden.dat
+DIFF=$(diff 2D_x+_Broyden.res 2D_x+_Broyden.dat )
+if [ "$DIFF" != "" ]
+then
+        echo "Test failed"
+else
+        echo "Test passed"
+fi
+echo "--2D direction x+ Newton_Krylov GMRES"
+python ../pd_dic.py -i input_elas_2D_x+_Newton_Krylov_GMRES.yaml -t pd > 2D_x+_Newton_Krylov_GMRES.dat
+sed -i '$ d' 2D_x+_Newton_Krylov_GMRES.dat
+DIFF=$(diff 2D_x+_Newton_Krylov_GMRES.res 2D_x+_Newton_Krylov_GMRES.dat )
+if [ "$DIFF" != "" ]
+then
+        echo "Test failed"
+else
+        echo "Test passed"
+fi
+echo "--2D direction x+ Newton_Krylov CG"
+python ../pd_dic.py -i input_elas_2D_x+_Newton_Krylov_CG.yaml -t pd > 2D_x+_Newton_Krylov_CG.dat
+sed -i '$ d' 2D_x+_Newton_Krylov_CG.dat
+DIFF=$(diff 2D_x+_Newton_Krylov_CG.res 2D_x+_Newton_Krylov_CG.dat )
+if [ "$DIFF" != "" ]
+then
+        echo "Test failed"
+else
+        echo "Test passed"
+fi
+echo "--2D direction x+ Local_Finite_Difference"
+python ../pd_dic.py -i input_elas_2D_x+_Local_Finite_Difference.yaml -t pd > 2D_x+_Local_Finite_Difference.dat
+sed -i '$ d' 2D_x+_Local_Finite_Difference.dat
+DIFF=$(diff 2D_x+_Local_Finite_Difference.res 2D_x+_Local_Finite_Difference.dat )
+if [ "$DIFF" != "" ]
+then
+        echo "Test failed"
+else
+        echo "Test passed"
+fi
+echo "--2D direction x+ Streaming"
+python ../pd_dic.py -i input_elas_2D_x+_Streaming.yaml -t pd > 2D_x+_Streaming.dat
+rm -r history_2D_x+
+sed -i '$ d' 2D_x+_Streaming.dat
+DIFF=$(diff 2D_x+_Streaming.res 2D_x+_Streaming.dat )
+if [ "$DIFF" != "" ]
+then
+        echo "Test failed"
+else
+        echo "Test passed"
+fi
+echo "--2D direction x+ Store"
+if python -c "import h5py" 2> /dev/null
+then
+python ../pd_dic.py -i input_elas_2D_x+_Store.yaml -t pd > 2D_x+_Store.dat
+sed -i '$ d' 2D_x+_Store.dat
+PYTHONPATH=..:$PYTHONPATH python -c "import pd_dic; from peripydic import IO; print(IO.read_results('results_2D_x+.h5', 'Position', time_steps=2, nodes=slice(72, 81))); print(IO.read_results('results_2D_x+.h5', 'Force', time_steps=slice(1, 3), nodes=[0, 40, 80])); print(IO.read_results('results_2D_x+.h5', 'Strain', time_steps=2, nodes=slice(0, 4)))" >> 2D_x+_Store.dat
+rm results_2D_x+.h5
+DIFF=$(diff 2D_x+_Store.res 2D_x+_Store.dat )
+if [ "$DIFF" != "" ]
+then
+        echo "Test failed"
+else
+        echo "Test passed"
+fi
+else
+        echo "Test skipped, h5py is not found"
+fi
+echo "--2D direction x+ Checkpoint"
+python ../pd_dic.py -i input_elas_2D_x+_Checkpoint.yaml -t pd > /dev/null
+python ../pd_dic.py -i input_elas_2D_x+_Checkpoint.yaml -t pd -r checkpoint_2D_x+.npz > 2D_x+_Checkpoint.dat
+rm checkpoint_2D_x+.npz
+sed -i '$ d' 2D_x+_Checkpoint.dat
+DIFF=$(diff 2D_x+_Checkpoint.res 2D_x+_Checkpoint.dat )
+if [ "$DIFF" != "" ]
+then
+        echo "Test failed"
+else
+        echo "Test passed"
+fi
+echo "--2D direction x+ Adaptive"
+python ../pd_dic.py -i input_elas_2D_x+_Adaptive.yaml -t pd > 2D_x+_Adaptive.dat
+sed -i '$ d' 2D_x+_Adaptive.dat
+DIFF=$(diff 2D_x+_Adaptive.res 2D_x+_Adaptive.dat )
+if [ "$DIFF" != "" ]
+then
+        echo "Test failed"
+else
+        echo "Test passed"
+fi
+echo "--2D direction x+ Dynamic_Relaxation"
+python ../pd_dic.py -i input_elas_2D_x+_Dynamic_Relaxation.yaml -t pd > 2D_x+_Dynamic_Relaxation.dat
+sed -i '$ d' 2D_x+_Dynamic_Relaxation.dat
+DIFF=$(diff 2D_x+_Dynamic_Relaxation.res 2D_x+_Dynamic_Relaxation.dat )
+if [ "$DIFF" != "" ]
+then
+        echo "Test failed"
+else
+        echo "Test passed"
+fi
+echo "--2D direction x+ Velocity_Verlet"
+python ../pd_dic.py -i input_elas_2D_x+_Velocity_Verlet.yaml -t pd > 2D_x+_Velocity_Verlet.dat
+sed -i '$ d' 2D_x+_Velocity_Verlet.dat
+DIFF=$(diff 2D_x+_Velocity_Verlet.res 2D_x+_Velocity_Verlet.dat )
+if [ "$DIFF" != "" ]
+then
+        echo "Test failed"
+else
+        echo "Test passed"
+fi
+echo "--2D direction x+ Critical_Stretch"
+python ../pd_dic.py -i input_elas_2D_x+_Critical_Stretch.yaml -t pd > 2D_x+_Critical_Stretch.dat
+sed -i '$ d' 2D_x+_Critical_Stretch.dat
+DIFF=$(diff 2D_x+_Critical_Stretch.res 2D_x+_Critical_Stretch.dat )
+if [ "$DIFF" != "" ]
+then
+        echo "Test failed"
+else
+        echo "Test passed"
+fi
+echo "--2D direction x+ Fracture"
+python ../pd_dic.py -i input_elas_2D_x+_Fracture.yaml -t pd > 2D_x+_Fracture.dat
+echo "Exit code $?" >> 2D_x+_Fracture.dat
+DIFF=$(diff 2D_x+_Fracture.res 2D_x+_Fracture.dat )
+if [ "$DIFF" != "" ]
+then
+        echo "Test failed"
+else
+        echo "Test passed"
+fi
+echo "--2D direction x+ Finite_Difference"
+python ../pd_dic.py -i input_elas_2D_x+_Finite_Difference.yaml -t pd > 2D_x+_Finite_Difference.dat
+sed -i '$ d' 2D_x+_Finite_Difference.dat
+DIFF=$(diff 2D_x+_Finite_Difference.res 2D_x+_Finite_Difference.dat )
+if [ "$DIFF" != "" ]
+then
+        echo "Test failed"
+else
+        echo "Test passed"
+fi
+echo "--2D Spacing"
+PYTHONPATH=..:$PYTHONPATH python -c "import numpy as np; from peripydic import IO; g = IO.geometry.Geometry(); g.readNodes(2, 'geometry_2D.csv'); d = np.sqrt(np.sum((g.nodes[:, None, :] - g.nodes[None, :, :])**2, axis=2)); np.fill_diagonal(d, np.inf); d = np.sort(d, axis=1)[:, 0:4]; m = g.getMinDist(); s = g.getSpacing(4); print(m == np.min(d), np.allclose(s[0], d[:, 0]), np.allclose(s[1], np.mean(d, axis=1)), np.allclose(s[2], d[:, 3]))" > 2D_Spacing.dat
+DIFF=$(diff 2D_Spacing.res 2D_Spacing.dat )
+if [ "$DIFF" != "" ]
+then
+        echo "Test failed"
+else
+        echo "Test passed"
+fi
+echo "--2D direction x+ Kernels"
+# The Numba backend is forced without compilation, so the kernels are evaluated as Python functions whether Numba is found or not
+NUMBA_DISABLE_JIT=1 PYTHONPATH=..:$PYTHONPATH python -c "import pd_dic; from peripydic import IO; deck = IO.deck.PD_deck('input_elas_2D_x+.yaml'); deck.num_threads = 1; deck.backend = 'Numba'; pd_dic.simulation(deck)" > 2D_x+_Kernels.dat
+sed -i '$ d' 2D_x+_Kernels.dat
+DIFF=$(diff 2D_x+_Kernels.res 2D_x+_Kernels.dat )
+if [ "$DIFF" != "" ]
+then
+        echo "Test failed"
+else
+        echo "Test passed"
+fi
+echo "--2D direction x+ Binary"
+python ../pd_dic.py -i input_elas_2D_x+_Binary.yaml -t pd > 2D_x+_Binary.dat
+sed -i '$ d' 2D_x+_Binary.dat
+# The geometry and the condition read from NPZ and NPY files give the same results as the CSV files
+DIFF=$(diff 2D_x+.res 2D_x+_Binary.dat )
+if [ "$DIFF" != "" ]
+then
+        echo "Test failed"
+else
+        echo "Test passed"
+fi
+echo "--2D direction x+ Cache"
+python ../pd_dic.py -i input_elas_2D_x+_Cache.yaml -t pd > 2D_x+_Cache.dat
+sed -i '$ d' 2D_x+_Cache.dat
+# The second run reads the CSV files from the cache
+python ../pd_dic.py -i input_elas_2D_x+_Cache.yaml -t pd >> 2D_x+_Cache.dat
+sed -i '$ d' 2D_x+_Cache.dat
+rm -r cache_2D_x+
+# Amount of reads and hashes of a CSV file for a new cache, a cache hit, a touched file with the same content and a changed file
+cp geometry_2D.csv cache_geometry_2D.csv
+PYTHONPATH=..:$PYTHONPATH python - >> 2D_x+_Cache.dat <<'PYTHON'
+import os
+import numpy as np
+from peripydic.IO import loader
+calls = {"read": 0, "hash": 0}
+loadtxt = np.loadtxt
+get_file_hash = loader.get_file_hash
+def counted_loadtxt(*args, **kwargs):
+    calls["read"] += 1
+    return loadtxt(*args, **kwargs)
+def counted_get_file_hash(inFile):
+    calls["hash"] += 1
+    return get_file_hash(inFile)
+np.loadtxt = counted_loadtxt
+loader.get_file_hash = counted_get_file_hash
+def read(label):
+    calls["read"] = 0
+    calls["hash"] = 0
+    values = loader.read_csv("cache_geometry_2D.csv", range(1, 4), "cache_2D_x+")
+    print(label, calls["read"], calls["hash"], values.shape)
+read("new")
+read("hit")
+stat = os.stat("cache_geometry_2D.csv")
+os.utime("cache_geometry_2D.csv", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+read("touched")
+read("hit")
+with open("cache_geometry_2D.csv", "a") as f:
+    f.write("81 2.25 -1.75 0.25\n")
+read("changed")
+read("hit")
+PYTHON
+rm -r cache_2D_x+ cache_geometry_2D.csv
+DIFF=$(diff 2D_x+_Cache.res 2D_x+_Cache.dat )
 if [ "$DIFF" != "" ]
 then
         echo "Test failed"
 else
         echo "Test passed"
 fi
-
-